@@ -4,18 +4,44 @@ TalkGPT - AI-Powered Transcription Pipeline
 A modular, high-performance transcription system built on OpenAI Whisper Fast Large.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "TalkGPT Team"
 
-# Core imports
-from .utils.config import ConfigManager, TalkGPTConfig, get_config, load_config
-from .utils.logger import TalkGPTLogger, get_logger, setup_logging
-from .core.resource_detector import ResourceDetector, detect_hardware, get_device_config
-from .core.file_processor import FileProcessor, get_file_processor
+# Core exports, imported on first access so ``import src.cli.main`` does not
+# load configuration, logging and audio modules it may never use
+_EXPORTS = {
+    "ConfigManager": ".utils.config",
+    "TalkGPTConfig": ".utils.config",
+    "get_config": ".utils.config",
+    "load_config": ".utils.config",
+    "TalkGPTLogger": ".utils.logger",
+    "get_logger": ".utils.logger",
+    "setup_logging": ".utils.logger",
+    "ResourceDetector": ".core.resource_detector",
+    "detect_hardware": ".core.resource_detector",
+    "get_device_config": ".core.resource_detector",
+    "FileProcessor": ".core.file_processor",
+    "get_file_processor": ".core.file_processor",
+}
 
 __all__ = [
     "ConfigManager", "TalkGPTConfig", "get_config", "load_config",
-    "TalkGPTLogger", "get_logger", "setup_logging", 
+    "TalkGPTLogger", "get_logger", "setup_logging",
     "ResourceDetector", "detect_hardware", "get_device_config",
     "FileProcessor", "get_file_processor"
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
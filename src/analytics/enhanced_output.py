@@ -9,7 +9,6 @@ Provides advanced output generation with detailed timing analysis including:
 - Comprehensive JSON with timing data
 """
 
-import json
 import csv
 import time
 from pathlib import Path
@@ -18,6 +17,7 @@ from dataclasses import asdict
 
 from analytics.timing_analyzer import TimingBucket, CadenceAnalysis
 from utils.logger import get_logger
+from utils.json_stream import write_json
 from output.md_writer import write_timing_analysis_outputs
 
 
@@ -157,8 +157,7 @@ class EnhancedOutputGenerator:
                 'flagged_percentage': uncertainty_result.flagged_percentage
             }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(data, output_file)
     
     def _generate_timing_srt(self, timing_buckets: List[TimingBucket], output_file: Path):
         """Generate SRT file with timing analysis indicators."""
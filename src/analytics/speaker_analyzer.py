@@ -9,9 +9,11 @@ import time
 import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 import tempfile
 
+import numpy as np
+
 try:
     import torch
     TORCH_AVAILABLE = True
@@ -29,12 +31,20 @@ except ImportError:
 try:
     from ..utils.logger import get_logger, get_file_logger
     from ..core.transcriber import TranscriptionResult, BatchTranscriptionResult
+    from ..core.timeline import TimeMap
+    from ..core.intervals import IntervalIndex, TimeBinSet, overlapping_pairs
+    from ..core.diarization import DiarizationStore, diarization_params, get_diarization_store
+    from ..utils.tracing import traced
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.logger import get_logger, get_file_logger
     from core.transcriber import TranscriptionResult, BatchTranscriptionResult
+    from core.timeline import TimeMap
+    from core.intervals import IntervalIndex, TimeBinSet, overlapping_pairs
+    from core.diarization import DiarizationStore, diarization_params, get_diarization_store
+    from utils.tracing import traced
 
 
 @dataclass
@@ -108,7 +118,8 @@ class SpeakerAnalyzer:
                  device: str = "auto",
                  auth_token: Optional[str] = None,
                  min_speakers: Optional[int] = None,
-                 max_speakers: Optional[int] = None):
+                 max_speakers: Optional[int] = None,
+                 diarization_store: Optional[DiarizationStore] = None):
         """
         Initialize the speaker analyzer.
         
@@ -118,12 +129,15 @@ class SpeakerAnalyzer:
             auth_token: HuggingFace auth token (required for some models)
             min_speakers: Minimum number of speakers
             max_speakers: Maximum number of speakers
+            diarization_store: Store of computed diarizations (defaults to
+                the one shared with overlap detection)
         """
         self.model_name = model_name
         self.device = device
         self.auth_token = auth_token
         self.min_speakers = min_speakers
         self.max_speakers = max_speakers
+        self.diarization_store = diarization_store or get_diarization_store()
         
         self.logger = get_logger("talkgpt.speaker_analyzer")
         self.pipeline: Optional[Pipeline] = None
@@ -172,11 +186,7 @@ class SpeakerAnalyzer:
             if actual_device == "cuda" and TORCH_AVAILABLE:
                 self.pipeline = self.pipeline.to(torch.device("cuda"))
             
-            # Configure pipeline parameters
-            if self.min_speakers is not None:
-                self.pipeline.instantiate({"clustering": {"min_speakers": self.min_speakers}})
-            if self.max_speakers is not None:
-                self.pipeline.instantiate({"clustering": {"max_speakers": self.max_speakers}})
+            # Speaker bounds are passed per call, through diarization_params
             
             self.model_info = {
                 'model_name': self.model_name,
@@ -192,6 +202,7 @@ class SpeakerAnalyzer:
             self.logger.warning("Speaker analysis will be disabled")
             self.pipeline = None
     
+    @traced("diarization")
     def perform_diarization(self, 
                           audio_path: Union[str, Path],
                           confidence_threshold: float = 0.5) -> DiarizationResult:
@@ -215,23 +226,27 @@ class SpeakerAnalyzer:
         file_logger.info(f"Starting speaker diarization: {audio_path}")
         
         try:
-            # Perform diarization
-            diarization = self.pipeline(str(audio_path))
+            # Perform diarization (reused if this file was already diarized)
+            turns = self.diarization_store.get(
+                audio_path,
+                self.pipeline,
+                diarization_params(self.model_name, self.min_speakers, self.max_speakers)
+            ).turns
             
             # Extract speaker segments
             speaker_segments = []
-            for segment, _, speaker in diarization.itertracks(yield_label=True):
+            for start, end, speaker in turns:
                 speaker_segment = SpeakerSegment(
                     speaker_id=speaker,
-                    start_time=segment.start,
-                    end_time=segment.end,
-                    duration=segment.duration,
+                    start_time=start,
+                    end_time=end,
+                    duration=end - start,
                     confidence=1.0  # pyannote doesn't provide segment-level confidence
                 )
                 speaker_segments.append(speaker_segment)
             
             # Detect overlaps
-            overlap_segments = self._detect_overlaps(diarization)
+            overlap_segments = self._detect_overlaps(turns)
             
             # Calculate statistics
             total_duration = max(seg.end_time for seg in speaker_segments) if speaker_segments else 0.0
@@ -262,67 +277,70 @@ class SpeakerAnalyzer:
             file_logger.error(f"Diarization failed: {e}")
             raise
     
-    def _detect_overlaps(self, diarization: Annotation) -> List[OverlapSegment]:
+    def _detect_overlaps(self, turns: List[Tuple[float, float, str]]) -> List[OverlapSegment]:
         """
         Detect overlapping speech segments.
         
         Args:
-            diarization: Pyannote annotation object
+            turns: Diarization turns as (start, end, speaker)
             
         Returns:
             List of overlap segments
         """
-        overlaps = []
-        
         # Get all segments sorted by start time
-        segments = [(segment, speaker) for segment, _, speaker in diarization.itertracks(yield_label=True)]
-        segments.sort(key=lambda x: x[0].start)
-        
-        # Find overlaps
-        for i, (seg1, spk1) in enumerate(segments):
-            for j, (seg2, spk2) in enumerate(segments[i+1:], i+1):
-                # Check if segments overlap
-                if seg1.end > seg2.start and seg2.end > seg1.start and spk1 != spk2:
-                    # Calculate overlap region
-                    overlap_start = max(seg1.start, seg2.start)
-                    overlap_end = min(seg1.end, seg2.end)
-                    
-                    if overlap_end > overlap_start:  # Valid overlap
-                        overlap_duration = overlap_end - overlap_start
-                        
-                        # Determine overlap type
-                        seg1_duration = seg1.duration
-                        seg2_duration = seg2.duration
-                        min_duration = min(seg1_duration, seg2_duration)
-                        
-                        if overlap_duration >= min_duration * 0.8:
-                            overlap_type = "complete"
-                        else:
-                            overlap_type = "partial"
-                        
-                        overlap = OverlapSegment(
-                            start_time=overlap_start,
-                            end_time=overlap_end,
-                            duration=overlap_duration,
-                            speakers=[spk1, spk2],
-                            overlap_type=overlap_type,
-                            confidence=1.0
-                        )
-                        
-                        overlaps.append(overlap)
-        
-        # Remove duplicate overlaps (same time range)
+        segments = sorted(turns, key=lambda x: x[0])
+        
+        # Sweep for pairs of different speakers whose turns intersect
+        pairs = overlapping_pairs(
+            [start for start, _, _ in segments],
+            [end for _, end, _ in segments],
+            labels=[speaker for _, _, speaker in segments]
+        )
+        
         unique_overlaps = []
-        for overlap in overlaps:
-            is_duplicate = False
-            for existing in unique_overlaps:
-                if (abs(overlap.start_time - existing.start_time) < 0.1 and
-                    abs(overlap.end_time - existing.end_time) < 0.1):
-                    is_duplicate = True
-                    break
+        seen = TimeBinSet(tolerance=0.1)
+        
+        for i, j in pairs:
+            start1, end1, spk1 = segments[i]
+            start2, end2, spk2 = segments[j]
+            
+            # Calculate overlap region
+            overlap_start = max(start1, start2)
+            overlap_end = min(end1, end2)
+            
+            if overlap_end <= overlap_start:
+                continue
+            
+            # Regions within 0.1s of one already found are the same overlap;
+            # fold their speakers into it
+            existing = seen.find(overlap_start, overlap_end)
+            if existing is not None:
+                for speaker in (spk1, spk2):
+                    if speaker not in existing.speakers:
+                        existing.speakers.append(speaker)
+                continue
+            
+            overlap_duration = overlap_end - overlap_start
+            
+            # Determine overlap type
+            min_duration = min(end1 - start1, end2 - start2)
+            
+            if overlap_duration >= min_duration * 0.8:
+                overlap_type = "complete"
+            else:
+                overlap_type = "partial"
+            
+            overlap = OverlapSegment(
+                start_time=overlap_start,
+                end_time=overlap_end,
+                duration=overlap_duration,
+                speakers=[spk1, spk2],
+                overlap_type=overlap_type,
+                confidence=1.0
+            )
             
-            if not is_duplicate:
-                unique_overlaps.append(overlap)
+            seen.add(overlap_start, overlap_end, overlap)
+            unique_overlaps.append(overlap)
         
         return unique_overlaps
     
@@ -363,10 +381,12 @@ class SpeakerAnalyzer:
         
         return stats
     
+    @traced("speaker_attribution")
     def enhance_transcription(self,
                             transcription_result: Union[TranscriptionResult, BatchTranscriptionResult],
                             audio_path: Union[str, Path],
-                            diarization_result: Optional[DiarizationResult] = None) -> EnhancedTranscriptionResult:
+                            diarization_result: Optional[DiarizationResult] = None,
+                            time_map: Optional[TimeMap] = None) -> EnhancedTranscriptionResult:
         """
         Enhance transcription with speaker information.
         
@@ -374,6 +394,8 @@ class SpeakerAnalyzer:
             transcription_result: Original transcription result
             audio_path: Path to original audio file
             diarization_result: Pre-computed diarization (None to compute)
+            time_map: Processed -> original map when ``audio_path`` is the
+                processed audio and the transcription is on the original timeline
             
         Returns:
             Enhanced transcription with speaker labels
@@ -388,6 +410,8 @@ class SpeakerAnalyzer:
             # Get diarization if not provided
             if diarization_result is None:
                 diarization_result = self.perform_diarization(audio_path)
+                if time_map is not None and not time_map.is_identity:
+                    diarization_result = self._remap_diarization(diarization_result, time_map)
             
             # Extract segments from transcription result
             if isinstance(transcription_result, BatchTranscriptionResult):
@@ -399,12 +423,20 @@ class SpeakerAnalyzer:
             speaker_labeled_segments = []
             overlap_flagged_segments = []
             
+            # Index diarization turns once instead of scanning them per segment
+            speaker_index = IntervalIndex.from_segments(diarization_result.speaker_segments)
+            overlap_index = IntervalIndex.from_segments(diarization_result.overlap_segments)
+            
             for segment in segments:
                 # Find the most overlapping speaker segment
-                best_speaker = self._find_speaker_for_segment(segment, diarization_result.speaker_segments)
+                best_speaker = self._find_speaker_for_segment(
+                    segment, diarization_result.speaker_segments, speaker_index
+                )
                 
                 # Check for overlaps
-                overlaps = self._find_overlaps_for_segment(segment, diarization_result.overlap_segments)
+                overlaps = self._find_overlaps_for_segment(
+                    segment, diarization_result.overlap_segments, overlap_index
+                )
                 
                 # Create enhanced segment
                 enhanced_segment = {
@@ -447,54 +479,67 @@ class SpeakerAnalyzer:
             file_logger.error(f"Transcription enhancement failed: {e}")
             raise
     
+    def _remap_diarization(self,
+                           diarization_result: DiarizationResult,
+                           time_map: TimeMap) -> DiarizationResult:
+        """Move a diarization of processed audio onto the original timeline."""
+        segments = diarization_result.speaker_segments
+        overlaps = diarization_result.overlap_segments
+        
+        bounds = np.array(
+            [(s.start_time, s.end_time) for s in segments] + [(o.start_time, o.end_time) for o in overlaps],
+            dtype=np.float64
+        ).reshape(-1, 2)
+        mapped = time_map.to_original(bounds).tolist()
+        
+        speaker_segments = [
+            replace(segment, start_time=start, end_time=end, duration=end - start)
+            for segment, (start, end) in zip(segments, mapped[:len(segments)])
+        ]
+        overlap_segments = [
+            replace(overlap, start_time=start, end_time=end, duration=end - start)
+            for overlap, (start, end) in zip(overlaps, mapped[len(segments):])
+        ]
+        total_duration = time_map.original_duration
+        
+        return replace(
+            diarization_result,
+            total_duration=total_duration,
+            speaker_segments=speaker_segments,
+            overlap_segments=overlap_segments,
+            speaker_stats=self._calculate_speaker_stats(speaker_segments, total_duration)
+        )
+    
     def _find_speaker_for_segment(self, 
                                  transcription_segment,
-                                 speaker_segments: List[SpeakerSegment]) -> Optional[str]:
+                                 speaker_segments: List[SpeakerSegment],
+                                 speaker_index: Optional[IntervalIndex] = None) -> Optional[str]:
         """Find the best matching speaker for a transcription segment."""
-        best_speaker = None
-        best_overlap = 0.0
+        if speaker_index is None:
+            speaker_index = IntervalIndex.from_segments(speaker_segments)
         
-        segment_start = transcription_segment.start
-        segment_end = transcription_segment.end
-        
-        for speaker_seg in speaker_segments:
-            # Calculate overlap
-            overlap_start = max(segment_start, speaker_seg.start_time)
-            overlap_end = min(segment_end, speaker_seg.end_time)
-            
-            if overlap_end > overlap_start:
-                overlap_duration = overlap_end - overlap_start
-                segment_duration = segment_end - segment_start
-                
-                # Calculate overlap ratio
-                overlap_ratio = overlap_duration / segment_duration if segment_duration > 0 else 0
-                
-                if overlap_ratio > best_overlap:
-                    best_overlap = overlap_ratio
-                    best_speaker = speaker_seg.speaker_id
-        
-        return best_speaker
+        best = speaker_index.best_overlap(transcription_segment.start, transcription_segment.end)
+        return speaker_segments[best].speaker_id if best is not None else None
     
     def _find_overlaps_for_segment(self,
                                   transcription_segment,
-                                  overlap_segments: List[OverlapSegment]) -> List[Dict[str, Any]]:
+                                  overlap_segments: List[OverlapSegment],
+                                  overlap_index: Optional[IntervalIndex] = None) -> List[Dict[str, Any]]:
         """Find overlaps that affect a transcription segment."""
-        segment_overlaps = []
+        if overlap_index is None:
+            overlap_index = IntervalIndex.from_segments(overlap_segments)
         
-        segment_start = transcription_segment.start
-        segment_end = transcription_segment.end
-        
-        for overlap in overlap_segments:
-            # Check if overlap affects this segment
-            if (overlap.start_time < segment_end and overlap.end_time > segment_start):
-                overlap_info = {
-                    'start_time': overlap.start_time,
-                    'end_time': overlap.end_time,
-                    'duration': overlap.duration,
-                    'speakers': overlap.speakers,
-                    'type': overlap.overlap_type
-                }
-                segment_overlaps.append(overlap_info)
+        segment_overlaps = []
+        for position in overlap_index.overlapping(transcription_segment.start, transcription_segment.end):
+            overlap = overlap_segments[position]
+            overlap_info = {
+                'start_time': overlap.start_time,
+                'end_time': overlap.end_time,
+                'duration': overlap.duration,
+                'speakers': overlap.speakers,
+                'type': overlap.overlap_type
+            }
+            segment_overlaps.append(overlap_info)
         
         return segment_overlaps
     
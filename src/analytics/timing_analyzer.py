@@ -17,6 +17,9 @@ from pathlib import Path
 
 # Import project modules
 from utils.logger import get_logger
+from core.intervals import IntervalIndex
+from core.word_table import grouped_gap_stats
+from utils.tracing import traced
 
 
 class WordTiming(NamedTuple):
@@ -98,6 +101,7 @@ class TimingAnalyzer:
         self.logger.info(f"Timing analyzer initialized: {bucket_seconds}s buckets, "
                         f"±{bucket_tolerance}s tolerance, {gap_threshold}x gap threshold")
     
+    @traced("timing_analysis")
     def analyze_timing(self, 
                       transcription_result,
                       speaker_timeline: Optional[Any] = None) -> Tuple[List[TimingBucket], CadenceAnalysis]:
@@ -122,10 +126,7 @@ class TimingAnalyzer:
         self.logger.info(f"Created {len(buckets)} timing buckets")
         
         # Calculate gap statistics for all buckets
-        all_gaps = []
-        for bucket in buckets:
-            bucket_gaps = self._calculate_gap_statistics(bucket)
-            all_gaps.extend(bucket_gaps)
+        all_gaps = self._calculate_gap_statistics(words, buckets)
         
         # Perform global cadence analysis
         cadence_analysis = self._analyze_global_cadence(all_gaps, buckets)
@@ -260,37 +261,29 @@ class TimingAnalyzer:
             total_silence_time=silence_time
         )
     
-    def _calculate_gap_statistics(self, bucket: TimingBucket) -> List[float]:
-        """Calculate word gap statistics for a bucket."""
-        if len(bucket.words) < 2:
-            bucket.word_gap_count = 0
-            bucket.word_gaps = []
-            bucket.word_gap_mean = 0.0
-            bucket.word_gap_var = 0.0
-            return []
-        
-        # Calculate gaps between consecutive words (true silence)
-        gaps = []
-        for i in range(1, len(bucket.words)):
-            gap = bucket.words[i].start - bucket.words[i-1].end
-            gaps.append(max(0.0, gap))  # Ensure non-negative gaps
-        
-        # Store limited number of gaps for readability
-        bucket.word_gaps = gaps[:self.gap_list_max]
-        bucket.word_gap_count = len(gaps)
-        
-        if gaps:
-            bucket.word_gap_mean = np.mean(gaps)
-            bucket.word_gap_var = np.var(gaps, ddof=1) if len(gaps) > 1 else 0.0
-        else:
-            bucket.word_gap_mean = 0.0
-            bucket.word_gap_var = 0.0
-        
-        return gaps
+    def _calculate_gap_statistics(self, words: List[WordTiming], buckets: List[TimingBucket]) -> np.ndarray:
+        """Calculate word gap statistics for all buckets; returns the within-bucket gaps."""
+        starts = np.fromiter((word.start for word in words), dtype=np.float64, count=len(words))
+        ends = np.fromiter((word.end for word in words), dtype=np.float64, count=len(words))
+        offsets = np.zeros(len(buckets) + 1, dtype=np.int64)
+        np.cumsum([len(bucket.words) for bucket in buckets], out=offsets[1:])
+        
+        # Gaps between consecutive words (true silence), reduced per bucket
+        grouped = grouped_gap_stats(starts, ends, offsets)
+        sample_variance = grouped.sample_variance()
+        
+        for i, bucket in enumerate(buckets):
+            # Store limited number of gaps for readability
+            bucket.word_gaps = grouped.group(i)[:self.gap_list_max].tolist()
+            bucket.word_gap_count = int(grouped.count[i])
+            bucket.word_gap_mean = float(grouped.mean[i])
+            bucket.word_gap_var = float(sample_variance[i])
+        
+        return grouped.gaps
     
-    def _analyze_global_cadence(self, all_gaps: List[float], buckets: List[TimingBucket]) -> CadenceAnalysis:
+    def _analyze_global_cadence(self, all_gaps: np.ndarray, buckets: List[TimingBucket]) -> CadenceAnalysis:
         """Perform global cadence analysis across all buckets."""
-        if not all_gaps:
+        if not len(all_gaps):
             return CadenceAnalysis(
                 global_gap_mean=0.0,
                 global_gap_std=0.0,
@@ -362,14 +355,14 @@ class TimingAnalyzer:
     def _add_speaker_overlap_info(self, buckets: List[TimingBucket], speaker_timeline):
         """Add speaker overlap information to buckets."""
         try:
-            for bucket in buckets:
-                # Check if any overlap intersects with bucket timespan
-                if hasattr(speaker_timeline, 'crop'):
-                    overlap_in_bucket = speaker_timeline.crop(bucket.start_ts, bucket.end_ts)
-                    bucket.speaker_overlap = len(overlap_in_bucket) > 0
-                else:
-                    # Fallback for different timeline formats
-                    bucket.speaker_overlap = False
+            # Accepts a pyannote timeline, OverlapSegment list or IntervalIndex
+            overlap_index = IntervalIndex.from_any(speaker_timeline)
+            flags = overlap_index.any_overlap_many(
+                [bucket.start_ts for bucket in buckets],
+                [bucket.end_ts for bucket in buckets]
+            )
+            for bucket, flag in zip(buckets, flags.tolist()):
+                bucket.speaker_overlap = flag
         except Exception as e:
             self.logger.warning(f"Failed to add speaker overlap info: {e}")
             for bucket in buckets:
@@ -15,12 +15,14 @@ import statistics
 try:
     from ..utils.logger import get_logger, get_file_logger
     from ..core.transcriber import TranscriptionResult, BatchTranscriptionResult, TranscriptionSegment
+    from ..utils.tracing import traced
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.logger import get_logger, get_file_logger
     from core.transcriber import TranscriptionResult, BatchTranscriptionResult, TranscriptionSegment
+    from utils.tracing import traced
 
 
 @dataclass
@@ -120,6 +122,7 @@ class UncertaintyDetector:
         
         self.logger.info("Uncertainty detector initialized")
     
+    @traced("uncertainty")
     def analyze_uncertainty(self,
                           transcription_result: Union[TranscriptionResult, BatchTranscriptionResult],
                           audio_path: Optional[Union[str, Path]] = None) -> UncertaintyAnalysis:
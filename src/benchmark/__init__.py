@@ -0,0 +1,37 @@
+"""
+TalkGPT Benchmark Module
+
+Stage-level performance benchmarks on deterministic synthetic audio,
+versioned JSON reports and regression comparison between runs.
+"""
+
+from .synthetic import synthesize_speech, SyntheticSpeech
+from .memory import measure_word_memory
+from .imports import measure_import_time, parse_importtime, IMPORT_BUDGET_SECONDS
+from .stages import run_benchmark_suite, run_case, BenchmarkCase, STAGES
+from .report import (
+    compare_reports, load_report, save_report, StageComparison, BENCHMARK_SCHEMA_VERSION
+)
+
+__all__ = [
+    # Synthetic audio
+    'synthesize_speech',
+    'SyntheticSpeech',
+    
+    # Stage runner
+    'run_benchmark_suite',
+    'run_case',
+    'BenchmarkCase',
+    'STAGES',
+    'measure_word_memory',
+    'measure_import_time',
+    'parse_importtime',
+    'IMPORT_BUDGET_SECONDS',
+    
+    # Reports
+    'compare_reports',
+    'load_report',
+    'save_report',
+    'StageComparison',
+    'BENCHMARK_SCHEMA_VERSION'
+]
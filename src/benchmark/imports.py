@@ -0,0 +1,127 @@
+"""
+TalkGPT Benchmark: Import Time
+
+Cold-start cost of importing a module, measured in a fresh interpreter
+with ``python -X importtime``. The CLI is started thousands of times a day
+by the Celery and cron wrappers, so its import time is budgeted like any
+other stage, and the heavy inference stack must stay out of it.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+
+# Default cold-start budget for ``import src.cli.main``, in seconds
+IMPORT_BUDGET_SECONDS = 1.0
+
+# Packages that may only load inside the commands that need them
+HEAVY_MODULES = (
+    'torch', 'faster_whisper', 'ctranslate2', 'pyannote', 'speechbrain',
+    'librosa', 'pydub', 'soundfile', 'ffmpeg', 'GPUtil',
+)
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@dataclass(slots=True)
+class ImportTiming:
+    """One line of ``-X importtime`` output."""
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse ``-X importtime`` output.
+
+    Lines look like ``import time:   self [us] | cumulative | name`` with
+    the name indented two spaces per nesting level; anything else on
+    stderr is ignored.
+
+    Args:
+        output: Captured stderr of the interpreter
+
+    Returns:
+        Timings in the order the imports finished
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|", 2)
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, name = fields
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        indent = len(name) - len(name.lstrip(" ")) - 1
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us), max(0, indent) // 2))
+    return timings
+
+
+def _run_importtime(module: str, python: str, cwd: Path) -> str:
+    env = dict(os.environ)
+    env.pop('PYTHONPROFILEIMPORTTIME', None)
+    completed = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(cwd), env=env, capture_output=True, text=True, check=False,
+    )
+    if completed.returncode != 0:
+        tail = completed.stderr.strip().splitlines()[-1:] or ["no output"]
+        raise RuntimeError(f"Importing {module} failed: {tail[0]}")
+    return completed.stderr
+
+
+def measure_import_time(module: str = "src.cli.main",
+                        repeats: int = 3,
+                        python: Optional[str] = None,
+                        cwd: Optional[Path] = None,
+                        heavy_modules: Sequence[str] = HEAVY_MODULES) -> Dict[str, Any]:
+    """
+    Measure the cold-start import time of ``module``.
+
+    Each repeat runs a fresh interpreter; a first, unmeasured run writes
+    the bytecode caches. The fastest repeat is reported, as the others
+    only add scheduler noise.
+
+    Args:
+        module: Dotted module name to import
+        repeats: Measured interpreter starts
+        python: Interpreter to run (defaults to the current one)
+        cwd: Working directory (defaults to the project root)
+        heavy_modules: Top-level packages that must not be imported
+
+    Returns:
+        Total import seconds (interpreter startup included), the module's
+        own cumulative seconds, the slowest imports at the top two levels
+        and any heavy packages that were loaded
+    """
+    python = python or sys.executable
+    cwd = Path(cwd) if cwd else _PROJECT_ROOT
+
+    _run_importtime(module, python, cwd)
+    runs = [parse_importtime(_run_importtime(module, python, cwd)) for _ in range(max(1, repeats))]
+    timings = min(runs, key=lambda run: sum(t.cumulative_us for t in run if t.depth == 0))
+
+    roots = [t for t in timings if t.depth == 0]
+    names = {t.name for t in timings}
+    heavy = sorted(h for h in heavy_modules if h in names)
+    target = next((t for t in reversed(roots) if t.name == module), None)
+    # Interpreter startup and what the module imports directly
+    breakdown = [t for t in timings if t.depth <= 1 and t is not target]
+
+    return {
+        'module': module,
+        'import_seconds': sum(t.cumulative_us for t in roots) / 1e6,
+        'module_seconds': target.cumulative_us / 1e6 if target else 0.0,
+        'modules_loaded': len(timings),
+        'slowest': [(t.name, t.cumulative_us / 1e6)
+                    for t in sorted(breakdown, key=lambda t: t.cumulative_us, reverse=True)[:10]],
+        'heavy_modules': heavy,
+    }
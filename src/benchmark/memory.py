@@ -0,0 +1,92 @@
+"""
+TalkGPT Benchmark: Memory
+
+Bytes per word retained by a transcript and by the word-gap analysis
+built on it, measured with tracemalloc. Long recordings are bounded by
+this per-word cost rather than by audio buffers.
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..core.transcriber import TranscriptionSegment, WordTimestamp
+from ..core.utils import Word
+from ..core.word_table import WordTable
+from ..post.assembler import assemble_records
+from ..post.cadence import bucket_gap_stats, create_analysis_context
+from ..post.segmenter import bucketize
+
+
+def _retained(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Run ``build`` and return its result with the bytes it left allocated."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return value, after - before
+
+
+def build_segments(words: List[Word], pause: float = 0.5) -> List[TranscriptionSegment]:
+    """
+    Transcript segments holding ``words``, split at pauses.
+
+    Texts and times are rebuilt rather than shared with ``words``, as
+    they would be when coming from the decoder.
+    """
+    texts = " ".join(word.word for word in words).split(" ")
+    starts = [word.start + 0.0 for word in words]
+    ends = [word.end + 0.0 for word in words]
+
+    segments: List[TranscriptionSegment] = []
+    for i, word in enumerate(words):
+        entry = WordTimestamp(texts[i], starts[i], ends[i], word.probability)
+        if segments and starts[i] - segments[-1].end < pause:
+            segments[-1].words.append(entry)
+            segments[-1].end = ends[i]
+        else:
+            segments.append(TranscriptionSegment(
+                id=len(segments), start=starts[i], end=ends[i], text="",
+                avg_logprob=-0.3, no_speech_prob=0.01, words=[entry]
+            ))
+    for segment in segments:
+        segment.text = " ".join(entry.word for entry in segment.words)
+    return segments
+
+
+def measure_word_memory(words: List[Word]) -> Dict[str, Any]:
+    """
+    Measure retained memory per word.
+
+    ``transcript`` covers the merged segments with their word timestamps;
+    ``analysis`` covers the word table, timing buckets, gap statistics and
+    assembled records built from them (without overlap detection).
+
+    Args:
+        words: Words of the transcript
+
+    Returns:
+        Word count and bytes per word for each part
+    """
+    segments, transcript_bytes = _retained(lambda: build_segments(words))
+
+    def analyze():
+        table = WordTable.from_segments(segments).validated()
+        buckets = bucketize(table)
+        grouped = bucket_gap_stats(buckets)
+        context = create_analysis_context(buckets, grouped=grouped)
+        return table, buckets, assemble_records(buckets, context, enable_overlap_detection=False, grouped=grouped)
+
+    _, analysis_bytes = _retained(analyze)
+
+    count = max(1, len(words))
+    return {
+        'words': len(words),
+        'transcript_bytes_per_word': round(transcript_bytes / count, 1),
+        'analysis_bytes_per_word': round(analysis_bytes / count, 1),
+    }
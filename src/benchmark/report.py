@@ -0,0 +1,190 @@
+"""
+TalkGPT Benchmark: Reports
+
+Versioned JSON benchmark results and run-to-run comparison.
+"""
+
+import json
+import platform
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+
+BENCHMARK_SCHEMA = "talkgpt-benchmark"
+BENCHMARK_SCHEMA_VERSION = 1
+
+OK = "ok"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+def summarize_runs(runs: List[float], audio_seconds: float, **extra) -> Dict[str, Any]:
+    """
+    Timing summary of one stage.
+
+    Args:
+        runs: Wall-clock seconds of each repetition
+        audio_seconds: Audio covered by one repetition
+        **extra: Additional fields to record
+
+    Returns:
+        Stage entry for a report
+    """
+    median = float(np.median(runs))
+    return {
+        'status': OK,
+        'runs': [round(run, 6) for run in runs],
+        'median': round(median, 6),
+        'min': round(float(np.min(runs)), 6),
+        'realtime_factor': round(audio_seconds / median, 2) if median > 0 else None,
+        **extra
+    }
+
+
+def environment_info(**extra) -> Dict[str, Any]:
+    """Host description recorded with each report."""
+    import os
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        **extra
+    }
+
+
+def build_report(cases: Dict[str, Dict[str, Any]],
+                 settings: Dict[str, Any],
+                 environment: Dict[str, Any],
+                 label: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Assemble a versioned benchmark report.
+
+    Args:
+        cases: Per-case results keyed by case name
+        settings: Benchmark settings (durations, repeats, seed, ...)
+        environment: Host description
+        label: Free-form run label, e.g. a commit id
+
+    Returns:
+        JSON-serializable report
+    """
+    try:
+        from .. import __version__
+    except ImportError:
+        __version__ = None
+
+    return {
+        'schema': BENCHMARK_SCHEMA,
+        'schema_version': BENCHMARK_SCHEMA_VERSION,
+        'talkgpt_version': __version__,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'label': label,
+        'environment': environment,
+        'settings': settings,
+        'cases': cases,
+    }
+
+
+def save_report(report: Dict[str, Any], path: Union[str, Path]) -> Path:
+    """Write a report as JSON, creating parent directories."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_report(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a report written by save_report.
+
+    Raises:
+        ValueError: If the file is not a benchmark report of this schema version
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+
+    if report.get('schema') != BENCHMARK_SCHEMA:
+        raise ValueError(f"{path} is not a TalkGPT benchmark report")
+    if report.get('schema_version') != BENCHMARK_SCHEMA_VERSION:
+        raise ValueError(f"{path} has schema version {report.get('schema_version')}, "
+                         f"expected {BENCHMARK_SCHEMA_VERSION}")
+    return report
+
+
+@dataclass
+class StageComparison:
+    """One stage of one case in two reports."""
+    case: str
+    stage: str
+    baseline: Optional[float]
+    candidate: Optional[float]
+    status: str  # regression, improvement, unchanged or missing
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline or self.candidate is None:
+            return None
+        return self.candidate / self.baseline
+
+
+def compare_reports(baseline: Dict[str, Any],
+                    candidate: Dict[str, Any],
+                    threshold: float = 0.10,
+                    min_delta: float = 0.002) -> List[StageComparison]:
+    """
+    Compare median stage times of two reports.
+
+    A stage regresses when it is more than ``threshold`` slower and also
+    at least ``min_delta`` seconds slower. The second condition keeps
+    timer noise on sub-millisecond stages from counting.
+
+    Args:
+        baseline: Earlier report
+        candidate: Report under test
+        threshold: Relative slowdown tolerated
+        min_delta: Absolute slowdown (seconds) below which changes are ignored
+
+    Returns:
+        Comparisons for every case/stage present in either report
+    """
+    comparisons = []
+    case_names = list(baseline['cases']) + [name for name in candidate['cases'] if name not in baseline['cases']]
+
+    for case in case_names:
+        base_stages = baseline['cases'].get(case, {}).get('stages', {})
+        cand_stages = candidate['cases'].get(case, {}).get('stages', {})
+        stage_names = list(base_stages) + [name for name in cand_stages if name not in base_stages]
+
+        for stage in stage_names:
+            base = base_stages.get(stage, {})
+            cand = cand_stages.get(stage, {})
+            base_time = base.get('median') if base.get('status') == OK else None
+            cand_time = cand.get('median') if cand.get('status') == OK else None
+
+            if base_time is None or cand_time is None:
+                status = 'missing'
+            elif cand_time > base_time * (1 + threshold) and cand_time - base_time >= min_delta:
+                status = 'regression'
+            elif cand_time < base_time * (1 - threshold) and base_time - cand_time >= min_delta:
+                status = 'improvement'
+            else:
+                status = 'unchanged'
+
+            comparisons.append(StageComparison(case, stage, base_time, cand_time, status))
+
+    return comparisons
+
+
+def environment_differences(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> List[str]:
+    """Environment fields that differ between two reports (comparisons across hosts are unreliable)."""
+    base_env = baseline.get('environment', {})
+    cand_env = candidate.get('environment', {})
+    return sorted(key for key in set(base_env) | set(cand_env) if base_env.get(key) != cand_env.get(key))
@@ -0,0 +1,375 @@
+"""
+TalkGPT Benchmark: Stage Runner
+
+Times each pipeline stage on its own: preprocessing, chunking, decode,
+merge, bucketize, cadence, record assembly, diarization lookup and the
+output writers, plus the memory retained per word by the transcript
+and its analysis. Synthetic cases carry a ground-truth transcript and
+diarization. Stages after decode therefore run on identical input every
+time, whether or not a Whisper model is available.
+"""
+
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import psutil
+
+from .memory import measure_word_memory
+from .report import FAILED, SKIPPED, build_report, environment_info, summarize_runs
+from .synthetic import SyntheticSpeech, synthesize_speech
+from ..core.chunker import ChunkingResult, get_smart_chunker
+from ..core.diarization import DiarizationTurns
+from ..core.file_processor import FFMPEG_AVAILABLE, FileProcessor
+from ..core.intervals import IntervalIndex
+from ..core.transcriber import TranscriptionResult, TranscriptionSegment, WordTimestamp, merge_chunk_results
+from ..core.utils import Word
+from ..core.word_table import WordTable
+from ..post.assembler import assemble_records
+from ..post.cadence import bucket_gap_stats, classify_cadences, create_analysis_context
+from ..post.segmenter import bucketize
+from ..utils.logger import get_logger
+
+
+STAGES = (
+    'preprocess', 'chunking', 'decode', 'merge', 'bucketize',
+    'cadence', 'assemble', 'diarization_lookup', 'writers',
+)
+
+OUTPUT_FORMATS = ['srt', 'json', 'txt', 'csv', 'npz']
+
+
+@dataclass
+class BenchmarkCase:
+    """One input to benchmark: synthetic speech or a sample file."""
+    name: str
+    speech: Optional[SyntheticSpeech] = None
+    path: Optional[Path] = None
+
+
+@dataclass
+class StageTimer:
+    """Runs stages, records their timings and remembers which failed."""
+    repeats: int
+    audio_seconds: float
+    stages: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def run(self, name: str, fn: Callable[[], Any], repeats: Optional[int] = None) -> Any:
+        """
+        Time ``fn`` over the configured repetitions.
+
+        Returns:
+            The last run's result, or None if the stage raised
+        """
+        runs = []
+        result = None
+        try:
+            for _ in range(repeats or self.repeats):
+                start = time.perf_counter()
+                result = fn()
+                runs.append(time.perf_counter() - start)
+        except Exception as e:
+            self.stages[name] = {'status': FAILED, 'error': f"{type(e).__name__}: {e}"}
+            return None
+
+        rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+        self.stages[name] = summarize_runs(runs, self.audio_seconds, rss_mb=round(rss_mb, 1))
+        return result
+
+    def skip(self, name: str, reason: str):
+        self.stages[name] = {'status': SKIPPED, 'reason': reason}
+
+
+def synthetic_chunk_results(words: List[Word], chunking: ChunkingResult) -> List[TranscriptionResult]:
+    """
+    Per-chunk results as a decoder would return them for ``words``.
+
+    Every chunk gets the words inside its span including overlaps, grouped
+    into segments at pauses, so merge has real duplicates to drop.
+    """
+    results = []
+    for chunk in chunking.chunks:
+        chunk_words = [word for word in words if chunk.start_time <= word.start < chunk.end_time]
+
+        groups: List[List[Word]] = []
+        for word in chunk_words:
+            if groups and word.start - groups[-1][-1].end < 0.5:
+                groups[-1].append(word)
+            else:
+                groups.append([word])
+
+        segments = [
+            TranscriptionSegment(
+                id=i,
+                start=group[0].start,
+                end=group[-1].end,
+                text=" ".join(word.word for word in group),
+                avg_logprob=-0.3,
+                no_speech_prob=0.01,
+                words=[WordTimestamp(word.word, word.start, word.end, word.probability) for word in group],
+                language='en'
+            )
+            for i, group in enumerate(groups)
+        ]
+        results.append(TranscriptionResult(
+            segments=segments,
+            language='en',
+            language_probability=1.0,
+            duration=chunk.duration,
+            text=" ".join(segment.text for segment in segments),
+            avg_confidence=-0.3,
+            processing_time=0.0,
+            model_info={},
+            chunk_info={
+                'chunk_id': chunk.chunk_id,
+                'original_start': chunk.original_start,
+                'original_end': chunk.original_end,
+                'overlap_prev': chunk.overlap_prev,
+                'overlap_next': chunk.overlap_next
+            }
+        ))
+    return results
+
+
+def _lookup_speakers(turns: List, segments: List[TranscriptionSegment], buckets: List) -> int:
+    """Speaker per segment and overlap flag per bucket, as speaker analysis does."""
+    diarization = DiarizationTurns(list(turns))
+    speakers = IntervalIndex([turn[0] for turn in turns], [turn[1] for turn in turns])
+    overlaps = diarization.overlap_index()
+
+    labelled = sum(speakers.best_overlap(segment.start, segment.end) is not None for segment in segments)
+    overlaps.any_overlap_many([bucket.start_time for bucket in buckets],
+                              [bucket.end_time for bucket in buckets])
+    return labelled
+
+
+def _write_outputs(merged: TranscriptionResult, records: List, output_dir: Path, base_name: str):
+    """Write every output format of the transcribe command."""
+    from ..cli.commands.transcribe import _generate_output_files
+    from ..output.md_writer import write_enhanced_markdown_report
+
+    _generate_output_files(merged, None, None, output_dir, OUTPUT_FORMATS, base_name, records=records)
+    write_enhanced_markdown_report(records, output_dir / f"{base_name}_enhanced.md",
+                                   precision=4, max_gaps_per_line=None)
+
+
+def run_case(case: BenchmarkCase,
+             config,
+             workdir: Path,
+             repeats: int = 3,
+             transcriber=None) -> Dict[str, Any]:
+    """
+    Benchmark every stage on one case.
+
+    Args:
+        case: Input to benchmark
+        config: TalkGPT configuration (chunking and cadence settings)
+        workdir: Scratch directory for the case's files
+        repeats: Repetitions per stage (decode and preprocessing run once)
+        transcriber: Loaded WhisperTranscriber, or None to skip decode
+
+    Returns:
+        Case entry for a report
+    """
+    workdir.mkdir(parents=True, exist_ok=True)
+    processor = FileProcessor()
+    sample_rate = 16000
+
+    if case.speech is not None:
+        audio_seconds = case.speech.duration
+        source = processor.write_wav(case.speech.audio, workdir / f"{case.name}.wav", sample_rate)
+    else:
+        audio_seconds = processor.get_file_info(case.path).duration
+        source = case.path
+    timer = StageTimer(repeats, audio_seconds)
+
+    # Preprocessing: the ffmpeg filter graph, decoded into memory
+    processed = None
+    if FFMPEG_AVAILABLE:
+        processed = timer.run('preprocess', lambda: processor.process_file(
+            source, workdir / "processed",
+            speed_multiplier=1.0, remove_silence=False, normalize=True,
+            target_sample_rate=sample_rate, target_channels=1
+        ), repeats=1)
+    else:
+        timer.skip('preprocess', "ffmpeg-python not installed")
+
+    if processed is not None and processed.audio is not None:
+        audio = processed.audio
+    elif case.speech is not None:
+        audio = case.speech.audio
+    else:
+        audio = None
+
+    def skip_rest(stages: Sequence[str], reason: str) -> Dict[str, Any]:
+        for stage in stages:
+            timer.skip(stage, reason)
+        return {'audio_seconds': round(audio_seconds, 3), 'stages': timer.stages}
+
+    if audio is None:
+        return skip_rest(STAGES[1:], "no audio: preprocessing unavailable")
+
+    chunker = get_smart_chunker(
+        chunk_size=config.processing.chunk_size,
+        overlap_duration=config.processing.overlap_duration,
+        silence_threshold=config.processing.silence_threshold,
+        min_silence_len=config.processing.min_silence_len,
+    )
+    chunking = timer.run('chunking', lambda: chunker.chunk_array(
+        audio, sample_rate=sample_rate, original_file=source, remove_silence=False
+    ))
+    if chunking is None or not chunking.chunks:
+        return skip_rest(STAGES[2:], "no chunks")
+
+    if transcriber is not None:
+        decoded = timer.run('decode', lambda: [
+            transcriber.transcribe_chunk(chunk, language=config.transcription.language,
+                                         beam_size=config.transcription.beam_size,
+                                         word_timestamps=True)
+            for chunk in chunking.chunks
+        ], repeats=1)
+    else:
+        decoded = None
+        timer.skip('decode', "no Whisper model")
+
+    # Later stages use the ground truth when there is one, so they see the
+    # same input on every run regardless of what the model produced
+    if case.speech is not None:
+        make_results = lambda: synthetic_chunk_results(case.speech.words, chunking)
+    elif decoded is not None:
+        make_results = lambda: decoded
+    else:
+        return skip_rest(STAGES[3:], "no transcript: decode unavailable")
+
+    merged = timer.run('merge', lambda: merge_chunk_results(make_results(), chunking))
+    if merged is None:
+        return skip_rest(STAGES[4:], "merge failed")
+
+    def make_buckets():
+        words = WordTable.from_segments(merged.segments).validated()
+        return bucketize(words, 4.0, 0.25)
+
+    buckets = timer.run('bucketize', make_buckets)
+    if buckets is None:
+        return skip_rest(STAGES[5:], "bucketize failed")
+
+    def cadence():
+        grouped = bucket_gap_stats(buckets)
+        context = create_analysis_context(buckets, 1.5, grouped=grouped)
+        classify_cadences(grouped, context)
+        return context, grouped
+
+    analysis = timer.run('cadence', cadence)
+    records = timer.run(
+        'assemble', lambda: assemble_records(buckets, analysis[0], None, False, grouped=analysis[1])
+    ) if analysis else None
+
+    if case.speech is not None:
+        timer.run('diarization_lookup', lambda: _lookup_speakers(case.speech.turns, merged.segments, buckets))
+    else:
+        timer.skip('diarization_lookup', "no reference diarization for sample files")
+
+    if records is not None:
+        output_dir = workdir / "outputs"
+        output_dir.mkdir(exist_ok=True)
+        timer.run('writers', lambda: _write_outputs(merged, records, output_dir, case.name))
+    else:
+        timer.skip('writers', "no records")
+
+    entry = {
+        'audio_seconds': round(audio_seconds, 3),
+        'chunks': len(chunking.chunks),
+        'words': sum(len(segment.words or []) for segment in merged.segments),
+        'stages': timer.stages,
+    }
+    if case.speech is not None:
+        entry['memory'] = measure_word_memory(case.speech.words)
+    return entry
+
+
+def _load_transcriber(config):
+    """The configured Whisper model, or None with the reason it is unavailable."""
+    from ..core.transcriber import get_transcriber
+    from ..core.resource_detector import get_device_config
+
+    device_cfg = get_device_config(
+        force_device=config.transcription.device if config.transcription.device != 'auto' else None
+    )
+    transcriber = get_transcriber(
+        model_size=config.transcription.model_size,
+        device=device_cfg['device'],
+        compute_type=device_cfg['compute_type'],
+        cpu_threads=config.resources.cpu_threads,
+    )
+    if transcriber.model is None:
+        raise RuntimeError("Whisper model not available")
+    return transcriber
+
+
+def run_benchmark_suite(config,
+                        durations: Sequence[float] = (30.0, 300.0),
+                        repeats: int = 3,
+                        seed: int = 0,
+                        sample_files: Sequence[Path] = (),
+                        decode: bool = True,
+                        label: Optional[str] = None,
+                        workdir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Benchmark all stages on synthetic audio and optional sample files.
+
+    Args:
+        config: TalkGPT configuration
+        durations: Lengths (seconds) of the synthetic cases
+        repeats: Repetitions per stage
+        seed: Seed for the synthetic audio
+        sample_files: Real recordings to add as cases
+        decode: Load the Whisper model and time decoding
+        label: Run label stored in the report
+        workdir: Scratch directory (a temporary one by default)
+
+    Returns:
+        Versioned report (see report.build_report)
+    """
+    logger = get_logger("talkgpt.benchmark")
+
+    transcriber = None
+    decode_note = None
+    if decode:
+        try:
+            transcriber = _load_transcriber(config)
+        except Exception as e:
+            decode_note = str(e)
+            logger.warning(f"Decode stage skipped: {e}")
+
+    cases = [BenchmarkCase(f"synthetic-{int(d)}s", speech=synthesize_speech(d, seed=seed)) for d in durations]
+    cases += [BenchmarkCase(f"file-{Path(p).stem}", path=Path(p)) for p in sample_files]
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="talkgpt_bench_") as tmp:
+        root = Path(workdir) if workdir else Path(tmp)
+        for case in cases:
+            logger.info(f"Benchmarking {case.name}")
+            try:
+                results[case.name] = run_case(case, config, root / case.name, repeats, transcriber)
+            except Exception as e:
+                logger.error(f"Benchmark case {case.name} failed: {e}")
+                results[case.name] = {'error': f"{type(e).__name__}: {e}", 'stages': {}}
+
+    settings = {
+        'durations': list(durations),
+        'repeats': repeats,
+        'seed': seed,
+        'sample_files': [str(p) for p in sample_files],
+        'decode': transcriber is not None,
+        'decode_note': decode_note,
+        'chunk_size': config.processing.chunk_size,
+        'overlap_duration': config.processing.overlap_duration,
+    }
+    environment = environment_info(
+        model_size=config.transcription.model_size if transcriber else None,
+        device=getattr(transcriber, 'device', None),
+        compute_type=getattr(transcriber, 'compute_type', None),
+    )
+    return build_report(results, settings, environment, label)
@@ -17,6 +17,10 @@ def analyze_speakers_command(
 ) -> Dict[str, Any]:
     """Analyze speakers in audio file (pyannote optional)."""
     from ...analytics.speaker_analyzer import SpeakerAnalyzer
+    from ...output.columnar import is_columnar_transcript
+
+    if is_columnar_transcript(input_path):
+        raise ValueError(f"Speaker analysis needs the audio file; {input_path} is a transcript")
 
     analyzer = SpeakerAnalyzer(
         min_speakers=config.analytics.min_speakers,
@@ -57,11 +61,39 @@ def analyze_quality_command(
     config,
     logger,
 ) -> Dict[str, Any]:
-    """Analyze transcription quality and uncertainty."""
+    """Analyze transcription quality and uncertainty of an audio file or a columnar transcript."""
+    from ...analytics.uncertainty_detector import UncertaintyDetector
+    from ...output.columnar import ColumnarTranscript, is_columnar_transcript
+
+    if is_columnar_transcript(input_path):
+        # Already transcribed: skip chunking and decoding
+        with ColumnarTranscript(input_path) as transcript:
+            transcription = transcript.to_result()
+    else:
+        transcription = _transcribe_for_analysis(input_path, config)
+
+    # Analyze uncertainty
+    detector = UncertaintyDetector(confidence_threshold=threshold or config.analytics.confidence_threshold)
+    analysis = detector.analyze_uncertainty(transcription, input_path)
+
+    # Optional save
+    if output_path:
+        detector.save_uncertainty_analysis(analysis, output_path, format='json')
+
+    return {
+        'quality_score': analysis.quality_metrics.overall_quality_score,
+        'flagged_segments': analysis.flagged_segments,
+        'flagged_percentage': analysis.flagged_percentage,
+        'output': str(output_path) if output_path else None,
+    }
+
+
+def _transcribe_for_analysis(input_path: Path, config):
+    """Transcribe an audio file with the configured model."""
     from ...core.chunker import get_smart_chunker
     from ...core.transcriber import get_transcriber
-    from ...analytics.uncertainty_detector import UncertaintyDetector
     from ...core.resource_detector import get_device_config
+    from ...utils.cache import get_configured_cache
 
     # Prepare chunking
     chunker = get_smart_chunker(
@@ -80,20 +112,68 @@ def analyze_quality_command(
         model_size=config.transcription.model_size,
         device=device_cfg['device'],
         compute_type=device_cfg['compute_type'],
+        result_cache=get_configured_cache(config.cache),
+        batch_size=config.transcription.batch_size,
     )
-    transcription = transcriber.transcribe_file(input_path, chunking_result, word_timestamps=config.output.word_timestamps)
+    return transcriber.transcribe_file(input_path, chunking_result, word_timestamps=config.output.word_timestamps)
 
-    # Analyze uncertainty
-    detector = UncertaintyDetector(confidence_threshold=threshold or config.analytics.confidence_threshold)
-    analysis = detector.analyze_uncertainty(transcription, input_path)
 
-    # Optional save
-    if output_path:
-        detector.save_uncertainty_analysis(analysis, output_path, format='json')
+def analyze_timing_command(
+    input_path: Path,
+    output_path: Optional[Path],
+    config,
+    logger,
+) -> Dict[str, Any]:
+    """
+    Cadence summary of a columnar transcript.
+
+    Timing records stored in the transcript are summarized from their
+    columns; without them, the words are bucketed and classified with the
+    configured timing settings.
+    """
+    import numpy as np
+
+    from ...core.word_table import WordTable
+    from ...output.columnar import ColumnarTranscript, is_columnar_transcript
+    from ...post.cadence import bucket_gap_stats, classify_cadences, create_analysis_context
+    from ...post.segmenter import bucketize
+    from ...utils.json_stream import write_json
+
+    if not is_columnar_transcript(input_path):
+        raise ValueError(f"{input_path} is not a columnar transcript (write one with --format npz)")
+
+    timing = config.analytics.timing
+    with ColumnarTranscript(input_path) as transcript:
+        if transcript.has_records:
+            labels = transcript.meta['cadence_labels']
+            counts = np.bincount(transcript.column('record_cadence'), minlength=len(labels))
+            gaps = transcript.column('record_gaps')
+            summary = {
+                'source': 'stored records',
+                'words': transcript.word_count,
+                'buckets': transcript.record_count,
+                'cadence_distribution': dict(zip(labels, counts.tolist())),
+                'global_gap_mean': float(gaps.mean()) if gaps.size else 0.0,
+                'global_gap_std': float(gaps.std()) if gaps.size else 0.0,
+            }
+        else:
+            # Same words as the transcription pipeline, including segment-text fallbacks
+            words = WordTable.from_segments(transcript.segments()).validated()
+            buckets = bucketize(words, timing.bucket_seconds, timing.bucket_tolerance)
+            grouped = bucket_gap_stats(buckets)
+            context = create_analysis_context(buckets, timing.gap_threshold, grouped=grouped)
+            cadences = classify_cadences(grouped, context)
+            summary = {
+                'source': 'computed',
+                'words': transcript.word_count,
+                'buckets': len(buckets),
+                'cadence_distribution': {label: cadences.count(label) for label in ('slow', 'normal', 'fast')},
+                'global_gap_mean': context.global_mean,
+                'global_gap_std': context.global_std_dev,
+            }
+        summary['duration'] = transcript.duration
 
-    return {
-        'quality_score': analysis.quality_metrics.overall_quality_score,
-        'flagged_segments': analysis.flagged_segments,
-        'flagged_percentage': analysis.flagged_percentage,
-        'output': str(output_path) if output_path else None,
-    }
\ No newline at end of file
+    if output_path:
+        write_json(summary, output_path)
+    summary['output'] = str(output_path) if output_path else None
+    return summary
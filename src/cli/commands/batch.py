@@ -2,16 +2,22 @@
 TalkGPT CLI Batch Processing Commands
 
 Implementation of batch processing functionality for multiple files.
+With more than one worker, files run on a process pool: each worker process
+loads its own model with a share of the CPU cores, and files are dispatched
+longest first so a long file does not start last and hold up the batch.
 """
 
+import multiprocessing
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Tuple
 
 try:
     from ...core.file_processor import get_file_processor
     from ...utils.config import TalkGPTConfig
-    from ...utils.logger import TalkGPTLogger
+    from ...utils.logger import TalkGPTLogger, setup_logging
     from .transcribe import transcribe_single_file
 except ImportError:
     import sys
@@ -19,10 +25,188 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent.parent))
     from core.file_processor import get_file_processor
     from utils.config import TalkGPTConfig
-    from utils.logger import TalkGPTLogger
+    from utils.logger import TalkGPTLogger, setup_logging
     from transcribe import transcribe_single_file
 
 
+# Per-process state of a pool worker, set by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+def plan_cpu_slots(workers: int) -> List[Tuple[Optional[List[int]], int]]:
+    """
+    Split the usable CPU cores between batch workers.
+    
+    Args:
+        workers: Number of worker processes
+        
+    Returns:
+        One (cores to pin to or None, thread budget) pair per worker
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    
+    if len(cores) < workers:
+        # Not enough cores to give each worker its own; share them unpinned
+        return [(None, 1)] * workers
+    
+    per_worker = len(cores) // workers
+    slots = []
+    for i in range(workers):
+        slice_ = cores[i * per_worker:(i + 1) * per_worker]
+        slots.append((slice_ if hasattr(os, 'sched_setaffinity') else None, per_worker))
+    return slots
+
+
+def order_longest_first(files: List[Path], processor=None) -> List[Path]:
+    """
+    Order files by decreasing duration.
+    
+    Durations are probed in parallel; files that cannot be probed fall
+    back to their size in bytes and sort after the probed ones.
+    
+    Args:
+        files: Files to order
+        processor: File processor used for probing
+        
+    Returns:
+        Files, longest first
+    """
+    processor = processor or get_file_processor()
+    
+    def probe(file_path: Path) -> Tuple[float, int]:
+        try:
+            duration = float(processor.get_file_info(file_path).duration)
+        except Exception:
+            duration = 0.0
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = 0
+        return duration, size
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(files)) or 1) as pool:
+        keys = list(pool.map(probe, files))
+    
+    order = sorted(range(len(files)), key=lambda i: keys[i], reverse=True)
+    return [files[i] for i in order]
+
+
+def _init_worker(config: TalkGPTConfig, slots):
+    """Pool initializer: pin this process and give it its thread budget."""
+    cores, cpu_threads = slots.get()
+    if cores:
+        os.sched_setaffinity(0, cores)
+    os.environ['OMP_NUM_THREADS'] = str(cpu_threads)
+    
+    config = config.copy(deep=True)
+    config.resources.cpu_threads = cpu_threads
+    # One model per process; parallelism comes from the pool, not decode threads
+    config.processing.max_workers = 1
+    
+    _worker_state['config'] = config
+    _worker_state['logger'] = setup_logging(config.logging)
+
+
+def _transcribe_in_worker(input_path: Path, output_dir: Path, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Pool task: transcribe one file with the worker's config and model."""
+    return transcribe_single_file(
+        input_path=input_path,
+        output_dir=output_dir,
+        config=_worker_state['config'],
+        logger=_worker_state['logger'],
+        **options
+    )
+
+
+def _file_result(file_path: Path, result: Optional[Dict[str, Any]] = None,
+                 error: Optional[Exception] = None) -> Dict[str, Any]:
+    """Per-file entry of a batch result."""
+    if error is not None:
+        return {'file': str(file_path), 'status': 'failed', 'error': str(error)}
+    return {'file': str(file_path), 'status': 'success', 'result': result}
+
+
+def _run_sequential(files: List[Path],
+                    output_dir: Path,
+                    config: TalkGPTConfig,
+                    logger: TalkGPTLogger,
+                    options: Dict[str, Any],
+                    continue_on_error: bool = True):
+    """Transcribe files one after another in this process, yielding entries."""
+    for i, file_path in enumerate(files, 1):
+        logger.get_logger("talkgpt.batch").info(f"Processing {i}/{len(files)}: {file_path.name}")
+        
+        try:
+            result = transcribe_single_file(
+                input_path=file_path,
+                output_dir=output_dir / file_path.stem,
+                config=config,
+                logger=logger,
+                **options
+            )
+            yield _file_result(file_path, result=result)
+        except Exception as e:
+            yield _file_result(file_path, error=e)
+            if not continue_on_error:
+                break
+
+
+def run_parallel(files: List[Path],
+                 output_dir: Path,
+                 config: TalkGPTConfig,
+                 workers: int,
+                 options: Dict[str, Any],
+                 continue_on_error: bool = True,
+                 task: Callable[..., Dict[str, Any]] = _transcribe_in_worker):
+    """
+    Transcribe files on a pool of worker processes.
+    
+    Args:
+        files: Files in dispatch order
+        output_dir: Output directory; each file gets a subdirectory
+        config: TalkGPT configuration
+        workers: Number of worker processes
+        options: Options passed to transcribe_single_file
+        continue_on_error: Keep going after a failed file
+        task: Picklable top-level function run per file
+        
+    Yields:
+        Per-file result entries in completion order
+    """
+    # Spawn rather than fork: the parent may already hold model or CUDA state
+    context = multiprocessing.get_context('spawn')
+    slots = context.Queue()
+    for slot in plan_cpu_slots(workers):
+        slots.put(slot)
+    
+    # The pool provides the parallelism; don't let workers fan out again
+    options = {k: v for k, v in options.items() if k != 'workers'}
+    
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                   initializer=_init_worker, initargs=(config, slots))
+    stop = False
+    try:
+        futures = {
+            executor.submit(task, file_path, output_dir / file_path.stem, options): file_path
+            for file_path in files
+        }
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                entry = _file_result(file_path, result=future.result())
+            except Exception as e:
+                entry = _file_result(file_path, error=e)
+                stop = not continue_on_error
+            yield entry
+            if stop:
+                break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def process_batch(input_dir: Path,
                  output_dir: Path,
                  config: TalkGPTConfig,
@@ -38,6 +222,10 @@ def process_batch(input_dir: Path,
         logger: Logger instance
         **options: Override options from CLI
         
+    Options besides the transcription overrides:
+        workers: Number of worker processes (sequential when 1 or unset)
+        on_result: Callback receiving each file's entry as it completes
+        
     Returns:
         Dictionary with batch processing results
     """
@@ -51,6 +239,8 @@ def process_batch(input_dir: Path,
     recursive = options.get('recursive', True)
     max_files = options.get('max_files')
     continue_on_error = options.get('continue_on_error', True)
+    workers = options.get('workers') or 1
+    on_result = options.pop('on_result', None)
     
     # Scan for files
     if pattern == '*':
@@ -100,44 +290,28 @@ def process_batch(input_dir: Path,
     results = []
     successful = 0
     failed = 0
+    batch_logger = logger.get_logger("talkgpt.batch")
     
-    for i, file_path in enumerate(files, 1):
-        if use_queue:
-            # Skip inline processing when queued
-            continue
-        file_output_dir = output_dir / file_path.stem
-        
-        logger.get_logger("talkgpt.batch").info(f"Processing {i}/{len(files)}: {file_path.name}")
-        
-        try:
-            result = transcribe_single_file(
-                input_path=file_path,
-                output_dir=file_output_dir,
-                config=config,
-                logger=logger,
-                **options
-            )
-            
-            results.append({
-                'file': str(file_path),
-                'status': 'success',
-                'result': result
-            })
+    if use_queue:
+        entries = iter(())
+    elif workers > 1 and len(files) > 1:
+        workers = min(workers, len(files))
+        batch_logger.info(f"Dispatching {len(files)} files to {workers} worker processes")
+        entries = run_parallel(order_longest_first(files, processor), output_dir, config,
+                               workers, options, continue_on_error=continue_on_error)
+    else:
+        entries = _run_sequential(files, output_dir, config, logger, options,
+                                  continue_on_error=continue_on_error)
+    
+    for entry in entries:
+        results.append(entry)
+        if entry['status'] == 'success':
             successful += 1
-            
-        except Exception as e:
-            error_msg = str(e)
-            logger.get_logger("talkgpt.batch").error(f"Failed to process {file_path}: {error_msg}")
-            
-            results.append({
-                'file': str(file_path),
-                'status': 'failed',
-                'error': error_msg
-            })
+        else:
+            batch_logger.error(f"Failed to process {entry['file']}: {entry['error']}")
             failed += 1
-            
-            if not continue_on_error:
-                break
+        if on_result:
+            on_result(entry)
     
     total_time = time.time() - start_time
     
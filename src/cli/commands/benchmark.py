@@ -4,96 +4,117 @@ TalkGPT CLI Benchmark Commands
 Implementation of performance benchmarking.
 """
 
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 
 
 def _find_samples(sample_dir: Optional[Path]) -> List[Path]:
     if not sample_dir or not sample_dir.exists():
         return []
     exts = {'.wav', '.mp3', '.m4a', '.flac', '.mp4', '.mkv'}
-    return [p for p in sample_dir.iterdir() if p.suffix.lower() in exts]
+    return sorted(p for p in sample_dir.iterdir() if p.suffix.lower() in exts)
+
+
+def default_report_path() -> Path:
+    """Timestamped report file under ./benchmarks."""
+    return Path("benchmarks") / f"benchmark-{time.strftime('%Y%m%d-%H%M%S')}.json"
 
 
 def run_benchmark(
-    duration: int,
+    durations: Sequence[float],
+    repeats: int,
+    seed: int,
     sample_dir: Optional[Path],
+    decode: bool,
+    output: Optional[Path],
+    label: Optional[str],
     config,
     logger,
 ) -> Dict[str, Any]:
-    """Run a quick performance benchmark using small samples."""
-    import time
-    import psutil
-
-    from ...core.file_processor import FileProcessor
-    from ...core.chunker import get_smart_chunker
-    from ...core.transcriber import get_transcriber
-    from ...core.resource_detector import get_device_config
-
-    samples = _find_samples(sample_dir)
-    if not samples:
-        return {
-            'processing_speed': 0.0,
-            'memory_usage': psutil.virtual_memory().percent,
-            'cpu_usage': psutil.cpu_percent(interval=0.2),
-            'samples': 0,
-            'message': 'No sample files found'
-        }
-
-    processor = FileProcessor()
-    chunker = get_smart_chunker(
-        chunk_size=config.processing.chunk_size,
-        overlap_duration=config.processing.overlap_duration,
-        silence_threshold=config.processing.silence_threshold,
-        min_silence_len=config.processing.min_silence_len,
-    )
+    """
+    Run the stage-level benchmark suite and save its report.
 
-    device_cfg = get_device_config(
-        force_device=config.transcription.device if config.transcription.device != 'auto' else None
-    )
-    transcriber = get_transcriber(
-        model_size=config.transcription.model_size,
-        device=device_cfg['device'],
-        compute_type=device_cfg['compute_type'],
+    Args:
+        durations: Lengths (seconds) of the synthetic audio cases
+        repeats: Repetitions per stage
+        seed: Seed for the synthetic audio
+        sample_dir: Directory with extra sample recordings (optional)
+        decode: Time Whisper decoding (needs the model)
+        output: Report path (defaults to a timestamped file in ./benchmarks)
+        label: Run label stored in the report
+        config: TalkGPT configuration
+        logger: Logger instance
+
+    Returns:
+        The report, with its path under 'report_path'
+    """
+    from ...benchmark import run_benchmark_suite, save_report
+
+    report = run_benchmark_suite(
+        config,
+        durations=durations,
+        repeats=repeats,
+        seed=seed,
+        sample_files=_find_samples(sample_dir),
+        decode=decode,
+        label=label,
     )
+    path = save_report(report, output or default_report_path())
+    logger.get_logger("talkgpt.benchmark").info(f"Benchmark report written to {path}")
+
+    return {**report, 'report_path': str(path)}
 
-    wall_start = time.time()
-    total_audio = 0.0
-    total_proc = 0.0
-    processed = 0
-
-    for sample in samples:
-        if time.time() - wall_start > duration:
-            break
-        # Preprocess at conservative settings for comparability
-        proc = processor.process_file(
-            sample,
-            Path(processor.temp_dir) / "bm",
-            speed_multiplier=1.0,
-            remove_silence=False,
-            normalize=True,
-            target_sample_rate=16000,
-            target_channels=1,
-        )
-        chunks = chunker.chunk_audio(proc.processed_path, remove_silence=False)
-        if not chunks.chunks:
-            continue
-        # Transcribe only first chunk to bound runtime
-        first_chunk = chunks.chunks[0]
-        start = time.time()
-        result = transcriber.transcribe_chunk(first_chunk, word_timestamps=False)
-        elapsed = time.time() - start
-        total_audio += first_chunk.duration
-        total_proc += elapsed
-        processed += 1
-
-    mem = psutil.virtual_memory().percent
-    cpu = psutil.cpu_percent(interval=0.2)
-    speed = (total_audio / total_proc) if total_proc > 0 else 0.0
+
+def compare_benchmarks(
+    baseline_path: Path,
+    candidate_path: Path,
+    threshold: float,
+    min_delta: float,
+) -> Dict[str, Any]:
+    """
+    Compare two benchmark reports stage by stage.
+
+    Args:
+        baseline_path: Earlier report
+        candidate_path: Report under test
+        threshold: Relative slowdown tolerated (0.10 = 10%)
+        min_delta: Slowdowns smaller than this many seconds are ignored
+
+    Returns:
+        Dictionary with the comparisons, the regressions and any
+        environment fields that differ between the runs
+    """
+    from ...benchmark import compare_reports, load_report
+    from ...benchmark.report import environment_differences
+
+    baseline = load_report(baseline_path)
+    candidate = load_report(candidate_path)
+    comparisons = compare_reports(baseline, candidate, threshold=threshold, min_delta=min_delta)
 
     return {
-        'processing_speed': round(speed, 2),
-        'memory_usage': mem,
-        'cpu_usage': cpu,
-        'samples': processed,
-    }
\ No newline at end of file
+        'comparisons': comparisons,
+        'regressions': [c for c in comparisons if c.status == 'regression'],
+        'environment_differences': environment_differences(baseline, candidate),
+    }
+
+
+def run_import_benchmark(module: str, repeats: int, budget: float) -> Dict[str, Any]:
+    """
+    Measure cold-start import time against a budget.
+
+    Args:
+        module: Module to import in a fresh interpreter
+        repeats: Measured interpreter starts
+        budget: Allowed total import time in seconds
+
+    Returns:
+        The measurement, with 'over_budget' set when the import took
+        longer than ``budget`` or loaded any of the heavy packages
+    """
+    from ...benchmark.imports import measure_import_time
+
+    result = measure_import_time(module, repeats=repeats)
+    result['budget_seconds'] = budget
+    result['over_budget'] = result['import_seconds'] > budget or bool(result['heavy_modules'])
+    return result
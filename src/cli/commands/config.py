@@ -55,7 +55,7 @@ def _show_config_section(console: Console, config: TalkGPTConfig, section_name:
     section_config = getattr(config, section_name, None)
     if not section_config:
         console.print(f"❌ [red]Section '{section_name}' not found[/red]")
-        console.print("Available sections: processing, transcription, output, analytics, logging, resources")
+        console.print("Available sections: processing, transcription, output, analytics, logging, resources, cache")
         return
     
     table = Table(title=f"{section_name.title()} Configuration")
@@ -231,7 +231,7 @@ def validate_config(config: TalkGPTConfig, quiet: bool = False) -> bool:
         errors.append(f"Invalid device. Must be one of: {', '.join(valid_devices)}")
     
     # Validate output settings
-    valid_formats = ["srt", "json", "txt", "csv"]
+    valid_formats = ["srt", "json", "txt", "csv", "npz"]
     for fmt in config.output.formats:
         if fmt not in valid_formats:
             errors.append(f"Invalid output format: {fmt}")
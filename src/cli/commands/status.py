@@ -21,7 +21,7 @@ except ImportError:
     from utils.logger import get_logger
 
 
-def show_system_status(quiet: bool = False):
+def show_system_status(quiet: bool = False, refresh: bool = False):
     """Display comprehensive system status information."""
     console = Console()
     
@@ -37,7 +37,7 @@ def show_system_status(quiet: bool = False):
             disable=quiet
         ) as progress:
             task = progress.add_task("Detecting hardware...", total=None)
-            hardware = detect_hardware()
+            hardware = detect_hardware(refresh)
             progress.update(task, completed=True)
         
         if quiet:
@@ -56,8 +56,8 @@ def show_system_status(quiet: bool = False):
         
         # Basic system info
         system_table.add_row("Platform", hardware.platform, "")
-        system_table.add_row("CPU Cores", str(hardware.cpu_cores), "Physical + Logical")
-        system_table.add_row("Memory", f"{hardware.memory_gb:.1f} GB", "Total RAM")
+        system_table.add_row("CPU Cores", str(hardware.cpu_cores), "Usable (affinity mask and cgroup quota)")
+        system_table.add_row("Memory", f"{hardware.memory_gb:.1f} GB", "Total RAM (cgroup limit applied)")
         
         # GPU information
         if hardware.gpu_available:
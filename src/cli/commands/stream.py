@@ -1,36 +1,56 @@
 """
-Streaming transcription (MVP) - optional dependency on sounddevice.
+Streaming transcription - optional dependency on sounddevice for microphone input.
 """
 
-from pathlib import Path
-from typing import Optional
+import sys
 import time
-import tempfile
+from pathlib import Path
+from typing import List, Optional
 
 
 def stream_transcription(
     duration: int,
     device: Optional[int],
     language: Optional[str],
-    chunk_seconds: float,
-    overlap_seconds: float,
+    step_seconds: float,
+    window_seconds: float,
     config,
     logger,
+    input_file: Optional[Path] = None,
+    show_partials: bool = True,
 ) -> bool:
-    try:
-        import sounddevice as sd
-        import soundfile as sf
-    except Exception:
-        print("Streaming requires 'sounddevice' (optional). Please install: pip install sounddevice")
-        return False
+    """
+    Caption live audio, printing words as they are confirmed.
 
-    samplerate = 16000
-    channels = 1
-    if device is not None:
-        sd.default.device = device
+    Args:
+        duration: Maximum seconds to stream
+        device: Input device index (microphone only)
+        language: Language code (None for auto-detection)
+        step_seconds: Seconds of new audio between decodes
+        window_seconds: Maximum decode window
+        config: TalkGPT configuration
+        logger: Logger instance
+        input_file: Replay this file at real time instead of the microphone
+        show_partials: Show tentative words on the current line
+
+    Returns:
+        True on success
+    """
+    from ...core.streaming import (
+        StreamingTranscriber, FileAudioSource, MicrophoneAudioSource, StreamWord, whisper_decoder
+    )
+
+    if input_file is not None:
+        source = FileAudioSource(input_file)
+    else:
+        try:
+            import sounddevice  # noqa: F401
+        except Exception:
+            print("Streaming requires 'sounddevice' (optional). Please install: pip install sounddevice")
+            return False
+        source = MicrophoneAudioSource(device)
 
     from ...core.transcriber import get_transcriber
-    from ...core.chunker import SmartChunker, AudioChunk, ChunkingResult
     from ...core.resource_detector import get_device_config
 
     device_cfg = get_device_config(
@@ -40,57 +60,63 @@ def stream_transcription(
         model_size=config.transcription.model_size,
         device=device_cfg['device'],
         compute_type=device_cfg['compute_type'],
+        cpu_threads=config.resources.cpu_threads,
     )
 
-    print("🎤 Streaming... Press Ctrl+C to stop.")
-    start_time = time.time()
-    last_end = 0.0
-    temp_dir = Path(tempfile.gettempdir()) / "talkgpt_stream"
-    temp_dir.mkdir(exist_ok=True)
+    line = {'partial': ''}
 
-    try:
-        with sd.InputStream(samplerate=samplerate, channels=channels):
-            while time.time() - start_time < duration:
-                frames = int(chunk_seconds * samplerate)
-                audio = sd.rec(frames, samplerate=samplerate, channels=channels, dtype='float32')
-                sd.wait()
-                # Save chunk to wav
-                wav_path = temp_dir / f"chunk_{int(last_end)}.wav"
-                sf.write(str(wav_path), audio, samplerate)
+    def clear_partial():
+        if line['partial']:
+            sys.stdout.write("\r" + " " * len(line['partial']) + "\r")
+            line['partial'] = ''
+
+    def on_confirmed(words: List[StreamWord]):
+        clear_partial()
+        ts = time.strftime('%H:%M:%S', time.gmtime(words[0].start))
+        print(f"[{ts}] {' '.join(word.text for word in words)}", flush=True)
 
-                # Create a synthetic AudioChunk and result wrapper for transcribe_chunk
-                chunk = AudioChunk(
-                    chunk_id=int(last_end),
-                    start_time=last_end - overlap_seconds if last_end > 0 else 0.0,
-                    end_time=last_end + chunk_seconds,
-                    duration=chunk_seconds + (overlap_seconds if last_end > 0 else 0.0),
-                    file_path=wav_path,
-                    original_start=last_end,
-                    original_end=last_end + chunk_seconds,
-                    overlap_prev=overlap_seconds if last_end > 0 else 0.0,
-                    overlap_next=0.0,
-                )
+    def on_partial(words: List[StreamWord]):
+        clear_partial()
+        if words:
+            line['partial'] = "... " + " ".join(word.text for word in words)
+            sys.stdout.write(line['partial'])
+            sys.stdout.flush()
 
-                result = transcriber.transcribe_chunk(
-                    chunk,
-                    language=language,
-                    temperature=config.transcription.temperature,
-                    beam_size=config.transcription.beam_size,
-                    word_timestamps=False,
-                )
-                # Print incremental result
-                text = result.text.strip()
-                if text:
-                    ts = time.strftime('%H:%M:%S', time.gmtime(last_end))
-                    print(f"[{ts}] {text}")
+    engine = StreamingTranscriber(
+        whisper_decoder(
+            transcriber,
+            language=language,
+            beam_size=config.transcription.beam_size,
+            temperature=config.transcription.temperature,
+        ),
+        step_seconds=step_seconds,
+        max_window_seconds=window_seconds,
+        on_confirmed=on_confirmed,
+        on_partial=on_partial if show_partials else None,
+    )
 
-                last_end += chunk_seconds
-        return True
+    print("🎤 Streaming... Press Ctrl+C to stop.")
+    try:
+        engine.run(source, timeout=duration)
     except KeyboardInterrupt:
+        try:
+            engine.finish()
+        except Exception as e:
+            # finish() re-raises a decoder failure from the worker thread
+            clear_partial()
+            print(f"\nStreaming error: {e}")
+            return False
+        clear_partial()
         print("\n⏹️  Stopped streaming.")
-        return True
     except Exception as e:
+        clear_partial()
         print(f"Streaming error: {e}")
         return False
 
-
+    clear_partial()
+    stats = engine.stats()
+    logger.get_logger("talkgpt.stream").info(
+        f"Streaming finished: {stats['confirmed_words']} words, {stats['decodes']} decodes, "
+        f"avg decode {stats['avg_decode_seconds']:.2f}s, avg confirm lag {stats['avg_confirm_lag']:.2f}s"
+    )
+    return True
@@ -4,25 +4,34 @@ TalkGPT CLI Transcription Commands
 Implementation of single-file transcription command with all advanced features.
 """
 
+import os
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 try:
     from ...core.file_processor import get_file_processor
-    from ...core.chunker import get_smart_chunker
+    from ...core.chunker import ChunkStream, get_smart_chunker
     from ...core.transcriber import get_transcriber
+    from ...core.diarization import get_diarization_store
+    from ...utils.cache import ResultCache, get_configured_cache, hash_file
     from ...utils.config import TalkGPTConfig
     from ...utils.logger import TalkGPTLogger
+    from ...utils.tracing import record_output_file, traced
+    from ...utils.json_stream import dump_json, write_json
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent.parent))
     from core.file_processor import get_file_processor
-    from core.chunker import get_smart_chunker
+    from core.chunker import ChunkStream, get_smart_chunker
     from core.transcriber import get_transcriber
+    from core.diarization import get_diarization_store
+    from utils.cache import ResultCache, get_configured_cache, hash_file
     from utils.config import TalkGPTConfig
     from utils.logger import TalkGPTLogger
+    from utils.tracing import record_output_file, traced
+    from utils.json_stream import dump_json, write_json
 
 # Import analytics modules only when needed to avoid DLL issues
 def get_speaker_analyzer():
@@ -133,49 +142,82 @@ def transcribe_single_file(input_path: Path,
     file_logger = logger.get_file_logger(str(input_path))
     file_logger.info(f"Starting single file transcription: {input_path}")
     
+    chunking_result = None
     try:
         # Apply configuration overrides
         effective_config = _apply_options_to_config(config, options)
         
-        # Step 1: File Processing
-        file_logger.info("Step 1: Processing audio file")
         processor = get_file_processor()
         
         # Accuracy-first: default speed 1.0; allow CLI override
         eff_speed = options.get('speed_multiplier', 1.0 if options.get('enhanced_analysis', False) else effective_config.processing.speed_multiplier)
-        processing_result = processor.process_file(
-            input_path,
-            output_dir / "processed",
-            speed_multiplier=eff_speed,
-            remove_silence=effective_config.processing.remove_silence,
-            normalize=True,
-            target_sample_rate=16000,
-            target_channels=1
-        )
-        
-        file_logger.info(f"File processing completed: {processing_result.processing_time:.2f}s")
-        
-        # Step 2: Smart Chunking
-        file_logger.info("Step 2: Smart audio chunking")
-        chunker = get_smart_chunker(
-            chunk_size=effective_config.processing.chunk_size,
-            overlap_duration=effective_config.processing.overlap_duration,
-            silence_threshold=effective_config.processing.silence_threshold,
-            min_silence_len=effective_config.processing.min_silence_len
-        )
         
-        chunking_result = chunker.chunk_audio(
-            processing_result.processed_path,
-            output_dir / "chunks",
-            remove_silence=False  # Already done in processing
-        )
-        
-        file_logger.info(f"Chunking completed: {chunking_result.total_chunks} chunks in {chunking_result.processing_time:.2f}s")
+        # Whole-file result cache: unchanged audio + settings skips steps 1-4
+        result_cache = get_configured_cache(effective_config.cache)
+        file_cache_key = None
+        cached = None
+        if result_cache is not None:
+            file_cache_key = ResultCache.make_key(
+                "file", hash_file(input_path), _file_cache_params(effective_config, options, eff_speed)
+            )
+            cached = result_cache.get(file_cache_key)
+        # Overlap detection and speaker analysis share one diarization,
+        # persisted only when the cache is enabled
+        get_diarization_store(result_cache)
+        
+        processing_result = None
+        if cached is not None:
+            file_logger.info("Result cache hit: reusing transcription, skipping processing and decoding")
+        else:
+            # Step 1: File Processing
+            file_logger.info("Step 1: Processing audio file")
+            processing_result = processor.process_file(
+                input_path,
+                output_dir / "processed",
+                speed_multiplier=eff_speed,
+                remove_silence=effective_config.processing.remove_silence,
+                normalize=True,
+                target_sample_rate=16000,
+                target_channels=1,
+                keep_intermediates=effective_config.processing.keep_intermediates
+            )
+            
+            file_logger.info(f"File processing completed: {processing_result.processing_time:.2f}s")
+            
+            # Step 2: Smart Chunking
+            file_logger.info("Step 2: Smart audio chunking")
+            chunker = get_smart_chunker(
+                chunk_size=effective_config.processing.chunk_size,
+                overlap_duration=effective_config.processing.overlap_duration,
+                silence_threshold=effective_config.processing.silence_threshold,
+                min_silence_len=effective_config.processing.min_silence_len
+            )
+            
+            # Chunks stream into step 3 while later ones are still being cut
+            if processing_result.audio is not None:
+                # Chunks are views into the decoded buffer; nothing is re-exported
+                chunking_result = chunker.stream_array(
+                    processing_result.audio,
+                    sample_rate=processing_result.sample_rate,
+                    original_file=processing_result.processed_path,
+                    remove_silence=False  # Already done in processing
+                )
+            else:
+                chunking_result = chunker.stream_audio(
+                    processing_result.processed_path,
+                    output_dir / "chunks",
+                    remove_silence=False  # Already done in processing
+                )
         
         # Step 3: Enhanced Transcription with Analysis
         enhanced_analysis = options.get('enhanced_analysis', False)
         
-        if enhanced_analysis:
+        if cached is not None:
+            transcription_result = cached['transcription_result']
+            enhanced_records = cached['enhanced_records']
+            analysis_context = cached['analysis_context']
+            enhanced_analysis = enhanced_records is not None
+        elif enhanced_analysis:
             file_logger.info("Step 3: Enhanced Whisper transcription with word-gap analysis")
             
             # Import enhanced transcription function
@@ -193,10 +235,15 @@ def transcribe_single_file(input_path: Path,
                     gap_tolerance=options.get('gap_tolerance', 0.25),
                     gap_threshold=options.get('gap_threshold', 1.5),
                     enable_overlap_detection=True,
+                    time_map=processing_result.time_map,
                     language=options.get('language'),
                     temperature=effective_config.transcription.temperature,
                     beam_size=effective_config.transcription.beam_size,
-                    timing_repair=options.get('timing_repair', True)
+                    timing_repair=options.get('timing_repair', True),
+                    num_workers=effective_config.processing.max_workers or 1,
+                    result_cache=result_cache,
+                    batch_size=effective_config.transcription.batch_size,
+                    cpu_threads=effective_config.resources.cpu_threads
                 )
                 
                 # Extract standard transcription result for compatibility
@@ -212,7 +259,7 @@ def transcribe_single_file(input_path: Path,
                 file_logger.warning(f"Enhanced analysis not available, falling back to standard: {e}")
                 enhanced_analysis = False
         
-        if not enhanced_analysis:
+        if cached is None and not enhanced_analysis:
             file_logger.info("Step 3: Standard Whisper transcription")
             from ...core.resource_detector import get_device_config
             device_cfg = get_device_config(
@@ -221,12 +268,17 @@ def transcribe_single_file(input_path: Path,
             transcriber = get_transcriber(
                 model_size=effective_config.transcription.model_size,
                 device=device_cfg['device'],
-                compute_type=device_cfg['compute_type']
+                compute_type=device_cfg['compute_type'],
+                num_workers=effective_config.processing.max_workers or 1,
+                result_cache=result_cache,
+                batch_size=effective_config.transcription.batch_size,
+                cpu_threads=effective_config.resources.cpu_threads
             )
             
             transcription_result = transcriber.transcribe_file(
                 processing_result.processed_path,
                 chunking_result,
+                time_map=processing_result.time_map,
                 language=options.get('language'),
                 temperature=effective_config.transcription.temperature,
                 beam_size=effective_config.transcription.beam_size,
@@ -236,12 +288,19 @@ def transcribe_single_file(input_path: Path,
             enhanced_records = None
             analysis_context = None
         
+        if isinstance(chunking_result, ChunkStream):
+            # Transcription consumed the stream; collect the finished chunking result
+            chunking_result = chunking_result.result
+            file_logger.info(f"Chunking completed: {chunking_result.total_chunks} chunks in {chunking_result.processing_time:.2f}s")
+        
         file_logger.info(f"Transcription completed: {transcription_result.chunks_processed} chunks, "
                         f"speed: {transcription_result.performance_metrics['processing_speed']:.1f}x real-time")
         
         # Step 4: Speaker Analysis (if enabled)
         speaker_result = None
-        if effective_config.analytics.enable_speaker_diarization:
+        if cached is not None:
+            speaker_result = cached['speaker_result']
+        elif effective_config.analytics.enable_speaker_diarization:
             file_logger.info("Step 4: Speaker diarization")
             try:
                 # Auto-route backend by CLI option and platform
@@ -257,7 +316,8 @@ def transcribe_single_file(input_path: Path,
                 if speaker_analyzer and hasattr(speaker_analyzer, 'pipeline') and speaker_analyzer.pipeline is not None:
                     speaker_result = speaker_analyzer.enhance_transcription(
                         transcription_result,
-                        processing_result.processed_path
+                        processing_result.processed_path,
+                        time_map=processing_result.time_map
                     )
                     file_logger.info(f"Speaker analysis completed: {speaker_result.diarization_result.speaker_count} speakers")
                 else:
@@ -265,6 +325,14 @@ def transcribe_single_file(input_path: Path,
             except Exception as e:
                 file_logger.warning(f"Speaker analysis failed: {e}")
         
+        if file_cache_key is not None and cached is None:
+            result_cache.put(file_cache_key, {
+                'transcription_result': transcription_result,
+                'enhanced_records': enhanced_records,
+                'analysis_context': analysis_context,
+                'speaker_result': speaker_result
+            }, kind="file")
+        
         # Step 5: Uncertainty Analysis (if enabled)
         uncertainty_result = None
         if effective_config.analytics.enable_uncertainty_detection:
@@ -281,9 +349,10 @@ def transcribe_single_file(input_path: Path,
                         # Fallback if factory doesn't accept arguments
                         uncertainty_detector = uncertainty_detector_factory()
                     
+                    # On a cache hit nothing was processed; the path only names the log
                     uncertainty_result = uncertainty_detector.analyze_uncertainty(
                         transcription_result,
-                        processing_result.processed_path
+                        processing_result.processed_path if processing_result is not None else input_path
                     )
                     
                     # Handle different types of uncertainty results
@@ -346,7 +415,8 @@ def transcribe_single_file(input_path: Path,
                 uncertainty_result,
                 output_dir,
                 effective_config.output.formats,
-                input_path.stem
+                input_path.stem,
+                include_chunks=effective_config.output.json_include_chunks
             )
             file_logger.info("Enhanced outputs with word-gap analysis generated")
         elif timing_buckets and cadence_analysis:
@@ -371,7 +441,8 @@ def transcribe_single_file(input_path: Path,
                     uncertainty_result,
                     output_dir,
                     effective_config.output.formats,
-                    input_path.stem
+                    input_path.stem,
+                    include_chunks=effective_config.output.json_include_chunks
                 )
                 file_logger.warning("Enhanced output generator not available, using standard outputs")
         else:
@@ -382,7 +453,8 @@ def transcribe_single_file(input_path: Path,
                 uncertainty_result,
                 output_dir,
                 effective_config.output.formats,
-                input_path.stem
+                input_path.stem,
+                include_chunks=effective_config.output.json_include_chunks
             )
         
         # Calculate final metrics
@@ -415,6 +487,7 @@ def transcribe_single_file(input_path: Path,
                 if uncertainty_result else None
             ),
             'chunks_processed': transcription_result.chunks_processed,
+            'cache_hit': cached is not None,
             'performance_metrics': convert_paths_to_strings(transcription_result.performance_metrics),
             # Timing analysis metrics
             'timing_analysis': {
@@ -431,16 +504,46 @@ def transcribe_single_file(input_path: Path,
         
         # Cleanup temporary files
         processor.cleanup_temp_files()
-        if chunking_result.chunks:
+        if chunking_result is not None and chunking_result.chunks:
             chunker.cleanup_chunks(chunking_result)
         
         return result
         
     except Exception as e:
         file_logger.error(f"Single file transcription failed: {e!r}")
+        if isinstance(chunking_result, ChunkStream):
+            chunking_result.close()
         raise
 
 
+def _file_cache_params(config: TalkGPTConfig, options: Dict[str, Any], speed_multiplier: float) -> Dict[str, Any]:
+    """Settings that change the cached whole-file result; output formats are deliberately absent."""
+    params = {
+        'model_size': config.transcription.model_size,
+        'device': config.transcription.device,
+        'compute_type': config.transcription.compute_type,
+        'beam_size': config.transcription.beam_size,
+        'batch_size': config.transcription.batch_size,
+        'temperature': config.transcription.temperature,
+        'language': config.transcription.language,
+        'chunk_size': config.processing.chunk_size,
+        'overlap_duration': config.processing.overlap_duration,
+        'silence_threshold': config.processing.silence_threshold,
+        'min_silence_len': config.processing.min_silence_len,
+        'remove_silence': config.processing.remove_silence,
+        'speed_multiplier': speed_multiplier,
+        'word_timestamps': config.output.word_timestamps,
+        'speaker_diarization': config.analytics.enable_speaker_diarization,
+        'diarization_backend': options.get('diarization_backend', 'auto'),
+        'enhanced_analysis': options.get('enhanced_analysis', False)
+    }
+    if params['enhanced_analysis']:
+        for name, default in (('bucket_seconds', 4.0), ('gap_tolerance', 0.25),
+                              ('gap_threshold', 1.5), ('timing_repair', True)):
+            params[name] = options.get(name, default)
+    return params
+
+
 def _apply_options_to_config(config: TalkGPTConfig, options: Dict[str, Any]) -> TalkGPTConfig:
     """Apply CLI options to configuration."""
     # Create a copy to avoid modifying the original
@@ -457,6 +560,12 @@ def _apply_options_to_config(config: TalkGPTConfig, options: Dict[str, Any]) ->
     if 'remove_silence' in options:
         effective_config.processing.remove_silence = options['remove_silence']
     
+    if options.get('keep_intermediates'):
+        effective_config.processing.keep_intermediates = True
+    
+    if 'cache' in options:
+        effective_config.cache.enabled = options['cache']
+    
     # Apply transcription options
     if 'device' in options:
         effective_config.transcription.device = options['device']
@@ -464,6 +573,9 @@ def _apply_options_to_config(config: TalkGPTConfig, options: Dict[str, Any]) ->
     if 'language' in options:
         effective_config.transcription.language = options['language']
     
+    if 'batch_size' in options:
+        effective_config.transcription.batch_size = options['batch_size']
+    
     # Apply output options
     if 'formats' in options:
         effective_config.output.formats = options['formats']
@@ -478,12 +590,15 @@ def _apply_options_to_config(config: TalkGPTConfig, options: Dict[str, Any]) ->
     return effective_config
 
 
+@traced("writers")
 def _generate_output_files(transcription_result,
                           speaker_result,
                           uncertainty_result,
                           output_dir: Path,
                           formats: List[str],
-                          base_name: str) -> Dict[str, str]:
+                          base_name: str,
+                          include_chunks: bool = True,
+                          records: Optional[List] = None) -> Dict[str, str]:
     """Generate all requested output files."""
     output_files = {}
     
@@ -501,13 +616,17 @@ def _generate_output_files(transcription_result,
         if format_type == "srt":
             _generate_srt_file(primary_result, output_file, segments)
         elif format_type == "json":
-            _generate_json_file(primary_result, speaker_result, uncertainty_result, output_file)
+            _generate_json_file(primary_result, speaker_result, uncertainty_result, output_file, include_chunks)
         elif format_type == "txt":
             _generate_txt_file(primary_result, output_file, segments)
         elif format_type == "csv":
             _generate_csv_file(primary_result, output_file, segments)
+        elif format_type == "npz":
+            from ...output.columnar import write_columnar_transcript
+            write_columnar_transcript(primary_result, output_file, records)
         
         output_files[format_type] = str(output_file)
+        record_output_file(output_file, format_type)
     
     return output_files
 
@@ -540,46 +659,21 @@ def _generate_srt_file(transcription_result, output_file: Path, speaker_segments
             f.write(f"{text}\n\n")
 
 
-def _generate_json_file(transcription_result, speaker_result, uncertainty_result, output_file: Path):
-    """Generate comprehensive JSON file."""
-    import json
-    from dataclasses import asdict
-    from pathlib import Path
-    
-    def convert_paths_to_strings(obj):
-        """Convert Path objects to strings for JSON serialization."""
-        if isinstance(obj, Path):
-            return str(obj)
-        elif isinstance(obj, dict):
-            return {k: convert_paths_to_strings(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [convert_paths_to_strings(item) for item in obj]
-        else:
-            return obj
-    
-    # Safely convert dataclasses to dicts, handling Path objects
-    try:
-        transcription_data = convert_paths_to_strings(asdict(transcription_result)) if transcription_result else None
-    except Exception as e:
-        # Fallback: create basic transcription data
-        transcription_data = {
-            'language': getattr(transcription_result, 'language', 'unknown'),
-            'segments_count': len(getattr(transcription_result, 'segments', [])),
-            'processing_time': getattr(transcription_result, 'total_processing_time', 0)
-        }
-    
-    try:
-        speaker_data = convert_paths_to_strings(asdict(speaker_result)) if speaker_result else None
-    except Exception:
-        speaker_data = {'speaker_count': getattr(speaker_result, 'speaker_count', 0)} if speaker_result else None
-    
-    try:
-        uncertainty_data = convert_paths_to_strings(asdict(uncertainty_result)) if uncertainty_result else None
-    except Exception:
-        uncertainty_data = {'flagged_segments': 0} if uncertainty_result else None
+def _generate_json_file(transcription_result, speaker_result, uncertainty_result, output_file: Path,
+                        include_chunks: bool = True):
+    """
+    Generate comprehensive JSON file.
     
+    Results are written while they are walked rather than converted with
+    ``asdict`` first; ``include_chunks=False`` leaves out the per-chunk
+    results, which repeat the merged segments. A section holding
+    unserializable objects is replaced by a basic summary on its own.
+    """
+    speaker_data = _json_section(
+        speaker_result, {'speaker_count': getattr(speaker_result, 'speaker_count', 0)})
+    uncertainty_data = _json_section(uncertainty_result, {'flagged_segments': 0})
     data = {
-        'transcription': transcription_data,
+        'transcription': transcription_result,
         'speaker_analysis': speaker_data,
         'uncertainty_analysis': uncertainty_data,
         'metadata': {
@@ -588,9 +682,31 @@ def _generate_json_file(transcription_result, speaker_result, uncertainty_result
             'format': 'TalkGPT JSON v1.0'
         }
     }
+    exclude = () if include_chunks else ('chunk_results',)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    try:
+        write_json(data, output_file, exclude=exclude)
+    except (TypeError, ValueError):
+        # The other sections were checked above, so the transcription failed.
+        # It is too large to check with a trial write first.
+        data['transcription'] = {
+            'language': getattr(transcription_result, 'language', 'unknown'),
+            'segments_count': len(getattr(transcription_result, 'segments', [])),
+            'processing_time': getattr(transcription_result, 'total_processing_time', 0)
+        }
+        write_json(data, output_file)
+
+
+def _json_section(result, summary: Dict[str, Any]):
+    """``result`` if the JSON writer can serialize it, otherwise ``summary``."""
+    if not result:
+        return None
+    try:
+        with open(os.devnull, 'wb') as sink:
+            dump_json(result, sink)
+    except (TypeError, ValueError):
+        return summary
+    return result
 
 
 def _generate_txt_file(transcription_result, output_file: Path, speaker_segments=None):
@@ -674,6 +790,7 @@ def _format_timestamp(seconds: float) -> str:
     secs = int(seconds % 60)
     return f"{minutes:02d}:{secs:02d}"
 
+@traced("enhanced_writers")
 def _generate_enhanced_output_files(enhanced_records,
                                    analysis_context,
                                    transcription_result,
@@ -681,7 +798,8 @@ def _generate_enhanced_output_files(enhanced_records,
                                    uncertainty_result,
                                    output_dir: Path,
                                    formats: List[str],
-                                   base_name: str) -> Dict[str, str]:
+                                   base_name: str,
+                                   include_chunks: bool = True) -> Dict[str, str]:
     """Generate enhanced output files with comprehensive word-gap analysis."""
     output_files = {}
     
@@ -692,7 +810,9 @@ def _generate_enhanced_output_files(enhanced_records,
         uncertainty_result,
         output_dir,
         formats,
-        base_name
+        base_name,
+        include_chunks,
+        records=enhanced_records
     )
     output_files.update(standard_files)
     
@@ -723,6 +843,7 @@ def _generate_enhanced_output_files(enhanced_records,
         )
         
         output_files['enhanced_markdown'] = str(enhanced_md_file)
+        record_output_file(enhanced_md_file, 'enhanced_markdown')
         
     except ImportError as e:
         print(f"Warning: Enhanced markdown output not available: {e}")
@@ -748,7 +869,8 @@ def _generate_enhanced_output_files(enhanced_records,
                 'slow_threshold': analysis_context.slow_threshold,
                 'fast_threshold': analysis_context.fast_threshold
             },
-            'timing_buckets': [record.to_dict() for record in enhanced_records],
+            # Streamed one record at a time by write_json
+            'timing_buckets': (record.to_dict() for record in enhanced_records),
             'original_transcription': {
                 'language': getattr(transcription_result, 'language', 'unknown'),
                 'segments_count': len(getattr(transcription_result, 'segments', [])),
@@ -772,11 +894,10 @@ def _generate_enhanced_output_files(enhanced_records,
             }
         }
         
-        import json
-        with open(enhanced_json_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_data, f, indent=2, ensure_ascii=False)
+        write_json(enhanced_data, enhanced_json_file)
         
         output_files['enhanced_json'] = str(enhanced_json_file)
+        record_output_file(enhanced_json_file, 'enhanced_json')
         
     except Exception as e:
         print(f"Warning: Enhanced JSON output failed: {e}")
@@ -17,10 +17,13 @@ import click
 from pathlib import Path
 from typing import Optional, List
 
+# Only what every command needs is imported here. Hardware probing, the
+# transcriber and the audio stack load inside the commands that use them,
+# which keeps `talkgpt --help` and `talkgpt config show` fast; the budget is
+# enforced by tests/cli/test_import_time.py.
 try:
     from ..utils.config import ConfigManager, load_config
     from ..utils.logger import setup_logging, get_talkgpt_logger
-    from ..core.resource_detector import detect_hardware
     # Ensure console is UTF-8 friendly on Windows terminals
     from ..utils.encoding import force_utf8_stdio
 except ImportError:
@@ -28,7 +31,7 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.config import ConfigManager, load_config
     from utils.logger import setup_logging, get_talkgpt_logger
-    from core.resource_detector import detect_hardware
+    from utils.encoding import force_utf8_stdio
 
 
 # Global context for CLI
@@ -51,9 +54,12 @@ pass_context = click.make_pass_decorator(CLIContext, ensure=True)
               default='INFO', help='Logging level')
 @click.option('--quiet', '-q', is_flag=True, help='Suppress console output')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+@click.option('--metrics-file', type=click.Path(),
+              help='Write pipeline metrics and trace spans on exit (.prom for Prometheus text, else JSON)')
 @click.version_option(version='0.1.0', prog_name='TalkGPT')
 @pass_context
-def cli(ctx: CLIContext, config: Optional[str], log_level: str, quiet: bool, verbose: bool):
+def cli(ctx: CLIContext, config: Optional[str], log_level: str, quiet: bool, verbose: bool,
+        metrics_file: Optional[str]):
     """
     TalkGPT - AI-Powered Transcription Pipeline
     
@@ -69,6 +75,10 @@ def cli(ctx: CLIContext, config: Optional[str], log_level: str, quiet: bool, ver
     ctx.quiet = quiet
     ctx.verbose = verbose
     
+    if metrics_file:
+        from ..utils.tracing import write_metrics_file
+        click.get_current_context().call_on_close(lambda: write_metrics_file(metrics_file))
+    
     try:
         # Load configuration
         if config:
@@ -104,7 +114,7 @@ def cli(ctx: CLIContext, config: Optional[str], log_level: str, quiet: bool, ver
 @click.option('--output', '-o', type=click.Path(), 
               help='Output directory (default: same as input)')
 @click.option('--format', '-f', 'formats', multiple=True, 
-              type=click.Choice(['srt', 'json', 'txt', 'csv']),
+              type=click.Choice(['srt', 'json', 'txt', 'csv', 'npz']),
               help='Output formats (can be used multiple times)')
 @click.option('--speed-multiplier', '-s', type=float, 
               help='Audio speed multiplier (1.0-3.0)')
@@ -112,6 +122,8 @@ def cli(ctx: CLIContext, config: Optional[str], log_level: str, quiet: bool, ver
               help='Number of parallel workers')
 @click.option('--device', type=click.Choice(['auto', 'cpu', 'cuda', 'mps']),
               help='Processing device (auto-routes compute type for accuracy)')
+@click.option('--batch-size', type=click.IntRange(1, 64),
+              help='Chunks decoded per batched inference call (1 = sequential)')
 @click.option('--language', '-l', type=str, 
               help='Audio language (auto-detect if not specified)')
 @click.option('--analyze-speakers/--no-analyze-speakers', default=None,
@@ -120,6 +132,10 @@ def cli(ctx: CLIContext, config: Optional[str], log_level: str, quiet: bool, ver
               help='Enable/disable uncertainty detection')
 @click.option('--remove-silence/--keep-silence', default=None,
               help='Remove silence from audio')
+@click.option('--keep-intermediates', is_flag=True, default=False,
+              help='Debug: run preprocessing step by step and keep intermediate WAVs')
+@click.option('--cache/--no-cache', default=None,
+              help='Reuse cached results for unchanged audio and settings')
 @click.option('--bucket-seconds', type=float, default=4.0,
               help='Target duration for timing buckets in seconds (default: 4.0)')
 @click.option('--gap-tolerance', type=float, default=0.25,
@@ -135,10 +151,10 @@ def cli(ctx: CLIContext, config: Optional[str], log_level: str, quiet: bool, ver
 @pass_context
 def transcribe(ctx: CLIContext, input_path: str, output: Optional[str], 
                formats: List[str], speed_multiplier: Optional[float],
-               workers: Optional[int], device: Optional[str], 
+               workers: Optional[int], device: Optional[str], batch_size: Optional[int],
                language: Optional[str], analyze_speakers: Optional[bool],
                analyze_uncertainty: Optional[bool], remove_silence: Optional[bool],
-               bucket_seconds: float, gap_tolerance: float, gap_threshold: float,
+               keep_intermediates: bool, cache: Optional[bool], bucket_seconds: float, gap_tolerance: float, gap_threshold: float,
                enhanced_analysis: bool, timing_repair: bool,
                diarization_backend: str):
     """
@@ -155,10 +171,13 @@ def transcribe(ctx: CLIContext, input_path: str, output: Optional[str],
         'speed_multiplier': speed_multiplier,
         'workers': workers,
         'device': device,
+        'batch_size': batch_size,
         'language': language,
         'analyze_speakers': analyze_speakers,
         'analyze_uncertainty': analyze_uncertainty,
         'remove_silence': remove_silence,
+        'keep_intermediates': keep_intermediates,
+        'cache': cache,
         'bucket_seconds': bucket_seconds,
         'gap_tolerance': gap_tolerance,
         'gap_threshold': gap_threshold,
@@ -195,7 +214,7 @@ def transcribe(ctx: CLIContext, input_path: str, output: Optional[str],
 @click.option('--output', '-o', type=click.Path(), required=True,
               help='Output directory for all transcriptions')
 @click.option('--format', '-f', 'formats', multiple=True,
-              type=click.Choice(['srt', 'json', 'txt', 'csv']),
+              type=click.Choice(['srt', 'json', 'txt', 'csv', 'npz']),
               help='Output formats (can be used multiple times)')
 @click.option('--pattern', '-p', type=str, default='*',
               help='File pattern to match (e.g., "*.mp3")')
@@ -234,6 +253,15 @@ def batch(ctx: CLIContext, input_dir: str, output: str, formats: List[str],
     # Remove None values
     options = {k: v for k, v in options.items() if v is not None}
     
+    if not ctx.quiet:
+        def report(entry):
+            name = Path(entry['file']).name
+            if entry['status'] == 'success':
+                click.echo(f"   done: {name} ({entry['result'].get('processing_time', 0.0):.2f}s)")
+            else:
+                click.echo(f"   failed: {name}: {entry['error']}")
+        options['on_result'] = report
+    
     try:
         result = process_batch(
             input_dir=Path(input_dir),
@@ -319,13 +347,14 @@ def status(ctx: CLIContext):
 
 @status.command('system')
 @click.option('--quiet', '-q', is_flag=True, help='Quiet output')
+@click.option('--refresh', is_flag=True, help='Probe hardware again instead of using the saved profile')
 @pass_context
-def status_system(ctx: CLIContext, quiet: bool):
+def status_system(ctx: CLIContext, quiet: bool, refresh: bool):
     """Show system hardware and capabilities."""
     from .commands.status import show_system_status
     
     try:
-        show_system_status(quiet or ctx.quiet)
+        show_system_status(quiet or ctx.quiet, refresh=refresh)
     except Exception as e:
         click.echo(f"Failed to get system status: {e}", err=True)
         sys.exit(1)
@@ -356,7 +385,6 @@ def analyze(ctx: CLIContext):
 def doctor(ctx: CLIContext):
     """Run environment preflight checks (Windows & cross-platform)."""
     import platform, shutil, os
-    from .commands.transcribe import get_speaker_analyzer
     from ..core.resource_detector import detect_hardware
     from ..utils.encoding import safe_console_text
 
@@ -369,7 +397,7 @@ def doctor(ctx: CLIContext):
         click.echo("FFmpeg: OK")
 
     # Hardware
-    hw = detect_hardware()
+    hw = detect_hardware(refresh=True)
     click.echo(safe_console_text(f"Device: {hw.recommended_device}, CPU cores: {hw.cpu_cores}, RAM: {hw.memory_gb:.1f} GB"))
 
     # Console encoding
@@ -426,7 +454,7 @@ def analyze_speakers(ctx: CLIContext, input_path: str, output: Optional[str], fo
               help='Confidence threshold for flagging segments')
 @pass_context
 def analyze_quality(ctx: CLIContext, input_path: str, output: Optional[str], threshold: float):
-    """Analyze transcription quality and uncertainty."""
+    """Analyze transcription quality of an audio file or a columnar (.npz) transcript."""
     from .commands.analyze import analyze_quality_command
     
     try:
@@ -453,43 +481,175 @@ def analyze_quality(ctx: CLIContext, input_path: str, output: Optional[str], thr
         sys.exit(1)
 
 
-@cli.command()
-@click.option('--duration', type=int, default=30, help='Benchmark duration in seconds')
+@analyze.command('timing')
+@click.argument('input_path', type=click.Path(exists=True))
+@click.option('--output', '-o', type=click.Path(),
+              help='Output JSON file for the cadence summary')
+@pass_context
+def analyze_timing(ctx: CLIContext, input_path: str, output: Optional[str]):
+    """Summarize word-gap cadence from a columnar (.npz) transcript."""
+    from .commands.analyze import analyze_timing_command
+    
+    try:
+        result = analyze_timing_command(
+            input_path=Path(input_path),
+            output_path=Path(output) if output else None,
+            config=ctx.config,
+            logger=ctx.logger
+        )
+        
+        if not ctx.quiet:
+            click.echo(f"Timing analysis completed ({result['source']}):")
+            click.echo(f"   Words: {result['words']}")
+            click.echo(f"   Buckets: {result['buckets']}")
+            for cadence, count in result['cadence_distribution'].items():
+                click.echo(f"   {cadence.capitalize()}: {count}")
+            click.echo(f"   Gap mean: {result['global_gap_mean']:.3f}s (std {result['global_gap_std']:.3f}s)")
+        
+    except Exception as e:
+        click.echo(f"Timing analysis failed: {e}", err=True)
+        sys.exit(1)
+
+
+@cli.group(invoke_without_command=True)
+@pass_context
+def benchmark(ctx: CLIContext):
+    """Run performance benchmarks (defaults to 'benchmark run')."""
+    click_ctx = click.get_current_context()
+    if click_ctx.invoked_subcommand is None:
+        click_ctx.invoke(benchmark_run)
+
+
+@benchmark.command('run')
+@click.option('--audio-seconds', 'durations', type=float, multiple=True,
+              help='Synthetic audio length; repeat for several cases (default: 30 and 300)')
+@click.option('--repeats', type=click.IntRange(1, 100), default=3, help='Repetitions per stage')
+@click.option('--seed', type=int, default=0, help='Seed for the synthetic audio')
 @click.option('--sample-files', type=click.Path(exists=True, file_okay=False),
-              help='Directory with sample audio files for testing')
+              help='Directory with extra sample audio files')
+@click.option('--decode/--no-decode', default=True, help='Time Whisper decoding (loads the model)')
+@click.option('--output', '-o', type=click.Path(), default=None,
+              help='Report path (default: benchmarks/benchmark-<timestamp>.json)')
+@click.option('--label', type=str, default=None, help='Run label stored in the report, e.g. a commit id')
 @pass_context
-def benchmark(ctx: CLIContext, duration: int, sample_files: Optional[str]):
-    """Run performance benchmarks."""
+def benchmark_run(ctx: CLIContext, durations: tuple = (), repeats: int = 3, seed: int = 0,
+                  sample_files: Optional[str] = None, decode: bool = True,
+                  output: Optional[str] = None, label: Optional[str] = None):
+    """Time every pipeline stage and write a JSON report."""
     from .commands.benchmark import run_benchmark
     
     try:
         result = run_benchmark(
-            duration=duration,
+            durations=list(durations) or [30.0, 300.0],
+            repeats=repeats,
+            seed=seed,
             sample_dir=Path(sample_files) if sample_files else None,
+            decode=decode,
+            output=Path(output) if output else None,
+            label=label,
             config=ctx.config,
             logger=ctx.logger
         )
         
         if not ctx.quiet:
             click.echo("Benchmark completed:")
-            click.echo(f"   Processing speed: {result['processing_speed']:.1f}x real-time")
-            click.echo(f"   Memory usage: {result['memory_usage']:.1f}%")
-            click.echo(f"   CPU usage: {result['cpu_usage']:.1f}%")
+            for case_name, case in result['cases'].items():
+                click.echo(f"   {case_name}:")
+                if case.get('error'):
+                    click.echo(f"      failed: {case['error']}")
+                for stage, entry in case['stages'].items():
+                    if entry['status'] == 'ok':
+                        click.echo(f"      {stage:<20} {entry['median'] * 1000:10.1f} ms  "
+                                   f"{entry['realtime_factor'] or 0:10.1f}x real-time")
+                    else:
+                        click.echo(f"      {stage:<20} {entry['status']}: {entry.get('reason') or entry.get('error')}")
+                memory = case.get('memory')
+                if memory:
+                    click.echo(f"      {'memory':<20} {memory['transcript_bytes_per_word']:10.1f} B/word transcript  "
+                               f"{memory['analysis_bytes_per_word']:10.1f} B/word analysis")
+            click.echo(f"   Report: {result['report_path']}")
         
     except Exception as e:
         click.echo(f"Benchmark failed: {e}", err=True)
         sys.exit(1)
 
 
+@benchmark.command('compare')
+@click.argument('baseline', type=click.Path(exists=True, dir_okay=False))
+@click.argument('candidate', type=click.Path(exists=True, dir_okay=False))
+@click.option('--threshold', type=float, default=0.10,
+              help='Relative slowdown that counts as a regression (0.10 = 10%)')
+@click.option('--min-delta', type=float, default=0.002,
+              help='Ignore slowdowns smaller than this many seconds')
+@pass_context
+def benchmark_compare(ctx: CLIContext, baseline: str, candidate: str, threshold: float, min_delta: float):
+    """Compare two benchmark reports; exits with status 1 on regressions."""
+    from .commands.benchmark import compare_benchmarks
+    
+    try:
+        result = compare_benchmarks(Path(baseline), Path(candidate), threshold, min_delta)
+    except Exception as e:
+        click.echo(f"Benchmark comparison failed: {e}", err=True)
+        sys.exit(2)
+    
+    if not ctx.quiet:
+        if result['environment_differences']:
+            click.echo(f"Warning: runs differ in environment: {', '.join(result['environment_differences'])}")
+        for comparison in result['comparisons']:
+            if comparison.status == 'missing':
+                click.echo(f"   {comparison.case:<18} {comparison.stage:<20} not comparable")
+                continue
+            click.echo(f"   {comparison.case:<18} {comparison.stage:<20} "
+                       f"{comparison.baseline * 1000:10.1f} -> {comparison.candidate * 1000:10.1f} ms "
+                       f"({comparison.ratio:.2f}x) {comparison.status.upper() if comparison.status == 'regression' else comparison.status}")
+        click.echo(f"Regressions: {len(result['regressions'])}")
+    
+    if result['regressions']:
+        sys.exit(1)
+
+
+@benchmark.command('imports')
+@click.option('--module', default='src.cli.main', show_default=True, help='Module to import')
+@click.option('--repeats', type=click.IntRange(1, 50), default=5, help='Interpreter starts to measure')
+@click.option('--budget', type=float, default=None,
+              help='Allowed cold-start import time in seconds (default: 1.0)')
+@pass_context
+def benchmark_imports(ctx: CLIContext, module: str, repeats: int, budget: Optional[float]):
+    """Measure CLI cold-start import time; exits with status 1 over budget."""
+    from .commands.benchmark import run_import_benchmark
+    from ..benchmark.imports import IMPORT_BUDGET_SECONDS
+    
+    try:
+        result = run_import_benchmark(module, repeats, budget if budget is not None else IMPORT_BUDGET_SECONDS)
+    except Exception as e:
+        click.echo(f"Import benchmark failed: {e}", err=True)
+        sys.exit(2)
+    
+    if not ctx.quiet:
+        click.echo(f"Import time for {result['module']}: {result['import_seconds'] * 1000:.1f} ms "
+                   f"(budget {result['budget_seconds'] * 1000:.0f} ms, {result['modules_loaded']} modules)")
+        for name, seconds in result['slowest'][:5]:
+            click.echo(f"   {name:<40} {seconds * 1000:10.1f} ms")
+        if result['heavy_modules']:
+            click.echo(f"Heavy modules loaded at startup: {', '.join(result['heavy_modules'])}")
+    
+    if result['over_budget']:
+        sys.exit(1)
+
+
 @cli.command()
 @click.option('--duration', type=int, default=60, help='Stream duration in seconds')
 @click.option('--device', type=int, default=None, help='Input device index (optional)')
 @click.option('--language', type=str, default=None, help='Language code (optional)')
-@click.option('--chunk-seconds', type=float, default=5.0, help='Chunk size in seconds')
-@click.option('--overlap-seconds', type=float, default=1.0, help='Overlap between chunks (context)')
+@click.option('--step-seconds', type=float, default=1.0, help='New audio between decodes (partial result latency)')
+@click.option('--window-seconds', type=float, default=15.0, help='Maximum audio context per decode')
+@click.option('--input-file', type=click.Path(exists=True), default=None,
+              help='Replay an audio file at real time instead of the microphone')
+@click.option('--partials/--no-partials', default=True, help='Show unconfirmed words as they are heard')
 @pass_context
-def stream(ctx: CLIContext, duration: int, device: Optional[int], language: Optional[str], chunk_seconds: float, overlap_seconds: float):
-    """Real-time streaming transcription (microphone)."""
+def stream(ctx: CLIContext, duration: int, device: Optional[int], language: Optional[str],
+           step_seconds: float, window_seconds: float, input_file: Optional[str], partials: bool):
+    """Real-time streaming transcription (microphone or replayed file)."""
     from .commands.stream import stream_transcription
 
     try:
@@ -497,10 +657,12 @@ def stream(ctx: CLIContext, duration: int, device: Optional[int], language: Opti
             duration=duration,
             device=device,
             language=language,
-            chunk_seconds=chunk_seconds,
-            overlap_seconds=overlap_seconds,
+            step_seconds=step_seconds,
+            window_seconds=window_seconds,
             config=ctx.config,
             logger=ctx.logger,
+            input_file=Path(input_file) if input_file else None,
+            show_partials=partials and not ctx.quiet,
         )
         if not ok:
             sys.exit(1)
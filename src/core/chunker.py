@@ -7,48 +7,53 @@ for optimal transcription accuracy and performance.
 
 import numpy as np
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple, Union, Callable, Iterable, Iterator
 from dataclasses import dataclass
+import queue
 import tempfile
+import threading
 import json
 
-try:
-    from pydub import AudioSegment
-    from pydub.silence import detect_nonsilent
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
-
-try:
-    import librosa
-    import soundfile as sf
-    LIBROSA_AVAILABLE = True
-except ImportError:
-    LIBROSA_AVAILABLE = False
-
 try:
     from ..utils.logger import get_logger, get_file_logger
+    from ..utils.tracing import traced
+    from ..utils.lazy_imports import lazy_import, module_available
+    from .silence import EnergyEnvelope
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.logger import get_logger, get_file_logger
+    from utils.tracing import traced
+    from utils.lazy_imports import lazy_import, module_available
+    from core.silence import EnergyEnvelope
 
+if TYPE_CHECKING:
+    from pydub import AudioSegment
 
-@dataclass
+# pydub loads on the first file-backed chunking run
+pydub = lazy_import("pydub")
+PYDUB_AVAILABLE = pydub is not None
+
+LIBROSA_AVAILABLE = module_available("librosa") and module_available("soundfile")
+
+
+@dataclass(slots=True)
 class AudioChunk:
     """Audio chunk information container."""
     chunk_id: int
     start_time: float
     end_time: float
     duration: float
-    file_path: Path
+    file_path: Optional[Path]  # None for in-memory chunks
     original_start: float  # Start time in original file
     original_end: float    # End time in original file
     has_speech: bool = True
     confidence: float = 1.0
     overlap_prev: float = 0.0  # Overlap with previous chunk
     overlap_next: float = 0.0  # Overlap with next chunk
+    audio: Optional[np.ndarray] = None  # float32 view into the shared file buffer
+    sample_rate: Optional[int] = None
 
 
 @dataclass
@@ -64,6 +69,92 @@ class ChunkingResult:
     chunking_strategy: str
 
 
+class ChunkStream:
+    """
+    Chunks handed over while chunking is still running.
+    
+    A producer thread runs the chunker and puts each chunk on a bounded
+    queue as soon as it is created; iterating the stream yields them in
+    order, so transcription of the first chunk overlaps with cutting the
+    rest. The full ChunkingResult is available from ``result`` once the
+    producer finishes.
+    """
+    
+    _DONE = object()
+    
+    def __init__(self,
+                 produce: Callable[[Callable[[AudioChunk], None]], ChunkingResult],
+                 max_pending: int = 4):
+        """
+        Start producing chunks.
+        
+        Args:
+            produce: Runs the chunker, calling its argument with each chunk,
+                and returns the final ChunkingResult
+            max_pending: Chunks buffered ahead of the consumer before the
+                producer waits
+        """
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_pending))
+        self._closed = threading.Event()
+        self._result: Optional[ChunkingResult] = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, args=(produce,),
+                                        name="talkgpt-chunker", daemon=True)
+        self._thread.start()
+    
+    def _run(self, produce: Callable[[Callable[[AudioChunk], None]], ChunkingResult]):
+        """Producer thread body."""
+        try:
+            self._result = produce(self._emit)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._put(self._DONE)
+    
+    def _emit(self, chunk: AudioChunk):
+        """Hand one chunk to the consumer, waiting while the queue is full."""
+        if not self._put(chunk):
+            raise RuntimeError("Chunk stream closed by consumer")
+    
+    def _put(self, item: Any) -> bool:
+        """Queue an item unless the stream was closed."""
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def __iter__(self) -> Iterator[AudioChunk]:
+        while True:
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._closed.is_set():
+                    raise RuntimeError("Chunk stream was closed")
+                continue
+            if item is self._DONE:
+                break
+            yield item
+        
+        if self._error is not None:
+            raise self._error
+    
+    @property
+    def result(self) -> ChunkingResult:
+        """Complete ChunkingResult; waits for the producer to finish."""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+    
+    def close(self):
+        """Stop the producer if the consumer gives up early."""
+        self._closed.set()
+        self._thread.join()
+
+
 class SmartChunker:
     """
     Intelligent audio chunking system.
@@ -114,10 +205,12 @@ class SmartChunker:
         else:
             self.logger.info("Librosa available for advanced audio processing")
     
+    @traced("chunking")
     def chunk_audio(self, 
                    audio_path: Union[str, Path],
                    output_dir: Optional[Union[str, Path]] = None,
-                   remove_silence: bool = True) -> ChunkingResult:
+                   remove_silence: bool = True,
+                   on_chunk: Optional[Callable[[AudioChunk], None]] = None) -> ChunkingResult:
         """
         Chunk audio file into segments with smart boundary detection.
         
@@ -125,6 +218,7 @@ class SmartChunker:
             audio_path: Path to input audio file
             output_dir: Output directory for chunks (temp dir if None)
             remove_silence: Whether to remove long silence segments
+            on_chunk: Called with each chunk as soon as it is written
             
         Returns:
             ChunkingResult with chunking information
@@ -149,16 +243,21 @@ class SmartChunker:
             audio = self._load_audio(audio_path)
             original_duration = len(audio) / 1000.0  # Convert to seconds
             
+            # One energy pass serves both silence removal and split detection
+            envelope = EnergyEnvelope.from_segment(audio)
+            
             # Remove silence if requested
             silence_removed = 0.0
             if remove_silence:
-                audio, silence_removed = self._remove_silence(audio)
-            
-            # Detect optimal split points
-            split_points = self._find_split_points(audio)
+                audio, envelope, silence_removed = self._remove_silence(audio, envelope)
             
-            # Create chunks
-            chunks = self._create_chunks(audio, split_points, audio_path, output_dir)
+            # Cut each chunk as soon as its split point is decided
+            chunks = []
+            for chunk in self._iter_chunks(audio, self._iter_split_points(envelope), audio_path, output_dir):
+                chunks.append(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+            self.logger.info(f"Created {len(chunks)} audio chunks")
             
             processing_time = time.time() - start_time
             compression_ratio = (original_duration - silence_removed) / original_duration
@@ -186,152 +285,346 @@ class SmartChunker:
             file_logger.error(f"Chunking failed: {e}")
             raise
     
-    def _load_audio(self, audio_path: Path) -> AudioSegment:
+    @traced("chunking")
+    def chunk_array(self,
+                    audio: np.ndarray,
+                    sample_rate: int = 16000,
+                    original_file: Optional[Union[str, Path]] = None,
+                    remove_silence: bool = False,
+                    on_chunk: Optional[Callable[[AudioChunk], None]] = None) -> ChunkingResult:
+        """
+        Chunk an in-memory float32 signal without writing chunk files.
+        
+        Each AudioChunk carries a sample-range view into ``audio`` instead of
+        a WAV on disk, so the transcriber can decode straight from memory.
+        
+        Args:
+            audio: Mono float32 samples (may be a np.memmap)
+            sample_rate: Sample rate of ``audio``
+            original_file: Source file the samples were decoded from
+            remove_silence: Whether to remove long silence segments
+            on_chunk: Called with each chunk as soon as it is created
+            
+        Returns:
+            ChunkingResult whose chunks reference ``audio`` by view
+        """
+        import time
+        start_time = time.time()
+        
+        # The placeholder names the per-file log, so it must be a valid filename on Windows too
+        original_file = Path(original_file) if original_file is not None else Path("in_memory")
+        
+        file_logger = get_file_logger(str(original_file))
+        file_logger.info(f"Starting in-memory chunking: {original_file}")
+        file_logger.info(f"Chunk size: {self.chunk_size}s, Overlap: {self.overlap_duration}s")
+        
+        try:
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1, dtype=np.float32)
+            audio = np.asarray(audio, dtype=np.float32)
+            original_duration = len(audio) / sample_rate
+            
+            envelope = EnergyEnvelope.from_array(audio, sample_rate)
+            
+            silence_removed = 0.0
+            if remove_silence:
+                audio, envelope, silence_removed = self._remove_silence_array(audio, sample_rate, envelope)
+            
+            chunks = []
+            for chunk in self._iter_array_chunks(audio, sample_rate, self._iter_split_points(envelope)):
+                chunks.append(chunk)
+                if on_chunk is not None:
+                    on_chunk(chunk)
+            self.logger.info(f"Created {len(chunks)} in-memory audio chunks")
+            
+            processing_time = time.time() - start_time
+            compression_ratio = (original_duration - silence_removed) / original_duration if original_duration > 0 else 1.0
+            
+            result = ChunkingResult(
+                original_file=original_file,
+                chunks=chunks,
+                total_duration=original_duration,
+                total_chunks=len(chunks),
+                processing_time=processing_time,
+                silence_removed=silence_removed,
+                compression_ratio=compression_ratio,
+                chunking_strategy="silence_aware_in_memory"
+            )
+            
+            file_logger.info(f"In-memory chunking completed: {len(chunks)} chunks in {processing_time:.2f}s")
+            
+            return result
+            
+        except Exception as e:
+            file_logger.error(f"Chunking failed: {e}")
+            raise
+    
+    def stream_audio(self,
+                     audio_path: Union[str, Path],
+                     output_dir: Optional[Union[str, Path]] = None,
+                     remove_silence: bool = True,
+                     max_pending: int = 4) -> ChunkStream:
+        """
+        Chunk an audio file on a background thread, yielding chunks as they
+        are written.
+        
+        Args:
+            audio_path: Path to input audio file
+            output_dir: Output directory for chunks (temp dir if None)
+            remove_silence: Whether to remove long silence segments
+            max_pending: Chunks buffered ahead of the consumer
+            
+        Returns:
+            ChunkStream over the chunks; ``result`` gives the ChunkingResult
+        """
+        return ChunkStream(
+            lambda emit: self.chunk_audio(audio_path, output_dir, remove_silence, on_chunk=emit),
+            max_pending=max_pending
+        )
+    
+    def stream_array(self,
+                     audio: np.ndarray,
+                     sample_rate: int = 16000,
+                     original_file: Optional[Union[str, Path]] = None,
+                     remove_silence: bool = False,
+                     max_pending: int = 4) -> ChunkStream:
+        """
+        Chunk an in-memory signal on a background thread, yielding chunks as
+        they are created.
+        
+        Args:
+            audio: Mono float32 samples (may be a np.memmap)
+            sample_rate: Sample rate of ``audio``
+            original_file: Source file the samples were decoded from
+            remove_silence: Whether to remove long silence segments
+            max_pending: Chunks buffered ahead of the consumer
+            
+        Returns:
+            ChunkStream over the chunks; ``result`` gives the ChunkingResult
+        """
+        return ChunkStream(
+            lambda emit: self.chunk_array(audio, sample_rate, original_file, remove_silence, on_chunk=emit),
+            max_pending=max_pending
+        )
+    
+    def _load_audio(self, audio_path: Path) -> 'AudioSegment':
         """Load audio file using pydub."""
         if not PYDUB_AVAILABLE:
             raise RuntimeError("Pydub required for audio loading")
         
         try:
-            audio = AudioSegment.from_file(str(audio_path))
+            audio = pydub.AudioSegment.from_file(str(audio_path))
             self.logger.debug(f"Loaded audio: {len(audio)}ms, {audio.frame_rate}Hz, {audio.channels} channels")
             return audio
         except Exception as e:
             self.logger.error(f"Failed to load audio {audio_path}: {e}")
             raise
     
-    def _remove_silence(self, audio: AudioSegment) -> Tuple[AudioSegment, float]:
+    def _silence_keep_ranges(self, envelope: EnergyEnvelope) -> List[Tuple[int, int]]:
+        """
+        Millisecond ranges retained by silence removal.
+        
+        Args:
+            envelope: Energy envelope of the audio
+            
+        Returns:
+            List of (start_ms, end_ms) non-silent ranges with word padding
+        """
+        nonsilent_ranges = envelope.nonsilent_ranges(self.min_silence_len, self.silence_threshold)
+        length_ms = envelope.duration_ms
+        
+        keep_ranges = []
+        for start_ms, end_ms in nonsilent_ranges:
+            # Add small padding to avoid cutting words
+            padding = min(100, start_ms, length_ms - end_ms)  # 100ms padding
+            if start_ms > padding:
+                keep_ranges.append((start_ms - padding, end_ms + padding))
+            else:
+                keep_ranges.append((start_ms, end_ms))
+        
+        return keep_ranges
+    
+    def _remove_silence(self,
+                        audio: 'AudioSegment',
+                        envelope: EnergyEnvelope) -> Tuple['AudioSegment', EnergyEnvelope, float]:
         """
         Remove long silence segments from audio.
         
         Args:
             audio: Input audio segment
+            envelope: Energy envelope of ``audio``
             
         Returns:
-            Tuple of (processed_audio, silence_duration_removed)
+            Tuple of (processed_audio, processed_envelope, silence_duration_removed)
         """
-        if not PYDUB_AVAILABLE:
-            return audio, 0.0
-        
         original_length = len(audio)
         
         try:
-            # Detect non-silent segments
-            nonsilent_ranges = detect_nonsilent(
-                audio,
-                min_silence_len=self.min_silence_len,
-                silence_thresh=self.silence_threshold
-            )
+            keep_ranges = self._silence_keep_ranges(envelope)
             
-            if not nonsilent_ranges:
+            if not keep_ranges:
                 self.logger.warning("No speech detected in audio")
-                return audio, 0.0
-            
-            # Combine non-silent segments with small gaps
-            processed_audio = AudioSegment.empty()
-            
-            for start_ms, end_ms in nonsilent_ranges:
-                segment = audio[start_ms:end_ms]
-                
-                # Add small padding to avoid cutting words
-                padding = min(100, start_ms, len(audio) - end_ms)  # 100ms padding
-                if start_ms > padding:
-                    segment = audio[start_ms - padding:end_ms + padding]
-                
-                processed_audio += segment
+                return audio, envelope, 0.0
+            
+            # Join raw PCM once instead of growing a segment per range
+            processed_audio = pydub.AudioSegment(
+                data=b"".join(audio[start_ms:end_ms].raw_data for start_ms, end_ms in keep_ranges),
+                sample_width=audio.sample_width,
+                frame_rate=audio.frame_rate,
+                channels=audio.channels
+            )
             
             silence_removed = (original_length - len(processed_audio)) / 1000.0
             
             self.logger.info(f"Silence removal: {original_length/1000:.1f}s -> {len(processed_audio)/1000:.1f}s")
             
-            return processed_audio, silence_removed
+            return processed_audio, envelope.select(keep_ranges), silence_removed
+            
+        except Exception as e:
+            self.logger.warning(f"Silence removal failed: {e}")
+            return audio, envelope, 0.0
+    
+    def _remove_silence_array(self,
+                              audio: np.ndarray,
+                              sample_rate: int,
+                              envelope: EnergyEnvelope) -> Tuple[np.ndarray, EnergyEnvelope, float]:
+        """
+        Remove long silence segments from an in-memory signal.
+        
+        Args:
+            audio: Mono float32 samples
+            sample_rate: Sample rate of ``audio``
+            envelope: Energy envelope of ``audio``
+            
+        Returns:
+            Tuple of (processed_samples, processed_envelope, silence_duration_removed)
+        """
+        try:
+            keep_ranges = self._silence_keep_ranges(envelope)
+            
+            if not keep_ranges:
+                self.logger.warning("No speech detected in audio")
+                return audio, envelope, 0.0
+            
+            processed = np.concatenate([
+                audio[start_ms * sample_rate // 1000:end_ms * sample_rate // 1000]
+                for start_ms, end_ms in keep_ranges
+            ])
+            
+            silence_removed = (len(audio) - len(processed)) / sample_rate
+            
+            self.logger.info(f"Silence removal: {len(audio)/sample_rate:.1f}s -> {len(processed)/sample_rate:.1f}s")
+            
+            return processed, envelope.select(keep_ranges), silence_removed
             
         except Exception as e:
             self.logger.warning(f"Silence removal failed: {e}")
-            return audio, 0.0
+            return audio, envelope, 0.0
     
-    def _find_split_points(self, audio: AudioSegment) -> List[float]:
+    def _find_split_points(self, envelope: EnergyEnvelope) -> List[float]:
         """
         Find optimal split points in audio based on silence detection.
         
         Args:
-            audio: Audio segment to analyze
+            envelope: Energy envelope of the audio to split
             
         Returns:
             List of split points in seconds
         """
-        if not PYDUB_AVAILABLE:
-            # Fallback to time-based splitting
-            return self._time_based_split_points(len(audio) / 1000.0)
+        split_points = list(self._iter_split_points(envelope))
+        self.logger.debug(f"Found {len(split_points)-1} split points: {split_points}")
+        return split_points
+    
+    def _iter_split_points(self, envelope: EnergyEnvelope) -> Iterator[float]:
+        """
+        Yield split points in order as each one is decided.
+        
+        Falls back to time-based splitting after the last yielded point if
+        silence-aware detection fails.
         
-        audio_length_s = len(audio) / 1000.0
+        Args:
+            envelope: Energy envelope of the audio to split
+            
+        Yields:
+            Split points in seconds, starting at 0.0
+        """
+        last = None
+        try:
+            for point in self._smart_split_points(envelope):
+                last = point
+                yield point
+        except Exception as e:
+            self.logger.warning(f"Smart split detection failed: {e}. Using time-based splitting.")
+            for point in self._time_based_split_points(envelope.duration_ms / 1000.0):
+                if last is None or point > last:
+                    yield point
+    
+    def _smart_split_points(self, envelope: EnergyEnvelope) -> Iterator[float]:
+        """Silence-aware split point generator behind _iter_split_points."""
+        audio_length_ms = envelope.duration_ms
+        audio_length_s = audio_length_ms / 1000.0
         target_chunk_ms = self.chunk_size * 1000
         
+        yield 0.0  # Always start at beginning
+        
         # If audio is shorter than chunk size, no splitting needed
         if audio_length_s <= self.chunk_size:
-            return [0.0, audio_length_s]
-        
-        split_points = [0.0]  # Always start at beginning
+            yield audio_length_s
+            return
+        
+        # Detect silence segments
+        silent_ranges = []
+        nonsilent_ranges = envelope.nonsilent_ranges(
+            self.min_silence_len // 2,  # More sensitive for split detection
+            self.silence_threshold
+        )
         
-        try:
-            # Detect silence segments
-            silent_ranges = []
-            nonsilent_ranges = detect_nonsilent(
-                audio,
-                min_silence_len=self.min_silence_len // 2,  # More sensitive for split detection
-                silence_thresh=self.silence_threshold
-            )
-            
-            # Convert non-silent ranges to silent ranges
-            if nonsilent_ranges:
-                for i in range(len(nonsilent_ranges) - 1):
-                    silent_start = nonsilent_ranges[i][1]
-                    silent_end = nonsilent_ranges[i + 1][0]
-                    if silent_end - silent_start >= self.min_silence_len // 2:
-                        silent_ranges.append((silent_start, silent_end))
-            
-            # Find split points
-            current_pos = 0
-            
-            while current_pos < len(audio):
-                target_end = current_pos + target_chunk_ms
-                
-                # If we're near the end, just use the end
-                if target_end >= len(audio) - (self.min_chunk_length * 1000):
-                    split_points.append(audio_length_s)
-                    break
-                
-                # Find the best silence point near the target
-                best_split = None
-                search_start = max(current_pos + (self.min_chunk_length * 1000), 
-                                 target_end - (5 * 1000))  # Search 5s before target
-                search_end = min(target_end + (5 * 1000), len(audio))  # Search 5s after target
-                
-                # Look for silence in the search window
-                for silent_start, silent_end in silent_ranges:
-                    if search_start <= silent_start <= search_end:
-                        # Use middle of silence as split point
-                        split_point = (silent_start + silent_end) / 2
-                        if best_split is None or abs(split_point - target_end) < abs(best_split - target_end):
-                            best_split = split_point
-                
-                # If no silence found, use target position
-                if best_split is None:
-                    best_split = target_end
-                
-                split_points.append(best_split / 1000.0)  # Convert to seconds
-                current_pos = int(best_split - (self.overlap_duration * 1000))  # Account for overlap
-            
-            # Ensure we end at the actual end
-            if split_points[-1] < audio_length_s:
-                split_points.append(audio_length_s)
-            
-            self.logger.debug(f"Found {len(split_points)-1} split points: {split_points}")
-            
-            return split_points
-            
-        except Exception as e:
-            self.logger.warning(f"Smart split detection failed: {e}. Using time-based splitting.")
-            return self._time_based_split_points(audio_length_s)
+        # Convert non-silent ranges to silent ranges
+        if nonsilent_ranges:
+            for i in range(len(nonsilent_ranges) - 1):
+                silent_start = nonsilent_ranges[i][1]
+                silent_end = nonsilent_ranges[i + 1][0]
+                if silent_end - silent_start >= self.min_silence_len // 2:
+                    silent_ranges.append((silent_start, silent_end))
+        
+        # Find split points
+        current_pos = 0
+        last_point = 0.0
+        
+        while current_pos < audio_length_ms:
+            target_end = current_pos + target_chunk_ms
+            
+            # If we're near the end, just use the end
+            if target_end >= audio_length_ms - (self.min_chunk_length * 1000):
+                last_point = audio_length_s
+                yield last_point
+                break
+            
+            # Find the best silence point near the target
+            best_split = None
+            search_start = max(current_pos + (self.min_chunk_length * 1000), 
+                             target_end - (5 * 1000))  # Search 5s before target
+            search_end = min(target_end + (5 * 1000), audio_length_ms)  # Search 5s after target
+            
+            # Look for silence in the search window
+            for silent_start, silent_end in silent_ranges:
+                if search_start <= silent_start <= search_end:
+                    # Use middle of silence as split point
+                    split_point = (silent_start + silent_end) / 2
+                    if best_split is None or abs(split_point - target_end) < abs(best_split - target_end):
+                        best_split = split_point
+            
+            # If no silence found, use target position
+            if best_split is None:
+                best_split = target_end
+            
+            last_point = best_split / 1000.0  # Convert to seconds
+            yield last_point
+            current_pos = int(best_split - (self.overlap_duration * 1000))  # Account for overlap
+        
+        # Ensure we end at the actual end
+        if last_point < audio_length_s:
+            yield audio_length_s
     
     def _time_based_split_points(self, duration_s: float) -> List[float]:
         """Fallback time-based splitting."""
@@ -345,8 +638,27 @@ class SmartChunker:
         split_points.append(duration_s)
         return split_points
     
+    @staticmethod
+    def _chunk_spans(split_points: Iterable[float]) -> Iterator[Tuple[int, float, float, bool]]:
+        """
+        Pair consecutive split points, looking one point ahead so the last
+        span is known without materializing the list.
+        
+        Yields:
+            Tuples of (index, start_time, end_time, is_last)
+        """
+        points = iter(split_points)
+        start = next(points, None)
+        end = next(points, None)
+        index = 0
+        while end is not None:
+            following = next(points, None)
+            yield index, start, end, following is None
+            start, end = end, following
+            index += 1
+    
     def _create_chunks(self, 
-                      audio: AudioSegment, 
+                      audio: 'AudioSegment', 
                       split_points: List[float],
                       original_path: Path,
                       output_dir: Path) -> List[AudioChunk]:
@@ -362,12 +674,28 @@ class SmartChunker:
         Returns:
             List of AudioChunk objects
         """
-        chunks = []
+        chunks = list(self._iter_chunks(audio, split_points, original_path, output_dir))
+        self.logger.info(f"Created {len(chunks)} audio chunks")
+        return chunks
+    
+    def _iter_chunks(self,
+                     audio: 'AudioSegment',
+                     split_points: Iterable[float],
+                     original_path: Path,
+                     output_dir: Path) -> Iterator[AudioChunk]:
+        """
+        Write and yield audio chunks as split points arrive.
         
-        for i in range(len(split_points) - 1):
-            start_time = split_points[i]
-            end_time = split_points[i + 1]
+        Args:
+            audio: Audio segment
+            split_points: Split points in seconds (may be a generator)
+            original_path: Original file path
+            output_dir: Output directory for chunk files
             
+        Yields:
+            AudioChunk objects backed by WAV files
+        """
+        for i, start_time, end_time, is_last in self._chunk_spans(split_points):
             # Add overlap
             overlap_start = max(0, start_time - self.overlap_duration)
             overlap_end = min(len(audio) / 1000.0, end_time + self.overlap_duration)
@@ -389,10 +717,10 @@ class SmartChunker:
             
             # Calculate overlaps
             overlap_prev = start_time - overlap_start if i > 0 else 0.0
-            overlap_next = overlap_end - end_time if i < len(split_points) - 2 else 0.0
+            overlap_next = overlap_end - end_time if not is_last else 0.0
             
             # Create chunk object
-            chunk = AudioChunk(
+            yield AudioChunk(
                 chunk_id=i,
                 start_time=overlap_start,
                 end_time=overlap_end,
@@ -405,12 +733,76 @@ class SmartChunker:
                 overlap_prev=overlap_prev,
                 overlap_next=overlap_next
             )
-            
-            chunks.append(chunk)
+    
+    def _create_array_chunks(self,
+                             audio: np.ndarray,
+                             sample_rate: int,
+                             split_points: List[float]) -> List[AudioChunk]:
+        """
+        Create in-memory audio chunks from split points.
         
-        self.logger.info(f"Created {len(chunks)} audio chunks")
+        Args:
+            audio: Shared float32 sample buffer
+            sample_rate: Sample rate of ``audio``
+            split_points: List of split points in seconds
+            
+        Returns:
+            List of AudioChunk objects holding views into ``audio``
+        """
+        chunks = list(self._iter_array_chunks(audio, sample_rate, split_points))
+        self.logger.info(f"Created {len(chunks)} in-memory audio chunks")
         return chunks
     
+    def _iter_array_chunks(self,
+                           audio: np.ndarray,
+                           sample_rate: int,
+                           split_points: Iterable[float]) -> Iterator[AudioChunk]:
+        """
+        Yield in-memory audio chunks as split points arrive.
+        
+        Args:
+            audio: Shared float32 sample buffer
+            sample_rate: Sample rate of ``audio``
+            split_points: Split points in seconds (may be a generator)
+            
+        Yields:
+            AudioChunk objects holding views into ``audio``
+        """
+        total_duration = len(audio) / sample_rate
+        
+        for i, start_time, end_time, is_last in self._chunk_spans(split_points):
+            # Add overlap
+            overlap_start = max(0, start_time - self.overlap_duration)
+            overlap_end = min(total_duration, end_time + self.overlap_duration)
+            
+            # Basic slicing returns a view, so no samples are copied
+            start_sample = int(overlap_start * sample_rate)
+            end_sample = int(overlap_end * sample_rate)
+            chunk_audio = audio[start_sample:end_sample]
+            
+            # Skip very short chunks
+            if len(chunk_audio) < self.min_chunk_length * sample_rate:
+                continue
+            
+            overlap_prev = start_time - overlap_start if i > 0 else 0.0
+            overlap_next = overlap_end - end_time if not is_last else 0.0
+            
+            yield AudioChunk(
+                chunk_id=i,
+                start_time=overlap_start,
+                end_time=overlap_end,
+                duration=overlap_end - overlap_start,
+                file_path=None,
+                original_start=start_time,
+                original_end=end_time,
+                has_speech=True,
+                confidence=1.0,
+                overlap_prev=overlap_prev,
+                overlap_next=overlap_next,
+                audio=chunk_audio,
+                sample_rate=sample_rate
+            )
+    
     def _save_chunk_metadata(self, result: ChunkingResult, output_dir: Path):
         """Save chunk metadata to JSON file."""
         metadata = {
@@ -433,7 +825,7 @@ class SmartChunker:
                     'start_time': chunk.start_time,
                     'end_time': chunk.end_time,
                     'duration': chunk.duration,
-                    'file_path': str(chunk.file_path),
+                    'file_path': str(chunk.file_path) if chunk.file_path else None,
                     'original_start': chunk.original_start,
                     'original_end': chunk.original_end,
                     'overlap_prev': chunk.overlap_prev,
@@ -472,7 +864,7 @@ class SmartChunker:
                 start_time=chunk_data['start_time'],
                 end_time=chunk_data['end_time'],
                 duration=chunk_data['duration'],
-                file_path=Path(chunk_data['file_path']),
+                file_path=Path(chunk_data['file_path']) if chunk_data['file_path'] else None,
                 original_start=chunk_data['original_start'],
                 original_end=chunk_data['original_end'],
                 overlap_prev=chunk_data['overlap_prev'],
@@ -546,7 +938,9 @@ class SmartChunker:
     
     def cleanup_chunks(self, result: ChunkingResult):
         """Clean up chunk files."""
-        for chunk in result.chunks:
+        file_chunks = [chunk for chunk in result.chunks if chunk.file_path is not None]
+        
+        for chunk in file_chunks:
             try:
                 if chunk.file_path.exists():
                     chunk.file_path.unlink()
@@ -554,7 +948,7 @@ class SmartChunker:
                 self.logger.warning(f"Failed to cleanup chunk {chunk.file_path}: {e}")
         
         # Remove chunk directory if empty
-        chunk_dir = result.chunks[0].file_path.parent if result.chunks else None
+        chunk_dir = file_chunks[0].file_path.parent if file_chunks else None
         if chunk_dir and chunk_dir.exists():
             try:
                 chunk_dir.rmdir()
@@ -0,0 +1,240 @@
+"""
+TalkGPT Diarization Store
+
+One diarization per audio file, shared by speaker analysis, bucket overlap
+detection and timing analysis. Turns are stored as plain (start, end,
+speaker) tuples in the result cache, keyed by the audio content and the
+pipeline settings, so later consumers and later runs skip pyannote.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    from .intervals import IntervalIndex, overlapping_pairs
+    from ..utils.cache import ResultCache, hash_audio_file
+    from ..utils.logger import get_logger
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from core.intervals import IntervalIndex, overlapping_pairs
+    from utils.cache import ResultCache, hash_audio_file
+    from utils.logger import get_logger
+
+
+DEFAULT_DIARIZATION_MODEL = "pyannote/speaker-diarization-3.1"
+
+
+@dataclass
+class DiarizationTurns:
+    """Pipeline-independent diarization: one (start, end, speaker) per turn."""
+    turns: List[Tuple[float, float, str]]
+
+    @classmethod
+    def from_annotation(cls, annotation: Any) -> "DiarizationTurns":
+        """
+        Convert a pyannote Annotation.
+
+        Args:
+            annotation: Diarization output of a pyannote pipeline
+
+        Returns:
+            DiarizationTurns in the annotation's track order
+        """
+        return cls([
+            (float(segment.start), float(segment.end), str(speaker))
+            for segment, _, speaker in annotation.itertracks(yield_label=True)
+        ])
+
+    def overlap_ranges(self) -> List[Tuple[float, float]]:
+        """
+        Regions where two or more turns are active, merged like pyannote's
+        ``Annotation.get_overlap()``.
+
+        Returns:
+            Sorted, disjoint (start, end) ranges
+        """
+        starts = [turn[0] for turn in self.turns]
+        ends = [turn[1] for turn in self.turns]
+
+        regions = sorted(
+            (max(starts[i], starts[j]), min(ends[i], ends[j]))
+            for i, j in overlapping_pairs(starts, ends)
+        )
+
+        merged: List[Tuple[float, float]] = []
+        for start, end in regions:
+            if end <= start:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def overlap_index(self) -> IntervalIndex:
+        """IntervalIndex over overlap_ranges(), built once per instance."""
+        index = self.__dict__.get('_overlap_index')
+        if index is None:
+            ranges = self.overlap_ranges()
+            index = IntervalIndex([start for start, _ in ranges], [end for _, end in ranges])
+            self.__dict__['_overlap_index'] = index
+        return index
+
+    def __getstate__(self):
+        # The index is derived data; keep cache entries to the turns
+        return {'turns': self.turns}
+
+
+def diarization_params(model_name: str = DEFAULT_DIARIZATION_MODEL,
+                       min_speakers: Optional[int] = None,
+                       max_speakers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Pipeline settings that shape a diarization, used in its cache key.
+
+    Everything but the model is passed to the pipeline call by
+    DiarizationStore.get, so speaker bounds are only included when set.
+
+    Args:
+        model_name: Pyannote pipeline name
+        min_speakers: Minimum number of speakers
+        max_speakers: Maximum number of speakers
+
+    Returns:
+        Dictionary of settings
+    """
+    params: Dict[str, Any] = {'model': model_name}
+    if min_speakers is not None:
+        params['min_speakers'] = min_speakers
+    if max_speakers is not None:
+        params['max_speakers'] = max_speakers
+    return params
+
+
+class DiarizationStore:
+    """
+    Looks up or computes diarizations.
+
+    Results live in the disk cache when one is configured; the most recent
+    ones are also kept in memory, so per-bucket callers neither rehash the
+    audio nor unpickle the turns each time. Concurrent requests for the
+    same file and settings wait for a single pipeline run.
+    """
+
+    MEMORY_ENTRIES = 8
+
+    def __init__(self, result_cache: Optional[ResultCache] = None):
+        """
+        Initialize the store.
+
+        Args:
+            result_cache: Disk cache (None keeps diarizations in memory only)
+        """
+        self.logger = get_logger("talkgpt.diarization")
+        self.result_cache = result_cache
+        self._memory: "OrderedDict[Tuple, DiarizationTurns]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+
+    def get(self,
+            audio_path: Union[str, Path],
+            run_pipeline: Callable[[str], Any],
+            params: Optional[Dict[str, Any]] = None) -> Optional[DiarizationTurns]:
+        """
+        Get the diarization of a file, running the pipeline only on a miss.
+
+        Args:
+            audio_path: Audio file
+            run_pipeline: Called on a miss with the path and the settings
+                other than the model; returns a pyannote Annotation, or None
+                when diarization is unavailable
+            params: Settings from diarization_params
+
+        Returns:
+            DiarizationTurns, or None if the pipeline returned None
+        """
+        audio_path = Path(audio_path)
+        params = params or diarization_params()
+        stat = audio_path.stat()
+        memory_key = (str(audio_path.resolve()), stat.st_mtime_ns, stat.st_size,
+                      json.dumps(params, sort_keys=True))
+
+        turns = self._from_memory(memory_key)
+        if turns is not None:
+            return turns
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(memory_key, threading.Lock())
+
+        with key_lock:
+            # Another caller may have diarized the file while this one waited
+            turns = self._from_memory(memory_key)
+            if turns is not None:
+                return turns
+
+            result_cache = self.result_cache
+            cache_key = None
+            if result_cache is not None:
+                cache_key = ResultCache.make_key("diarization", hash_audio_file(audio_path), params)
+                turns = result_cache.get(cache_key)
+
+            if turns is None:
+                pipeline_kwargs = {name: value for name, value in params.items() if name != 'model'}
+                annotation = run_pipeline(str(audio_path), **pipeline_kwargs)
+                if annotation is None:
+                    return None
+                turns = DiarizationTurns.from_annotation(annotation)
+                if cache_key is not None:
+                    result_cache.put(cache_key, turns, kind="diarization")
+            else:
+                self.logger.info(f"Reusing cached diarization for {audio_path.name}")
+
+            with self._lock:
+                self._memory[memory_key] = turns
+                while len(self._memory) > self.MEMORY_ENTRIES:
+                    self._memory.popitem(last=False)
+
+        return turns
+
+    def _from_memory(self, memory_key: Tuple) -> Optional[DiarizationTurns]:
+        """Recently used turns for a key, if still held in memory."""
+        with self._lock:
+            turns = self._memory.get(memory_key)
+            if turns is not None:
+                self._memory.move_to_end(memory_key)
+            return turns
+
+
+# Global diarization store instance
+_diarization_store: Optional[DiarizationStore] = None
+_diarization_store_lock = threading.Lock()
+
+# Default of get_diarization_store: leave the store's cache as it is
+_KEEP_CACHE: Any = object()
+
+
+def get_diarization_store(result_cache: Optional[ResultCache] = _KEEP_CACHE) -> DiarizationStore:
+    """
+    Get the global diarization store.
+
+    Args:
+        result_cache: Disk cache to persist diarizations in, normally
+            ``get_configured_cache(config.cache)``; replaces the store's
+            current cache when given, and None (a disabled cache) turns
+            persistence off. Left out, the cache is unchanged.
+
+    Returns:
+        DiarizationStore shared by all consumers in the process
+    """
+    global _diarization_store
+    with _diarization_store_lock:
+        if _diarization_store is None:
+            _diarization_store = DiarizationStore()
+        if result_cache is not _KEEP_CACHE:
+            _diarization_store.result_cache = result_cache
+        return _diarization_store
@@ -8,32 +8,35 @@ including speed optimization and volume normalization.
 import os
 import subprocess
 import tempfile
+import wave
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 import shutil
 
-try:
-    import ffmpeg
-    FFMPEG_AVAILABLE = True
-except ImportError:
-    FFMPEG_AVAILABLE = False
-
-try:
-    from pydub import AudioSegment
-    from pydub.utils import which
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
+import numpy as np
 
 try:
     from ..utils.logger import get_logger, get_file_logger
+    from ..utils.tracing import traced
+    from ..utils.lazy_imports import lazy_import, module_available
+    from .silence import EnergyEnvelope
+    from .timeline import TimeMap
 except ImportError:
     # Fallback for direct execution
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.logger import get_logger, get_file_logger
+    from utils.tracing import traced
+    from utils.lazy_imports import lazy_import, module_available
+    from core.silence import EnergyEnvelope
+    from core.timeline import TimeMap
+
+ffmpeg = lazy_import("ffmpeg")
+FFMPEG_AVAILABLE = ffmpeg is not None
+
+PYDUB_AVAILABLE = module_available("pydub")
 
 
 @dataclass
@@ -57,6 +60,9 @@ class ProcessingResult:
     original_info: AudioFileInfo
     processed_info: AudioFileInfo
     applied_operations: List[str]
+    audio: Optional[np.ndarray] = None  # Decoded float32 mono PCM (single-pass mode)
+    sample_rate: Optional[int] = None
+    time_map: Optional[TimeMap] = None  # Processed -> original timeline knots
 
 
 class FileProcessor:
@@ -88,7 +94,7 @@ class FileProcessor:
     def _check_dependencies(self):
         """Check for required dependencies."""
         # Check for FFmpeg
-        ffmpeg_path = which("ffmpeg")
+        ffmpeg_path = shutil.which("ffmpeg")
         if not ffmpeg_path and not FFMPEG_AVAILABLE:
             self.logger.warning("FFmpeg not found. Audio conversion capabilities limited.")
         else:
@@ -278,21 +284,9 @@ class FileProcessor:
             # Use atempo filter for speed adjustment without pitch change
             input_stream = ffmpeg.input(str(input_path))
             
-            # atempo filter has limitations (0.5-100.0), so we may need to chain filters
-            if speed_multiplier <= 2.0:
-                # Single atempo filter
-                audio_stream = input_stream.audio.filter('atempo', speed_multiplier)
-            else:
-                # Chain multiple atempo filters for higher speeds
-                audio_stream = input_stream.audio
-                remaining_speed = speed_multiplier
-                
-                while remaining_speed > 2.0:
-                    audio_stream = audio_stream.filter('atempo', 2.0)
-                    remaining_speed /= 2.0
-                
-                if remaining_speed > 1.0:
-                    audio_stream = audio_stream.filter('atempo', remaining_speed)
+            audio_stream = input_stream.audio
+            for factor in self._atempo_factors(speed_multiplier):
+                audio_stream = audio_stream.filter('atempo', factor)
             
             # Output
             output_stream = ffmpeg.output(audio_stream, str(output_path))
@@ -305,6 +299,28 @@ class FileProcessor:
             file_logger.error(f"Speed adjustment failed: {e}")
             raise
     
+    @staticmethod
+    def _atempo_factors(speed_multiplier: float) -> List[float]:
+        """
+        Split a speed multiplier into a chain of atempo factors.
+        
+        atempo only accepts factors up to 2.0 per instance, so higher speeds
+        are expressed as repeated 2.0x stages followed by the remainder.
+        """
+        if speed_multiplier <= 2.0:
+            return [speed_multiplier]
+        
+        factors = []
+        remaining_speed = speed_multiplier
+        while remaining_speed > 2.0:
+            factors.append(2.0)
+            remaining_speed /= 2.0
+        
+        if remaining_speed > 1.0:
+            factors.append(remaining_speed)
+        
+        return factors
+    
     def remove_silence(self, 
                       input_path: Union[str, Path],
                       silence_threshold: float = -40,
@@ -406,6 +422,239 @@ class FileProcessor:
             file_logger.error(f"Volume normalization failed: {e}")
             raise
     
+    def build_filter_graph(self,
+                           sample_rate: int = 16000,
+                           channels: int = 1,
+                           normalize: bool = True,
+                           remove_silence: bool = True,
+                           silence_threshold: float = -40,
+                           min_silence_duration: float = 1.0,
+                           speed_multiplier: float = 1.0) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Build the single-pass preprocessing filter chain.
+        
+        The chain mirrors the staged pipeline (convert_to_wav ->
+        remove_silence -> apply_speed_multiplier) but runs as one ffmpeg
+        filter graph so no intermediate WAV is produced.
+        
+        Args:
+            sample_rate: Target sample rate
+            channels: Target channel count
+            normalize: Whether to apply loudness normalization
+            remove_silence: Whether to remove long silences
+            silence_threshold: Silence threshold in dB
+            min_silence_duration: Minimum silence duration to remove (seconds)
+            speed_multiplier: Audio speed multiplier (1.0 = unchanged)
+            
+        Returns:
+            Ordered list of (filter_name, filter_kwargs) tuples
+        """
+        filters: List[Tuple[str, Dict[str, Any]]] = []
+        
+        if normalize:
+            filters.append(('loudnorm', {}))
+        
+        # Resample, downmix and convert to float once, before the cheaper
+        # time-domain filters run at the target rate
+        channel_layout = 'mono' if channels == 1 else 'stereo'
+        filters.append(('aformat', {
+            'sample_fmts': 'flt',
+            'sample_rates': sample_rate,
+            'channel_layouts': channel_layout
+        }))
+        
+        if remove_silence:
+            filters.append(('silenceremove', {
+                'start_periods': 1,
+                'start_duration': min_silence_duration,
+                'start_threshold': f'{silence_threshold}dB',
+                'stop_periods': -1,
+                'stop_duration': min_silence_duration,
+                'stop_threshold': f'{silence_threshold}dB'
+            }))
+        
+        if speed_multiplier != 1.0:
+            for factor in self._atempo_factors(speed_multiplier):
+                filters.append(('atempo', {'tempo': factor}))
+        
+        return filters
+    
+    def decode_to_array(self,
+                        input_path: Union[str, Path],
+                        filters: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+                        sample_rate: int = 16000,
+                        channels: int = 1) -> np.ndarray:
+        """
+        Decode a file through a filter graph straight into a NumPy buffer.
+        
+        ffmpeg writes raw float32 PCM to a pipe, so nothing touches disk.
+        
+        Args:
+            input_path: Input file path
+            filters: Filter chain from build_filter_graph (None = plain decode)
+            sample_rate: Output sample rate
+            channels: Output channel count
+            
+        Returns:
+            float32 array of shape (samples,) for mono or (samples, channels)
+        """
+        input_path = Path(input_path)
+        
+        file_logger = get_file_logger(str(input_path))
+        file_logger.info(f"Decoding to memory: {input_path} "
+                         f"({', '.join(name for name, _ in filters or []) or 'no filters'})")
+        
+        try:
+            audio_stream = ffmpeg.input(str(input_path)).audio
+            for name, kwargs in filters or []:
+                audio_stream = audio_stream.filter(name, **kwargs)
+            
+            output_stream = ffmpeg.output(
+                audio_stream, 'pipe:',
+                format='f32le',
+                acodec='pcm_f32le',
+                ar=sample_rate,
+                ac=channels
+            )
+            pcm_bytes, _ = ffmpeg.run(output_stream, capture_stdout=True, capture_stderr=True)
+            
+            audio = np.frombuffer(pcm_bytes, dtype=np.float32)
+            if channels > 1:
+                audio = audio.reshape(-1, channels)
+            
+            file_logger.info(f"Decoded {audio.shape[0] / sample_rate:.1f}s of audio into memory")
+            return audio
+            
+        except Exception as e:
+            file_logger.error(f"In-memory decode failed: {e}")
+            raise
+    
+    def write_wav(self,
+                  audio: np.ndarray,
+                  output_path: Union[str, Path],
+                  sample_rate: int = 16000) -> Path:
+        """
+        Write float PCM samples to a 16-bit WAV file.
+        
+        Args:
+            audio: float32 samples in [-1, 1], mono or (samples, channels)
+            output_path: Output file path
+            sample_rate: Sample rate of the samples
+            
+        Returns:
+            Path to the written WAV file
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        channels = 1 if audio.ndim == 1 else audio.shape[1]
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype('<i2')
+        
+        with wave.open(str(output_path), 'wb') as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm.tobytes())
+        
+        return output_path
+    
+    def read_wav(self, input_path: Union[str, Path]) -> Tuple[np.ndarray, int]:
+        """
+        Read a 16/32-bit PCM WAV file into float32 samples.
+        
+        Args:
+            input_path: WAV file path
+            
+        Returns:
+            Tuple of (samples shaped (frames,) or (frames, channels), sample_rate)
+        """
+        with wave.open(str(input_path), 'rb') as wav_file:
+            sample_width = wav_file.getsampwidth()
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            raw = wav_file.readframes(wav_file.getnframes())
+        
+        if sample_width not in (2, 4):
+            raise ValueError(f"Unsupported WAV sample width: {sample_width * 8} bits")
+        
+        pcm = np.frombuffer(raw, dtype='<i2' if sample_width == 2 else '<i4')
+        audio = pcm.astype(np.float32) / float(2 ** (8 * sample_width - 1))
+        if channels > 1:
+            audio = audio.reshape(-1, channels)
+        
+        return audio, sample_rate
+    
+    def apply_tempo_to_array(self,
+                             audio: np.ndarray,
+                             speed_multiplier: float,
+                             sample_rate: int = 16000) -> np.ndarray:
+        """
+        Time-stretch in-memory samples with atempo over stdin/stdout pipes.
+        
+        Args:
+            audio: float32 samples, mono or (samples, channels)
+            speed_multiplier: Speed multiplier (1.0 = normal, 2.0 = 2x speed)
+            sample_rate: Sample rate of ``audio``
+            
+        Returns:
+            Time-stretched float32 samples
+        """
+        channels = 1 if audio.ndim == 1 else audio.shape[1]
+        
+        audio_stream = ffmpeg.input('pipe:', format='f32le', ac=channels, ar=sample_rate).audio
+        for factor in self._atempo_factors(speed_multiplier):
+            audio_stream = audio_stream.filter('atempo', factor)
+        
+        output_stream = ffmpeg.output(
+            audio_stream, 'pipe:',
+            format='f32le',
+            acodec='pcm_f32le',
+            ar=sample_rate,
+            ac=channels
+        )
+        pcm_bytes, _ = ffmpeg.run(
+            output_stream,
+            input=np.ascontiguousarray(audio, dtype=np.float32).tobytes(),
+            capture_stdout=True,
+            capture_stderr=True
+        )
+        
+        stretched = np.frombuffer(pcm_bytes, dtype=np.float32)
+        return stretched.reshape(-1, channels) if channels > 1 else stretched
+    
+    def cut_silence(self,
+                    audio: np.ndarray,
+                    sample_rate: int,
+                    silence_threshold: float = -40,
+                    min_silence_duration: float = 1.0) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+        """
+        Remove long silences from in-memory samples.
+        
+        Unlike ffmpeg's silenceremove the retained ranges are known exactly,
+        which is what lets the timeline be mapped back to the source.
+        
+        Args:
+            audio: float32 samples, mono or (samples, channels)
+            sample_rate: Sample rate of ``audio``
+            silence_threshold: Silence threshold in dB
+            min_silence_duration: Minimum silence duration to remove (seconds)
+            
+        Returns:
+            Tuple of (concatenated speech samples, kept (start, end) ranges in seconds)
+        """
+        envelope = EnergyEnvelope.from_array(audio, sample_rate)
+        kept_ms = envelope.speech_ranges(int(min_silence_duration * 1000), silence_threshold)
+        
+        if not kept_ms:
+            self.logger.warning("No speech detected, keeping audio unchanged")
+            return audio, [(0.0, audio.shape[0] / sample_rate)]
+        
+        pieces = [audio[start * sample_rate // 1000:end * sample_rate // 1000] for start, end in kept_ms]
+        kept_ranges = [(start / 1000.0, end / 1000.0) for start, end in kept_ms]
+        
+        return np.concatenate(pieces), kept_ranges
+    
+    @traced("preprocess")
     def process_file(self, 
                     input_path: Union[str, Path],
                     output_dir: Union[str, Path],
@@ -413,10 +662,17 @@ class FileProcessor:
                     remove_silence: bool = True,
                     normalize: bool = True,
                     target_sample_rate: int = 16000,
-                    target_channels: int = 1) -> ProcessingResult:
+                    target_channels: int = 1,
+                    single_pass: bool = True,
+                    keep_intermediates: bool = False) -> ProcessingResult:
         """
         Process a single file with all optimizations.
         
+        By default every step runs in one ffmpeg filter graph whose output is
+        decoded straight into memory; only the final processed WAV is written.
+        Setting keep_intermediates runs the staged pipeline instead, leaving
+        one WAV per step on disk for debugging.
+        
         Args:
             input_path: Input file path
             output_dir: Output directory
@@ -425,6 +681,8 @@ class FileProcessor:
             normalize: Whether to normalize volume
             target_sample_rate: Target sample rate
             target_channels: Target channel count
+            single_pass: Use the fused in-memory filter graph
+            keep_intermediates: Write every intermediate WAV (debug)
             
         Returns:
             ProcessingResult with processing information
@@ -443,6 +701,19 @@ class FileProcessor:
         original_info = self.get_file_info(input_path)
         applied_operations = []
         
+        if single_pass and not keep_intermediates:
+            return self._process_file_single_pass(
+                input_path,
+                output_dir,
+                original_info,
+                start_time,
+                speed_multiplier=speed_multiplier,
+                remove_silence=remove_silence,
+                normalize=normalize,
+                target_sample_rate=target_sample_rate,
+                target_channels=target_channels
+            )
+        
         try:
             current_file = input_path
             
@@ -458,9 +729,16 @@ class FileProcessor:
                 if normalize:
                     applied_operations.append("volume_normalization")
             
-            # Step 2: Remove silence (if requested)
+            # Step 2: Remove silence (if requested), keeping the cut ranges
+            kept_ranges = [(0.0, original_info.duration)]
             if remove_silence:
-                current_file = self.remove_silence(current_file)
+                audio, sample_rate = self.read_wav(current_file)
+                audio, kept_ranges = self.cut_silence(audio, sample_rate)
+                current_file = self.write_wav(
+                    audio,
+                    self.temp_dir / f"{Path(current_file).stem}_no_silence.wav",
+                    sample_rate=sample_rate
+                )
                 applied_operations.append("silence_removal")
             
             # Step 3: Apply speed multiplier (if not 1.0)
@@ -468,6 +746,8 @@ class FileProcessor:
                 current_file = self.apply_speed_multiplier(current_file, speed_multiplier)
                 applied_operations.append(f"speed_adjustment_{speed_multiplier}x")
             
+            time_map = TimeMap.from_kept_ranges(kept_ranges, speed_multiplier)
+            
             # Step 4: Move to final output location
             final_output = output_dir / f"{input_path.stem}_processed.wav"
             if current_file != final_output:
@@ -484,7 +764,8 @@ class FileProcessor:
                 processing_time=processing_time,
                 original_info=original_info,
                 processed_info=processed_info,
-                applied_operations=applied_operations
+                applied_operations=applied_operations,
+                time_map=time_map
             )
             
             file_logger.info(f"File processing completed in {processing_time:.2f}s")
@@ -496,6 +777,93 @@ class FileProcessor:
             file_logger.error(f"File processing failed: {e}")
             raise
     
+    def _process_file_single_pass(self,
+                                  input_path: Path,
+                                  output_dir: Path,
+                                  original_info: AudioFileInfo,
+                                  start_time: float,
+                                  speed_multiplier: float,
+                                  remove_silence: bool,
+                                  normalize: bool,
+                                  target_sample_rate: int,
+                                  target_channels: int) -> ProcessingResult:
+        """Run process_file as one fused filter graph decoded into memory."""
+        import time
+        
+        file_logger = get_file_logger(str(input_path))
+        
+        try:
+            # Silence is cut in memory rather than by silenceremove so the
+            # removed ranges are known; atempo then runs over a pipe
+            filters = self.build_filter_graph(
+                sample_rate=target_sample_rate,
+                channels=target_channels,
+                normalize=normalize,
+                remove_silence=False,
+                speed_multiplier=1.0 if remove_silence else speed_multiplier
+            )
+            audio = self.decode_to_array(
+                input_path,
+                filters,
+                sample_rate=target_sample_rate,
+                channels=target_channels
+            )
+            
+            kept_ranges = [(0.0, original_info.duration)]
+            if remove_silence:
+                audio, kept_ranges = self.cut_silence(audio, target_sample_rate)
+                if speed_multiplier != 1.0:
+                    audio = self.apply_tempo_to_array(audio, speed_multiplier, target_sample_rate)
+            
+            time_map = TimeMap.from_kept_ranges(kept_ranges, speed_multiplier)
+            
+            applied_operations = ["format_conversion"]
+            if normalize:
+                applied_operations.append("volume_normalization")
+            if remove_silence:
+                applied_operations.append("silence_removal")
+            if speed_multiplier != 1.0:
+                applied_operations.append(f"speed_adjustment_{speed_multiplier}x")
+            
+            final_output = self.write_wav(
+                audio,
+                output_dir / f"{input_path.stem}_processed.wav",
+                sample_rate=target_sample_rate
+            )
+            
+            processed_info = AudioFileInfo(
+                path=final_output,
+                duration=audio.shape[0] / target_sample_rate,
+                sample_rate=target_sample_rate,
+                channels=target_channels,
+                format="wav",
+                size_bytes=final_output.stat().st_size,
+                bitrate=target_sample_rate * target_channels * 16
+            )
+            
+            processing_time = time.time() - start_time
+            
+            result = ProcessingResult(
+                original_path=input_path,
+                processed_path=final_output,
+                processing_time=processing_time,
+                original_info=original_info,
+                processed_info=processed_info,
+                applied_operations=applied_operations,
+                audio=audio,
+                sample_rate=target_sample_rate,
+                time_map=time_map
+            )
+            
+            file_logger.info(f"Single-pass processing completed in {processing_time:.2f}s")
+            file_logger.info(f"Applied operations: {', '.join(applied_operations)}")
+            
+            return result
+            
+        except Exception as e:
+            file_logger.error(f"File processing failed: {e}")
+            raise
+    
     def process_batch(self, 
                      input_files: List[Union[str, Path]],
                      output_dir: Union[str, Path],
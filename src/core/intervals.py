@@ -0,0 +1,273 @@
+"""
+TalkGPT Interval Index
+
+Static sorted-interval index for overlap queries between transcription
+segments, timing buckets and diarization turns, plus a sweep-line pass for
+finding overlapping turns within one diarization.
+"""
+
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class IntervalIndex:
+    """
+    Sorted index over (start, end) intervals.
+
+    Intervals are sorted by start, with a running maximum of their ends.
+    For a query range, bisecting the running maximum finds the first
+    interval that can still reach the range and bisecting the starts finds
+    the last one that begins before it ends, so a query costs O(log n) plus
+    the number of candidates.
+    """
+
+    def __init__(self, starts: Iterable[float], ends: Iterable[float]):
+        """
+        Build the index.
+
+        Args:
+            starts: Interval start times
+            ends: Interval end times, aligned with ``starts``
+        """
+        starts = np.fromiter(starts, dtype=np.float64)
+        ends = np.fromiter(ends, dtype=np.float64)
+
+        # Stable sort keeps input order among equal starts
+        self.order = np.argsort(starts, kind='stable')
+        self.starts = starts[self.order]
+        self.ends = ends[self.order]
+        self.max_ends = np.maximum.accumulate(self.ends) if self.ends.size else self.ends
+
+    @classmethod
+    def from_segments(cls,
+                      segments: List[Any],
+                      start_attr: str = 'start_time',
+                      end_attr: str = 'end_time') -> "IntervalIndex":
+        """
+        Index objects exposing start/end attributes (e.g. SpeakerSegment).
+
+        Args:
+            segments: Objects to index; query results are positions in this list
+            start_attr: Name of the start attribute
+            end_attr: Name of the end attribute
+
+        Returns:
+            IntervalIndex over the segments
+        """
+        return cls([getattr(s, start_attr) for s in segments],
+                   [getattr(s, end_attr) for s in segments])
+
+    @classmethod
+    def from_any(cls, intervals: Any) -> "IntervalIndex":
+        """
+        Index an IntervalIndex, a pyannote Timeline/Annotation, the overlap
+        regions of DiarizationTurns, or a list of objects with
+        ``start``/``end`` or ``start_time``/``end_time``.
+
+        Args:
+            intervals: Interval collection
+
+        Returns:
+            IntervalIndex over the intervals
+        """
+        if isinstance(intervals, IntervalIndex):
+            return intervals
+        if hasattr(intervals, 'overlap_index'):
+            # DiarizationTurns: index where speakers overlap
+            return intervals.overlap_index()
+        if hasattr(intervals, 'itersegments'):
+            intervals = list(intervals.itersegments())
+
+        items = list(intervals)
+        if items and hasattr(items[0], 'start_time'):
+            return cls.from_segments(items)
+        return cls.from_segments(items, 'start', 'end')
+
+    def __len__(self) -> int:
+        return int(self.starts.size)
+
+    def _bounds(self, start, end):
+        """Sorted-position range [lo, hi) of intervals that may overlap."""
+        lo = np.searchsorted(self.max_ends, start, side='right')
+        hi = np.searchsorted(self.starts, end, side='left')
+        return lo, hi
+
+    def any_overlap(self, start: float, end: float) -> bool:
+        """
+        Check whether any interval intersects (start, end).
+
+        Args:
+            start: Query start
+            end: Query end
+
+        Returns:
+            True if some interval has ``start_i < end`` and ``end_i > start``
+        """
+        lo, hi = self._bounds(start, end)
+        # The interval at ``lo`` is where the running max end first passes
+        # ``start``, so it reaches the query whenever it begins before ``end``
+        return bool(lo < hi)
+
+    def any_overlap_many(self, starts: Iterable[float], ends: Iterable[float]) -> np.ndarray:
+        """
+        Vectorized any_overlap for many query ranges.
+
+        Args:
+            starts: Query starts
+            ends: Query ends
+
+        Returns:
+            Boolean array, one entry per query
+        """
+        lo, hi = self._bounds(np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64))
+        return lo < hi
+
+    def overlapping(self, start: float, end: float) -> np.ndarray:
+        """
+        Find intervals intersecting (start, end).
+
+        Args:
+            start: Query start
+            end: Query end
+
+        Returns:
+            Input positions of the intersecting intervals, in input order
+        """
+        lo, hi = self._bounds(start, end)
+        candidates = np.arange(lo, hi)
+        hits = candidates[self.ends[lo:hi] > start]
+        return np.sort(self.order[hits])
+
+    def best_overlap(self, start: float, end: float) -> Optional[int]:
+        """
+        Find the interval covering the largest part of (start, end).
+
+        Ties go to the interval that comes first in input order.
+
+        Args:
+            start: Query start
+            end: Query end
+
+        Returns:
+            Input position of the best interval, or None if none intersects
+        """
+        duration = end - start
+        if duration <= 0:
+            return None
+
+        lo, hi = self._bounds(start, end)
+        overlap = np.minimum(self.ends[lo:hi], end) - np.maximum(self.starts[lo:hi], start)
+        positive = overlap > 0
+        if not positive.any():
+            return None
+
+        ratio = np.where(positive, overlap / duration, -1.0)
+        best = np.flatnonzero(ratio == ratio.max())
+        return int(self.order[lo + best].min())
+
+
+def overlapping_pairs(starts: Iterable[float],
+                      ends: Iterable[float],
+                      labels: Optional[List[Any]] = None) -> List[Tuple[int, int]]:
+    """
+    Find every pair of intersecting intervals with a sweep over start order.
+
+    Intervals are visited by start time while a heap keyed on end time holds
+    the ones still open, so each interval is only compared with those it
+    actually overlaps: O(n log n) plus the number of pairs reported.
+
+    Args:
+        starts: Interval start times
+        ends: Interval end times, aligned with ``starts``
+        labels: Optional label per interval; pairs sharing a label are skipped
+
+    Returns:
+        (i, j) input positions with ``i`` starting no later than ``j``,
+        ordered by the start-sorted position of ``i`` and then of ``j``
+    """
+    starts = np.fromiter(starts, dtype=np.float64)
+    ends = np.fromiter(ends, dtype=np.float64)
+    order = np.argsort(starts, kind='stable').tolist()
+    rank = {position: r for r, position in enumerate(order)}
+    start_list = starts.tolist()
+    end_list = ends.tolist()
+
+    open_intervals: List[Tuple[float, int]] = []
+    pairs = []
+    for j in order:
+        # Anything ending at or before this start cannot reach later intervals
+        while open_intervals and open_intervals[0][0] <= start_list[j]:
+            heapq.heappop(open_intervals)
+
+        for _, i in open_intervals:
+            if labels is None or labels[i] != labels[j]:
+                pairs.append((i, j))
+
+        heapq.heappush(open_intervals, (end_list[j], j))
+
+    pairs.sort(key=lambda pair: (rank[pair[0]], rank[pair[1]]))
+    return pairs
+
+
+class TimeBinSet:
+    """
+    Set of time ranges where ranges within ``tolerance`` at both ends count
+    as duplicates.
+
+    Ranges are hashed into bins of ``tolerance`` seconds on (start, end), so
+    a lookup only compares against ranges in the neighbouring bins.
+    """
+
+    def __init__(self, tolerance: float = 0.1):
+        """
+        Initialize an empty set.
+
+        Args:
+            tolerance: Maximum start and end difference for two ranges to match
+        """
+        self.tolerance = tolerance
+        self._bins: Dict[Tuple[int, int], List[Tuple[float, float, Any, int]]] = {}
+        self._count = 0
+
+    def _key(self, start: float, end: float) -> Tuple[int, int]:
+        """Bin coordinates of a range."""
+        return int(math.floor(start / self.tolerance)), int(math.floor(end / self.tolerance))
+
+    def find(self, start: float, end: float) -> Optional[Any]:
+        """
+        Find a stored range matching (start, end).
+
+        Args:
+            start: Range start
+            end: Range end
+
+        Returns:
+            Payload of the first matching range added, or None
+        """
+        start_bin, end_bin = self._key(start, end)
+        match = None
+        for ds in (-1, 0, 1):
+            for de in (-1, 0, 1):
+                for entry in self._bins.get((start_bin + ds, end_bin + de), ()):
+                    if (abs(start - entry[0]) < self.tolerance and
+                            abs(end - entry[1]) < self.tolerance and
+                            (match is None or entry[3] < match[3])):
+                        match = entry
+        return match[2] if match is not None else None
+
+    def add(self, start: float, end: float, payload: Any = None):
+        """
+        Store a range.
+
+        Args:
+            start: Range start
+            end: Range end
+            payload: Value returned by find for matching ranges
+        """
+        # The insertion number lets find prefer the earliest match
+        entry = (start, end, payload, self._count)
+        self._bins.setdefault(self._key(start, end), []).append(entry)
+        self._count += 1
@@ -0,0 +1,357 @@
+"""
+TalkGPT Model Registry
+
+Process-wide registry of loaded Whisper models so the CLI transcriber,
+confidence reprocessor and GPU worker share one instance per
+(model path, device, compute type) instead of loading their own copies.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import psutil
+
+try:
+    from ..utils.logger import get_logger
+    from ..utils.lazy_imports import lazy_import
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    from pathlib import Path
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.logger import get_logger
+    from utils.lazy_imports import lazy_import
+
+torch = lazy_import("torch")
+TORCH_AVAILABLE = torch is not None
+
+ctranslate2 = lazy_import("ctranslate2")
+CTRANSLATE2_AVAILABLE = ctranslate2 is not None
+
+# Converted models baked into the worker images, one directory per name
+DEFAULT_MODEL_CACHE_PATH = "/model-cache"
+
+
+ModelKey = Tuple[str, str, str]
+
+
+@dataclass
+class ModelHandle:
+    """A loaded model shared through the registry."""
+    key: ModelKey
+    model: Any
+    load_time: float
+    memory_bytes: int
+    gpu_memory_bytes: int = 0
+    load_kwargs: Dict[str, Any] = field(default_factory=dict)
+    users: int = 0
+    warmed_up: bool = False
+    last_used: float = field(default_factory=time.time)
+
+
+def resolve_model_path(model_size: str, cache_dir: Optional[str] = None) -> str:
+    """
+    Resolve a model name to a pre-downloaded model directory if one exists.
+
+    Entry points that resolve names the same way end up with the same
+    registry key.
+
+    Args:
+        model_size: Model name (e.g. "large-v3") or path
+        cache_dir: Directory that may contain a converted model per name
+
+    Returns:
+        The cached model directory, or ``model_size`` unchanged
+    """
+    if cache_dir:
+        cached_path = os.path.join(cache_dir, model_size)
+        if os.path.isdir(cached_path):
+            return cached_path
+    return model_size
+
+
+def model_cache_dir() -> str:
+    """Directory of pre-downloaded models (``MODEL_CACHE_PATH``)."""
+    return os.getenv("MODEL_CACHE_PATH", DEFAULT_MODEL_CACHE_PATH)
+
+
+_shared_device: Optional[Tuple[str, str]] = None
+
+
+def shared_model_device() -> Tuple[str, str]:
+    """
+    Device and compute type for models shared by the worker and reprocessor.
+
+    CTranslate2 runs the models, so it is asked for CUDA devices; the
+    answer is kept for the life of the process.
+
+    Returns:
+        ("cuda", "float16") with a usable GPU, otherwise ("cpu", "int8")
+    """
+    global _shared_device
+    if _shared_device is None:
+        try:
+            has_cuda = CTRANSLATE2_AVAILABLE and ctranslate2.get_cuda_device_count() > 0
+        except Exception:
+            has_cuda = False
+        _shared_device = ("cuda", "float16") if has_cuda else ("cpu", "int8")
+    return _shared_device
+
+
+def shared_model_key(model_size: str, cache_dir: Optional[str] = None) -> ModelKey:
+    """
+    Registry key for a model loaded by the GPU worker or confidence reprocessor.
+
+    Both resolve through here so they share one instance.
+
+    Args:
+        model_size: Model name (e.g. "large-v3") or path
+        cache_dir: Pre-downloaded models (defaults to model_cache_dir())
+
+    Returns:
+        (model path, device, compute type)
+    """
+    device, compute_type = shared_model_device()
+    return resolve_model_path(model_size, cache_dir or model_cache_dir()), device, compute_type
+
+
+class ModelRegistry:
+    """
+    Shares loaded models across the process.
+
+    Each key is loaded at most once, even when several threads ask for it
+    concurrently. CTranslate2 models accept concurrent transcribe() calls,
+    so handing the same instance to several callers is safe. Models stay
+    loaded until unload() is called or their last user releases them with
+    ``unload_unused=True``.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.logger = get_logger("talkgpt.model_registry")
+        self._handles: Dict[ModelKey, ModelHandle] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+
+    def acquire(self,
+                model_path: str,
+                device: str = "cpu",
+                compute_type: str = "default",
+                loader: Optional[Callable[..., Any]] = None,
+                **model_kwargs) -> ModelHandle:
+        """
+        Get the shared handle for a model, loading it on first use.
+
+        Args:
+            model_path: Model name or directory
+            device: Device the model runs on
+            compute_type: CTranslate2 compute type
+            loader: Model class/factory (defaults to faster_whisper.WhisperModel)
+            **model_kwargs: Extra constructor arguments, used on first load only
+
+        Returns:
+            ModelHandle whose ``model`` is shared with other callers
+        """
+        key = (str(model_path), device, compute_type)
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            handle = self._handles.get(key)
+            if handle is None:
+                handle = self._load(key, loader, model_kwargs)
+                with self._lock:
+                    self._handles[key] = handle
+            elif model_kwargs.get('num_workers', 1) > handle.load_kwargs.get('num_workers', 1):
+                self.logger.warning(f"{key} already loaded with num_workers="
+                                    f"{handle.load_kwargs.get('num_workers', 1)}; "
+                                    f"requested {model_kwargs['num_workers']} ignored")
+
+            handle.users += 1
+            handle.last_used = time.time()
+            return handle
+
+    def get(self,
+            model_path: str,
+            device: str = "cpu",
+            compute_type: str = "default",
+            loader: Optional[Callable[..., Any]] = None,
+            **model_kwargs) -> Any:
+        """Shorthand for ``acquire(...).model``."""
+        return self.acquire(model_path, device, compute_type, loader, **model_kwargs).model
+
+    def _load(self,
+              key: ModelKey,
+              loader: Optional[Callable[..., Any]],
+              model_kwargs: Dict[str, Any]) -> ModelHandle:
+        """Load a model and measure the memory it added."""
+        if loader is None:
+            from faster_whisper import WhisperModel
+            loader = WhisperModel
+
+        model_path, device, compute_type = key
+        self.logger.info(f"Loading shared model {model_path} ({device}, {compute_type})")
+
+        process = psutil.Process()
+        rss_before = process.memory_info().rss
+        gpu_free_before = self._gpu_free_bytes(device)
+        start_time = time.time()
+
+        model = loader(model_path, device=device, compute_type=compute_type, **model_kwargs)
+
+        load_time = time.time() - start_time
+        memory_bytes = max(0, process.memory_info().rss - rss_before)
+        gpu_memory_bytes = max(0, gpu_free_before - self._gpu_free_bytes(device))
+
+        self.logger.info(f"Model {model_path} loaded in {load_time:.1f}s "
+                         f"(+{memory_bytes / 1024 ** 2:.0f} MB RAM, "
+                         f"+{gpu_memory_bytes / 1024 ** 2:.0f} MB GPU)")
+
+        return ModelHandle(
+            key=key,
+            model=model,
+            load_time=load_time,
+            memory_bytes=memory_bytes,
+            gpu_memory_bytes=gpu_memory_bytes,
+            load_kwargs=dict(model_kwargs)
+        )
+
+    @staticmethod
+    def _gpu_free_bytes(device: str) -> int:
+        """Free memory on the current CUDA device (0 when not applicable)."""
+        if device != "cuda" or not TORCH_AVAILABLE:
+            return 0
+        try:
+            return torch.cuda.mem_get_info()[0]
+        except Exception:
+            return 0
+
+    def release(self, model: Any, unload_unused: bool = False) -> bool:
+        """
+        Drop one user of a model.
+
+        Args:
+            model: Model instance previously returned by get/acquire
+            unload_unused: Unload the model once it has no users left
+
+        Returns:
+            True if the model was unloaded
+        """
+        with self._lock:
+            for key, handle in self._handles.items():
+                if handle.model is model:
+                    handle.users = max(0, handle.users - 1)
+                    if not (unload_unused and handle.users == 0):
+                        return False
+                    del self._handles[key]
+                    break
+            else:
+                return False
+
+        self.logger.info(f"Unloading {handle.key}: no users left")
+        handle.model = None
+        return True
+
+    def warm_up(self, model: Any, seconds: float = 1.0):
+        """
+        Run one short decode so the first real request does not pay for
+        lazy initialization.
+
+        Args:
+            model: Model instance from get/acquire
+            seconds: Length of the silent warm-up clip
+        """
+        handle = self._find(model)
+        if handle is not None and handle.warmed_up:
+            return
+
+        segments, _ = model.transcribe(np.zeros(int(16000 * seconds), dtype=np.float32), beam_size=1)
+        list(segments)
+
+        if handle is not None:
+            handle.warmed_up = True
+
+    def _find(self, model: Any) -> Optional[ModelHandle]:
+        """Find the handle holding a model instance."""
+        with self._lock:
+            for handle in self._handles.values():
+                if handle.model is model:
+                    return handle
+        return None
+
+    def unload(self, model_path: str, device: str = "cpu", compute_type: str = "default") -> bool:
+        """
+        Remove a model from the registry.
+
+        Callers that still hold the model keep it alive until they drop it.
+
+        Args:
+            model_path: Model name or directory
+            device: Device the model runs on
+            compute_type: CTranslate2 compute type
+
+        Returns:
+            True if the model was loaded
+        """
+        with self._lock:
+            handle = self._handles.pop((str(model_path), device, compute_type), None)
+
+        if handle is None:
+            return False
+
+        if handle.users:
+            self.logger.warning(f"Unloading {handle.key} with {handle.users} active users")
+        handle.model = None
+        return True
+
+    def unload_all(self):
+        """Remove every model from the registry."""
+        with self._lock:
+            keys = list(self._handles)
+        for key in keys:
+            self.unload(*key)
+
+    def memory_report(self) -> List[Dict[str, Any]]:
+        """
+        Report loaded models and the memory each one added when loading.
+
+        Returns:
+            List of dictionaries, one per loaded model
+        """
+        with self._lock:
+            handles = list(self._handles.values())
+
+        return [
+            {
+                'model_path': handle.key[0],
+                'device': handle.key[1],
+                'compute_type': handle.key[2],
+                'memory_mb': handle.memory_bytes / 1024 ** 2,
+                'gpu_memory_mb': handle.gpu_memory_bytes / 1024 ** 2,
+                'load_time': handle.load_time,
+                'users': handle.users,
+                'warmed_up': handle.warmed_up
+            }
+            for handle in handles
+        ]
+
+
+# Global registry instance
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the global model registry instance."""
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            # Two threads must not each create a registry and load the model twice
+            if _model_registry is None:
+                _model_registry = ModelRegistry()
+    return _model_registry
@@ -3,35 +3,223 @@ TalkGPT Resource Detection Module
 
 Cross-platform hardware detection and optimization for CPU/GPU resources.
 Automatically determines optimal processing configuration based on available hardware.
+
+CPU and memory come from the scheduler affinity mask, ``/proc/meminfo``
+and the cgroup CPU/memory limits, so container quotas are respected. CUDA
+devices are counted with CTranslate2, the library that runs the models;
+torch is only a fallback. The result is persisted as a hardware profile
+(``~/.cache/talkgpt/hardware-profile.json``) and reused by later processes
+on the same machine until its TTL expires.
 """
 
+import json
+import math
 import os
 import platform
+import shutil
+import subprocess
+import tempfile
+import time
 import psutil
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-from pathlib import Path
-
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
-
-try:
-    import GPUtil
-    GPUTIL_AVAILABLE = True
-except ImportError:
-    GPUTIL_AVAILABLE = False
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePosixPath
 
 try:
     from ..utils.logger import get_logger
+    from ..utils.lazy_imports import lazy_import
 except ImportError:
     # Fallback for direct execution
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.logger import get_logger
+    from utils.lazy_imports import lazy_import
+
+# Imported on the first GPU probe, not when the CLI starts
+ctranslate2 = lazy_import("ctranslate2")
+CTRANSLATE2_AVAILABLE = ctranslate2 is not None
+
+torch = lazy_import("torch")
+TORCH_AVAILABLE = torch is not None
+
+GPUtil = lazy_import("GPUtil")
+GPUTIL_AVAILABLE = GPUtil is not None
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PROC_SELF_CGROUP = Path("/proc/self/cgroup")
+PROC_MEMINFO = Path("/proc/meminfo")
+
+# cgroup v1 reports "no memory limit" as a page-rounded LONG_MAX
+_CGROUP_V1_UNLIMITED = 1 << 60
+
+PROFILE_VERSION = 1
+# TALKGPT_HARDWARE_PROFILE overrides the path ("off" disables the profile);
+# TALKGPT_HARDWARE_PROFILE_TTL is in seconds
+DEFAULT_PROFILE_PATH: Optional[Path] = (
+    None if os.environ.get("TALKGPT_HARDWARE_PROFILE", "").lower() in ("off", "none", "0")
+    else Path(os.environ.get("TALKGPT_HARDWARE_PROFILE") or "~/.cache/talkgpt/hardware-profile.json").expanduser()
+)
+
+
+def _env_seconds(name: str, default: float) -> float:
+    """A duration from the environment; a malformed value falls back to ``default``."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        get_logger("talkgpt.resources").warning(f"Ignoring {name}={value!r}: not a number of seconds")
+        return default
+
+
+DEFAULT_PROFILE_TTL = _env_seconds("TALKGPT_HARDWARE_PROFILE_TTL", 24 * 3600)
+
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _read_int(path: Path) -> Optional[int]:
+    text = _read_text(path)
+    try:
+        return int(text) if text is not None else None
+    except ValueError:
+        return None
+
+
+def _own_cgroups(proc_cgroup: Path) -> Dict[str, str]:
+    """Controller -> cgroup path of this process ('' for the v2 unified hierarchy)."""
+    paths = {}
+    for line in (_read_text(proc_cgroup) or "").splitlines():
+        parts = line.split(":", 2)
+        if len(parts) == 3:
+            for controller in parts[1].split(","):
+                paths[controller] = parts[2]
+    return paths
+
+
+def _cgroup_dirs(base: Path, own_path: Optional[str]) -> List[Path]:
+    """
+    The process's cgroup directory and its ancestors, innermost first.
+
+    Inside a container the mount usually shows only the container's own
+    cgroup at ``base``; the longer paths then simply do not exist.
+    """
+    path = PurePosixPath(own_path or "/")
+    dirs = [base / str(path).lstrip("/")]
+    while path != path.parent:
+        path = path.parent
+        dirs.append(base / str(path).lstrip("/"))
+    return dirs
+
+
+def cgroup_cpu_limit(root: Path = CGROUP_ROOT, proc_cgroup: Path = PROC_SELF_CGROUP) -> Optional[float]:
+    """
+    CPU quota of this process's cgroup in cores (cgroup v2 or v1).
+
+    Returns:
+        The tightest quota along the hierarchy, or None when unlimited
+    """
+    own = _own_cgroups(proc_cgroup)
+    limits = []
+    
+    for directory in _cgroup_dirs(root, own.get("")):
+        quota, _, period = (_read_text(directory / "cpu.max") or "").partition(" ")
+        if quota.isdigit() and period.isdigit() and int(period) > 0:
+            limits.append(int(quota) / int(period))
+    
+    for controller in ("cpu,cpuacct", "cpu"):
+        for directory in _cgroup_dirs(root / controller, own.get("cpu")):
+            quota = _read_int(directory / "cpu.cfs_quota_us")
+            period = _read_int(directory / "cpu.cfs_period_us")
+            if quota and quota > 0 and period:
+                limits.append(quota / period)
+    
+    return min(limits) if limits else None
+
+
+def cgroup_memory_limit(root: Path = CGROUP_ROOT, proc_cgroup: Path = PROC_SELF_CGROUP) -> Optional[int]:
+    """
+    Memory limit of this process's cgroup in bytes (cgroup v2 or v1).
+
+    Returns:
+        The tightest limit along the hierarchy, or None when unlimited
+    """
+    own = _own_cgroups(proc_cgroup)
+    limits = []
+    
+    for directory in _cgroup_dirs(root, own.get("")):
+        limit = _read_int(directory / "memory.max")  # "max" reads as None
+        if limit:
+            limits.append(limit)
+    
+    for directory in _cgroup_dirs(root / "memory", own.get("memory")):
+        limit = _read_int(directory / "memory.limit_in_bytes")
+        if limit and limit < _CGROUP_V1_UNLIMITED:
+            limits.append(limit)
+    
+    return min(limits) if limits else None
+
+
+def usable_cpu_count(root: Path = CGROUP_ROOT, proc_cgroup: Path = PROC_SELF_CGROUP) -> int:
+    """CPUs this process may run on: the affinity mask capped by the cgroup quota."""
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cores = os.cpu_count() or 1
+    
+    quota = cgroup_cpu_limit(root, proc_cgroup)
+    if quota:
+        cores = min(cores, math.ceil(quota))
+    return max(1, cores)
+
+
+def total_memory_bytes(root: Path = CGROUP_ROOT,
+                       proc_cgroup: Path = PROC_SELF_CGROUP,
+                       meminfo: Path = PROC_MEMINFO) -> int:
+    """Physical memory from /proc/meminfo (psutil elsewhere), capped by the cgroup limit."""
+    total = None
+    for line in (_read_text(meminfo) or "").splitlines():
+        if line.startswith("MemTotal:"):
+            fields = line.split()
+            if len(fields) >= 2 and fields[1].isdigit():
+                total = int(fields[1]) * 1024
+            break
+    if total is None:
+        total = psutil.virtual_memory().total
+    
+    limit = cgroup_memory_limit(root, proc_cgroup)
+    if limit:
+        total = min(total, limit)
+    return total
+
+
+def _nvidia_smi_gpus() -> List[Tuple[str, int]]:
+    """(name, total memory in bytes) per GPU from nvidia-smi; empty when unavailable."""
+    executable = shutil.which("nvidia-smi")
+    if not executable:
+        return []
+    try:
+        output = subprocess.run(
+            [executable, "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
+            capture_output=True, text=True, timeout=10, check=True
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return []
+    
+    gpus = []
+    for line in output.splitlines():
+        name, _, memory_mb = line.rpartition(",")
+        try:
+            gpus.append((name.strip(), int(float(memory_mb)) * 1024**2))
+        except ValueError:
+            continue
+    return gpus
 
 
 @dataclass
@@ -57,28 +245,50 @@ class ResourceDetector:
     and provides recommendations for optimal processing configuration.
     """
     
-    def __init__(self):
-        """Initialize the resource detector."""
+    def __init__(self,
+                 profile_path: Optional[Union[str, Path]] = DEFAULT_PROFILE_PATH,
+                 profile_ttl: float = DEFAULT_PROFILE_TTL):
+        """
+        Initialize the resource detector.
+        
+        Args:
+            profile_path: Persisted hardware profile (None disables it)
+            profile_ttl: Seconds a saved profile stays valid
+        """
         self.logger = get_logger("talkgpt.resources")
         self._hardware_info: Optional[HardwareInfo] = None
+        self.profile_path = Path(profile_path).expanduser() if profile_path else None
+        self.profile_ttl = profile_ttl
     
-    def detect_hardware(self) -> HardwareInfo:
+    def detect_hardware(self, refresh: bool = False) -> HardwareInfo:
         """
         Detect all available hardware resources.
         
+        CPU and memory are probed on every call (they are cheap); GPU and
+        MPS detection is skipped when a saved profile matches them and has
+        not expired.
+        
+        Args:
+            refresh: Ignore the cached result and saved profile and probe again
+        
         Returns:
             HardwareInfo object with complete hardware information
         """
-        if self._hardware_info is not None:
+        if self._hardware_info is not None and not refresh:
             return self._hardware_info
         
+        system = self._probe_system()
+        if not refresh:
+            self._hardware_info = self._load_profile(system)
+            if self._hardware_info is not None:
+                return self._hardware_info
+        
         self.logger.info("Detecting hardware resources...")
         
-        # Basic system information
-        cpu_cores = os.cpu_count() or 1
-        memory_info = psutil.virtual_memory()
-        memory_gb = memory_info.total / (1024**3)
-        platform_name = platform.system()
+        # Basic system information, within the affinity mask and cgroup limits
+        cpu_cores = system['cpu_cores']
+        memory_gb = system['memory_bytes'] / (1024**3)
+        platform_name = system['platform']
         
         # GPU detection
         gpu_info = self._detect_gpu()
@@ -115,8 +325,63 @@ class ResourceDetector:
         )
         
         self.logger.info(f"Hardware detection complete: {self._hardware_info}")
+        self._save_profile(self._hardware_info, system)
         return self._hardware_info
     
+    def _probe_system(self) -> Dict[str, Any]:
+        """
+        Cheap facts about this machine and process.
+        
+        They are stored with the profile, so a profile written on another
+        host, under another quota or with other visible GPUs is not reused.
+        """
+        return {
+            'hostname': platform.node(),
+            'platform': platform.system(),
+            'cpu_cores': usable_cpu_count(),
+            'memory_bytes': total_memory_bytes(),
+            'cuda_visible_devices': os.environ.get('CUDA_VISIBLE_DEVICES'),
+        }
+    
+    def _load_profile(self, system: Dict[str, Any]) -> Optional[HardwareInfo]:
+        """Saved hardware info, if it is current and was probed on this system."""
+        if self.profile_path is None:
+            return None
+        try:
+            profile = json.loads(self.profile_path.read_text(encoding='utf-8'))
+            age = time.time() - profile['created']
+            if profile['version'] != PROFILE_VERSION or profile['system'] != system or not 0 <= age <= self.profile_ttl:
+                return None
+            hardware = HardwareInfo(**profile['hardware'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        self.logger.debug(f"Using hardware profile {self.profile_path} ({age:.0f}s old)")
+        return hardware
+    
+    def _save_profile(self, hardware: HardwareInfo, system: Dict[str, Any]):
+        """Persist hardware info for later processes; failures are only logged."""
+        if self.profile_path is None:
+            return
+        profile = {
+            'version': PROFILE_VERSION,
+            'created': time.time(),
+            'system': system,
+            'hardware': asdict(hardware),
+        }
+        try:
+            self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.profile_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(profile, f, indent=2)
+                os.replace(tmp_name, self.profile_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Could not save hardware profile {self.profile_path}: {e}")
+    
     def _detect_gpu(self) -> Dict[str, Any]:
         """
         Detect GPU availability and specifications.
@@ -131,12 +396,47 @@ class ResourceDetector:
             'names': []
         }
         
-        if not TORCH_AVAILABLE:
-            self.logger.warning("PyTorch not available, GPU detection disabled")
-            return gpu_info
+        # CTranslate2 runs the models, so its device count is the one that
+        # matters, and it answers without importing torch
+        if not (CTRANSLATE2_AVAILABLE and self._detect_gpu_ctranslate2(gpu_info)):
+            self._detect_gpu_fallback(gpu_info)
+        
+        if not gpu_info['available']:
+            self.logger.info("No GPU detected, will use CPU processing")
+        
+        return gpu_info
+    
+    def _detect_gpu_ctranslate2(self, gpu_info: Dict[str, Any]) -> bool:
+        """
+        Count CUDA devices with CTranslate2; names and memory come from nvidia-smi.
+        
+        Returns:
+            False when CTranslate2 could not be queried
+        """
+        try:
+            count = ctranslate2.get_cuda_device_count()
+        except Exception as e:
+            self.logger.debug(f"CTranslate2 CUDA probe failed: {e}")
+            return False
+        
+        if count > 0:
+            gpu_info['available'] = True
+            gpu_info['count'] = count
+            # nvidia-smi ignores CUDA_VISIBLE_DEVICES; assume the first devices are visible
+            for name, memory in _nvidia_smi_gpus()[:count]:
+                gpu_info['names'].append(name)
+                gpu_info['memory'].append(memory)
+                self.logger.info(f"CUDA GPU: {name} ({memory / 1024**3:.1f} GB)")
+        return True
+    
+    def _detect_gpu_fallback(self, gpu_info: Dict[str, Any]):
+        """GPU detection through torch, or GPUtil, when CTranslate2 is unavailable."""
+        if not TORCH_AVAILABLE and not GPUTIL_AVAILABLE:
+            self.logger.warning("Neither CTranslate2 nor PyTorch available, GPU detection disabled")
+            return
         
         # NVIDIA CUDA detection
-        if torch.cuda.is_available():
+        if TORCH_AVAILABLE and torch.cuda.is_available():
             gpu_info['available'] = True
             gpu_info['count'] = torch.cuda.device_count()
             
@@ -166,11 +466,6 @@ class ResourceDetector:
                         self.logger.info(f"GPU detected: {gpu.name} ({gpu.memoryTotal} MB)")
             except Exception as e:
                 self.logger.warning(f"GPUtil detection failed: {e}")
-        
-        if not gpu_info['available']:
-            self.logger.info("No GPU detected, will use CPU processing")
-        
-        return gpu_info
     
     def _detect_mps(self) -> bool:
         """
@@ -179,7 +474,8 @@ class ResourceDetector:
         Returns:
             True if MPS is available, False otherwise
         """
-        if not TORCH_AVAILABLE:
+        # MPS only exists on macOS; elsewhere there is no reason to import torch
+        if not TORCH_AVAILABLE or platform.system() != "Darwin":
             return False
         
         try:
@@ -335,8 +631,8 @@ class ResourceDetector:
             'percent_used': memory.percent
         }
         
-        # Add GPU memory if available
-        if TORCH_AVAILABLE and torch.cuda.is_available():
+        # Add GPU memory if available (torch is only imported when there is a GPU)
+        if TORCH_AVAILABLE and self.detect_hardware().gpu_available and torch.cuda.is_available():
             for i in range(torch.cuda.device_count()):
                 memory_allocated = torch.cuda.memory_allocated(i) / (1024**3)
                 memory_reserved = torch.cuda.memory_reserved(i) / (1024**3)
@@ -489,9 +785,9 @@ def get_resource_detector() -> ResourceDetector:
     return _resource_detector
 
 
-def detect_hardware() -> HardwareInfo:
+def detect_hardware(refresh: bool = False) -> HardwareInfo:
     """Detect hardware using the global detector."""
-    return get_resource_detector().detect_hardware()
+    return get_resource_detector().detect_hardware(refresh)
 
 
 def get_device_config(force_device: Optional[str] = None) -> Dict[str, Any]:
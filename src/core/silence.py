@@ -0,0 +1,210 @@
+"""
+TalkGPT Silence Detection Module
+
+Vectorized frame-energy analysis for silence removal and split-point
+detection, replacing pydub's per-millisecond Python scan.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+class EnergyEnvelope:
+    """
+    Per-millisecond energy envelope of an audio signal.
+
+    Holds the sum of squared (full-scale normalized) samples and the sample
+    count of every 1 ms frame. Windowed RMS for any window length is derived
+    from prefix sums, so detection at several ``min_silence_len`` values
+    reuses a single pass over the audio. Results follow the semantics of
+    ``pydub.silence.detect_silence``/``detect_nonsilent`` with ``seek_step=1``.
+    """
+
+    # Samples are squared block by block to bound temporary memory
+    BLOCK_SECONDS = 60
+
+    def __init__(self, energy: np.ndarray, counts: np.ndarray):
+        """
+        Initialize the envelope from precomputed frame statistics.
+
+        Args:
+            energy: Sum of squared samples per millisecond frame
+            counts: Number of samples (across channels) per frame
+        """
+        self.energy = np.asarray(energy, dtype=np.float64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self._energy_prefix = np.concatenate(([0.0], np.cumsum(self.energy)))
+        self._count_prefix = np.concatenate(([0], np.cumsum(self.counts)))
+
+    @classmethod
+    def from_array(cls,
+                   samples: np.ndarray,
+                   sample_rate: int,
+                   full_scale: float = 1.0) -> "EnergyEnvelope":
+        """
+        Build an envelope from a sample array.
+
+        Args:
+            samples: Samples shaped (frames,) or (frames, channels)
+            sample_rate: Sample rate in Hz
+            full_scale: Amplitude corresponding to 0 dBFS
+
+        Returns:
+            EnergyEnvelope covering the whole signal
+        """
+        samples = np.asarray(samples)
+        if samples.ndim == 1:
+            samples = samples[:, None]
+
+        frame_count, channels = samples.shape
+        duration_ms = int(round(1000 * frame_count / sample_rate))
+        bounds = np.minimum(np.arange(duration_ms + 1, dtype=np.int64) * sample_rate // 1000, frame_count)
+
+        energy = np.zeros(duration_ms, dtype=np.float64)
+        block_ms = cls.BLOCK_SECONDS * 1000
+
+        for first in range(0, duration_ms, block_ms):
+            last = min(first + block_ms, duration_ms)
+            lo, hi = bounds[first], bounds[last]
+            block = samples[lo:hi].astype(np.float64)
+            block_prefix = np.concatenate(([0.0], np.cumsum(np.einsum('ij,ij->i', block, block))))
+            local = bounds[first:last + 1] - lo
+            energy[first:last] = block_prefix[local[1:]] - block_prefix[local[:-1]]
+
+        energy /= float(full_scale) ** 2
+        counts = np.diff(bounds) * channels
+        return cls(energy, counts)
+
+    @classmethod
+    def from_segment(cls, segment) -> "EnergyEnvelope":
+        """
+        Build an envelope from a pydub AudioSegment without pydub analysis.
+
+        Args:
+            segment: AudioSegment (or any object exposing raw_data,
+                sample_width, channels and frame_rate)
+
+        Returns:
+            EnergyEnvelope covering the whole segment
+        """
+        dtype = {1: np.int8, 2: '<i2', 4: '<i4'}[segment.sample_width]
+        samples = np.frombuffer(segment.raw_data, dtype=dtype).reshape(-1, segment.channels)
+        full_scale = float(2 ** (8 * segment.sample_width - 1))
+        return cls.from_array(samples, segment.frame_rate, full_scale=full_scale)
+
+    @property
+    def duration_ms(self) -> int:
+        """Envelope length in milliseconds."""
+        return len(self.energy)
+
+    def silent_ranges(self, min_silence_len: int, silence_thresh: float) -> List[Tuple[int, int]]:
+        """
+        Find silent ranges, equivalent to pydub's detect_silence.
+
+        Args:
+            min_silence_len: Minimum silence length in milliseconds
+            silence_thresh: Silence threshold in dBFS
+
+        Returns:
+            List of (start_ms, end_ms) silent ranges
+        """
+        window = max(1, int(min_silence_len))
+        if self.duration_ms < window:
+            return []
+
+        # RMS of every window starting at each millisecond, compared squared
+        window_energy = self._energy_prefix[window:] - self._energy_prefix[:-window]
+        window_counts = self._count_prefix[window:] - self._count_prefix[:-window]
+        threshold = 10 ** (silence_thresh / 20.0)
+        starts = np.flatnonzero(window_energy <= (threshold ** 2) * window_counts)
+
+        if starts.size == 0:
+            return []
+
+        # Window starts closer than one window apart belong to the same range
+        breaks = np.flatnonzero(np.diff(starts) > window)
+        range_starts = starts[np.concatenate(([0], breaks + 1))]
+        range_ends = starts[np.concatenate((breaks, [starts.size - 1]))] + window
+
+        return list(zip(range_starts.tolist(), range_ends.tolist()))
+
+    def nonsilent_ranges(self, min_silence_len: int, silence_thresh: float) -> List[Tuple[int, int]]:
+        """
+        Find non-silent ranges, equivalent to pydub's detect_nonsilent.
+
+        Args:
+            min_silence_len: Minimum silence length in milliseconds
+            silence_thresh: Silence threshold in dBFS
+
+        Returns:
+            List of (start_ms, end_ms) non-silent ranges
+        """
+        silent = self.silent_ranges(min_silence_len, silence_thresh)
+        length = self.duration_ms
+
+        if not silent:
+            return [(0, length)]
+
+        if silent[0][0] == 0 and silent[0][1] == length:
+            return []
+
+        nonsilent = []
+        prev_end = 0
+        for start, end in silent:
+            nonsilent.append((prev_end, start))
+            prev_end = end
+
+        if prev_end != length:
+            nonsilent.append((prev_end, length))
+
+        if nonsilent[0] == (0, 0):
+            nonsilent.pop(0)
+
+        return nonsilent
+
+    def speech_ranges(self,
+                      min_silence_len: int,
+                      silence_thresh: float,
+                      padding_ms: int = 100) -> List[Tuple[int, int]]:
+        """
+        Non-silent ranges padded to avoid clipping words, merged when padding
+        makes neighbours touch, so the result is strictly increasing.
+
+        Args:
+            min_silence_len: Minimum silence length in milliseconds
+            silence_thresh: Silence threshold in dBFS
+            padding_ms: Padding added on both sides of each range
+
+        Returns:
+            List of disjoint (start_ms, end_ms) ranges
+        """
+        merged: List[Tuple[int, int]] = []
+        for start, end in self.nonsilent_ranges(min_silence_len, silence_thresh):
+            start = max(0, start - padding_ms)
+            end = min(self.duration_ms, end + padding_ms)
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def select(self, ranges: List[Tuple[int, int]]) -> "EnergyEnvelope":
+        """
+        Envelope of the audio obtained by concatenating millisecond ranges.
+
+        Lets callers keep analysing audio after silence removal without
+        rescanning the samples.
+
+        Args:
+            ranges: List of (start_ms, end_ms) ranges to keep, in order
+
+        Returns:
+            New EnergyEnvelope for the concatenated ranges
+        """
+        if not ranges:
+            return EnergyEnvelope(np.zeros(0), np.zeros(0, dtype=np.int64))
+
+        energy = np.concatenate([self.energy[start:end] for start, end in ranges])
+        counts = np.concatenate([self.counts[start:end] for start, end in ranges])
+        return EnergyEnvelope(energy, counts)
@@ -0,0 +1,614 @@
+"""
+TalkGPT Streaming Transcription Engine
+
+Live transcription from a continuous audio source. The source's callback
+writes into a ring buffer, so no audio is lost while a decode runs. A
+background thread re-decodes a sliding window over the most recent audio
+every ``step_seconds``. A local-agreement policy then emits a word only
+once two consecutive decodes agree on it.
+"""
+
+import re
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+try:
+    from ..utils.logger import get_logger
+    from ..utils.lazy_imports import lazy_import
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.logger import get_logger
+    from utils.lazy_imports import lazy_import
+
+sf = lazy_import("soundfile")
+SOUNDFILE_AVAILABLE = sf is not None
+
+
+SAMPLE_RATE = 16000
+
+
+@dataclass
+class StreamWord:
+    """A word with absolute stream times in seconds."""
+    start: float
+    end: float
+    text: str
+
+
+def _normalize(text: str) -> str:
+    """Comparison form of a word: lowercase, without punctuation."""
+    return re.sub(r"[^\w']", "", text.lower())
+
+
+class AudioRingBuffer:
+    """
+    Fixed-size float32 sample buffer addressed by absolute sample position.
+
+    Writers (audio callbacks) append; readers copy out any range still
+    held. Once more than ``capacity`` samples have been written, the oldest
+    ones are overwritten.
+    """
+
+    def __init__(self, capacity_seconds: float = 60.0, sample_rate: int = SAMPLE_RATE):
+        """
+        Initialize the buffer.
+
+        Args:
+            capacity_seconds: Seconds of audio retained
+            sample_rate: Sample rate of the written audio
+        """
+        self.sample_rate = sample_rate
+        self.capacity = max(1, int(capacity_seconds * sample_rate))
+        self._data = np.zeros(self.capacity, dtype=np.float32)
+        self._written = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def end(self) -> int:
+        """Absolute position one past the newest sample."""
+        return self._written
+
+    @property
+    def start(self) -> int:
+        """Absolute position of the oldest sample still held."""
+        return max(0, self._written - self.capacity)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, samples: np.ndarray):
+        """
+        Append samples; multi-channel input is mixed down to mono.
+
+        Args:
+            samples: 1-D samples or a (frames, channels) block
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1)
+        count = samples.size
+        if count > self.capacity:
+            samples = samples[-self.capacity:]
+
+        with self._cond:
+            position = (self._written + count - samples.size) % self.capacity
+            first = min(samples.size, self.capacity - position)
+            self._data[position:position + first] = samples[:first]
+            self._data[:samples.size - first] = samples[first:]
+            self._written += count
+            self._cond.notify_all()
+
+    def read(self, start: int, end: Optional[int] = None) -> np.ndarray:
+        """
+        Copy out samples in [start, end), clamped to what is still held.
+
+        Args:
+            start: Absolute start position
+            end: Absolute end position (defaults to the newest sample)
+
+        Returns:
+            Contiguous float32 array
+        """
+        with self._cond:
+            end = self._written if end is None else min(end, self._written)
+            start = max(start, self.start)
+            if end <= start:
+                return np.zeros(0, dtype=np.float32)
+
+            first = start % self.capacity
+            count = end - start
+            if first + count <= self.capacity:
+                return self._data[first:first + count].copy()
+            head = self._data[first:]
+            return np.concatenate([head, self._data[:count - head.size]])
+
+    def wait_for(self, position: int, timeout: Optional[float] = None) -> bool:
+        """
+        Block until ``position`` samples have been written or the buffer closes.
+
+        Returns:
+            True if the position was reached
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._written >= position or self._closed, timeout)
+            return self._written >= position
+
+    def close(self):
+        """Mark the end of the stream and wake waiting readers."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class LocalAgreement:
+    """
+    Confirms words that two consecutive hypotheses agree on (LocalAgreement-2).
+
+    Each decode of the sliding window produces a hypothesis for everything
+    after the last confirmed word. The longest common prefix with the
+    previous hypothesis is confirmed; the rest stays tentative.
+    """
+
+    # Confirmed words a new hypothesis may repeat at its start
+    MAX_REPEAT = 5
+
+    def __init__(self):
+        self.committed: List[StreamWord] = []
+        self.tentative: List[StreamWord] = []
+
+    @property
+    def committed_end(self) -> float:
+        """End time of the last confirmed word."""
+        return self.committed[-1].end if self.committed else 0.0
+
+    def insert(self, words: List[StreamWord]) -> List[StreamWord]:
+        """
+        Add a new hypothesis.
+
+        Args:
+            words: Words of the latest decode, in absolute stream time
+
+        Returns:
+            Newly confirmed words
+        """
+        committed_end = self.committed_end
+        words = [word for word in words if word.start > committed_end - 0.1]
+
+        # The window usually starts before the last confirmed word ends,
+        # so the decode repeats a few confirmed words; drop them
+        if words and self.committed and abs(words[0].start - committed_end) < 1.0:
+            for n in range(min(self.MAX_REPEAT, len(self.committed), len(words)), 0, -1):
+                tail = [_normalize(word.text) for word in self.committed[-n:]]
+                head = [_normalize(word.text) for word in words[:n]]
+                if tail == head:
+                    words = words[n:]
+                    break
+
+        confirmed = []
+        for previous, word in zip(self.tentative, words):
+            if _normalize(previous.text) != _normalize(word.text):
+                break
+            confirmed.append(word)
+
+        self.committed.extend(confirmed)
+        self.tentative = words[len(confirmed):]
+        return confirmed
+
+    def confirm_until(self, time_seconds: float) -> List[StreamWord]:
+        """Confirm tentative words ending by ``time_seconds`` (audio about to leave the window)."""
+        count = 0
+        while count < len(self.tentative) and self.tentative[count].end <= time_seconds:
+            count += 1
+        confirmed, self.tentative = self.tentative[:count], self.tentative[count:]
+        self.committed.extend(confirmed)
+        return confirmed
+
+    def flush(self) -> List[StreamWord]:
+        """Confirm the remaining tentative words (end of stream)."""
+        confirmed, self.tentative = self.tentative, []
+        self.committed.extend(confirmed)
+        return confirmed
+
+
+# Decoder signature: (window samples, window start in seconds, prompt) -> words
+Decoder = Callable[[np.ndarray, float, Optional[str]], List[StreamWord]]
+
+
+def whisper_decoder(transcriber,
+                    language: Optional[str] = None,
+                    beam_size: int = 5,
+                    temperature: float = 0.0) -> Decoder:
+    """
+    Build a decoder on a loaded WhisperTranscriber.
+
+    Args:
+        transcriber: WhisperTranscriber with a loaded model
+        language: Language code (None for auto-detection)
+        beam_size: Beam size
+        temperature: Sampling temperature
+
+    Returns:
+        Decoder producing word-timestamped StreamWords
+    """
+    if transcriber.model is None:
+        raise RuntimeError("Model not loaded")
+
+    def decode(audio: np.ndarray, offset: float, prompt: Optional[str] = None) -> List[StreamWord]:
+        segments, _ = transcriber.model.transcribe(
+            audio,
+            language=language,
+            beam_size=beam_size,
+            temperature=temperature,
+            word_timestamps=True,
+            initial_prompt=prompt or None,
+            condition_on_previous_text=False,
+            vad_filter=False
+        )
+        return [
+            StreamWord(offset + word.start, offset + word.end, word.word.strip())
+            for segment in segments
+            for word in (segment.words or [])
+            if word.word.strip()
+        ]
+
+    return decode
+
+
+class StreamingTranscriber:
+    """
+    Runs the decode loop over a ring buffer fed by an audio source.
+
+    ``feed`` is cheap enough to call from an audio callback. The decode
+    thread reports confirmed words through ``on_confirmed``. After each
+    decode it also reports the current tentative tail through
+    ``on_partial``.
+    """
+
+    # Characters of confirmed text passed to the decoder as a prompt
+    PROMPT_CHARS = 200
+
+    def __init__(self,
+                 decode: Decoder,
+                 sample_rate: int = SAMPLE_RATE,
+                 step_seconds: float = 1.0,
+                 max_window_seconds: float = 15.0,
+                 buffer_seconds: float = 60.0,
+                 on_confirmed: Optional[Callable[[List[StreamWord]], None]] = None,
+                 on_partial: Optional[Callable[[List[StreamWord]], None]] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            decode: Decoder run on each window
+            sample_rate: Sample rate of the fed audio
+            step_seconds: New audio required before the next decode
+            max_window_seconds: Window length after which it is trimmed to
+                the last confirmed word
+            buffer_seconds: Ring buffer capacity
+            on_confirmed: Called with newly confirmed words
+            on_partial: Called with the tentative words after each decode
+        """
+        self.logger = get_logger("talkgpt.streaming")
+        self.decode = decode
+        self.sample_rate = sample_rate
+        self.step = max(1, int(step_seconds * sample_rate))
+        self.max_window = max(self.step, int(max_window_seconds * sample_rate))
+        self.buffer = AudioRingBuffer(max(buffer_seconds, 2 * max_window_seconds), sample_rate)
+        self.agreement = LocalAgreement()
+        self.on_confirmed = on_confirmed
+        self.on_partial = on_partial
+
+        self._window_start = 0
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._decodes = 0
+        self._decode_seconds = 0.0
+        self._confirm_lags: List[float] = []
+
+    def feed(self, samples: np.ndarray):
+        """Append captured audio (safe to call from an audio callback)."""
+        self.buffer.write(samples)
+
+    def start(self):
+        """Start the decode thread."""
+        if self._thread is not None:
+            raise RuntimeError("Streaming transcriber already started")
+        self._thread = threading.Thread(target=self._run, name="talkgpt-stream-decode", daemon=True)
+        self._thread.start()
+
+    def finish(self, timeout: Optional[float] = None) -> List[StreamWord]:
+        """
+        End the stream, decode the remaining audio and confirm everything.
+
+        Returns:
+            All confirmed words
+
+        Raises:
+            Exception: Whatever the decoder raised, if it failed
+        """
+        self.buffer.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._error is not None:
+            raise self._error
+        return list(self.agreement.committed)
+
+    def run(self, source: "AudioSource", timeout: Optional[float] = None) -> List[StreamWord]:
+        """
+        Transcribe a source until it ends (or ``timeout`` seconds pass).
+
+        Args:
+            source: Audio source to capture from
+            timeout: Maximum seconds to capture (None until the source ends)
+
+        Returns:
+            All confirmed words
+        """
+        self.start()
+        source.start(self.feed)
+        try:
+            source.wait(timeout)
+        finally:
+            source.stop()
+        return self.finish()
+
+    def stats(self) -> Dict[str, Any]:
+        """Decode counts and timing; lag is audio received past a word's end when it was confirmed."""
+        lags = self._confirm_lags
+        return {
+            'decodes': self._decodes,
+            'avg_decode_seconds': self._decode_seconds / self._decodes if self._decodes else 0.0,
+            'confirmed_words': len(self.agreement.committed),
+            'avg_confirm_lag': float(np.mean(lags)) if lags else 0.0,
+            'max_confirm_lag': float(np.max(lags)) if lags else 0.0,
+        }
+
+    def _prompt(self) -> Optional[str]:
+        """Confirmed text preceding the current window."""
+        window_start = self._window_start / self.sample_rate
+        text = " ".join(word.text for word in self.agreement.committed if word.end <= window_start)
+        return text[-self.PROMPT_CHARS:] or None
+
+    def _run(self):
+        """Decode thread body."""
+        try:
+            next_decode = self.step
+            while True:
+                self.buffer.wait_for(next_decode, timeout=0.1)
+                final = self.buffer.closed
+                end = self.buffer.end
+                if end < next_decode and not final:
+                    continue
+
+                if self._window_start < self.buffer.start:
+                    self.logger.warning("Decoding fell behind; oldest audio was overwritten")
+                    self._window_start = self.buffer.start
+
+                if end > self._window_start:
+                    self._decode_window(end, final)
+
+                if final:
+                    return
+                next_decode = end + self.step
+        except BaseException as e:
+            self._error = e
+            self.logger.error(f"Streaming decode failed: {e}")
+
+    def _decode_window(self, end: int, final: bool):
+        """Decode [window start, end), emit results and slide the window."""
+        audio = self.buffer.read(self._window_start, end)
+        offset = self._window_start / self.sample_rate
+
+        decode_start = time.time()
+        words = self.decode(audio, offset, self._prompt())
+        self._decodes += 1
+        self._decode_seconds += time.time() - decode_start
+
+        confirmed = self.agreement.insert(words)
+        if final:
+            confirmed += self.agreement.flush()
+        else:
+            confirmed += self._slide_window(end)
+
+        if confirmed:
+            heard = self.buffer.end / self.sample_rate
+            self._confirm_lags.extend(heard - word.end for word in confirmed)
+            if self.on_confirmed:
+                self.on_confirmed(confirmed)
+        if self.on_partial and not final:
+            self.on_partial(list(self.agreement.tentative))
+
+    def _slide_window(self, end: int) -> List[StreamWord]:
+        """
+        Keep the window bounded by restarting it at the last confirmed word.
+
+        If that still leaves more than max_window, the oldest audio is cut
+        and the tentative words in it are confirmed as they stand, since
+        no later decode will see them again. The cut moves back to the
+        start of a word it would split, so that word stays in the window.
+
+        Returns:
+            Words confirmed by a forced cut
+        """
+        if end - self._window_start <= self.max_window:
+            return []
+
+        committed = int(self.agreement.committed_end * self.sample_rate)
+        if end - committed <= self.max_window:
+            self._window_start = max(self._window_start, committed)
+            return []
+
+        cut = end - self.max_window
+        confirmed = self.agreement.confirm_until(cut / self.sample_rate)
+        if self.agreement.tentative:
+            cut = min(cut, int(self.agreement.tentative[0].start * self.sample_rate))
+        self._window_start = max(self._window_start, cut)
+        return confirmed
+
+
+class AudioSource(ABC):
+    """
+    Pushes captured audio blocks to a callback.
+
+    Subclasses implement ``start`` and ``stop``; ``wait`` returns once the
+    source has ended or the timeout expired.
+    """
+
+    sample_rate = SAMPLE_RATE
+
+    def __init__(self):
+        self._finished = threading.Event()
+
+    @abstractmethod
+    def start(self, callback: Callable[[np.ndarray], None]):
+        """Begin delivering blocks to ``callback`` without blocking."""
+
+    def stop(self):
+        self._finished.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the source ends; True if it did within the timeout."""
+        return self._finished.wait(timeout)
+
+
+class ArrayAudioSource(AudioSource):
+    """Replays samples in blocks, paced at real time unless told otherwise."""
+
+    def __init__(self,
+                 samples: np.ndarray,
+                 sample_rate: int = SAMPLE_RATE,
+                 block_seconds: float = 0.1,
+                 realtime: bool = True):
+        """
+        Initialize the source.
+
+        Args:
+            samples: Mono float32 samples
+            sample_rate: Sample rate of the samples
+            block_seconds: Size of each delivered block
+            realtime: Pace delivery at the audio's own rate
+        """
+        super().__init__()
+        self.samples = np.asarray(samples, dtype=np.float32)
+        self.sample_rate = sample_rate
+        self.block = max(1, int(block_seconds * sample_rate))
+        self.realtime = realtime
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, callback: Callable[[np.ndarray], None]):
+        self._thread = threading.Thread(target=self._replay, args=(callback,),
+                                        name="talkgpt-stream-source", daemon=True)
+        self._thread.start()
+
+    def _replay(self, callback: Callable[[np.ndarray], None]):
+        started = time.monotonic()
+        try:
+            for position in range(0, self.samples.size, self.block):
+                if self._stop.is_set():
+                    break
+                if self.realtime:
+                    delay = started + position / self.sample_rate - time.monotonic()
+                    if delay > 0:
+                        self._stop.wait(delay)
+                callback(self.samples[position:position + self.block])
+        finally:
+            self._finished.set()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        super().stop()
+
+
+def _load_samples(path: Path, sample_rate: int) -> np.ndarray:
+    """Read an audio file as mono float32 at ``sample_rate``."""
+    if SOUNDFILE_AVAILABLE:
+        samples, file_rate = sf.read(str(path), dtype='float32', always_2d=True)
+        samples = samples.mean(axis=1)
+    else:
+        with wave.open(str(path), 'rb') as wav_file:
+            if wav_file.getsampwidth() != 2:
+                raise ValueError(f"Only 16-bit PCM WAV is supported without soundfile: {path}")
+            file_rate = wav_file.getframerate()
+            frames = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype='<i2')
+            samples = frames.reshape(-1, wav_file.getnchannels()).mean(axis=1) / 32768.0
+
+    if file_rate != sample_rate:
+        # Linear resampling is plenty for replaying test material
+        duration = samples.size / file_rate
+        positions = np.arange(int(duration * sample_rate)) / sample_rate
+        samples = np.interp(positions, np.arange(samples.size) / file_rate, samples)
+    return samples.astype(np.float32)
+
+
+class FileAudioSource(ArrayAudioSource):
+    """Replays an audio file as if it were being captured live."""
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 sample_rate: int = SAMPLE_RATE,
+                 block_seconds: float = 0.1,
+                 realtime: bool = True):
+        """
+        Initialize the source.
+
+        Args:
+            path: Audio file (any format soundfile reads; 16-bit WAV otherwise)
+            sample_rate: Rate to deliver at
+            block_seconds: Size of each delivered block
+            realtime: Pace delivery at the audio's own rate
+        """
+        super().__init__(_load_samples(Path(path), sample_rate), sample_rate, block_seconds, realtime)
+        self.path = Path(path)
+
+
+class MicrophoneAudioSource(AudioSource):
+    """Captures from an input device through sounddevice's callback stream."""
+
+    def __init__(self,
+                 device: Optional[int] = None,
+                 sample_rate: int = SAMPLE_RATE,
+                 block_seconds: float = 0.1):
+        """
+        Initialize the source.
+
+        Args:
+            device: Input device index (None for the default device)
+            sample_rate: Capture rate
+            block_seconds: Size of each delivered block
+        """
+        super().__init__()
+        self.device = device
+        self.sample_rate = sample_rate
+        self.block = max(1, int(block_seconds * sample_rate))
+        self._stream = None
+
+    def start(self, callback: Callable[[np.ndarray], None]):
+        import sounddevice as sd
+
+        def on_audio(indata, frames, time_info, status):
+            callback(indata[:, 0].copy())
+
+        self._stream = sd.InputStream(samplerate=self.sample_rate, channels=1, dtype='float32',
+                                      blocksize=self.block, device=self.device, callback=on_audio)
+        self._stream.start()
+
+    def stop(self):
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        super().stop()
@@ -0,0 +1,126 @@
+"""
+TalkGPT Timeline Mapping Module
+
+Piecewise-linear mapping between the processed audio timeline (after
+silence removal and speed-up) and the original source timeline.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+
+@dataclass
+class TimeMap:
+    """
+    Piecewise-linear processed -> original time map.
+
+    Stored as knots of (processed_t, original_t). Both arrays are
+    non-decreasing; a removed silence shows up as two knots sharing one
+    processed time, and speed-up as a slope of ``speed_multiplier``.
+    """
+    processed: np.ndarray
+    original: np.ndarray
+
+    @classmethod
+    def identity(cls, duration: float) -> "TimeMap":
+        """Map for audio whose timeline was not altered."""
+        knots = np.array([0.0, float(duration)])
+        return cls(processed=knots, original=knots.copy())
+
+    @classmethod
+    def from_kept_ranges(cls,
+                         kept_ranges: Iterable[Tuple[float, float]],
+                         speed_multiplier: float = 1.0) -> "TimeMap":
+        """
+        Build a map from the original ranges retained by silence removal.
+
+        Args:
+            kept_ranges: Ordered, non-overlapping (start, end) ranges in
+                original seconds that were concatenated into the output
+            speed_multiplier: Tempo factor applied after concatenation
+
+        Returns:
+            TimeMap with two knots per kept range
+        """
+        ranges = np.asarray(list(kept_ranges), dtype=np.float64).reshape(-1, 2)
+        if ranges.size == 0:
+            return cls.identity(0.0)
+
+        lengths = ranges[:, 1] - ranges[:, 0]
+        processed_starts = np.concatenate(([0.0], np.cumsum(lengths)[:-1]))
+
+        processed = np.column_stack((processed_starts, processed_starts + lengths)).ravel() / speed_multiplier
+        original = ranges.ravel()
+        return cls(processed=processed, original=original)
+
+    def scaled(self, speed_multiplier: float) -> "TimeMap":
+        """Compose this map with a later tempo change of ``speed_multiplier``."""
+        return TimeMap(processed=self.processed / speed_multiplier, original=self.original.copy())
+
+    def to_original(self, t: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Map processed-audio time(s) to original time(s)."""
+        mapped = np.interp(t, self.processed, self.original)
+        return float(mapped) if np.ndim(mapped) == 0 else mapped
+
+    def to_processed(self, t: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Map original time(s) to processed-audio time(s)."""
+        mapped = np.interp(t, self.original, self.processed)
+        return float(mapped) if np.ndim(mapped) == 0 else mapped
+
+    @property
+    def is_identity(self) -> bool:
+        """True when the map does not change any timestamp."""
+        return np.array_equal(self.processed, self.original)
+
+    @property
+    def original_duration(self) -> float:
+        """Length of the original timeline covered by the map."""
+        return float(self.original[-1]) if self.original.size else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the map as [processed_t, original_t] knot pairs."""
+        return {'knots': np.column_stack((self.processed, self.original)).tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TimeMap":
+        """Rebuild a map serialized by to_dict."""
+        knots = np.asarray(data['knots'], dtype=np.float64).reshape(-1, 2)
+        return cls(processed=knots[:, 0].copy(), original=knots[:, 1].copy())
+
+
+def remap_segments(segments: List[Any], time_map: TimeMap) -> None:
+    """
+    Remap transcription segments and their words to the original timeline.
+
+    All start/end values are gathered into one array and mapped with a
+    single ``np.interp`` call, then written back in place. Each segment is
+    remapped once even if it appears in the list several times.
+
+    Args:
+        segments: Objects with ``start``/``end`` and optional ``words``
+            (list of dicts with 'start'/'end' keys)
+        time_map: Processed -> original map
+    """
+    unique_segments = list({id(segment): segment for segment in segments}.values())
+    if not unique_segments:
+        return
+
+    times = []
+    for segment in unique_segments:
+        times.append(segment.start)
+        times.append(segment.end)
+        for word in segment.words or []:
+            times.append(word['start'])
+            times.append(word['end'])
+
+    mapped = time_map.to_original(np.asarray(times, dtype=np.float64)).tolist()
+
+    position = 0
+    for segment in unique_segments:
+        segment.start, segment.end = mapped[position], mapped[position + 1]
+        position += 2
+        for word in segment.words or []:
+            word['start'], word['end'] = mapped[position], mapped[position + 1]
+            position += 2
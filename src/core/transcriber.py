@@ -6,17 +6,16 @@ and advanced optimization features.
 """
 
 import time
-import json
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Iterable, List, Optional, Union, Tuple
+from dataclasses import dataclass
 import tempfile
 
-try:
-    from faster_whisper import WhisperModel
-    FASTER_WHISPER_AVAILABLE = True
-except ImportError:
-    FASTER_WHISPER_AVAILABLE = False
+import numpy as np
+
 import warnings
 # Silence specific deprecation warning originating from ctranslate2 importing pkg_resources
 warnings.filterwarnings(
@@ -26,26 +25,91 @@ warnings.filterwarnings(
     module=r"ctranslate2.*",
 )
 
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
-
 try:
     from ..utils.logger import get_logger, get_file_logger
-    from ..core.chunker import AudioChunk, ChunkingResult
+    from ..utils.lazy_imports import module_available
+    from ..core.chunker import AudioChunk, ChunkingResult, ChunkStream
     from ..core.resource_detector import get_device_config
+    from ..core.model_registry import get_model_registry
+    from ..core.timeline import TimeMap, remap_segments
+    from ..utils.cache import ResultCache, hash_array, hash_audio_file
+    from ..utils.json_stream import write_json
+    from ..utils.tracing import (
+        AUDIO_SECONDS, CHUNK_LATENCY, CHUNKS, REALTIME_FACTOR, get_tracer, traced
+    )
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.logger import get_logger, get_file_logger
-    from core.chunker import AudioChunk, ChunkingResult
+    from utils.lazy_imports import module_available
+    from core.chunker import AudioChunk, ChunkingResult, ChunkStream
     from core.resource_detector import get_device_config
+    from core.model_registry import get_model_registry
+    from core.timeline import TimeMap, remap_segments
+    from utils.cache import ResultCache, hash_array, hash_audio_file
+    from utils.json_stream import write_json
+    from utils.tracing import (
+        AUDIO_SECONDS, CHUNK_LATENCY, CHUNKS, REALTIME_FACTOR, get_tracer, traced
+    )
 
+# faster-whisper (and torch behind it) is imported when the first model
+# loads, so result types can be used without the inference stack
+FASTER_WHISPER_AVAILABLE = module_available("faster_whisper")
+TORCH_AVAILABLE = module_available("torch")
+WhisperModel = None
+BatchedInferencePipeline = None
+BATCHED_PIPELINE_AVAILABLE = FASTER_WHISPER_AVAILABLE
+_faster_whisper_lock = threading.Lock()
 
-@dataclass
+
+def _import_faster_whisper():
+    """Bind WhisperModel and BatchedInferencePipeline on first use."""
+    global WhisperModel, BatchedInferencePipeline, BATCHED_PIPELINE_AVAILABLE
+    if WhisperModel is not None:
+        return
+    with _faster_whisper_lock:
+        if WhisperModel is not None:
+            return
+        from faster_whisper import WhisperModel as whisper_model
+        try:
+            # Added in faster-whisper 1.1
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            BATCHED_PIPELINE_AVAILABLE = False
+        # Bound last: other threads skip the lock once it is set
+        WhisperModel = whisper_model
+
+
+@dataclass(slots=True)
+class WordTimestamp:
+    """
+    Word-level timestamp inside a segment.
+    
+    Segment words used to be dicts; item access (``word['start']``,
+    ``word.get('probability')``) keeps working for existing callers.
+    """
+    word: str
+    start: float
+    end: float
+    probability: float = 1.0
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+
+@dataclass(slots=True)
 class TranscriptionSegment:
     """Single transcription segment with metadata."""
     id: int
@@ -54,12 +118,12 @@ class TranscriptionSegment:
     text: str
     avg_logprob: float
     no_speech_prob: float
-    words: Optional[List[Dict[str, Any]]] = None
+    words: Optional[List[WordTimestamp]] = None
     language: Optional[str] = None
     temperature: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """Complete transcription result for a single chunk or file."""
     segments: List[TranscriptionSegment]
@@ -93,12 +157,18 @@ class WhisperTranscriber:
     selection, confidence scoring, and performance optimization.
     """
     
+    SAMPLE_RATE = 16000
+    # Longest clip BatchedInferencePipeline encodes as one batch item
+    BATCH_CLIP_SECONDS = 30.0
+    
     def __init__(self,
                  model_size: str = "large-v3",
                  device: str = "auto",
                  compute_type: str = "auto",
                  cpu_threads: Optional[int] = None,
-                 num_workers: int = 1):
+                 num_workers: int = 1,
+                 result_cache: Optional[ResultCache] = None,
+                 batch_size: int = 1):
         """
         Initialize the Whisper transcriber.
         
@@ -107,16 +177,24 @@ class WhisperTranscriber:
             device: Device to use (auto, cpu, cuda, mps)
             compute_type: Compute precision (float16, int8, float32)
             cpu_threads: Number of CPU threads (None = auto)
-            num_workers: Number of parallel workers for batch processing
+            num_workers: Number of chunks decoded concurrently; values above 1
+                load that many CTranslate2 model replicas and transcribe chunks
+                on a bounded thread pool
+            result_cache: Cache for per-chunk results (None to disable)
+            batch_size: Chunks decoded together in one encoder/decoder batch
+                through BatchedInferencePipeline (1 = decode chunk by chunk)
         """
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.cpu_threads = cpu_threads
-        self.num_workers = num_workers
+        self.num_workers = max(1, int(num_workers or 1))
+        self.result_cache = result_cache
+        self.batch_size = max(1, int(batch_size or 1))
+        self.batched_pipeline = None
         
         self.logger = get_logger("talkgpt.transcriber")
-        self.model: Optional[WhisperModel] = None
+        self.model: Optional['WhisperModel'] = None
         self.model_info: Dict[str, Any] = {}
         
         # Check dependencies
@@ -129,6 +207,7 @@ class WhisperTranscriber:
         """Check for required dependencies."""
         if not FASTER_WHISPER_AVAILABLE:
             raise RuntimeError("faster-whisper is required but not installed")
+        _import_faster_whisper()
         
         if not TORCH_AVAILABLE:
             self.logger.warning("PyTorch not available, some features may be limited")
@@ -154,21 +233,35 @@ class WhisperTranscriber:
             self.logger.info(f"Device: {actual_device}, Compute type: {actual_compute_type}")
             
             # Load model with compatible parameters
-            model_kwargs = {
-                'device': actual_device,
-                'compute_type': actual_compute_type
-            }
+            model_kwargs = {}
             
             # Add device_index for CUDA
             if actual_device == 'cuda':
                 model_kwargs['device_index'] = 0
             
             # Note: Avoid intra_threads parameter as it causes conflicts in ctranslate2
-            # The library will use optimal thread count automatically
+            # The library will use optimal thread count automatically, unless the
+            # caller set an explicit budget (e.g. one batch worker's share of the cores)
+            if self.cpu_threads:
+                model_kwargs['cpu_threads'] = self.cpu_threads
             
-            # Note: num_workers is not a WhisperModel parameter, it's for batch processing
+            # Concurrent transcribe() calls from several threads only run in
+            # parallel when CTranslate2 holds one replica per worker
+            if self.num_workers > 1:
+                model_kwargs['num_workers'] = self.num_workers
             
-            self.model = WhisperModel(self.model_size, **model_kwargs)
+            # Shared with every other user of the same model in this process
+            self.model = get_model_registry().get(
+                self.model_size, actual_device, actual_compute_type,
+                loader=WhisperModel, **model_kwargs
+            )
+            
+            if self.batch_size > 1:
+                if BATCHED_PIPELINE_AVAILABLE:
+                    self.batched_pipeline = BatchedInferencePipeline(model=self.model)
+                else:
+                    self.logger.warning("BatchedInferencePipeline requires faster-whisper >= 1.1, "
+                                        "decoding chunks one at a time")
             
             # Store model info
             self.model_info = {
@@ -176,7 +269,8 @@ class WhisperTranscriber:
                 'device': actual_device,
                 'compute_type': actual_compute_type,
                 'cpu_threads': cpu_threads,
-                'num_workers': self.num_workers
+                'num_workers': self.num_workers,
+                'batch_size': self.batch_size if self.batched_pipeline is not None else 1
             }
             
             self.logger.info("Whisper model loaded successfully")
@@ -185,6 +279,7 @@ class WhisperTranscriber:
             self.logger.error(f"Failed to load Whisper model: {e}")
             raise
     
+    @traced("transcribe_chunk")
     def transcribe_chunk(self, 
                         audio_chunk: AudioChunk,
                         language: Optional[str] = None,
@@ -215,102 +310,228 @@ class WhisperTranscriber:
         
         file_logger = get_file_logger(str(audio_chunk.original_start))
         file_logger.info(f"Transcribing chunk {audio_chunk.chunk_id}: {audio_chunk.duration:.1f}s")
+        get_tracer().annotate(chunk_id=audio_chunk.chunk_id, audio_seconds=audio_chunk.duration)
+        
+        decode_options = {
+            'language': language,
+            'temperature': temperature,
+            'beam_size': beam_size,
+            'best_of': best_of,
+            'patience': patience,
+            'word_timestamps': word_timestamps
+        }
+        
+        cache_key, cached = self._lookup_chunk_cache(audio_chunk, decode_options)
+        if cached is not None:
+            file_logger.info(f"Chunk {audio_chunk.chunk_id} served from result cache")
+            CHUNKS.inc(status="cached")
+            return self._place_chunk_result(cached, audio_chunk, time.time() - start_time)
         
         try:
             # Transcribe audio
-            segments, info = self.model.transcribe(
-                str(audio_chunk.file_path),
-                language=language,
-                temperature=temperature,
-                beam_size=beam_size,
-                best_of=best_of,
-                patience=patience,
-                word_timestamps=word_timestamps
-            )
+            segments, info = self.model.transcribe(self._chunk_audio_input(audio_chunk), **decode_options)
             
-            # Convert segments to our format
-            transcription_segments = []
-            full_text_parts = []
-            confidence_scores = []
-            
-            for i, segment in enumerate(segments):
-                # Adjust timestamps to account for chunk position
-                adjusted_start = segment.start + audio_chunk.original_start
-                adjusted_end = segment.end + audio_chunk.original_start
-                
-                # Extract word-level timestamps if available
-                words = None
-                if word_timestamps and hasattr(segment, 'words') and segment.words:
-                    words = []
-                    for word in segment.words:
-                        word_info = {
-                            'word': word.word,
-                            'start': word.start + audio_chunk.original_start,
-                            'end': word.end + audio_chunk.original_start,
-                            'probability': getattr(word, 'probability', 1.0)
-                        }
-                        words.append(word_info)
-                
-                transcription_segment = TranscriptionSegment(
-                    id=i,
-                    start=adjusted_start,
-                    end=adjusted_end,
-                    text=segment.text.strip(),
-                    avg_logprob=segment.avg_logprob,
-                    no_speech_prob=segment.no_speech_prob,
-                    words=words,
-                    language=info.language,
-                    temperature=segment.temperature if hasattr(segment, 'temperature') else temperature
-                )
-                
-                transcription_segments.append(transcription_segment)
-                full_text_parts.append(segment.text.strip())
-                confidence_scores.append(segment.avg_logprob)
-            
-            # Calculate overall confidence
-            avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else -5.0
-            
-            # Create result
-            processing_time = time.time() - start_time
-            full_text = " ".join(full_text_parts).strip()
-            
-            result = TranscriptionResult(
-                segments=transcription_segments,
-                language=info.language,
-                language_probability=info.language_probability,
-                duration=audio_chunk.duration,
-                text=full_text,
-                avg_confidence=avg_confidence,
-                processing_time=processing_time,
-                model_info=self.model_info.copy(),
-                chunk_info={
-                    'chunk_id': audio_chunk.chunk_id,
-                    'original_start': audio_chunk.original_start,
-                    'original_end': audio_chunk.original_end,
-                    'overlap_prev': audio_chunk.overlap_prev,
-                    'overlap_next': audio_chunk.overlap_next
-                }
+            result = self._build_chunk_result(
+                audio_chunk, segments, info, decode_options,
+                offset=audio_chunk.original_start,
+                processing_time=None,
+                start_time=start_time
             )
             
-            file_logger.info(f"Chunk transcription completed: {len(transcription_segments)} segments, "
-                           f"confidence: {avg_confidence:.2f}, time: {processing_time:.2f}s")
+            file_logger.info(f"Chunk transcription completed: {len(result.segments)} segments, "
+                           f"confidence: {result.avg_confidence:.2f}, time: {result.processing_time:.2f}s")
+            
+            self._store_chunk_result(cache_key, result, audio_chunk)
+            CHUNK_LATENCY.observe(result.processing_time)
+            CHUNKS.inc(status="ok")
             
             return result
             
         except Exception as e:
             file_logger.error(f"Chunk transcription failed: {e}")
+            CHUNKS.inc(status="failed")
             raise
     
+    @staticmethod
+    def _chunk_audio_input(audio_chunk: AudioChunk) -> Union[str, np.ndarray]:
+        """Samples for in-memory chunks, a path for file-backed ones."""
+        # In-memory chunks hand their sample view straight to the model;
+        # file-backed chunks are decoded from disk by faster-whisper
+        if audio_chunk.audio is not None:
+            if audio_chunk.sample_rate not in (None, 16000):
+                raise ValueError(f"In-memory chunks must be 16 kHz, got {audio_chunk.sample_rate} Hz")
+            return audio_chunk.audio
+        return str(audio_chunk.file_path)
+    
+    def _build_chunk_result(self,
+                            audio_chunk: AudioChunk,
+                            segments,
+                            info,
+                            decode_options: Dict[str, Any],
+                            offset: float,
+                            processing_time: Optional[float] = None,
+                            start_time: Optional[float] = None) -> TranscriptionResult:
+        """
+        Convert faster-whisper segments of one chunk into a TranscriptionResult.
+        
+        Args:
+            audio_chunk: Chunk the segments belong to
+            segments: Iterable of faster-whisper segments
+            info: faster-whisper TranscriptionInfo
+            decode_options: Options the segments were decoded with
+            offset: Seconds added to segment/word times to place them
+            processing_time: Decode time to report (None to measure from start_time)
+            start_time: Decode start timestamp used when processing_time is None
+            
+        Returns:
+            TranscriptionResult for the chunk
+        """
+        word_timestamps = decode_options.get('word_timestamps', False)
+        temperature = decode_options.get('temperature', 0.0)
+        
+        # Convert segments to our format
+        transcription_segments = []
+        full_text_parts = []
+        confidence_scores = []
+        
+        for i, segment in enumerate(segments):
+            # Adjust timestamps to account for chunk position
+            adjusted_start = segment.start + offset
+            adjusted_end = segment.end + offset
+            
+            # Extract word-level timestamps if available
+            words = None
+            if word_timestamps and hasattr(segment, 'words') and segment.words:
+                words = []
+                for word in segment.words:
+                    words.append(WordTimestamp(
+                        word=word.word,
+                        start=word.start + offset,
+                        end=word.end + offset,
+                        probability=getattr(word, 'probability', 1.0)
+                    ))
+            
+            transcription_segment = TranscriptionSegment(
+                id=i,
+                start=adjusted_start,
+                end=adjusted_end,
+                text=segment.text.strip(),
+                avg_logprob=segment.avg_logprob,
+                no_speech_prob=segment.no_speech_prob,
+                words=words,
+                language=info.language,
+                temperature=segment.temperature if hasattr(segment, 'temperature') else temperature
+            )
+            
+            transcription_segments.append(transcription_segment)
+            full_text_parts.append(segment.text.strip())
+            confidence_scores.append(segment.avg_logprob)
+        
+        # Calculate overall confidence
+        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else -5.0
+        
+        # Create result
+        if processing_time is None:
+            processing_time = time.time() - start_time
+        full_text = " ".join(full_text_parts).strip()
+        
+        return TranscriptionResult(
+            segments=transcription_segments,
+            language=info.language,
+            language_probability=info.language_probability,
+            duration=audio_chunk.duration,
+            text=full_text,
+            avg_confidence=avg_confidence,
+            processing_time=processing_time,
+            model_info=self.model_info.copy(),
+            chunk_info={
+                'chunk_id': audio_chunk.chunk_id,
+                'original_start': audio_chunk.original_start,
+                'original_end': audio_chunk.original_end,
+                'overlap_prev': audio_chunk.overlap_prev,
+                'overlap_next': audio_chunk.overlap_next
+            }
+        )
+    
+    def _lookup_chunk_cache(self,
+                            audio_chunk: AudioChunk,
+                            decode_options: Dict[str, Any]) -> Tuple[Optional[str], Optional[TranscriptionResult]]:
+        """Return (cache key, chunk-relative cached result) for a chunk."""
+        if self.result_cache is None:
+            return None, None
+        cache_key = self._chunk_cache_key(audio_chunk, decode_options)
+        return cache_key, self.result_cache.get(cache_key)
+    
+    def _store_chunk_result(self,
+                            cache_key: Optional[str],
+                            result: TranscriptionResult,
+                            audio_chunk: AudioChunk):
+        """Cache a chunk result relative to the chunk start."""
+        if cache_key is None:
+            return
+        # Stored relative to the chunk so identical audio elsewhere reuses it
+        self.result_cache.put(
+            cache_key,
+            self._shift_result(copy.deepcopy(result), -audio_chunk.original_start),
+            kind="chunk"
+        )
+    
+    def _chunk_cache_key(self, audio_chunk: AudioChunk, decode_options: Dict[str, Any]) -> str:
+        """Key a chunk by its PCM samples, the model and the decode options."""
+        if audio_chunk.audio is not None:
+            content_hash = hash_array(audio_chunk.audio)
+        else:
+            content_hash = hash_audio_file(audio_chunk.file_path)
+        
+        params = dict(decode_options, model_size=self.model_size,
+                      compute_type=self.model_info.get('compute_type', self.compute_type))
+        return ResultCache.make_key("chunk", content_hash, params)
+    
+    @staticmethod
+    def _shift_result(result: TranscriptionResult, offset: float) -> TranscriptionResult:
+        """Shift all segment and word timestamps of a result in place."""
+        for segment in result.segments:
+            segment.start += offset
+            segment.end += offset
+            for word in segment.words or []:
+                word['start'] += offset
+                word['end'] += offset
+        return result
+    
+    def _place_chunk_result(self,
+                            cached: TranscriptionResult,
+                            audio_chunk: AudioChunk,
+                            lookup_time: float) -> TranscriptionResult:
+        """Position a chunk-relative cached result at this chunk."""
+        result = self._shift_result(cached, audio_chunk.original_start)
+        result.duration = audio_chunk.duration
+        result.processing_time = lookup_time
+        result.chunk_info = {
+            'chunk_id': audio_chunk.chunk_id,
+            'original_start': audio_chunk.original_start,
+            'original_end': audio_chunk.original_end,
+            'overlap_prev': audio_chunk.overlap_prev,
+            'overlap_next': audio_chunk.overlap_next,
+            'cached': True
+        }
+        return result
+    
+    @traced("transcribe_file")
     def transcribe_file(self, 
                        audio_path: Union[str, Path],
-                       chunking_result: Optional[ChunkingResult] = None,
+                       chunking_result: Optional[Union[ChunkingResult, ChunkStream]] = None,
+                       time_map: Optional[TimeMap] = None,
                        **transcription_options) -> BatchTranscriptionResult:
         """
         Transcribe a complete audio file, optionally using pre-computed chunks.
         
         Args:
             audio_path: Path to audio file
-            chunking_result: Pre-computed chunking result (None to chunk automatically)
+            chunking_result: Pre-computed chunking result, or a ChunkStream
+                whose chunks are decoded while later ones are still being cut
+                (None to stream chunks from the default chunker)
+            time_map: Processed -> original map; when given, all segment and
+                word timestamps are reported on the original timeline
             **transcription_options: Options passed to transcribe_chunk
             
         Returns:
@@ -327,31 +548,47 @@ class WhisperTranscriber:
             if chunking_result is None:
                 from .chunker import get_smart_chunker
                 chunker = get_smart_chunker()
-                chunking_result = chunker.chunk_audio(audio_path)
+                chunking_result = chunker.stream_audio(audio_path)
             
-            chunks = chunking_result.chunks
-            file_logger.info(f"Transcribing {len(chunks)} chunks")
+            if isinstance(chunking_result, ChunkStream):
+                file_logger.info("Transcribing chunks as they are produced")
+                chunks = chunking_result
+            else:
+                chunks = chunking_result.chunks
+                file_logger.info(f"Transcribing {len(chunks)} chunks")
             
             # Transcribe chunks
-            chunk_results = []
-            failed_chunks = 0
+            try:
+                chunk_results, failed_chunks = self._transcribe_chunks(
+                    chunks, file_logger, **transcription_options
+                )
+            except BaseException:
+                if isinstance(chunking_result, ChunkStream):
+                    chunking_result.close()
+                raise
             
-            for chunk in chunks:
-                try:
-                    result = self.transcribe_chunk(chunk, **transcription_options)
-                    chunk_results.append(result)
-                except Exception as e:
-                    file_logger.error(f"Failed to transcribe chunk {chunk.chunk_id}: {e}")
-                    failed_chunks += 1
+            if isinstance(chunking_result, ChunkStream):
+                chunking_result = chunking_result.result
             
             # Merge results
             merged_result = self._merge_chunk_results(chunk_results, chunking_result)
             
+            # Undo silence removal and speed-up in one vectorized pass
+            if time_map is not None and not time_map.is_identity:
+                remap_segments(
+                    [segment for result in chunk_results for segment in result.segments],
+                    time_map
+                )
+                merged_result.duration = time_map.original_duration
+            
             # Calculate performance metrics
             total_processing_time = time.time() - start_time
             performance_metrics = self._calculate_performance_metrics(
                 chunk_results, chunking_result, total_processing_time
             )
+            if total_processing_time > 0:
+                REALTIME_FACTOR.observe(chunking_result.total_duration / total_processing_time)
+            AUDIO_SECONDS.inc(chunking_result.total_duration)
             
             # Create batch result
             batch_result = BatchTranscriptionResult(
@@ -364,7 +601,7 @@ class WhisperTranscriber:
                 performance_metrics=performance_metrics
             )
             
-            file_logger.info(f"File transcription completed: {len(chunk_results)}/{len(chunks)} chunks successful")
+            file_logger.info(f"File transcription completed: {len(chunk_results)}/{chunking_result.total_chunks} chunks successful")
             file_logger.info(f"Total time: {total_processing_time:.2f}s, "
                            f"Speed: {performance_metrics.get('processing_speed', 0):.1f}x real-time")
             
@@ -374,69 +611,207 @@ class WhisperTranscriber:
             file_logger.error(f"File transcription failed: {e}")
             raise
     
-    def _merge_chunk_results(self, 
-                           chunk_results: List[TranscriptionResult],
-                           chunking_result: ChunkingResult) -> TranscriptionResult:
+    def _transcribe_chunks(self,
+                           chunks: Iterable[AudioChunk],
+                           file_logger,
+                           **transcription_options) -> Tuple[List[TranscriptionResult], int]:
         """
-        Merge chunk transcription results into a single result.
+        Transcribe chunks sequentially or on a bounded worker pool.
+        
+        With ``num_workers > 1`` each worker thread drives one model replica;
+        results are returned in chunk order regardless of completion order.
+        Chunks may come from a ChunkStream, in which case each one is
+        decoded as soon as it arrives.
         
         Args:
-            chunk_results: List of chunk transcription results
-            chunking_result: Original chunking information
+            chunks: Chunks to transcribe (a list or a ChunkStream)
+            file_logger: Per-file logger for failure reporting
+            **transcription_options: Options passed to transcribe_chunk
             
         Returns:
-            Merged TranscriptionResult
+            Tuple of (successful chunk results in chunk order, failed chunk count)
         """
-        if not chunk_results:
-            raise ValueError("No chunk results to merge")
+        known_count = len(chunks) if isinstance(chunks, list) else None
         
-        # Collect all segments
-        all_segments = []
-        all_text_parts = []
-        confidence_scores = []
+        if self.batched_pipeline is not None and (known_count is None or known_count > 1):
+            return self._transcribe_chunks_batched(chunks, file_logger, **transcription_options)
+        
+        # Chunk spans stay children of the file span on worker threads
+        parent_span = get_tracer().current()
         
-        segment_id = 0
+        def run(chunk: AudioChunk) -> Optional[TranscriptionResult]:
+            try:
+                with get_tracer().activate(parent_span):
+                    return self.transcribe_chunk(chunk, **transcription_options)
+            except Exception as e:
+                file_logger.error(f"Failed to transcribe chunk {chunk.chunk_id}: {e}")
+                return None
         
-        for chunk_result in chunk_results:
-            chunk_info = chunk_result.chunk_info
-            overlap_start = chunk_info['original_start'] if chunk_info else 0
-            overlap_end = chunk_info['original_end'] if chunk_info else float('inf')
+        workers = min(self.num_workers, known_count) if known_count is not None else self.num_workers
+        if workers > 1:
+            file_logger.info(f"Decoding chunks on {workers} parallel workers")
+            # map() submits each chunk as the iterator yields it
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="talkgpt-decode") as pool:
+                outcomes = list(pool.map(run, chunks))
+        else:
+            outcomes = [run(chunk) for chunk in chunks]
+        
+        chunk_results = [result for result in outcomes if result is not None]
+        return chunk_results, len(outcomes) - len(chunk_results)
+    
+    def _transcribe_chunks_batched(self,
+                                   chunks: Iterable[AudioChunk],
+                                   file_logger,
+                                   **transcription_options) -> Tuple[List[TranscriptionResult], int]:
+        """
+        Transcribe chunks in encoder/decoder batches of ``batch_size``.
+        
+        Cached chunks are served as they arrive; the rest are decoded with
+        _decode_batch each time ``batch_size`` of them are pending, and
+        cached. A failing batch marks all of its chunks as failed.
+        
+        Args:
+            chunks: Chunks to transcribe (a list or a ChunkStream)
+            file_logger: Per-file logger for failure reporting
+            **transcription_options: Options accepted by transcribe_chunk
             
-            for segment in chunk_result.segments:
-                # Only include segments that fall within the original chunk boundaries
-                # (exclude overlap regions to avoid duplication)
-                if overlap_start <= segment.start < overlap_end:
-                    segment.id = segment_id
-                    all_segments.append(segment)
-                    all_text_parts.append(segment.text)
-                    confidence_scores.append(segment.avg_logprob)
-                    segment_id += 1
+        Returns:
+            Tuple of (successful chunk results in chunk order, failed chunk count)
+        """
+        decode_options = {
+            'language': None,
+            'temperature': 0.0,
+            'beam_size': 5,
+            'best_of': 5,
+            'patience': 1.0,
+            'word_timestamps': False
+        }
+        decode_options.update(transcription_options)
         
-        # Calculate merged metrics
-        avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else -5.0
-        total_duration = chunking_result.total_duration
-        merged_text = " ".join(all_text_parts).strip()
+        # Batched decodes are cached apart from sequential ones
+        cache_options = dict(decode_options, batched=True)
         
-        # Use language from first chunk (should be consistent)
-        primary_language = chunk_results[0].language
-        language_prob = sum(r.language_probability for r in chunk_results) / len(chunk_results)
+        outcomes: Dict[int, Optional[TranscriptionResult]] = {}
+        pending = []
+        cache_served = 0
         
-        # Sum processing times
-        total_processing_time = sum(r.processing_time for r in chunk_results)
+        def flush():
+            try:
+                results = self._decode_batch([chunk for _, chunk, _ in pending], decode_options)
+            except Exception as e:
+                file_logger.error(f"Failed to transcribe batch of chunks "
+                                  f"{[chunk.chunk_id for _, chunk, _ in pending]}: {e}")
+                results = [None] * len(pending)
+            
+            for (index, chunk, cache_key), result in zip(pending, results):
+                outcomes[index] = result
+                if result is not None:
+                    self._store_chunk_result(cache_key, result, chunk)
+                    CHUNK_LATENCY.observe(result.processing_time)
+                CHUNKS.inc(status="ok" if result is not None else "failed")
+            pending.clear()
         
-        merged_result = TranscriptionResult(
-            segments=all_segments,
-            language=primary_language,
-            language_probability=language_prob,
-            duration=total_duration,
-            text=merged_text,
-            avg_confidence=avg_confidence,
-            processing_time=total_processing_time,
-            model_info=self.model_info.copy(),
-            chunk_info=None  # Not applicable for merged result
+        for index, chunk in enumerate(chunks):
+            cache_key, cached = self._lookup_chunk_cache(chunk, cache_options)
+            if cached is not None:
+                outcomes[index] = self._place_chunk_result(cached, chunk, 0.0)
+                cache_served += 1
+                CHUNKS.inc(status="cached")
+                continue
+            
+            pending.append((index, chunk, cache_key))
+            if len(pending) == self.batch_size:
+                flush()
+        
+        if pending:
+            flush()
+        
+        file_logger.info(f"Decoded {len(outcomes) - cache_served} chunks in batches of {self.batch_size} "
+                         f"({cache_served} served from cache)")
+        
+        ordered = [outcomes[index] for index in range(len(outcomes))]
+        chunk_results = [result for result in ordered if result is not None]
+        return chunk_results, len(ordered) - len(chunk_results)
+    
+    @traced("decode_batch")
+    def _decode_batch(self,
+                      chunks: List[AudioChunk],
+                      decode_options: Dict[str, Any]) -> List[TranscriptionResult]:
+        """
+        Decode several chunks with one BatchedInferencePipeline call.
+        
+        The chunks are concatenated and passed as ``clip_timestamps`` (split
+        at the pipeline's 30 s window), so every clip becomes one batch item.
+        Segments are assigned back to the chunk containing their start time.
+        
+        Args:
+            chunks: Chunks decoded together
+            decode_options: Options accepted by transcribe_chunk
+            
+        Returns:
+            One TranscriptionResult per chunk, in order
+        """
+        start_time = time.time()
+        
+        arrays = []
+        for chunk in chunks:
+            audio_input = self._chunk_audio_input(chunk)
+            if isinstance(audio_input, str):
+                from faster_whisper import decode_audio
+                audio_input = decode_audio(audio_input, sampling_rate=self.SAMPLE_RATE)
+            arrays.append(np.asarray(audio_input, dtype=np.float32))
+        
+        lengths = np.array([audio.shape[0] for audio in arrays], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        stitched = np.concatenate(arrays)
+        
+        # The batched pipeline slices audio[start:end], so clips are in samples
+        clip_samples = int(self.BATCH_CLIP_SECONDS * self.SAMPLE_RATE)
+        clip_timestamps = [
+            {'start': offset + clip_start,
+             'end': offset + min(clip_start + clip_samples, length)}
+            for offset, length in zip(offsets.tolist(), lengths.tolist())
+            for clip_start in range(0, length, clip_samples)
+        ]
+        
+        segments, info = self.batched_pipeline.transcribe(
+            stitched,
+            clip_timestamps=clip_timestamps,
+            batch_size=self.batch_size,
+            **decode_options
         )
         
-        return merged_result
+        offset_seconds = offsets / self.SAMPLE_RATE
+        per_chunk = [[] for _ in chunks]
+        for segment in segments:
+            owner = int(np.searchsorted(offset_seconds, segment.start, side='right')) - 1
+            per_chunk[max(owner, 0)].append(segment)
+        
+        # Batch wall time is shared evenly between its chunks
+        processing_time = (time.time() - start_time) / len(chunks)
+        return [
+            self._build_chunk_result(
+                chunk, per_chunk[i], info, decode_options,
+                offset=chunk.original_start - float(offset_seconds[i]),
+                processing_time=processing_time
+            )
+            for i, chunk in enumerate(chunks)
+        ]
+    
+    def _merge_chunk_results(self, 
+                           chunk_results: List[TranscriptionResult],
+                           chunking_result: ChunkingResult) -> TranscriptionResult:
+        """
+        Merge chunk transcription results into a single result.
+        
+        Args:
+            chunk_results: List of chunk transcription results
+            chunking_result: Original chunking information
+            
+        Returns:
+            Merged TranscriptionResult
+        """
+        return merge_chunk_results(chunk_results, chunking_result, self.model_info)
     
     def _calculate_performance_metrics(self,
                                      chunk_results: List[TranscriptionResult],
@@ -471,9 +846,15 @@ class WhisperTranscriber:
             'min_confidence': min(confidences),
             'max_confidence': max(confidences),
             'parallel_efficiency': total_processing_time / total_time if total_time > 0 else 0,
+            'num_workers': self.num_workers,
             'words_per_minute': len(chunk_results[0].text.split()) / (total_audio_duration / 60) if chunk_results else 0
         }
         
+        if self.result_cache is not None:
+            cache_hits = sum(1 for r in chunk_results if r.chunk_info and r.chunk_info.get('cached'))
+            metrics['cache_hits'] = cache_hits
+            metrics['cache_misses'] = len(chunk_results) - cache_hits
+        
         return metrics
     
     def detect_language(self, audio_path: Union[str, Path]) -> Tuple[str, float]:
@@ -539,7 +920,8 @@ class WhisperTranscriber:
     def save_transcription_result(self, 
                                  result: Union[TranscriptionResult, BatchTranscriptionResult],
                                  output_path: Union[str, Path],
-                                 format: str = "json"):
+                                 format: str = "json",
+                                 include_chunks: bool = True):
         """
         Save transcription result to file.
         
@@ -547,18 +929,14 @@ class WhisperTranscriber:
             result: Transcription result to save
             output_path: Output file path
             format: Output format (json, txt, srt)
+            include_chunks: Write a batch result's per-chunk results to
+                JSON (they repeat the merged segments)
         """
         output_path = Path(output_path)
         
         if format == "json":
-            # Convert to JSON-serializable format
-            if isinstance(result, BatchTranscriptionResult):
-                data = asdict(result)
-            else:
-                data = asdict(result)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Streamed from the dataclasses; no asdict copy
+            write_json(result, output_path, exclude=() if include_chunks else ('chunk_results',))
         
         elif format == "txt":
             # Simple text output
@@ -603,12 +981,80 @@ class WhisperTranscriber:
     def cleanup(self):
         """Clean up resources."""
         if self.model is not None:
-            # The model cleanup is handled by faster-whisper internally
+            # The registry owns the model; it is unloaded once no one else uses it
+            get_model_registry().release(self.model, unload_unused=True)
             self.model = None
+            self.batched_pipeline = None
         
         self.logger.info("Transcriber cleanup completed")
 
 
+def merge_chunk_results(chunk_results: List[TranscriptionResult],
+                        chunking_result: ChunkingResult,
+                        model_info: Optional[Dict[str, Any]] = None) -> TranscriptionResult:
+    """
+    Merge chunk transcription results into a single result.
+    
+    Args:
+        chunk_results: List of chunk transcription results
+        chunking_result: Original chunking information
+        model_info: Model description copied into the merged result
+        
+    Returns:
+        Merged TranscriptionResult
+    """
+    if not chunk_results:
+        raise ValueError("No chunk results to merge")
+    
+    # Collect all segments
+    all_segments = []
+    all_text_parts = []
+    confidence_scores = []
+    
+    segment_id = 0
+    
+    for chunk_result in chunk_results:
+        chunk_info = chunk_result.chunk_info
+        overlap_start = chunk_info['original_start'] if chunk_info else 0
+        overlap_end = chunk_info['original_end'] if chunk_info else float('inf')
+        
+        for segment in chunk_result.segments:
+            # Only include segments that fall within the original chunk boundaries
+            # (exclude overlap regions to avoid duplication)
+            if overlap_start <= segment.start < overlap_end:
+                segment.id = segment_id
+                all_segments.append(segment)
+                all_text_parts.append(segment.text)
+                confidence_scores.append(segment.avg_logprob)
+                segment_id += 1
+    
+    # Calculate merged metrics
+    avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else -5.0
+    total_duration = chunking_result.total_duration
+    merged_text = " ".join(all_text_parts).strip()
+    
+    # Use language from first chunk (should be consistent)
+    primary_language = chunk_results[0].language
+    language_prob = sum(r.language_probability for r in chunk_results) / len(chunk_results)
+    
+    # Sum processing times
+    total_processing_time = sum(r.processing_time for r in chunk_results)
+    
+    merged_result = TranscriptionResult(
+        segments=all_segments,
+        language=primary_language,
+        language_probability=language_prob,
+        duration=total_duration,
+        text=merged_text,
+        avg_confidence=avg_confidence,
+        processing_time=total_processing_time,
+        model_info=dict(model_info or {}),
+        chunk_info=None  # Not applicable for merged result
+    )
+    
+    return merged_result
+
+
 # Global transcriber instance
 _whisper_transcriber: Optional[WhisperTranscriber] = None
 
@@ -625,12 +1071,14 @@ def transcribe_file(audio_path: Union[str, Path], **kwargs) -> BatchTranscriptio
     """Transcribe file using the global transcriber."""
     return get_transcriber().transcribe_file(audio_path, **kwargs)
 
+@traced("enhanced_analysis")
 def enhanced_transcribe_with_analysis(audio_path: Union[str, Path],
                                      chunking_result,
                                      bucket_seconds: float = 4.0,
                                      gap_tolerance: float = 0.25,
                                      gap_threshold: float = 1.5,
                                      enable_overlap_detection: bool = True,
+                                     time_map: Optional[TimeMap] = None,
                                      **transcribe_kwargs) -> Dict[str, Any]:
     """
     Perform enhanced transcription with comprehensive word-gap analysis.
@@ -645,6 +1093,7 @@ def enhanced_transcribe_with_analysis(audio_path: Union[str, Path],
         gap_tolerance: Bucket duration tolerance (default: 0.25s)
         gap_threshold: Cadence classification threshold in std devs (default: 1.5)
         enable_overlap_detection: Whether to detect speaker overlaps
+        time_map: Processed -> original map for the chunked audio
         **transcribe_kwargs: Additional arguments for transcription
         
     Returns:
@@ -658,14 +1107,18 @@ def enhanced_transcribe_with_analysis(audio_path: Union[str, Path],
     
     try:
         # Import our new analysis modules
-        from ..core.utils import flatten_segments, validate_word_timing
+        from ..core.word_table import WordTable
         from ..post.segmenter import bucketize, validate_buckets
-        from ..post.cadence import create_analysis_context
+        from ..post.cadence import bucket_gap_stats, create_analysis_context
         from ..post.assembler import assemble_records, validate_records
         
         # Perform standard transcription with word timestamps
         # Sanitize kwargs to avoid passing unsupported keys to transcribe_chunk
         timing_repair = transcribe_kwargs.pop('timing_repair', True)
+        num_workers = transcribe_kwargs.pop('num_workers', 1)
+        result_cache = transcribe_kwargs.pop('result_cache', None)
+        batch_size = transcribe_kwargs.pop('batch_size', 1)
+        cpu_threads = transcribe_kwargs.pop('cpu_threads', None)
         transcribe_kwargs.pop('device', None)
         transcribe_kwargs.pop('compute_type', None)
         transcribe_kwargs['word_timestamps'] = True
@@ -674,9 +1127,10 @@ def enhanced_transcribe_with_analysis(audio_path: Union[str, Path],
             k: v for k, v in transcribe_kwargs.items()
             if k in {"language", "temperature", "beam_size", "best_of", "patience", "word_timestamps"}
         }
-        transcriber = get_transcriber()
+        transcriber = get_transcriber(num_workers=num_workers, result_cache=result_cache,
+                                      batch_size=batch_size, cpu_threads=cpu_threads)
         transcription_result = transcriber.transcribe_file(
-            audio_path, chunking_result, **safe_options
+            audio_path, chunking_result, time_map=time_map, **safe_options
         )
         
         # Extract and flatten word-level data
@@ -686,28 +1140,35 @@ def enhanced_transcribe_with_analysis(audio_path: Union[str, Path],
             segments = transcription_result.segments
         
         logger.info(f"Flattening {len(segments)} segments to word-level data")
-        words = flatten_segments(segments)
-        words = validate_word_timing(words, timing_repair=timing_repair)
+        words = WordTable.from_segments(segments).validated(timing_repair=timing_repair)
         
         logger.info(f"Processing {len(words)} words for gap analysis")
         
+        tracer = get_tracer()
+        
         # Create 4-second timing buckets
-        buckets = bucketize(words, bucket_seconds, gap_tolerance)
+        with tracer.span("bucketize", words=len(words)):
+            buckets = bucketize(words, bucket_seconds, gap_tolerance)
         
         # Validate buckets
         bucket_validation = validate_buckets(buckets, bucket_seconds, gap_tolerance)
         logger.info(f"Created {len(buckets)} timing buckets (validation: {bucket_validation['valid']})")
         
         # Create global analysis context
-        context = create_analysis_context(buckets, gap_threshold)
+        with tracer.span("cadence", buckets=len(buckets)):
+            grouped_gaps = bucket_gap_stats(buckets)
+            context = create_analysis_context(buckets, gap_threshold, grouped=grouped_gaps)
         
         # Assemble comprehensive records
-        records = assemble_records(
-            buckets, 
-            context, 
-            Path(audio_path) if enable_overlap_detection else None,
-            enable_overlap_detection
-        )
+        with tracer.span("assemble", overlap_detection=enable_overlap_detection):
+            records = assemble_records(
+                buckets, 
+                context, 
+                Path(audio_path) if enable_overlap_detection else None,
+                enable_overlap_detection,
+                time_map=time_map,
+                grouped=grouped_gaps
+            )
         
         # Validate final records
         record_validation = validate_records(records)
@@ -12,7 +12,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Word:
     """
     Single word with timing and confidence information.
@@ -60,53 +60,8 @@ def flatten_segments(segments: List[Any]) -> List[Word]:
         >>> words[0].word
         'Hello'
     """
-    words = []
-    
-    for segment in segments:
-        # Handle different segment formats
-        if hasattr(segment, 'words') and segment.words:
-            segment_words = segment.words
-        elif isinstance(segment, dict) and 'words' in segment:
-            segment_words = segment['words']
-        else:
-            # Fallback: create word from segment text
-            if hasattr(segment, 'text'):
-                words.append(Word(
-                    word=segment.text.strip(),
-                    start=getattr(segment, 'start', 0.0),
-                    end=getattr(segment, 'end', 0.0),
-                    probability=getattr(segment, 'avg_logprob', 0.0)
-                ))
-            continue
-        
-        # Process individual words within the segment
-        for word_data in segment_words:
-            if isinstance(word_data, dict):
-                word_text = word_data.get('word', '').strip()
-                word_start = word_data.get('start', 0.0)
-                word_end = word_data.get('end', 0.0)
-                word_prob = word_data.get('probability', 0.0)
-            else:
-                # Handle word objects
-                word_text = getattr(word_data, 'word', '').strip()
-                word_start = getattr(word_data, 'start', 0.0)
-                word_end = getattr(word_data, 'end', 0.0)
-                word_prob = getattr(word_data, 'probability', 0.0)
-            
-            # Skip empty words
-            if word_text:
-                words.append(Word(
-                    word=word_text,
-                    start=float(word_start),
-                    end=float(word_end),
-                    probability=float(word_prob)
-                ))
-    
-    # Sort by start time to ensure chronological order
-    words.sort(key=lambda w: w.start)
-    
-    logger.debug(f"Flattened {len(words)} words from {len(segments)} segments")
-    return words
+    from .word_table import WordTable
+    return WordTable.from_segments(segments).to_words()
 
 def calculate_word_gaps(words: List[Word]) -> List[float]:
     """
@@ -116,7 +71,7 @@ def calculate_word_gaps(words: List[Word]) -> List[float]:
     This represents the true silence/pause between words.
     
     Args:
-        words: List of Word objects in chronological order
+        words: Word objects (or a WordTable) in chronological order
         
     Returns:
         List of gap durations in seconds. Length is len(words) - 1.
@@ -133,6 +88,10 @@ def calculate_word_gaps(words: List[Word]) -> List[float]:
     if len(words) < 2:
         return []
     
+    from .word_table import WordTable
+    if isinstance(words, WordTable):
+        return words.gaps().tolist()
+    
     gaps = []
     for i in range(1, len(words)):
         gap = words[i].start - words[i-1].end
@@ -152,60 +111,32 @@ def validate_word_timing(words: List[Word], timing_repair: bool = True) -> List[
     
     Args:
         words: List of Word objects
+        timing_repair: Repair zero-length words (20ms) instead of dropping them
         
     Returns:
-        List of validated Word objects
+        List of validated Word objects (new objects; see WordTable.validated)
     """
     if not words:
         return []
     
-    valid_words = []
-    
-    for word in words:
-        # Repair or skip words with invalid timing
-        if word.start < 0 or word.end < 0:
-            logger.warning(f"Skipping word with negative timing: {word}")
-            continue
-        if word.end <= word.start:
-            # Repair with epsilon (20ms) matching Whisper frame stride
-            if timing_repair:
-                eps = 0.02
-                word.end = word.start + eps
-                word.timing_repaired = True
-            else:
-                logger.warning(f"Skipping zero-length word timing (repair disabled): {word}")
-                continue
-        else:
-            word.timing_repaired = False
-
-        valid_words.append(word)
-    
-    # Sort by start time
-    valid_words.sort(key=lambda w: w.start)
-    
-    # Fix overlapping words
-    fixed_words = []
-    for i, word in enumerate(valid_words):
-        if i > 0 and word.start < fixed_words[-1].end:
-            # Adjust start time to avoid overlap
-            word.start = fixed_words[-1].end + 0.001
-            
-        fixed_words.append(word)
-    
-    logger.debug(f"Validated {len(fixed_words)} words from {len(words)} input words")
-    return fixed_words
+    from .word_table import WordTable
+    return WordTable.from_words(words).validated(timing_repair).to_words()
 
 def extract_text_from_words(words: List[Word]) -> str:
     """
     Extract clean text from a list of words.
     
     Args:
-        words: List of Word objects
+        words: Word objects or a WordTable
         
     Returns:
         Concatenated text with proper spacing
     """
-    if not words:
+    if not len(words):
         return ""
     
+    from .word_table import WordTable
+    if isinstance(words, WordTable):
+        return words.joined_text()
+    
     return " ".join(word.word for word in words)
@@ -0,0 +1,424 @@
+"""
+TalkGPT Word Table
+
+Columnar (struct-of-arrays) storage for word-level timing data. Starts,
+ends and probabilities live in NumPy arrays and the word texts in one
+string with an offset index, so a long transcript costs a few arrays
+instead of one Python object per word. Flattening, timing repair, gap
+computation and bucket assignment run as array operations over it.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .utils import Word
+
+logger = logging.getLogger(__name__)
+
+# Repair length for zero-length words, matching Whisper's 20 ms frame stride
+REPAIR_EPSILON = 0.02
+# Shift applied to a word that starts before its predecessor ends
+OVERLAP_NUDGE = 0.001
+
+
+class WordTable:
+    """
+    Words as parallel arrays.
+
+    Slicing returns a view that keeps a reference to the parent's columns
+    and text buffer plus a row range, so a bucket-sized view costs one
+    small object; its column arrays are made on access. Indexing with an
+    integer returns a ``Word``.
+
+    Attributes:
+        start: Word start times (float64)
+        end: Word end times (float64)
+        probability: Word probabilities (float64)
+        repaired: Whether the word's timing was repaired (bool)
+        segment: Index of the source segment of each word (int32)
+    """
+
+    __slots__ = ('_columns', '_text', '_offsets', '_first', '_stop')
+
+    def __init__(self,
+                 texts: Union[Sequence[str], Tuple[str, np.ndarray]],
+                 start: np.ndarray,
+                 end: np.ndarray,
+                 probability: Optional[np.ndarray] = None,
+                 repaired: Optional[np.ndarray] = None,
+                 segment: Optional[np.ndarray] = None):
+        """
+        Build a table.
+
+        Args:
+            texts: Word texts, or an already packed ``(buffer, offsets)`` pair
+            start: Start times
+            end: End times
+            probability: Probabilities (default 0.0)
+            repaired: Timing-repair flags (default False)
+            segment: Source segment ids (default 0)
+        """
+        start = np.asarray(start, dtype=np.float64)
+        count = start.size
+        self._columns = (
+            start,
+            np.asarray(end, dtype=np.float64),
+            np.zeros(count) if probability is None else np.asarray(probability, dtype=np.float64),
+            np.zeros(count, dtype=bool) if repaired is None else np.asarray(repaired, dtype=bool),
+            np.zeros(count, dtype=np.int32) if segment is None else np.asarray(segment, dtype=np.int32),
+        )
+        self._first = 0
+        self._stop = count
+
+        if isinstance(texts, tuple):
+            self._text, self._offsets = texts
+        else:
+            self._text = "".join(texts)
+            self._offsets = np.zeros(count + 1, dtype=np.int64)
+            np.cumsum(np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts)),
+                      out=self._offsets[1:])
+
+        if any(column.size != count for column in self._columns) or self._offsets.size != count + 1:
+            raise ValueError("WordTable columns must have equal lengths")
+
+    def _column(self, index: int) -> np.ndarray:
+        column = self._columns[index]
+        if self._first == 0 and self._stop == column.size:
+            return column
+        return column[self._first:self._stop]
+
+    @property
+    def start(self) -> np.ndarray:
+        return self._column(0)
+
+    @property
+    def end(self) -> np.ndarray:
+        return self._column(1)
+
+    @property
+    def probability(self) -> np.ndarray:
+        return self._column(2)
+
+    @property
+    def repaired(self) -> np.ndarray:
+        return self._column(3)
+
+    @property
+    def segment(self) -> np.ndarray:
+        return self._column(4)
+
+    @classmethod
+    def from_segments(cls, segments: List[Any]) -> "WordTable":
+        """
+        Flatten Whisper segments into a chronologically sorted table.
+
+        Accepts segment objects or dicts whose words are objects or dicts.
+        A segment without words contributes its whole text as one word
+        (with ``avg_logprob`` as probability); empty words are skipped.
+
+        Args:
+            segments: Transcription segments
+
+        Returns:
+            WordTable sorted (stably) by start time
+        """
+        texts, starts, ends, probs, seg_ids = [], [], [], [], []
+
+        for index, segment in enumerate(segments):
+            if hasattr(segment, 'words') and segment.words:
+                segment_words = segment.words
+            elif isinstance(segment, dict) and 'words' in segment:
+                segment_words = segment['words']
+            else:
+                if hasattr(segment, 'text'):
+                    texts.append(segment.text.strip())
+                    starts.append(getattr(segment, 'start', 0.0))
+                    ends.append(getattr(segment, 'end', 0.0))
+                    probs.append(getattr(segment, 'avg_logprob', 0.0))
+                    seg_ids.append(index)
+                continue
+
+            for word_data in segment_words:
+                if isinstance(word_data, dict):
+                    text = word_data.get('word', '').strip()
+                    if text:
+                        texts.append(text)
+                        starts.append(word_data.get('start', 0.0))
+                        ends.append(word_data.get('end', 0.0))
+                        probs.append(word_data.get('probability', 0.0))
+                        seg_ids.append(index)
+                else:
+                    text = getattr(word_data, 'word', '').strip()
+                    if text:
+                        texts.append(text)
+                        starts.append(getattr(word_data, 'start', 0.0))
+                        ends.append(getattr(word_data, 'end', 0.0))
+                        probs.append(getattr(word_data, 'probability', 0.0))
+                        seg_ids.append(index)
+
+        table = cls(texts, starts, ends, probs, segment=seg_ids).sorted()
+        logger.debug(f"Flattened {len(table)} words from {len(segments)} segments")
+        return table
+
+    @classmethod
+    def from_words(cls, words: Sequence[Word]) -> "WordTable":
+        """Build a table from Word objects, keeping their order."""
+        return cls(
+            [w.word for w in words],
+            np.fromiter((w.start for w in words), dtype=np.float64, count=len(words)),
+            np.fromiter((w.end for w in words), dtype=np.float64, count=len(words)),
+            np.fromiter((w.probability for w in words), dtype=np.float64, count=len(words)),
+            np.fromiter((w.timing_repaired for w in words), dtype=bool, count=len(words)),
+        )
+
+    def __len__(self) -> int:
+        return self._stop - self._first
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            first, stop, step = key.indices(len(self))
+            if step != 1:
+                return self.take(np.arange(first, stop, step))
+            view = object.__new__(WordTable)
+            view._columns = self._columns
+            view._text = self._text
+            view._offsets = self._offsets
+            view._first = self._first + first
+            view._stop = self._first + max(first, stop)
+            return view
+
+        row = self._first + range(len(self))[key]  # normalizes negative indices, raises IndexError
+        start, end, probability, repaired, _ = self._columns
+        return Word(
+            word=self._text[self._offsets[row]:self._offsets[row + 1]],
+            start=float(start[row]),
+            end=float(end[row]),
+            probability=float(probability[row]),
+            timing_repaired=bool(repaired[row]),
+        )
+
+    def __add__(self, other: "WordTable") -> "WordTable":
+        return WordTable(
+            self.texts + other.texts,
+            np.concatenate([self.start, other.start]),
+            np.concatenate([self.end, other.end]),
+            np.concatenate([self.probability, other.probability]),
+            np.concatenate([self.repaired, other.repaired]),
+            np.concatenate([self.segment, other.segment]),
+        )
+
+    def __iter__(self) -> Iterator[Word]:
+        return iter(self.to_words())
+
+    def __repr__(self) -> str:
+        return f"WordTable({len(self)} words)"
+
+    def text(self, index: int) -> str:
+        """Text of one word."""
+        row = self._first + range(len(self))[index]
+        return self._text[self._offsets[row]:self._offsets[row + 1]]
+
+    @property
+    def texts(self) -> List[str]:
+        """Texts of all words."""
+        bounds = self._offsets[self._first:self._stop + 1].tolist()
+        buffer = self._text
+        return [buffer[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def joined_text(self, separator: str = " ") -> str:
+        """All word texts joined with ``separator``."""
+        return separator.join(self.texts)
+
+    def take(self, indices: np.ndarray) -> "WordTable":
+        """New table with the rows at ``indices``, in that order."""
+        indices = np.asarray(indices, dtype=np.int64)
+        texts = self.texts
+        return WordTable(
+            [texts[i] for i in indices.tolist()],
+            self.start[indices], self.end[indices], self.probability[indices],
+            self.repaired[indices], self.segment[indices],
+        )
+
+    def sorted(self) -> "WordTable":
+        """Table ordered by start time (stable); returns self when already sorted."""
+        if len(self) < 2 or not np.any(self.start[1:] < self.start[:-1]):
+            return self
+        return self.take(np.argsort(self.start, kind='stable'))
+
+    def to_words(self) -> List[Word]:
+        """Materialize the rows as Word objects."""
+        return [
+            Word(word=text, start=start, end=end, probability=prob, timing_repaired=repaired)
+            for text, start, end, prob, repaired in zip(
+                self.texts, self.start.tolist(), self.end.tolist(),
+                self.probability.tolist(), self.repaired.tolist()
+            )
+        ]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Rows as ``{word, start, end, probability}`` dictionaries."""
+        return [
+            {'word': text, 'start': start, 'end': end, 'probability': prob}
+            for text, start, end, prob in zip(
+                self.texts, self.start.tolist(), self.end.tolist(), self.probability.tolist()
+            )
+        ]
+
+    def validated(self, timing_repair: bool = True) -> "WordTable":
+        """
+        Clean word timing.
+
+        - Words with a negative start or end are dropped
+        - Zero/negative-length words get ``end = start + 20 ms`` and are
+          flagged as repaired (dropped when ``timing_repair`` is False)
+        - Words are sorted by start
+        - A word starting before its predecessor ends is moved to 1 ms
+          after that end
+
+        Args:
+            timing_repair: Repair zero-length words instead of dropping them
+
+        Returns:
+            New table with valid timing
+        """
+        if not len(self):
+            return self
+
+        start = self.start.copy()
+        end = self.end.copy()
+
+        negative = (start < 0) | (end < 0)
+        if negative.any():
+            logger.warning(f"Skipping {int(negative.sum())} words with negative timing")
+
+        zero_length = ~negative & (end <= start)
+        if timing_repair:
+            end[zero_length] = start[zero_length] + REPAIR_EPSILON
+            keep = ~negative
+        else:
+            if zero_length.any():
+                logger.warning(f"Skipping {int(zero_length.sum())} zero-length words (repair disabled)")
+            keep = ~negative & ~zero_length
+
+        if keep.all() and self._first == 0 and self._stop == self._columns[0].size:
+            texts = (self._text, self._offsets)
+        else:
+            texts = [t for t, k in zip(self.texts, keep.tolist()) if k]
+        # Boolean indexing copies, so the new table owns its columns
+        table = WordTable(
+            texts, start[keep], end[keep], self.probability[keep], zero_length[keep], self.segment[keep],
+        ).sorted()
+
+        # Ends are never moved, so each word's shift depends only on its predecessor
+        if len(table) > 1:
+            start = table.start
+            previous_end = table.end[:-1]
+            overlapping = start[1:] < previous_end
+            start[1:][overlapping] = previous_end[overlapping] + OVERLAP_NUDGE
+
+        logger.debug(f"Validated {len(table)} words from {len(self)} input words")
+        return table
+
+    def gaps(self) -> np.ndarray:
+        """Non-negative pauses between consecutive words (``len - 1`` values)."""
+        if len(self) < 2:
+            return np.zeros(0)
+        return np.maximum(self.start[1:] - self.end[:-1], 0.0)
+
+    def durations(self) -> np.ndarray:
+        """Per-word durations."""
+        return self.end - self.start
+
+    def grouped_gaps(self, offsets: Sequence[int]) -> "GroupedGaps":
+        """Gap statistics per word group; group ``i`` is rows ``offsets[i]:offsets[i + 1]``."""
+        return grouped_gap_stats(self.start, self.end, offsets)
+
+
+@dataclass
+class GroupedGaps:
+    """
+    Pause statistics of consecutive word groups (e.g. timing buckets).
+
+    Only gaps between words of the same group count. Group ``i`` owns
+    ``gaps[gap_offsets[i]:gap_offsets[i + 1]]``; groups with no gaps have
+    zero count, mean, variance, min and max.
+    """
+    gaps: np.ndarray
+    gap_offsets: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    variance: np.ndarray  # population variance (ddof=0)
+    min_gap: np.ndarray
+    max_gap: np.ndarray
+
+    def __len__(self) -> int:
+        return self.count.size
+
+    @property
+    def std_dev(self) -> np.ndarray:
+        return np.sqrt(self.variance)
+
+    def sample_variance(self) -> np.ndarray:
+        """Variance with ddof=1 (0 for groups with fewer than two gaps)."""
+        scale = np.divide(self.count, self.count - 1, out=np.zeros(len(self)), where=self.count > 1)
+        return self.variance * scale
+
+    def group(self, index: int) -> np.ndarray:
+        """Gaps of one group."""
+        return self.gaps[self.gap_offsets[index]:self.gap_offsets[index + 1]]
+
+
+def grouped_gap_stats(start: np.ndarray, end: np.ndarray, offsets: Sequence[int]) -> GroupedGaps:
+    """
+    Compute every inter-word gap once and reduce it per group.
+
+    Args:
+        start: Word start times in chronological order
+        end: Word end times
+        offsets: Group boundaries covering all words (``offsets[0] == 0``,
+            ``offsets[-1] == len(start)``)
+
+    Returns:
+        GroupedGaps with per-group count, mean, variance, min and max
+    """
+    start = np.asarray(start, dtype=np.float64)
+    end = np.asarray(end, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.size == 0 or offsets[0] != 0 or offsets[-1] != start.size:
+        raise ValueError("Group offsets must cover all words")
+
+    # Gap j lies between words j and j + 1; drop those spanning a group boundary
+    gaps = np.maximum(start[1:] - end[:-1], 0.0)
+    boundaries = offsets[1:-1]
+    boundaries = boundaries[(boundaries > 0) & (boundaries < start.size)]
+    if boundaries.size:
+        keep = np.ones(gaps.size, dtype=bool)
+        keep[boundaries - 1] = False
+        gaps = gaps[keep]
+
+    count = np.maximum(np.diff(offsets) - 1, 0)
+    gap_offsets = np.zeros(count.size + 1, dtype=np.int64)
+    np.cumsum(count, out=gap_offsets[1:])
+
+    groups = count.size
+    mean = np.zeros(groups)
+    variance = np.zeros(groups)
+    min_gap = np.zeros(groups)
+    max_gap = np.zeros(groups)
+
+    present = count > 0
+    if gaps.size:
+        # Groups without gaps add no elements, so reducing at the starts of
+        # the others yields exactly their own slices
+        starts = gap_offsets[:-1][present]
+        counts = count[present]
+        mean[present] = np.add.reduceat(gaps, starts) / counts
+        deviation = gaps - np.repeat(mean[present], counts)
+        variance[present] = np.add.reduceat(deviation * deviation, starts) / counts
+        min_gap[present] = np.minimum.reduceat(gaps, starts)
+        max_gap[present] = np.maximum.reduceat(gaps, starts)
+
+    return GroupedGaps(gaps, gap_offsets, count, mean, variance, min_gap, max_gap)
@@ -0,0 +1,171 @@
+"""
+In-process job queue for the MCP server.
+
+Transcriptions run on a bounded worker pool; callers get a job id back
+immediately and poll for status and results.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from ..utils.tracing import QUEUE_WAIT
+
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+@dataclass
+class Job:
+    """A submitted unit of work and its outcome."""
+    job_id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str = QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Status view of the job (without the result payload)."""
+        return {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'status': self.status,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'error': self.error,
+        }
+
+
+class JobManager:
+    """
+    Runs jobs on a fixed-size thread pool.
+
+    At most ``max_workers`` jobs run at once and at most ``max_pending``
+    wait behind them; further submissions are rejected. Finished jobs are
+    kept for polling until ``max_finished`` newer ones have completed.
+    """
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 16, max_finished: int = 256):
+        """
+        Initialize the manager.
+
+        Args:
+            max_workers: Jobs executed concurrently
+            max_pending: Jobs allowed to wait for a worker
+            max_finished: Finished jobs retained for status/result queries
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self.max_finished = max(1, max_finished)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="talkgpt-job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[..., Any], params: Dict[str, Any]) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            kind: Job type, e.g. "transcribe_audio"
+            fn: Called with ``**params`` on a worker thread; its return value
+                becomes the job result
+            params: Keyword arguments for ``fn``, also reported in status
+
+        Returns:
+            The queued Job
+
+        Raises:
+            JobQueueFullError: If all workers are busy and the queue is full
+        """
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if not job.finished)
+            if active >= self.max_workers + self.max_pending:
+                raise JobQueueFullError(f"Job queue full ({active} jobs active)")
+
+            job = Job(job_id=uuid.uuid4().hex, kind=kind, params=params)
+            self._jobs[job.job_id] = job
+
+        self._executor.submit(self._run, job, fn)
+        return job
+
+    def _run(self, job: Job, fn: Callable[..., Any]):
+        """Worker body: execute a job and record its outcome."""
+        job.status = RUNNING
+        job.started_at = time.time()
+        QUEUE_WAIT.observe(job.started_at - job.submitted_at, queue="mcp")
+        try:
+            job.result = fn(**job.params)
+            job.status = COMPLETED
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = FAILED
+        finally:
+            job.finished_at = time.time()
+            job.done.set()
+            self._prune()
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond max_finished."""
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+                del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id (None if unknown or pruned)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """
+        Block until a job finishes.
+
+        Args:
+            job_id: Job to wait for
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            The job (finished unless the timeout expired), or None if unknown
+        """
+        job = self.get(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return job
+
+    def list_jobs(self) -> List[Job]:
+        """All retained jobs, oldest first."""
+        with self._lock:
+            return list(self._jobs.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Number of retained jobs per status."""
+        counts = {QUEUED: 0, RUNNING: 0, COMPLETED: 0, FAILED: 0}
+        for job in self.list_jobs():
+            counts[job.status] += 1
+        return counts
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and optionally wait for running jobs."""
+        self._executor.shutdown(wait=wait)
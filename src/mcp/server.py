@@ -1,35 +1,113 @@
 """
 Minimal MCP-style server (HTTP MVP) exposing a transcribe tool.
+
+Transcriptions run as jobs on a bounded in-process worker pool. Config,
+logging and the Whisper model are set up once at startup instead of per
+request.
 """
 
+import logging
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
 # Local imports
-from ..utils.config import load_config
+from ..utils.config import load_config, TalkGPTConfig
 from ..cli.commands.transcribe import transcribe_single_file
-from ..utils.logger import setup_logging
+from ..utils.logger import setup_logging, TalkGPTLogger
+from ..utils.tracing import get_metrics
 
 
+from .jobs import JobManager, JobQueueFullError, COMPLETED, FAILED
 from .schemas.requests import TranscribeAudioRequest
-from .schemas.responses import TranscribeAudioResponse
+from .schemas.responses import TranscribeAudioResponse, JobStatusResponse
 
 
-app = FastAPI(title="TalkGPT MCP Server (MVP)")
+logger = logging.getLogger(__name__)
 
+# Worker pool sizing; one worker keeps a single transcription on the device at a time
+JOB_WORKERS = int(os.getenv("TALKGPT_MCP_WORKERS", "1"))
+JOB_MAX_PENDING = int(os.getenv("TALKGPT_MCP_MAX_PENDING", "16"))
+PRELOAD_MODELS = os.getenv("TALKGPT_MCP_PRELOAD", "1").lower() in ("1", "true", "yes", "on")
+
+
+class ServerState:
+    """Config, logger and job manager shared by all requests."""
+
+    def __init__(self):
+        self.config: TalkGPTConfig = load_config("default")
+        self.logger: TalkGPTLogger = setup_logging(self.config.logging)
+        self.jobs = JobManager(max_workers=JOB_WORKERS, max_pending=JOB_MAX_PENDING)
+        self.models_ready = False
+
+
+_state: Optional[ServerState] = None
+
+
+def get_state() -> ServerState:
+    """Get the server state, creating it on first use."""
+    global _state
+    if _state is None:
+        _state = ServerState()
+    return _state
+
+
+def _preload_models(state: ServerState):
+    """
+    Load and warm up the transcription model before the first request.
+
+    Uses the same transcriber settings as transcribe_single_file, so jobs
+    pick up the already-loaded instance.
+    """
+    from ..core.transcriber import get_transcriber
+    from ..core.resource_detector import get_device_config
+    from ..core.model_registry import get_model_registry
+    from ..utils.cache import get_configured_cache
+
+    cfg = state.config
+    device_cfg = get_device_config(
+        force_device=cfg.transcription.device if cfg.transcription.device != 'auto' else None
+    )
+    transcriber = get_transcriber(
+        model_size=cfg.transcription.model_size,
+        device=device_cfg['device'],
+        compute_type=device_cfg['compute_type'],
+        num_workers=cfg.processing.max_workers or 1,
+        result_cache=get_configured_cache(cfg.cache),
+        batch_size=cfg.transcription.batch_size,
+        cpu_threads=cfg.resources.cpu_threads
+    )
+    if transcriber.model is None:
+        raise RuntimeError("Whisper model not available")
+
+    get_model_registry().warm_up(transcriber.model)
+    state.models_ready = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    state = get_state()
+    if PRELOAD_MODELS:
+        try:
+            _preload_models(state)
+        except Exception as e:
+            # The server still starts; the first job loads the model instead
+            logger.warning(f"Model preload failed: {e}")
+    yield
+    state.jobs.shutdown(wait=False)
 
-@app.post("/tools/transcribe_audio", response_model=TranscribeAudioResponse)
-def transcribe_audio(req: TranscribeAudioRequest):
-    input_path = Path(req.input_path)
-    if not input_path.exists():
-        raise HTTPException(status_code=400, detail=f"Input not found: {input_path}")
 
-    # Load config and initialize logging for consistent logs
-    cfg = load_config("default")
-    setup_logging(cfg.logging)
+app = FastAPI(title="TalkGPT MCP Server (MVP)", lifespan=lifespan)
+
+
+def _run_transcription(req: TranscribeAudioRequest) -> TranscribeAudioResponse:
+    """Job body: transcribe one file with the shared config and logger."""
+    state = get_state()
 
     # Prepare options for CLI layer
     options: Dict[str, Any] = {
@@ -42,10 +120,10 @@ def transcribe_audio(req: TranscribeAudioRequest):
 
     # Use CLI implementation directly to keep one code path
     result = transcribe_single_file(
-        input_path=input_path,
+        input_path=Path(req.input_path),
         output_dir=Path(req.output_dir) if req.output_dir else None,
-        config=cfg,
-        logger=None,  # Transcribe layer uses TalkGPTLogger internally
+        config=state.config,
+        logger=state.logger,
         **options,
     )
 
@@ -58,3 +136,63 @@ def transcribe_audio(req: TranscribeAudioRequest):
     )
 
 
+def _submit_transcription(req: TranscribeAudioRequest):
+    """Validate a request and queue it as a job."""
+    input_path = Path(req.input_path)
+    if not input_path.exists():
+        raise HTTPException(status_code=400, detail=f"Input not found: {input_path}")
+
+    try:
+        return get_state().jobs.submit("transcribe_audio", _run_transcription, {'req': req})
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+def _get_job(job_id: str):
+    job = get_state().jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@app.post("/tools/transcribe_audio", response_model=TranscribeAudioResponse)
+def transcribe_audio(req: TranscribeAudioRequest):
+    """Synchronous form of the tool: runs as a job and waits for it."""
+    job = _submit_transcription(req)
+    job.done.wait()
+    if job.status == FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
+    return job.result
+
+
+@app.post("/jobs/transcribe_audio", response_model=JobStatusResponse, status_code=202)
+def submit_transcribe_audio(req: TranscribeAudioRequest):
+    """Queue a transcription and return its job id immediately."""
+    return JobStatusResponse(**_submit_transcription(req).to_dict())
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+def job_status(job_id: str):
+    return JobStatusResponse(**_get_job(job_id).to_dict())
+
+
+@app.get("/jobs/{job_id}/result", response_model=TranscribeAudioResponse)
+def job_result(job_id: str):
+    job = _get_job(job_id)
+    if job.status == FAILED:
+        raise HTTPException(status_code=500, detail=job.error)
+    if job.status != COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status}")
+    return job.result
+
+
+@app.get("/health")
+def health():
+    state = get_state()
+    return {'status': 'ok', 'models_ready': state.models_ready, 'jobs': state.jobs.stats()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Pipeline metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(get_metrics().render(), media_type="text/plain; version=0.0.4; charset=utf-8")
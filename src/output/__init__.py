@@ -2,13 +2,18 @@
 TalkGPT Output Module
 
 Enhanced output generation with comprehensive markdown and JSON formats
-for word-gap analysis and cadence classification results.
+for word-gap analysis and cadence classification results, and a columnar
+binary transcript format with a memory-mapped reader.
 """
 
 from .md_writer import MarkdownWriter, write_enhanced_markdown_report, validate_markdown_output
+from .columnar import ColumnarTranscript, write_columnar_transcript, is_columnar_transcript
 
 __all__ = [
     'MarkdownWriter',
     'write_enhanced_markdown_report', 
-    'validate_markdown_output'
+    'validate_markdown_output',
+    'ColumnarTranscript',
+    'write_columnar_transcript',
+    'is_columnar_transcript'
 ]
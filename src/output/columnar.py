@@ -0,0 +1,437 @@
+"""
+TalkGPT Output: Columnar Transcript
+
+Binary transcript format storing segments, words and timing records
+column-wise in an uncompressed ``.npz`` archive. Text columns are string
+tables: one UTF-8 buffer plus code point offsets per entry. Any NumPy
+can read the archive with ``np.load``; ``ColumnarTranscript`` instead
+memory-maps its members, so opening a transcript costs a few
+milliseconds and columns are only read when used.
+
+Columns (``n`` entries each unless noted):
+    segment_{start,end,avg_logprob,no_speech_prob,id}, segment_text
+    segment_word_offsets (n + 1): word range of each segment
+    word_{start,end,probability}, word_text
+    record_{index,start,end,duration,gap_mean,gap_var,confidence}, record_text
+    record_{cadence,overlap}: codes into the label lists in ``meta``
+    record_gaps, record_gap_offsets (n + 1)
+    record_word_{start,end,probability,repaired}, record_word_text,
+    record_word_offsets (n + 1): the validated words of each record
+    text: full transcript text; meta: JSON document
+"""
+
+import contextlib
+import gc
+import io
+import json
+import mmap
+import os
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..core.transcriber import BatchTranscriptionResult, TranscriptionResult, TranscriptionSegment, WordTimestamp
+from ..core.word_table import WordTable
+from ..post.assembler import TranscriptionRecord
+
+
+COLUMNAR_FORMAT = "talkgpt-columnar"
+COLUMNAR_VERSION = 1
+
+# Zip local file header, up to the member name
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """Pause the cyclic collector while building many objects that hold no cycles."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _string_table(texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 buffer and code point offsets for ``texts``."""
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, texts), dtype=np.int64, count=len(texts)), out=offsets[1:])
+    return np.frombuffer("".join(texts).encode('utf-8'), dtype=np.uint8), offsets
+
+
+def _codes(values: List[str], labels: List[str]) -> np.ndarray:
+    """Category codes for ``values``, extending ``labels`` with new ones."""
+    index = {label: i for i, label in enumerate(labels)}
+    for value in values:
+        if value not in index:
+            index[value] = len(labels)
+            labels.append(value)
+    return np.array([index[value] for value in values], dtype=np.uint8)
+
+
+def _segment_columns(segments: List[TranscriptionSegment]) -> Dict[str, np.ndarray]:
+    texts: List[str] = []
+    start: List[float] = []
+    end: List[float] = []
+    probability: List[float] = []
+    counts: List[int] = []
+    for segment in segments:
+        words = segment.words or []
+        counts.append(len(words))
+        for word in words:
+            # WordTimestamp objects and dicts both support item access
+            texts.append(word['word'])
+            start.append(word['start'])
+            end.append(word['end'])
+            probability.append(word.get('probability', 1.0))
+
+    word_offsets = np.zeros(len(segments) + 1, dtype=np.int64)
+    np.cumsum(counts, out=word_offsets[1:])
+    columns = {
+        'segment_id': np.array([segment.id for segment in segments], dtype=np.int64),
+        'segment_start': np.array([segment.start for segment in segments], dtype=np.float64),
+        'segment_end': np.array([segment.end for segment in segments], dtype=np.float64),
+        'segment_avg_logprob': np.array([segment.avg_logprob for segment in segments], dtype=np.float64),
+        'segment_no_speech_prob': np.array([segment.no_speech_prob for segment in segments], dtype=np.float64),
+        'segment_word_offsets': word_offsets,
+        'word_start': np.array(start, dtype=np.float64),
+        'word_end': np.array(end, dtype=np.float64),
+        'word_probability': np.array(probability, dtype=np.float64),
+    }
+    columns['segment_text'], columns['segment_text_offsets'] = _string_table([segment.text for segment in segments])
+    columns['word_text'], columns['word_text_offsets'] = _string_table(texts)
+    return columns
+
+
+def _record_columns(records: List[TranscriptionRecord], meta: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    tables = [record.words if isinstance(record.words, WordTable) else WordTable.from_words(list(record.words))
+              for record in records]
+    gaps = [np.asarray(record.word_gaps, dtype=np.float64) for record in records]
+
+    def offsets(sizes: Iterable[int]) -> np.ndarray:
+        result = np.zeros(len(records) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(sizes, dtype=np.int64, count=len(records)), out=result[1:])
+        return result
+
+    def floats(name: str) -> np.ndarray:
+        return np.array([getattr(record, name) for record in records], dtype=np.float64)
+
+    def stacked(name: str, dtype) -> np.ndarray:
+        return np.concatenate([getattr(table, name) for table in tables]) if tables else np.zeros(0, dtype=dtype)
+
+    meta['cadence_labels'] = ['slow', 'normal', 'fast']
+    meta['overlap_labels'] = ['single', 'overlap', 'unknown check pyannote']
+    columns = {
+        'record_index': np.array([record.bucket_index for record in records], dtype=np.int64),
+        'record_start': floats('start_time'),
+        'record_end': floats('end_time'),
+        'record_duration': floats('duration'),
+        'record_gap_mean': floats('word_gap_mean'),
+        'record_gap_var': floats('word_gap_var'),
+        'record_confidence': floats('confidence_score'),
+        'record_cadence': _codes([record.cadence for record in records], meta['cadence_labels']),
+        'record_overlap': _codes([record.speaker_overlap for record in records], meta['overlap_labels']),
+        'record_gaps': np.concatenate(gaps) if gaps else np.zeros(0),
+        'record_gap_offsets': offsets(len(g) for g in gaps),
+        'record_word_offsets': offsets(len(table) for table in tables),
+        'record_word_start': stacked('start', np.float64),
+        'record_word_end': stacked('end', np.float64),
+        'record_word_probability': stacked('probability', np.float64),
+        'record_word_repaired': stacked('repaired', bool),
+    }
+    columns['record_text'], columns['record_text_offsets'] = _string_table([record.text for record in records])
+    columns['record_word_text'], columns['record_word_text_offsets'] = _string_table(
+        [text for table in tables for text in table.texts])
+    return columns
+
+
+def write_columnar_transcript(result: Union[TranscriptionResult, BatchTranscriptionResult],
+                              output_path: Union[str, Path],
+                              records: Optional[List[TranscriptionRecord]] = None) -> Path:
+    """
+    Write a transcript in the columnar format.
+
+    Args:
+        result: Transcription result (a batch result's merged result is written)
+        output_path: Destination ``.npz`` file
+        records: Timing records to store alongside the words
+
+    Returns:
+        Path of the written file
+    """
+    merged = result.merged_result if isinstance(result, BatchTranscriptionResult) else result
+    meta: Dict[str, Any] = {
+        'format': COLUMNAR_FORMAT,
+        'version': COLUMNAR_VERSION,
+        'language': merged.language,
+        'language_probability': merged.language_probability,
+        'duration': merged.duration,
+        'avg_confidence': merged.avg_confidence,
+        'processing_time': merged.processing_time,
+        'model_info': merged.model_info,
+        'chunk_info': merged.chunk_info,
+        'has_records': records is not None,
+    }
+    if isinstance(result, BatchTranscriptionResult):
+        meta['original_file'] = str(result.original_file)
+
+    columns = _segment_columns(merged.segments)
+    if records is not None:
+        columns.update(_record_columns(records, meta))
+    columns['text'] = np.frombuffer(merged.text.encode('utf-8'), dtype=np.uint8)
+    columns['meta'] = np.frombuffer(json.dumps(meta, default=str).encode('utf-8'), dtype=np.uint8)
+
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        # A file object keeps np.savez from appending its own suffix
+        with open(temp_path, 'wb') as f:
+            np.savez(f, **columns)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return output_path
+
+
+def is_columnar_transcript(path: Union[str, Path]) -> bool:
+    """Whether ``path`` is a columnar transcript (checked by content, not suffix)."""
+    try:
+        with zipfile.ZipFile(path) as archive:
+            return 'meta.npy' in archive.namelist() and 'word_start.npy' in archive.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+class ColumnarTranscript:
+    """
+    Memory-mapped reader for columnar transcripts.
+
+    Columns are NumPy arrays backed by the mapped file and read from disk
+    when first touched; string tables are decoded once, on first use.
+    ``words()`` and ``record_words()`` are WordTables built directly on
+    the columns; ``segments()``, ``records()`` and ``to_result()``
+    materialize Python objects and cost proportionally more.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a transcript.
+
+        Args:
+            path: Columnar transcript file
+
+        Raises:
+            ValueError: If the file is not a columnar transcript of a
+                supported version
+        """
+        self.path = Path(path)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._strings: Dict[str, Tuple[str, np.ndarray]] = {}
+        self._text: Optional[str] = None
+
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with zipfile.ZipFile(self.path) as archive:
+                self._members = {info.filename[:-4]: info for info in archive.infolist()
+                                 if info.filename.endswith('.npy')}
+        except zipfile.BadZipFile:
+            raise ValueError(f"Not a columnar transcript: {self.path}") from None
+
+        if 'meta' not in self._members:
+            raise ValueError(f"Not a columnar transcript: {self.path}")
+        self.meta: Dict[str, Any] = json.loads(self.column('meta').tobytes().decode('utf-8'))
+        if self.meta.get('format') != COLUMNAR_FORMAT:
+            raise ValueError(f"Not a columnar transcript: {self.path}")
+        if self.meta.get('version', 0) > COLUMNAR_VERSION:
+            raise ValueError(f"Unsupported columnar transcript version {self.meta['version']}")
+
+    def __enter__(self) -> "ColumnarTranscript":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Drop cached columns and unmap the file once no column is referenced elsewhere."""
+        self._columns.clear()
+        self._strings.clear()
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # arrays handed out still use the mapping; it closes when they are freed
+
+    # Columns
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        A column, memory-mapped when its archive member is stored uncompressed.
+
+        Raises:
+            KeyError: If the transcript has no such column
+        """
+        array = self._columns.get(name)
+        if array is None:
+            array = self._load(name)
+            self._columns[name] = array
+        return array
+
+    def _load(self, name: str) -> np.ndarray:
+        info = self._members[name]
+        if info.compress_type != zipfile.ZIP_STORED:
+            with np.load(self.path) as archive:
+                return archive[name]
+
+        header = _LOCAL_HEADER.unpack_from(self._map, info.header_offset)
+        start = info.header_offset + _LOCAL_HEADER.size + header[-2] + header[-1]
+        npy = io.BytesIO(self._map[start:start + min(info.file_size, 1 << 16)])
+        version = np.lib.format.read_magic(npy)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(npy)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(npy)
+        return np.ndarray(shape, dtype=dtype, buffer=self._map, offset=start + npy.tell(),
+                          order='F' if fortran_order else 'C')
+
+    def strings(self, name: str) -> Tuple[str, np.ndarray]:
+        """Decoded text buffer and code point offsets of a string table."""
+        table = self._strings.get(name)
+        if table is None:
+            table = (self.column(name).tobytes().decode('utf-8'), self.column(f"{name}_offsets"))
+            self._strings[name] = table
+        return table
+
+    def texts(self, name: str) -> List[str]:
+        """All entries of a string table."""
+        buffer, offsets = self.strings(name)
+        bounds = offsets.tolist()
+        return [buffer[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+
+    # Sizes and metadata
+
+    @property
+    def language(self) -> str:
+        return self.meta.get('language', 'unknown')
+
+    @property
+    def duration(self) -> float:
+        return self.meta.get('duration', 0.0)
+
+    @property
+    def segment_count(self) -> int:
+        return len(self.column('segment_start'))
+
+    @property
+    def word_count(self) -> int:
+        return len(self.column('word_start'))
+
+    @property
+    def has_records(self) -> bool:
+        return bool(self.meta.get('has_records')) and 'record_start' in self._members
+
+    @property
+    def record_count(self) -> int:
+        return len(self.column('record_start')) if self.has_records else 0
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.column('text').tobytes().decode('utf-8')
+        return self._text
+
+    # Tables and objects
+
+    def words(self) -> WordTable:
+        """Transcript words as a WordTable; texts are kept as decoded (with leading spaces)."""
+        counts = np.diff(self.column('segment_word_offsets'))
+        return WordTable(
+            self.strings('word_text'),
+            self.column('word_start'), self.column('word_end'), self.column('word_probability'),
+            segment=np.repeat(np.arange(len(counts), dtype=np.int32), counts),
+        )
+
+    def record_words(self) -> WordTable:
+        """Validated words of all records, in record order."""
+        return WordTable(
+            self.strings('record_word_text'),
+            self.column('record_word_start'), self.column('record_word_end'),
+            self.column('record_word_probability'), self.column('record_word_repaired'),
+        )
+
+    def segments(self) -> List[TranscriptionSegment]:
+        """Segments with their word timestamps."""
+        bounds = self.column('segment_word_offsets').tolist()
+        language = self.language
+
+        segments = []
+        with _gc_paused():
+            words = list(map(WordTimestamp, self.texts('word_text'), self.column('word_start').tolist(),
+                             self.column('word_end').tolist(), self.column('word_probability').tolist()))
+            for i, (segment_id, start, end, text, avg_logprob, no_speech_prob) in enumerate(zip(
+                    self.column('segment_id').tolist(), self.column('segment_start').tolist(),
+                    self.column('segment_end').tolist(), self.texts('segment_text'),
+                    self.column('segment_avg_logprob').tolist(), self.column('segment_no_speech_prob').tolist())):
+                segments.append(TranscriptionSegment(
+                    id=segment_id, start=start, end=end, text=text,
+                    avg_logprob=avg_logprob, no_speech_prob=no_speech_prob,
+                    words=words[bounds[i]:bounds[i + 1]] or None, language=language
+                ))
+        return segments
+
+    def to_result(self) -> TranscriptionResult:
+        """The stored transcript as a TranscriptionResult."""
+        meta = self.meta
+        return TranscriptionResult(
+            segments=self.segments(),
+            language=self.language,
+            language_probability=meta.get('language_probability', 0.0),
+            duration=self.duration,
+            text=self.text,
+            avg_confidence=meta.get('avg_confidence', 0.0),
+            processing_time=meta.get('processing_time', 0.0),
+            model_info=meta.get('model_info') or {},
+            chunk_info=meta.get('chunk_info'),
+        )
+
+    def records(self) -> List[TranscriptionRecord]:
+        """
+        Stored timing records; their words are views of ``record_words()``.
+
+        Raises:
+            ValueError: If the transcript was written without records
+        """
+        if not self.has_records:
+            raise ValueError(f"{self.path} has no timing records")
+
+        table = self.record_words()
+        word_bounds = self.column('record_word_offsets').tolist()
+        gaps = self.column('record_gaps')
+        gap_bounds = self.column('record_gap_offsets').tolist()
+        cadence_labels = self.meta['cadence_labels']
+        overlap_labels = self.meta['overlap_labels']
+
+        records = []
+        with _gc_paused():
+            for i, (index, start, end, duration, text, mean, var, confidence, cadence, overlap) in enumerate(zip(
+                    self.column('record_index').tolist(), self.column('record_start').tolist(),
+                    self.column('record_end').tolist(), self.column('record_duration').tolist(),
+                    self.texts('record_text'), self.column('record_gap_mean').tolist(),
+                    self.column('record_gap_var').tolist(), self.column('record_confidence').tolist(),
+                    self.column('record_cadence').tolist(), self.column('record_overlap').tolist())):
+                record_gaps = gaps[gap_bounds[i]:gap_bounds[i + 1]].tolist()
+                records.append(TranscriptionRecord(
+                    bucket_index=index, start_time=start, end_time=end, duration=duration,
+                    text=text, word_count=word_bounds[i + 1] - word_bounds[i],
+                    word_gap_count=len(record_gaps), word_gaps=record_gaps,
+                    word_gap_mean=mean, word_gap_var=var,
+                    cadence=cadence_labels[cadence], speaker_overlap=overlap_labels[overlap],
+                    confidence_score=confidence, words=table[word_bounds[i]:word_bounds[i + 1]]
+                ))
+        return records
+
@@ -6,13 +6,13 @@ cadence classification, and speaker overlap detection.
 """
 
 from typing import List, Dict, Any, Optional, TextIO
-import json
 import csv
 import time
 import logging
 from pathlib import Path
 
 from ..post.assembler import TranscriptionRecord
+from ..utils.json_stream import write_json
 
 logger = logging.getLogger(__name__)
 
@@ -429,8 +429,7 @@ def _generate_timing_json(
             'flagged_percentage': getattr(uncertainty_result, 'flagged_percentage', None),
         }
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json(data, output_file)
 
 
 def _generate_timing_srt(timing_buckets: List[Any], output_file: Path) -> None:
@@ -21,6 +21,7 @@ from workers.optimized_gpu_worker import OptimizedGPUWorker
 from quality.confidence_reprocessor import ConfidenceReprocessor, reprocess_low_confidence_segments
 from analytics.timing_analyzer import TimingAnalyzer
 from analytics.enhanced_output import EnhancedOutputGenerator
+from utils.cache import ResultCache
 from utils.logger import get_logger
 
 
@@ -58,13 +59,14 @@ class PipelineResults:
 class TranscriptionOrchestrator:
     """Orchestrates the complete transcription pipeline with confidence reprocessing"""
     
-    def __init__(self):
+    def __init__(self, result_cache: Optional[ResultCache] = None):
         self.logger = get_logger(__name__)
+        self.result_cache = result_cache  # e.g. get_configured_cache(config.cache)
         
         # Pipeline components
         self.chunker = SmartAudioChunker()
         self.gpu_worker = OptimizedGPUWorker()
-        self.confidence_reprocessor = ConfidenceReprocessor()
+        self.confidence_reprocessor = ConfidenceReprocessor(result_cache)
         self.timing_analyzer = TimingAnalyzer()
         self.output_generator = EnhancedOutputGenerator()
         
@@ -204,7 +206,8 @@ class TranscriptionOrchestrator:
         final_segments, confidence_report = await reprocess_low_confidence_segments(
             initial_segments, 
             job.original_audio_path, 
-            job.output_dir / "reprocessing"
+            job.output_dir / "reprocessing",
+            result_cache=self.result_cache
         )
         
         self.stage_timings["confidence_reprocessing"] = time.time() - stage_start
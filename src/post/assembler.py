@@ -5,19 +5,25 @@ Assembles comprehensive transcription records with all analysis data including
 text, gap statistics, cadence classification, and overlap detection.
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Optional, Union
 import logging
 from pathlib import Path
 
+import numpy as np
+
 from ..core.utils import Word, extract_text_from_words
+from ..core.word_table import WordTable
 from .segmenter import TimingBucket
-from .cadence import GapStatistics, AnalysisContext, analyze_bucket_cadence, format_gaps_for_output
+from .cadence import (GapStatistics, AnalysisContext, bucket_gap_stats, bucket_statistics,
+                      classify_cadences, format_gaps_for_output)
+from ..core.word_table import GroupedGaps
 from .overlap import detect_speaker_overlaps, batch_detect_overlaps
+from ..core.timeline import TimeMap
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionRecord:
     """
     Complete transcription record for a timing bucket.
@@ -50,22 +56,26 @@ class TranscriptionRecord:
     # Quality metrics
     confidence_score: float
     
-    # Raw data (for advanced processing)
-    words: List[Word]
+    # Raw data (for advanced processing); shared with the bucket, not copied
+    words: Union[List[Word], WordTable]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert record to dictionary for serialization."""
-        record_dict = asdict(self)
+        record_dict = {f.name: getattr(self, f.name) for f in fields(self)}
+        record_dict['word_gaps'] = list(self.word_gaps)
         # Convert Word objects to dictionaries
-        record_dict['words'] = [
-            {
-                'word': w.word,
-                'start': w.start,
-                'end': w.end,
-                'probability': w.probability
-            }
-            for w in self.words
-        ]
+        if isinstance(self.words, WordTable):
+            record_dict['words'] = self.words.to_dicts()
+        else:
+            record_dict['words'] = [
+                {
+                    'word': w.word,
+                    'start': w.start,
+                    'end': w.end,
+                    'probability': w.probability
+                }
+                for w in self.words
+            ]
         return record_dict
     
     def format_time_range(self) -> str:
@@ -84,7 +94,9 @@ class TranscriptionRecord:
 def assemble_records(buckets: List[TimingBucket],
                     context: AnalysisContext,
                     audio_path: Optional[Path] = None,
-                    enable_overlap_detection: bool = True) -> List[TranscriptionRecord]:
+                    enable_overlap_detection: bool = True,
+                    time_map: Optional[TimeMap] = None,
+                    grouped: Optional[GroupedGaps] = None) -> List[TranscriptionRecord]:
     """
     Assemble complete transcription records from timing buckets.
     
@@ -96,6 +108,9 @@ def assemble_records(buckets: List[TimingBucket],
         context: AnalysisContext with global statistics
         audio_path: Path to audio file for overlap detection (optional)
         enable_overlap_detection: Whether to perform overlap detection
+        time_map: Processed -> original map; bucket times are on the original
+            timeline, so overlap queries against processed audio map back
+        grouped: Precomputed bucket_gap_stats(buckets), if available
         
     Returns:
         List of TranscriptionRecord objects with complete analysis
@@ -114,13 +129,24 @@ def assemble_records(buckets: List[TimingBucket],
     
     records = []
     
+    # Gap statistics and cadence for all buckets at once
+    if grouped is None:
+        grouped = bucket_gap_stats(buckets)
+    cadences = classify_cadences(grouped, context)
+    
     # Batch overlap detection if enabled and audio path provided
     overlap_results = {}
+    query_ranges = [(bucket.start_time, bucket.end_time) for bucket in buckets]
+    if time_map is not None and not time_map.is_identity:
+        query_ranges = [
+            tuple(pair) for pair in time_map.to_processed(np.asarray(query_ranges, dtype=np.float64)).tolist()
+        ]
+    
     if enable_overlap_detection and audio_path and audio_path.exists():
         try:
             bucket_data = [
-                {'start': bucket.start_time, 'end': bucket.end_time}
-                for bucket in buckets
+                {'start': start, 'end': end}
+                for start, end in query_ranges
             ]
             overlap_results = batch_detect_overlaps(audio_path, bucket_data)
             logger.info(f"Completed batch overlap detection for {len(buckets)} buckets")
@@ -131,19 +157,24 @@ def assemble_records(buckets: List[TimingBucket],
     for i, bucket in enumerate(buckets):
         try:
             # Analyze cadence
-            gap_stats, cadence = analyze_bucket_cadence(bucket, context)
+            gap_stats = bucket_statistics(grouped, i)
+            cadence = cadences[i]
             
             # Get overlap status
             if i in overlap_results:
                 speaker_overlap = overlap_results[i]
             elif enable_overlap_detection and audio_path and audio_path.exists():
                 # Fallback to individual detection
-                speaker_overlap = detect_speaker_overlaps(audio_path, bucket.start_time, bucket.end_time)
+                speaker_overlap = detect_speaker_overlaps(audio_path, *query_ranges[i])
             else:
                 speaker_overlap = 'unknown check pyannote'
             
             # Calculate average confidence
-            confidence_scores = [word.probability for word in bucket.words if word.probability > 0]
+            if isinstance(bucket.words, WordTable):
+                probabilities = bucket.words.probability
+                confidence_scores = probabilities[probabilities > 0].tolist()
+            else:
+                confidence_scores = [word.probability for word in bucket.words if word.probability > 0]
             avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
             
             # Create comprehensive record
@@ -161,7 +192,7 @@ def assemble_records(buckets: List[TimingBucket],
                 cadence=cadence,
                 speaker_overlap=speaker_overlap,
                 confidence_score=avg_confidence,
-                words=bucket.words.copy()
+                words=bucket.words
             )
             
             records.append(record)
@@ -185,7 +216,7 @@ def assemble_records(buckets: List[TimingBucket],
                 cadence='normal',
                 speaker_overlap='unknown check pyannote',
                 confidence_score=0.0,
-                words=bucket.words.copy()
+                words=bucket.words
             )
             records.append(fallback_record)
     
@@ -3,13 +3,19 @@ TalkGPT Post-Processing: Cadence Analysis
 
 Implements word-gap statistics and cadence classification using population variance
 and statistical thresholds for speech rhythm analysis.
+
+All gaps of a transcript are computed once as one array; per-bucket
+statistics are reductions over bucket offsets (see GroupedGaps).
 """
 
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Tuple
 import logging
-import statistics
-from ..core.utils import Word, calculate_word_gaps
+
+import numpy as np
+
+from ..core.utils import Word
+from ..core.word_table import GroupedGaps, WordTable, grouped_gap_stats
 from .segmenter import TimingBucket
 
 logger = logging.getLogger(__name__)
@@ -82,51 +88,49 @@ def gap_stats(bucket: TimingBucket) -> GapStatistics:
         >>> round(stats.mean, 3)
         0.2
     """
-    if len(bucket.words) < 2:
-        # Return empty statistics for buckets with insufficient words
-        return GapStatistics(
-            gaps=[],
-            mean=0.0,
-            variance=0.0,
-            std_dev=0.0,
-            count=0,
-            min_gap=0.0,
-            max_gap=0.0
-        )
-    
-    # Calculate word gaps
-    gaps = calculate_word_gaps(bucket.words)
-    
-    if not gaps:
-        return GapStatistics(
-            gaps=[],
-            mean=0.0,
-            variance=0.0,
-            std_dev=0.0,
-            count=0,
-            min_gap=0.0,
-            max_gap=0.0
-        )
-    
-    # Calculate statistics using population variance (ddof=0)
-    mean_gap = statistics.mean(gaps)
-    
-    # Population variance calculation
-    variance = sum((gap - mean_gap) ** 2 for gap in gaps) / len(gaps)
-    std_dev = variance ** 0.5
+    return bucket_statistics(bucket_gap_stats([bucket]), 0)
+
+def _bucket_times(words) -> Tuple[np.ndarray, np.ndarray]:
+    if isinstance(words, WordTable):
+        return words.start, words.end
+    return (np.fromiter((w.start for w in words), dtype=np.float64, count=len(words)),
+            np.fromiter((w.end for w in words), dtype=np.float64, count=len(words)))
+
+def bucket_gap_stats(buckets: List[TimingBucket]) -> GroupedGaps:
+    """
+    Gap statistics of all buckets in one pass.
     
+    Args:
+        buckets: TimingBucket objects in chronological order
+        
+    Returns:
+        GroupedGaps with one group per bucket
+    """
+    times = [_bucket_times(bucket.words) for bucket in buckets]
+    offsets = np.zeros(len(buckets) + 1, dtype=np.int64)
+    np.cumsum([len(bucket.words) for bucket in buckets], out=offsets[1:])
+    if not times:
+        return grouped_gap_stats(np.zeros(0), np.zeros(0), offsets)
+    return grouped_gap_stats(np.concatenate([t[0] for t in times]),
+                             np.concatenate([t[1] for t in times]),
+                             offsets)
+
+def bucket_statistics(grouped: GroupedGaps, index: int) -> GapStatistics:
+    """GapStatistics of one bucket of a GroupedGaps."""
+    count = int(grouped.count[index])
     return GapStatistics(
-        gaps=gaps.copy(),
-        mean=mean_gap,
-        variance=variance,
-        std_dev=std_dev,
-        count=len(gaps),
-        min_gap=min(gaps),
-        max_gap=max(gaps)
+        gaps=grouped.group(index).tolist(),
+        mean=float(grouped.mean[index]),
+        variance=float(grouped.variance[index]),
+        std_dev=float(grouped.variance[index]) ** 0.5,
+        count=count,
+        min_gap=float(grouped.min_gap[index]),
+        max_gap=float(grouped.max_gap[index])
     )
 
 def create_analysis_context(buckets: List[TimingBucket],
-                          gap_threshold: float = 1.5) -> AnalysisContext:
+                          gap_threshold: float = 1.5,
+                          grouped: Optional[GroupedGaps] = None) -> AnalysisContext:
     """
     Create global analysis context from all timing buckets.
     
@@ -136,19 +140,16 @@ def create_analysis_context(buckets: List[TimingBucket],
     Args:
         buckets: List of TimingBucket objects
         gap_threshold: Standard deviations for cadence thresholds
+        grouped: Precomputed bucket_gap_stats(buckets), if available
         
     Returns:
         AnalysisContext with global statistics
     """
-    all_gaps = []
+    if grouped is None:
+        grouped = bucket_gap_stats(buckets)
+    all_gaps = grouped.gaps
     
-    # Collect all gaps from all buckets
-    for bucket in buckets:
-        if len(bucket.words) >= 2:
-            gaps = calculate_word_gaps(bucket.words)
-            all_gaps.extend(gaps)
-    
-    if not all_gaps:
+    if not all_gaps.size:
         logger.warning("No word gaps found in any bucket")
         return AnalysisContext(
             global_mean=0.0,
@@ -159,8 +160,8 @@ def create_analysis_context(buckets: List[TimingBucket],
         )
     
     # Calculate global statistics using population variance
-    global_mean = statistics.mean(all_gaps)
-    global_variance = sum((gap - global_mean) ** 2 for gap in all_gaps) / len(all_gaps)
+    global_mean = float(all_gaps.mean())
+    global_variance = float(np.mean((all_gaps - global_mean) ** 2))
     global_std_dev = global_variance ** 0.5
     
     # Always emit ASCII for console safety on Windows
@@ -207,6 +208,24 @@ def classify_cadence(gap_stats: GapStatistics,
     else:
         return 'normal'
 
+def classify_cadences(grouped: GroupedGaps,
+                      context: AnalysisContext) -> List[str]:
+    """
+    Classify every bucket of a GroupedGaps at once (same rule as classify_cadence).
+    
+    Args:
+        grouped: Gap statistics per bucket
+        context: AnalysisContext with global thresholds
+        
+    Returns:
+        Cadence classification per bucket
+    """
+    labels = np.full(len(grouped), 'normal', dtype=object)
+    has_gaps = grouped.count > 0
+    labels[has_gaps & (grouped.mean > context.slow_threshold)] = 'slow'
+    labels[has_gaps & (grouped.mean < context.fast_threshold)] = 'fast'
+    return labels.tolist()
+
 def analyze_bucket_cadence(bucket: TimingBucket,
                           context: AnalysisContext) -> Tuple[GapStatistics, str]:
     """
@@ -276,9 +295,7 @@ def validate_gap_analysis(buckets: List[TimingBucket],
     # Analyze cadence distribution
     cadence_counts = {'slow': 0, 'normal': 0, 'fast': 0}
     
-    for bucket in buckets:
-        stats = gap_stats(bucket)
-        cadence = classify_cadence(stats, context)
+    for cadence in classify_cadences(bucket_gap_stats(buckets), context):
         cadence_counts[cadence] += 1
     
     return {
@@ -8,6 +8,9 @@ from typing import Dict, Any, Optional, List
 import logging
 from pathlib import Path
 
+from ..core.intervals import IntervalIndex
+from ..core.diarization import DEFAULT_DIARIZATION_MODEL, diarization_params, get_diarization_store
+
 logger = logging.getLogger(__name__)
 
 def detect_speaker_overlaps(audio_path: Path,
@@ -36,17 +39,14 @@ def detect_speaker_overlaps(audio_path: Path,
         # Try to import pyannote.audio
         from pyannote.audio import Pipeline
         
-        # Check if we have a cached pipeline
-        pipeline = _get_or_create_pipeline()
+        # Reuses the file's diarization; only the first bucket runs pyannote
+        overlap_index = _get_overlap_index(audio_path)
         
-        if pipeline is None:
+        if overlap_index is None:
             return 'unknown check pyannote'
         
-        # Perform diarization on the audio segment
-        diarization = pipeline(str(audio_path))
-        
         # Check for overlaps in the specified time range
-        has_overlap = _check_overlap_in_range(diarization, bucket_start, bucket_end)
+        has_overlap = _check_overlap_in_range(overlap_index, bucket_start, bucket_end)
         
         return 'overlap' if has_overlap else 'single'
         
@@ -71,7 +71,7 @@ def _get_or_create_pipeline() -> Optional[Any]:
             
             # Try to load speaker diarization pipeline
             pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
+                DEFAULT_DIARIZATION_MODEL,
                 use_auth_token=None  # May require HuggingFace token for some models
             )
             
@@ -84,6 +84,26 @@ def _get_or_create_pipeline() -> Optional[Any]:
     
     return getattr(_get_or_create_pipeline, '_cached_pipeline', None)
 
+def _run_pipeline(audio_path: str, **pipeline_kwargs) -> Optional[Any]:
+    """Diarize a file with the shared pipeline (None if unavailable)."""
+    pipeline = _get_or_create_pipeline()
+    return pipeline(audio_path, **pipeline_kwargs) if pipeline is not None else None
+
+def _get_overlap_index(audio_path: Path) -> Optional[IntervalIndex]:
+    """
+    Get an index of overlapping speech from the file's shared diarization.
+    
+    Args:
+        audio_path: Path to the audio file
+        
+    Returns:
+        IntervalIndex of overlap regions, or None if diarization is unavailable
+    """
+    turns = get_diarization_store().get(
+        audio_path, _run_pipeline, diarization_params(DEFAULT_DIARIZATION_MODEL)
+    )
+    return turns.overlap_index() if turns is not None else None
+
 def _check_overlap_in_range(diarization: Any,
                            start_time: float,
                            end_time: float) -> bool:
@@ -91,7 +111,8 @@ def _check_overlap_in_range(diarization: Any,
     Check if there are speaker overlaps within a time range.
     
     Args:
-        diarization: pyannote diarization result
+        diarization: pyannote diarization result, or an IntervalIndex of its
+            overlapping speech built once by the caller
         start_time: Start of time range to check
         end_time: End of time range to check
         
@@ -99,19 +120,11 @@ def _check_overlap_in_range(diarization: Any,
         True if overlaps detected, False otherwise
     """
     try:
-        # Get timeline of overlapping speech
-        overlaps = diarization.get_overlap()
-        
-        # Check if any overlap intersects with our time range
-        for overlap_segment in overlaps:
-            overlap_start = overlap_segment.start
-            overlap_end = overlap_segment.end
-            
-            # Check for intersection with our bucket
-            if (overlap_start < end_time and overlap_end > start_time):
-                return True
+        if not isinstance(diarization, IntervalIndex):
+            # Get timeline of overlapping speech
+            diarization = IntervalIndex.from_any(diarization.get_overlap())
         
-        return False
+        return diarization.any_overlap(start_time, end_time)
         
     except Exception as e:
         logger.warning(f"Error checking overlaps in range: {e}")
@@ -123,7 +136,8 @@ def batch_detect_overlaps(audio_path: Path,
     Detect overlaps for multiple timing buckets efficiently.
     
     Performs batch overlap detection to minimize repeated pipeline
-    initialization and audio processing.
+    initialization and audio processing. The diarization is shared with
+    speaker analysis through the diarization store.
     
     Args:
         audio_path: Path to the audio file
@@ -141,22 +155,18 @@ def batch_detect_overlaps(audio_path: Path,
     results = {}
     
     try:
-        # Try to get the pipeline once for all buckets
-        pipeline = _get_or_create_pipeline()
+        # Diarize once for the entire file (or reuse an earlier diarization)
+        overlap_index = _get_overlap_index(audio_path)
         
-        if pipeline is None:
+        if overlap_index is None:
             # Return 'unknown' for all buckets
             return {i: 'unknown check pyannote' for i in range(len(buckets))}
         
-        # Perform diarization once for the entire file
-        diarization = pipeline(str(audio_path))
-        
-        # Check each bucket
         for i, bucket in enumerate(buckets):
             start_time = bucket.get('start', 0.0)
             end_time = bucket.get('end', 0.0)
             
-            has_overlap = _check_overlap_in_range(diarization, start_time, end_time)
+            has_overlap = _check_overlap_in_range(overlap_index, start_time, end_time)
             results[i] = 'overlap' if has_overlap else 'single'
         
         logger.info(f"Batch overlap detection completed for {len(buckets)} buckets")
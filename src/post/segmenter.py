@@ -5,23 +5,28 @@ Implements 4-second windowing with tolerance for comprehensive word-gap analysis
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
-from ..core.utils import Word
+
+import numpy as np
+
+from ..core.utils import Word, extract_text_from_words
+from ..core.word_table import WordTable
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class TimingBucket:
     """
     A time window containing words for analysis.
     
     Represents a ~4-second window of speech with word-level timing data
-    for gap analysis and cadence detection.
+    for gap analysis and cadence detection. Buckets made from a WordTable
+    hold a view of it rather than Word objects.
     """
     start_time: float
     end_time: float
-    words: List[Word]
+    words: Union[List[Word], WordTable]
     
     @property
     def duration(self) -> float:
@@ -36,12 +41,96 @@ class TimingBucket:
     @property
     def text(self) -> str:
         """Text content of the bucket."""
-        return " ".join(word.word for word in self.words)
+        return extract_text_from_words(self.words)
     
     def __str__(self) -> str:
         return f"TimingBucket({self.start_time:.1f}-{self.end_time:.1f}s, {self.word_count} words)"
 
-def bucketize(words: List[Word], 
+def _scan_for_close(ends: np.ndarray, first: int, bucket_start: float,
+                    bucket_seconds: float, min_duration: float, max_duration: float) -> Optional[int]:
+    """First word at or after ``first`` that closes a bucket opened at ``bucket_start``."""
+    target_end = bucket_start + bucket_seconds
+    block = 64
+    while first < ends.size:
+        window = ends[first:first + block]
+        duration = window - bucket_start
+        hits = np.flatnonzero((duration >= min_duration) & ((duration >= max_duration) | (window >= target_end)))
+        if hits.size:
+            return first + int(hits[0])
+        first += block
+        block *= 2
+    return None
+
+
+def bucket_bounds(table: WordTable,
+                  bucket_seconds: float = 4.0,
+                  tolerance: float = 0.25) -> Tuple[np.ndarray, List[float], List[float]]:
+    """
+    Assign the words of a table to timing buckets.
+    
+    A bucket closes at the first word ending at least ``bucket_seconds``
+    after the bucket start, and the next bucket starts at that word's end.
+    With a running maximum of the word ends this is a binary search per
+    bucket rather than a pass over every word.
+    
+    Args:
+        table: Words in chronological order
+        bucket_seconds: Target bucket duration in seconds
+        tolerance: Acceptable deviation from target duration
+        
+    Returns:
+        Tuple of (offsets, start times, end times); bucket ``i`` holds
+        words ``offsets[i]:offsets[i + 1]``
+    """
+    count = len(table)
+    if not count:
+        return np.zeros(1, dtype=np.int64), [], []
+    
+    ends = table.end
+    max_ends = np.maximum.accumulate(ends)
+    min_duration = bucket_seconds - tolerance
+    max_duration = bucket_seconds + tolerance
+    
+    offsets = [0]
+    starts: List[float] = []
+    bucket_ends: List[float] = []
+    first = 0
+    bucket_start = float(table.start[0])
+    
+    while first < count:
+        target_end = bucket_start + bucket_seconds
+        close = None
+        # For a positive tolerance a bucket closes exactly when a word
+        # reaches the target end; an earlier word ending past the target
+        # (or a degenerate tolerance) needs the exact per-word check.
+        if tolerance > 0 and (first == 0 or max_ends[first - 1] < target_end):
+            candidate = int(np.searchsorted(max_ends, target_end, side='left'))
+            if candidate < count and ends[candidate] - bucket_start >= min_duration:
+                close = candidate
+            elif candidate >= count:
+                break
+        if close is None:
+            close = _scan_for_close(ends, first, bucket_start, bucket_seconds, min_duration, max_duration)
+            if close is None:
+                break
+        
+        bucket_start_next = float(ends[close])
+        starts.append(bucket_start)
+        bucket_ends.append(bucket_start_next)
+        offsets.append(close + 1)
+        first = close + 1
+        bucket_start = bucket_start_next
+    
+    # Remaining words form the final bucket
+    if first < count:
+        starts.append(bucket_start)
+        bucket_ends.append(float(ends[-1]))
+        offsets.append(count)
+    
+    return np.asarray(offsets, dtype=np.int64), starts, bucket_ends
+
+
+def bucketize(words: Union[List[Word], WordTable], 
               bucket_seconds: float = 4.0,
               tolerance: float = 0.25) -> List[TimingBucket]:
     """
@@ -52,12 +141,13 @@ def bucketize(words: List[Word],
     to include complete words.
     
     Args:
-        words: List of Word objects in chronological order
+        words: Word objects or a WordTable in chronological order
         bucket_seconds: Target bucket duration in seconds (default: 4.0)
         tolerance: Acceptable deviation from target duration (default: 0.25)
         
     Returns:
-        List of TimingBucket objects, each containing ~4s of speech
+        List of TimingBucket objects, each containing ~4s of speech; for
+        a WordTable input their words are views of the table
         
     Example:
         >>> words = create_test_words()  # 12 seconds of words
@@ -67,53 +157,19 @@ def bucketize(words: List[Word],
         >>> all(3.75 <= bucket.duration <= 4.25 for bucket in buckets[:-1])
         True
     """
-    if not words:
+    if not len(words):
         return []
     
-    buckets = []
-    current_bucket_words = []
-    bucket_start = words[0].start
-    target_end = bucket_start + bucket_seconds
-    min_duration = bucket_seconds - tolerance
-    max_duration = bucket_seconds + tolerance
+    table = words if isinstance(words, WordTable) else WordTable.from_words(words)
+    offsets, starts, ends = bucket_bounds(table, bucket_seconds, tolerance)
+    bounds = offsets.tolist()
     
-    for word in words:
-        current_bucket_words.append(word)
-        current_duration = word.end - bucket_start
-        
-        # Check if we should close the current bucket
-        should_close = False
-        
-        if current_duration >= min_duration:
-            # We've reached minimum duration
-            if current_duration >= max_duration:
-                # We've exceeded maximum duration, must close
-                should_close = True
-            elif word.end >= target_end:
-                # We've reached target duration, close at word boundary
-                should_close = True
-        
-        if should_close and current_bucket_words:
-            # Create bucket from accumulated words
-            bucket_end = current_bucket_words[-1].end
-            buckets.append(TimingBucket(
-                start_time=bucket_start,
-                end_time=bucket_end,
-                words=current_bucket_words.copy()
-            ))
-            
-            # Start new bucket
-            current_bucket_words = []
-            bucket_start = word.end  # Start next bucket at end of current word
-            target_end = bucket_start + bucket_seconds
-    
-    # Handle remaining words in final bucket
-    if current_bucket_words:
-        bucket_end = current_bucket_words[-1].end
+    buckets = []
+    for start_time, end_time, first, stop in zip(starts, ends, bounds[:-1], bounds[1:]):
         buckets.append(TimingBucket(
-            start_time=bucket_start,
-            end_time=bucket_end,
-            words=current_bucket_words
+            start_time=start_time,
+            end_time=end_time,
+            words=words[first:stop]
         ))
     
     logger.info(f"Created {len(buckets)} timing buckets from {len(words)} words")
@@ -7,7 +7,6 @@ at 0.7x speed with additional context for improved accuracy.
 """
 
 import asyncio
-import os
 import json
 import numpy as np
 import librosa
@@ -18,6 +17,8 @@ from pathlib import Path
 import tempfile
 
 from faster_whisper import WhisperModel
+from core.model_registry import get_model_registry, shared_model_key
+from utils.cache import ResultCache, hash_array
 from utils.logger import get_logger
 
 
@@ -54,9 +55,15 @@ class ReprocessingContext:
 class ConfidenceReprocessor:
     """Handles confidence-based reprocessing of low-quality segments"""
     
-    def __init__(self):
+    def __init__(self, result_cache: Optional[ResultCache] = None):
         self.logger = get_logger(__name__)
         self.model = None
+        self.model_size = "large-v3"
+        self.compute_type = None
+        
+        # Pass get_configured_cache(config.cache) to share decodes with the CLI;
+        # None (also what a disabled cache gives) decodes every time
+        self.result_cache = result_cache
         
         # Reprocessing parameters
         self.slow_speed_multiplier = 0.7  # Slower for better accuracy
@@ -178,14 +185,16 @@ class ConfidenceReprocessor:
         """Load Whisper model for reprocessing"""
         if self.model is None:
             self.logger.info("📦 Loading Whisper model for reprocessing...")
-            device = "cuda" if os.system("nvidia-smi") == 0 else "cpu"
-            compute_type = "float16" if device == "cuda" else "int8"
-            
-            self.model = WhisperModel(
-                "large-v3",
+            # Same key as OptimizedGPUWorker, so both share one instance
+            model_path, device, compute_type = shared_model_key(self.model_size)
+            registry = get_model_registry()
+            self.model = registry.get(
+                model_path,
                 device=device,
-                compute_type=compute_type
+                compute_type=compute_type,
+                loader=WhisperModel
             )
+            self.compute_type = compute_type
             self.logger.info(f"✅ Model loaded on {device}")
     
     async def _reprocess_segments(self, 
@@ -300,30 +309,47 @@ class ConfidenceReprocessor:
                                      output_dir: Path) -> Optional[SegmentConfidence]:
         """Reprocess audio segment with enhanced parameters"""
         
+        # Transcribe with enhanced settings for accuracy
+        decode_options = dict(
+            beam_size=10,  # Increased beam size for better accuracy
+            temperature=0.0,  # Deterministic output
+            word_timestamps=True,
+            vad_filter=True,
+            vad_parameters=dict(
+                min_silence_duration_ms=100,  # More sensitive to speech
+                speech_pad_ms=200  # More padding around speech
+            ),
+            condition_on_previous_text=True,  # Use context
+            compression_ratio_threshold=2.4,  # More strict
+            logprob_threshold=-1.0,  # Accept lower confidence during reprocessing
+            no_speech_threshold=0.6  # Be more permissive of speech
+        )
+        
+        # Identical slowed audio (e.g. a re-run) reuses the earlier decode
+        cache_key = None
+        segment_list = None
+        if self.result_cache is not None:
+            cache_key = ResultCache.make_key(
+                "reprocess",
+                hash_array(audio_segment),
+                dict(decode_options, model_size=self.model_size, compute_type=self.compute_type)
+            )
+            segment_list = self.result_cache.get(cache_key)
+        
         # Save audio to temporary file
         temp_file = output_dir / f"reprocess_{context.target_segment.segment_id}.wav"
-        sf.write(temp_file, audio_segment, self.sample_rate)
         
         try:
-            # Transcribe with enhanced settings for accuracy
-            segments, info = self.model.transcribe(
-                str(temp_file),
-                beam_size=10,  # Increased beam size for better accuracy
-                temperature=0.0,  # Deterministic output
-                word_timestamps=True,
-                vad_filter=True,
-                vad_parameters=dict(
-                    min_silence_duration_ms=100,  # More sensitive to speech
-                    speech_pad_ms=200  # More padding around speech
-                ),
-                condition_on_previous_text=True,  # Use context
-                compression_ratio_threshold=2.4,  # More strict
-                logprob_threshold=-1.0,  # Accept lower confidence during reprocessing
-                no_speech_threshold=0.6  # Be more permissive of speech
-            )
+            if segment_list is None:
+                sf.write(temp_file, audio_segment, self.sample_rate)
+                segments, info = self.model.transcribe(str(temp_file), **decode_options)
+                segment_list = list(segments)
+                if cache_key is not None:
+                    self.result_cache.put(cache_key, segment_list, kind="reprocess")
+            else:
+                self.logger.info(f"📋 {context.target_segment.segment_id} decode served from result cache")
             
             # Process results
-            segment_list = list(segments)
             if not segment_list:
                 return None
             
@@ -494,7 +520,8 @@ class ConfidenceReprocessor:
 
 async def reprocess_low_confidence_segments(segments: List[Dict], 
                                           audio_file_path: str,
-                                          output_dir: Path) -> Tuple[List[Dict], Dict[str, Any]]:
+                                          output_dir: Path,
+                                          result_cache: Optional[ResultCache] = None) -> Tuple[List[Dict], Dict[str, Any]]:
     """
     Convenience function to reprocess low-confidence segments
     
@@ -502,11 +529,12 @@ async def reprocess_low_confidence_segments(segments: List[Dict],
         segments: Original transcribed segments
         audio_file_path: Path to original audio file
         output_dir: Directory for temporary files
+        result_cache: Cache for the slowed-segment decodes (None disables caching)
         
     Returns:
         Tuple of (improved_segments, reprocessing_report)
     """
-    reprocessor = ConfidenceReprocessor()
+    reprocessor = ConfidenceReprocessor(result_cache)
     
     improved_segments = await reprocessor.analyze_and_reprocess(
         segments, audio_file_path, output_dir
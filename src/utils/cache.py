@@ -0,0 +1,278 @@
+"""
+TalkGPT Result Cache
+
+Content-addressed, size-bounded cache for transcription results. Entries
+are keyed by a hash of the audio content plus the settings that affect the
+output, pickled into a SQLite database in the cache directory and evicted
+least-recently-used first once the configured size is exceeded.
+"""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+try:
+    from .logger import get_logger
+except ImportError:
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.logger import get_logger
+
+
+def hash_file(path: Union[str, Path], block_size: int = 1 << 20) -> str:
+    """
+    Hash a file's content.
+
+    Args:
+        path: File to hash
+        block_size: Read size in bytes
+
+    Returns:
+        Hex SHA-256 digest of the file bytes
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_array(samples: np.ndarray) -> str:
+    """
+    Hash an array's samples, dtype and shape.
+
+    Args:
+        samples: Array to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    samples = np.ascontiguousarray(samples)
+    digest = hashlib.sha256(f"{samples.dtype.str}{samples.shape}".encode())
+    digest.update(memoryview(samples).cast('B'))
+    return digest.hexdigest()
+
+
+def hash_audio_file(path: Union[str, Path]) -> str:
+    """
+    Hash the PCM samples of an audio file.
+
+    WAV files are hashed by sample format and frames only, so header-only
+    differences (e.g. metadata chunks) do not change the hash. Other
+    containers fall back to hashing the file bytes.
+
+    Args:
+        path: Audio file to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    try:
+        with wave.open(str(path), 'rb') as wav_file:
+            digest = hashlib.sha256(
+                f"pcm{wav_file.getsampwidth()}/{wav_file.getnchannels()}/{wav_file.getframerate()}".encode()
+            )
+            while True:
+                frames = wav_file.readframes(1 << 16)
+                if not frames:
+                    break
+                digest.update(frames)
+            return digest.hexdigest()
+    except (wave.Error, EOFError):
+        return hash_file(path)
+
+
+class ResultCache:
+    """
+    Disk-backed LRU cache for pickled results.
+
+    SQLite in WAL mode lets several processes share one cache directory;
+    each thread uses its own connection.
+    """
+
+    DB_NAME = "results.sqlite"
+
+    def __init__(self,
+                 cache_dir: Union[str, Path],
+                 max_size_mb: float = 2048):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_size_mb: Total size of stored values before eviction starts
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / self.DB_NAME
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self.logger = get_logger("talkgpt.cache")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def make_key(kind: str, content_hash: str, params: Dict[str, Any]) -> str:
+        """
+        Build a cache key from content and the settings that shape the result.
+
+        Args:
+            kind: Entry kind (e.g. "file", "chunk")
+            content_hash: Hash of the audio content
+            params: Settings affecting the result; must be JSON-serializable
+                (other values are converted with str)
+
+        Returns:
+            Hex SHA-256 key
+        """
+        payload = json.dumps({'kind': kind, 'content': content_hash, 'params': params},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The stored value, or None on a miss
+        """
+        connection = self._connect()
+        row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        connection.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        with self._lock:
+            self.hits += 1
+
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            # Entries written by an incompatible version are dropped
+            self.logger.warning(f"Discarding unreadable cache entry {key[:12]}: {e}")
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+
+    def put(self, key: str, value: Any, kind: str = "file"):
+        """
+        Store a value and evict old entries if the cache is over its size limit.
+
+        Args:
+            key: Key from make_key
+            value: Picklable value
+            kind: Entry kind, used for stats
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) > self.max_size_bytes:
+            self.logger.warning(f"Not caching {kind} entry of {len(blob)} bytes: larger than the cache")
+            return
+
+        connection = self._connect()
+        connection.execute(
+            "INSERT OR REPLACE INTO entries (key, kind, value, size, last_access) VALUES (?, ?, ?, ?, ?)",
+            (key, kind, sqlite3.Binary(blob), len(blob), time.time())
+        )
+        self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection):
+        """Delete least recently used entries until the size limit holds."""
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        excess = total - self.max_size_bytes
+        victims = []
+        for key, size in connection.execute("SELECT key, size FROM entries ORDER BY last_access"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        connection.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self.logger.debug(f"Evicted {len(victims)} cache entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry counts and sizes per kind plus hit/miss counts
+        """
+        rows = self._connect().execute(
+            "SELECT kind, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY kind"
+        ).fetchall()
+        return {
+            'directory': str(self.cache_dir),
+            'entries': {kind: count for kind, count, _ in rows},
+            'size_bytes': sum(size for _, _, size in rows),
+            'max_size_bytes': self.max_size_bytes,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def clear(self):
+        """Remove every cached entry."""
+        self._connect().execute("DELETE FROM entries")
+
+
+# Global cache instances, one per directory
+_result_caches: Dict[str, ResultCache] = {}
+
+
+def get_result_cache(cache_dir: Union[str, Path] = "~/.cache/talkgpt",
+                     max_size_mb: float = 2048) -> ResultCache:
+    """Get the global result cache for a directory."""
+    resolved = str(Path(cache_dir).expanduser().resolve())
+    if resolved not in _result_caches:
+        _result_caches[resolved] = ResultCache(resolved, max_size_mb=max_size_mb)
+    return _result_caches[resolved]
+
+
+def get_configured_cache(cache_config) -> Optional[ResultCache]:
+    """
+    Get the result cache described by a CacheConfig.
+
+    Args:
+        cache_config: CacheConfig section of TalkGPTConfig
+
+    Returns:
+        ResultCache, or None when caching is disabled
+    """
+    if not cache_config.enabled:
+        return None
+    return get_result_cache(cache_config.directory, max_size_mb=cache_config.max_size_mb)
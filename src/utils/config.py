@@ -23,6 +23,8 @@ class ProcessingConfig(BaseModel):
     silence_threshold: float = Field(default=-40, ge=-60, le=-20)
     min_silence_len: int = Field(default=1000, ge=100)
     remove_silence: bool = True
+    # Debug: run preprocessing step by step and keep every intermediate WAV
+    keep_intermediates: bool = False
 
 
 class TranscriptionConfig(BaseModel):
@@ -36,6 +38,8 @@ class TranscriptionConfig(BaseModel):
     beam_size: int = Field(default=5, ge=1, le=10)
     best_of: int = Field(default=5, ge=1, le=10)
     patience: float = Field(default=1.0, ge=0.0, le=2.0)
+    # >1 decodes that many chunks per BatchedInferencePipeline batch
+    batch_size: int = Field(default=1, ge=1, le=64)
     
     @validator('model_size')
     def validate_model_size(cls, v):
@@ -66,10 +70,11 @@ class OutputConfig(BaseModel):
     include_confidence: bool = True
     speaker_labels: bool = True
     word_timestamps: bool = False
+    json_include_chunks: bool = True  # per-chunk results repeat the merged segments
     
     @validator('formats')
     def validate_formats(cls, v):
-        valid_formats = ["srt", "json", "txt", "csv"]
+        valid_formats = ["srt", "json", "txt", "csv", "npz"]
         for fmt in v:
             if fmt not in valid_formats:
                 raise ValueError(f"Invalid format '{fmt}'. Must be one of: {valid_formats}")
@@ -127,6 +132,13 @@ class ResourcesConfig(BaseModel):
     cpu_threads: Optional[int] = Field(default=None, ge=1)
 
 
+class CacheConfig(BaseModel):
+    """Transcription result cache configuration."""
+    enabled: bool = True
+    directory: str = "~/.cache/talkgpt"
+    max_size_mb: float = Field(default=2048, ge=1)
+
+
 class TalkGPTConfig(BaseModel):
     """Main TalkGPT configuration model."""
     processing: ProcessingConfig = ProcessingConfig()
@@ -135,6 +147,7 @@ class TalkGPTConfig(BaseModel):
     analytics: AnalyticsConfig = AnalyticsConfig()
     logging: LoggingConfig = LoggingConfig()
     resources: ResourcesConfig = ResourcesConfig()
+    cache: CacheConfig = CacheConfig()
 
 
 class ConfigManager:
@@ -251,6 +264,7 @@ class ConfigManager:
             'TALKGPT_MODEL': ('transcription', 'model_size'),
             'TALKGPT_SPEED': ('processing', 'speed_multiplier'),
             'TALKGPT_LOG_LEVEL': ('logging', 'level'),
+            'TALKGPT_CACHE_DIR': ('cache', 'directory'),
         }
         
         for env_var, (section, key) in env_mappings.items():
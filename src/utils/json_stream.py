@@ -0,0 +1,298 @@
+"""
+TalkGPT Streaming JSON
+
+Writes results as JSON while walking them, without ``asdict`` or other
+deep copies. Small subtrees (a segment with its words, a record) are
+converted and encoded in one call; larger containers are walked and
+their items written in batches, so memory stays bounded by the batch
+rather than the transcript. Uses orjson when it is installed.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import os
+from pathlib import Path, PurePath
+from typing import Any, BinaryIO, Callable, Collection, Iterable, Optional, Union
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+# Subtrees with up to this many values are encoded in one call
+UNIT_BUDGET = 256
+
+# Flat list items encoded together
+BATCH_ITEMS = 64
+
+WRITE_BUFFER = 1 << 16
+
+_SCALARS = (str, int, float, bool, type(None))
+_SCALAR_TYPES = frozenset(_SCALARS)
+
+
+class _TooLarge(Exception):
+    """Raised while converting a subtree that exceeds the unit budget."""
+
+
+class JsonStreamWriter:
+    """
+    Incremental JSON encoder writing to a binary stream.
+
+    Dataclasses (including slotted ones) become objects, sequences,
+    sets, generators and NumPy arrays become arrays, and paths, enums,
+    NumPy scalars and datetimes become their plain values. With orjson,
+    NaN and infinity are written as null; the json fallback writes them
+    as ``NaN``/``Infinity`` like ``json.dump``.
+    """
+
+    def __init__(self,
+                 stream: BinaryIO,
+                 indent: Optional[int] = 2,
+                 exclude: Collection[str] = (),
+                 default: Optional[Callable[[Any], Any]] = None,
+                 use_orjson: Optional[bool] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            stream: Binary stream to write to
+            indent: Spaces per nesting level (None for compact output)
+            exclude: Dataclass field and mapping key names to leave out
+            default: Called with unsupported objects; returns a
+                serializable replacement (TypeError if not given)
+            use_orjson: Force the encoder (None uses orjson if installed)
+        """
+        self.stream = stream
+        self.indent = indent
+        self.exclude = frozenset(exclude)
+        self.default = default
+        self._fields: dict = {}
+        use_orjson = ORJSON_AVAILABLE if use_orjson is None else use_orjson
+        if use_orjson and not ORJSON_AVAILABLE:
+            raise RuntimeError("orjson is not installed")
+        # orjson only indents by two spaces
+        self._orjson_option = None
+        if use_orjson and indent in (None, 2):
+            self._orjson_option = orjson.OPT_INDENT_2 if indent else 0
+
+    def write(self, value: Any):
+        """Write one JSON document."""
+        self._write(value, 0)
+        self.stream.write(b"\n")
+
+    # Encoding of converted values
+
+    def _encode(self, plain: Any) -> bytes:
+        if self._orjson_option is not None:
+            try:
+                return orjson.dumps(plain, option=self._orjson_option)
+            except (orjson.JSONEncodeError, TypeError):
+                pass  # e.g. integers beyond 64 bits; json handles them
+        separators = None if self.indent else (',', ':')
+        return json.dumps(plain, indent=self.indent, separators=separators, ensure_ascii=False).encode('utf-8')
+
+    def _newline(self, depth: int) -> bytes:
+        return b"\n" + b" " * (self.indent * depth) if self.indent else b""
+
+    def _emit(self, plain: Any, depth: int):
+        encoded = self._encode(plain)
+        if self.indent and depth:
+            encoded = encoded.replace(b"\n", self._newline(depth))
+        self.stream.write(encoded)
+
+    # Conversion to plain values
+
+    def _field_names(self, cls: type) -> tuple:
+        """Names of a dataclass's written fields, cached per class."""
+        names = self._fields.get(cls)
+        if names is None:
+            names = tuple(field.name for field in dataclasses.fields(cls) if field.name not in self.exclude)
+            self._fields[cls] = names
+        return names
+
+    def _plain(self, value: Any, budget: list) -> Any:
+        """Plain copy of a small subtree; raises _TooLarge past the budget."""
+        budget[0] -= 1
+        if budget[0] < 0:
+            raise _TooLarge()
+
+        if type(value) in _SCALAR_TYPES or isinstance(value, _SCALARS):
+            return value
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return {name: self._plain(getattr(value, name), budget) for name in self._field_names(type(value))}
+        if isinstance(value, dict):
+            return {self._key(key): self._plain(item, budget)
+                    for key, item in value.items() if key not in self.exclude}
+        if isinstance(value, (list, tuple, set, frozenset)):
+            if len(value) > budget[0]:
+                raise _TooLarge()
+            return [self._plain(item, budget) for item in value]
+        if isinstance(value, np.ndarray):
+            budget[0] -= value.size
+            if budget[0] < 0:
+                raise _TooLarge()
+            return value.tolist()
+        if _is_iterator(value):
+            # Consuming a generator here would lose it; let the walker stream it
+            raise _TooLarge()
+        if hasattr(value, '__iter__') and hasattr(value, '__len__') and not isinstance(value, (bytes, bytearray)):
+            if len(value) > budget[0]:
+                raise _TooLarge()
+            return [self._plain(item, budget) for item in value]
+        return self._plain(self._replacement(value), budget)
+
+    def _replacement(self, value: Any) -> Any:
+        """Serializable stand-in for a non-container value."""
+        if isinstance(value, PurePath):
+            return str(value)
+        if isinstance(value, enum.Enum):
+            return value.value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if self.default is not None:
+            return self.default(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _key(self, key: Any) -> str:
+        if isinstance(key, str):
+            return key
+        if isinstance(key, (bool, type(None))):
+            return json.dumps(key)
+        if isinstance(key, (int, float)):
+            return str(key)
+        return str(self._replacement(key))
+
+    # Walking large containers
+
+    def _write(self, value: Any, depth: int):
+        try:
+            self._emit(self._plain(value, [UNIT_BUDGET]), depth)
+            return
+        except _TooLarge:
+            pass
+
+        if dataclasses.is_dataclass(value):
+            self._write_object(((name, getattr(value, name)) for name in self._field_names(type(value))), depth)
+        elif isinstance(value, dict):
+            self._write_object(((self._key(key), item) for key, item in value.items()
+                                if key not in self.exclude), depth)
+        elif isinstance(value, np.ndarray):
+            self._write_array((value[start:start + UNIT_BUDGET].tolist()
+                               for start in range(0, len(value), UNIT_BUDGET)), depth, batched=True)
+        else:
+            self._write_array(value, depth)
+
+    def _write_object(self, items: Iterable, depth: int):
+        stream = self.stream
+        separator = b": " if self.indent else b":"
+        first = True
+        stream.write(b"{")
+        for key, item in items:
+            stream.write((b"" if first else b",") + self._newline(depth + 1))
+            stream.write(self._encode(key) + separator)
+            self._write(item, depth + 1)
+            first = False
+        stream.write(b"}" if first else self._newline(depth) + b"}")
+
+    def _write_array(self, items: Iterable, depth: int, batched: bool = False):
+        """Write an array, encoding runs of small items together."""
+        stream = self.stream
+        pending: list = []
+        empty = True
+
+        def flush():
+            nonlocal empty
+            if not pending:
+                return
+            encoded = self._encode(pending)[1:-1]
+            if self.indent:
+                encoded = encoded.rstrip(b"\n").replace(b"\n", self._newline(depth))
+            stream.write(encoded if empty else b"," + encoded)
+            pending.clear()
+            empty = False
+
+        stream.write(b"[")
+        for item in items:
+            if batched:
+                pending.extend(item)
+                flush()
+                continue
+            try:
+                pending.append(self._plain(item, [UNIT_BUDGET]))
+            except _TooLarge:
+                flush()
+                stream.write((b"" if empty else b",") + self._newline(depth + 1))
+                self._write(item, depth + 1)
+                empty = False
+                continue
+            if len(pending) >= BATCH_ITEMS:
+                flush()
+        flush()
+        stream.write(b"]" if empty else self._newline(depth) + b"]")
+
+
+def _is_iterator(value: Any) -> bool:
+    """Single-pass iterables (generators, map objects) that cannot be re-read."""
+    return hasattr(value, '__next__') or (hasattr(value, '__iter__') and not hasattr(value, '__len__'))
+
+
+def dump_json(value: Any,
+              stream: BinaryIO,
+              indent: Optional[int] = 2,
+              exclude: Collection[str] = (),
+              default: Optional[Callable[[Any], Any]] = None):
+    """
+    Write ``value`` as JSON to a binary stream.
+
+    Args:
+        value: Dataclass, mapping, sequence or scalar to write
+        stream: Binary stream
+        indent: Spaces per nesting level (None for compact output)
+        exclude: Field and key names to leave out
+        default: Fallback converter for unsupported objects
+    """
+    JsonStreamWriter(stream, indent=indent, exclude=exclude, default=default).write(value)
+
+
+def write_json(value: Any,
+               output_path: Union[str, Path],
+               indent: Optional[int] = 2,
+               exclude: Collection[str] = (),
+               default: Optional[Callable[[Any], Any]] = None) -> Path:
+    """
+    Write ``value`` as JSON to a file.
+
+    The document goes to a temporary file next to the target, which
+    replaces the target once complete, so a failure midway never leaves
+    a truncated file behind.
+
+    Args:
+        value: Dataclass, mapping, sequence or scalar to write
+        output_path: Destination file
+        indent: Spaces per nesting level (None for compact output)
+        exclude: Field and key names to leave out (e.g. ``chunk_results``)
+        default: Fallback converter for unsupported objects
+
+    Returns:
+        Path of the written file
+    """
+    output_path = Path(output_path)
+    temp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        with open(temp_path, 'wb', buffering=WRITE_BUFFER) as f:
+            dump_json(value, f, indent=indent, exclude=exclude, default=default)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return output_path
@@ -0,0 +1,66 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+torch, faster-whisper, librosa, pydub and ffmpeg-python take from a few
+hundred milliseconds to several seconds to import. Modules that only need
+them inside a few methods bind a ``LazyModule`` at import time instead,
+so ``talkgpt --help``, ``talkgpt config show`` and the worker wrappers that
+shell out to the CLI do not pay for them.
+
+Usage mirrors the ``try: import x / except ImportError`` pattern::
+
+    torch = lazy_import("torch")
+    TORCH_AVAILABLE = torch is not None
+
+The availability check only looks the package up on ``sys.path``; errors
+raised while actually importing it surface at first use.
+"""
+
+import importlib
+import importlib.util
+import sys
+from typing import Optional
+
+
+def module_available(name: str) -> bool:
+    """Whether a module can be imported, without importing it."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access.
+
+    Unlike ``importlib.util.LazyLoader`` this is safe to touch from several
+    threads at once: the import itself runs under the import system's
+    per-module lock.
+    """
+
+    __slots__ = ('_name', '_module')
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _resolve(self):
+        # Underscored so it cannot shadow a real attribute such as torch.load
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name: str) -> Optional[LazyModule]:
+    """Return a ``LazyModule`` for ``name``, or None when it is not installed."""
+    return LazyModule(name) if module_available(name) else None
@@ -0,0 +1,389 @@
+"""
+TalkGPT Tracing and Metrics
+
+Lightweight, dependency-free instrumentation:
+
+- Nested spans. Each pipeline stage and each chunk runs in a span, and
+  its duration feeds the ``talkgpt_span_seconds`` histogram.
+- Counters and histograms for real-time factor, queue wait, chunk
+  latency and bytes written.
+- Output in the Prometheus text format (MCP ``/metrics``) or as JSON with
+  the finished spans (CLI ``--metrics-file``).
+"""
+
+import contextvars
+import functools
+import itertools
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _format_labels(labelnames: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    """Shared label handling for counters and histograms."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items
+        ]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{'labels': dict(zip(self.labelnames, key)), 'value': value}
+                    for key, value in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    """Bucketed observations with sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            # Per-bucket (non-cumulative) counts, then sum and count
+            series = self._series.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return int(series[-1]) if series else 0
+
+    def sum(self, **labels) -> float:
+        series = self._series.get(self._key(labels))
+        return series[-2] if series else 0.0
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        for key, series in items:
+            cumulative = itertools.accumulate(series[:len(self.buckets)])
+            for bound, total in zip(self.buckets, cumulative):
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {_format_value(total)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {_format_value(series[-1])}")
+        return lines
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [{
+                'labels': dict(zip(self.labelnames, key)),
+                'count': int(series[-1]),
+                'sum': series[-2],
+                'buckets': {_format_value(bound): int(total) for bound, total in
+                            zip(self.buckets, itertools.accumulate(series[:len(self.buckets)]))},
+            } for key, series in sorted(self._series.items())]
+
+
+class MetricsRegistry:
+    """Named collection of metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as JSON-serializable data."""
+        return {name: {'type': metric.kind, 'help': metric.documentation, 'series': metric.snapshot()}
+                for name, metric in list(self._metrics.items())}
+
+
+@dataclass
+class Span:
+    """A timed, named unit of work."""
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    start: float
+    end: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    thread: str = ""
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.end is None else self.end - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': self.start,
+            'duration': self.duration,
+            'thread': self.thread,
+            'attributes': self.attributes,
+        }
+
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("talkgpt_span", default=None)
+
+
+class Tracer:
+    """
+    Creates nested spans and records their durations.
+
+    The active span is tracked per thread/task with a context variable.
+    Work handed to another thread can keep its parent with ``activate``.
+    """
+
+    def __init__(self, registry: MetricsRegistry, max_spans: int = 10000):
+        """
+        Initialize the tracer.
+
+        Args:
+            registry: Registry receiving the span duration histogram
+            max_spans: Finished spans retained for export (oldest dropped first)
+        """
+        self.span_seconds = registry.histogram(
+            "talkgpt_span_seconds", "Duration of traced pipeline spans", ["span"]
+        )
+        self._finished: deque = deque(maxlen=max_spans)
+        self._ids = itertools.count(1)
+
+    def current(self) -> Optional[Span]:
+        """The active span, if any."""
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """
+        Run a block inside a new child of the active span.
+
+        Args:
+            name: Span name; also the ``span`` label of the duration histogram
+            **attributes: Attributes recorded with the span
+        """
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent else None,
+            start=time.time(),
+            attributes=attributes,
+            thread=threading.current_thread().name,
+        )
+        token = _current_span.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.attributes['error'] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            span.end = span.start + elapsed
+            _current_span.reset(token)
+            self.span_seconds.observe(elapsed, span=name)
+            self._finished.append(span)
+
+    @contextmanager
+    def activate(self, span: Optional[Span]) -> Iterator[None]:
+        """Make ``span`` the parent of spans opened in this block (e.g. on a worker thread)."""
+        token = _current_span.set(span)
+        try:
+            yield
+        finally:
+            _current_span.reset(token)
+
+    def annotate(self, **attributes):
+        """Add attributes to the active span (no-op outside a span)."""
+        span = _current_span.get()
+        if span is not None:
+            span.attributes.update(attributes)
+
+    def spans(self) -> List[Span]:
+        """Finished spans, oldest first."""
+        return list(self._finished)
+
+    def clear(self):
+        self._finished.clear()
+
+
+# Global registry, tracer and pipeline metrics
+_registry = MetricsRegistry()
+_tracer = Tracer(_registry)
+
+CHUNK_LATENCY = _registry.histogram(
+    "talkgpt_chunk_latency_seconds", "Decode time per audio chunk"
+)
+CHUNKS = _registry.counter(
+    "talkgpt_chunks_total", "Chunks transcribed, by outcome", ["status"]
+)
+REALTIME_FACTOR = _registry.histogram(
+    "talkgpt_realtime_factor", "Audio seconds transcribed per second of processing, per file",
+    buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0)
+)
+AUDIO_SECONDS = _registry.counter(
+    "talkgpt_audio_seconds_total", "Audio transcribed, in seconds"
+)
+QUEUE_WAIT = _registry.histogram(
+    "talkgpt_queue_wait_seconds", "Time work waited in a queue before starting", ["queue"]
+)
+BYTES_WRITTEN = _registry.counter(
+    "talkgpt_output_bytes_total", "Bytes written to output files", ["format"]
+)
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    return _registry
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer."""
+    return _tracer
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorator running each call of a function inside a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+    """
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _tracer.span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_output_file(path: Union[str, Path], format_name: str):
+    """Count the size of a written output file."""
+    try:
+        BYTES_WRITTEN.inc(Path(path).stat().st_size, format=format_name)
+    except OSError:
+        pass
+
+
+def write_metrics_file(path: Union[str, Path]) -> Path:
+    """
+    Dump metrics and finished spans.
+
+    ``.prom`` and ``.txt`` files get the Prometheus text format; anything
+    else gets JSON with the metrics and the span list.
+
+    Args:
+        path: Output file
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix in ('.prom', '.txt'):
+        path.write_text(_registry.render(), encoding='utf-8')
+    else:
+        data = {
+            'generated_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'metrics': _registry.snapshot(),
+            'spans': [span.to_dict() for span in _tracer.spans()],
+        }
+        path.write_text(json.dumps(data, indent=2, default=str), encoding='utf-8')
+    return path
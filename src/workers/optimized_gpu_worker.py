@@ -19,6 +19,8 @@ import torch
 import torch.multiprocessing as mp
 from faster_whisper import WhisperModel
 
+from core.model_registry import get_model_registry, model_cache_dir, shared_model_device, shared_model_key
+
 # Async processing
 import aioredis
 import aiofiles
@@ -39,8 +41,7 @@ class OptimizedGPUWorker:
     """High-performance GPU worker with async processing"""
     
     def __init__(self):
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.compute_type = "float16" if self.device == "cuda" else "int8"
+        self.device, self.compute_type = shared_model_device()
         self.model = None
         self.redis_pool = None
         self.storage_client = storage.Client()
@@ -52,7 +53,7 @@ class OptimizedGPUWorker:
         self.speed_multiplier = float(os.getenv("SPEED_MULTIPLIER", "1.75"))
         
         # Shared model cache across workers
-        self.model_cache_path = os.getenv("MODEL_CACHE_PATH", "/model-cache")
+        self.model_cache_path = model_cache_dir()
         os.makedirs(self.model_cache_path, exist_ok=True)
         
         print(f"🚀 GPU Worker initialized - Device: {self.device}, Concurrent: {self.concurrent_chunks}")
@@ -77,26 +78,11 @@ class OptimizedGPUWorker:
         start_time = time.time()
         
         try:
-            # Check if model is cached
-            cached_model_path = os.path.join(self.model_cache_path, "large-v3")
-            
-            if os.path.exists(cached_model_path):
-                print("📋 Using cached model")
-                self.model = WhisperModel(cached_model_path, 
-                                        device=self.device, 
-                                        compute_type=self.compute_type)
-            else:
-                print("⬇️ Downloading model...")
-                self.model = WhisperModel("large-v3", 
-                                        device=self.device, 
-                                        compute_type=self.compute_type,
-                                        download_root=self.model_cache_path)
+            self.model = self._get_shared_model()
             
             # Warm up model with empty audio
             print("🔥 Warming up model...")
-            import numpy as np
-            dummy_audio = np.zeros(16000, dtype=np.float32)  # 1 second of silence
-            list(self.model.transcribe(dummy_audio, beam_size=1))
+            get_model_registry().warm_up(self.model)
             
             load_time = time.time() - start_time
             print(f"✅ Model preloaded in {load_time:.1f} seconds")
@@ -105,6 +91,26 @@ class OptimizedGPUWorker:
             print(f"❌ Model preloading failed: {e}")
             self.model = None
     
+    def _get_shared_model(self):
+        """Get large-v3 from the process-wide registry, loading it once"""
+        # Check if model is cached
+        model_path, device, compute_type = shared_model_key("large-v3", self.model_cache_path)
+        
+        if model_path != "large-v3":
+            print("📋 Using cached model")
+            model_kwargs = {}
+        else:
+            print("⬇️ Downloading model...")
+            model_kwargs = {'download_root': self.model_cache_path}
+        
+        return get_model_registry().get(
+            model_path,
+            device=device,
+            compute_type=compute_type,
+            loader=WhisperModel,
+            **model_kwargs
+        )
+    
     async def process_audio_chunks_batch(self, chunks: List[AudioChunk]) -> List[Dict]:
         """Process multiple audio chunks in parallel"""
         print(f"🔄 Processing batch of {len(chunks)} chunks")
@@ -159,9 +165,7 @@ class OptimizedGPUWorker:
         """Synchronous transcription (runs in thread pool)"""
         if not self.model:
             # Lazy load model if not preloaded
-            self.model = WhisperModel("large-v3", 
-                                    device=self.device, 
-                                    compute_type=self.compute_type)
+            self.model = self._get_shared_model()
         
         # Save audio data temporarily
         temp_path = f"/tmp/chunk_{chunk.id}.wav"
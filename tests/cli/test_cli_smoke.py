@@ -18,3 +18,37 @@ def test_status_system_quiet(tmp_path: Path):
     res = run_cli("status", "system", "--quiet", cwd=root)
     assert res.returncode == 0
 
+
+
+def test_analyze_timing_reads_columnar_transcripts(tmp_path: Path):
+    import json
+    from src.core.transcriber import TranscriptionResult, TranscriptionSegment, WordTimestamp
+    from src.core.word_table import WordTable
+    from src.output.columnar import write_columnar_transcript
+    from src.post.assembler import assemble_records
+    from src.post.cadence import create_analysis_context
+    from src.post.segmenter import bucketize
+
+    segments = []
+    for i in range(30):
+        pause = 0.9 if i % 7 == 0 else 0.35
+        words = [WordTimestamp(f" w{j}", i * 6.0 + j * pause, i * 6.0 + j * pause + 0.25) for j in range(6)]
+        segments.append(TranscriptionSegment(i, i * 6.0, i * 6.0 + 5.5, "w", -0.2, 0.0, words))
+    result = TranscriptionResult(segments, "en", 0.99, 180.0, "w", 0.9, 1.0, {})
+    buckets = bucketize(WordTable.from_segments(segments).validated())
+    records = assemble_records(buckets, create_analysis_context(buckets), enable_overlap_detection=False)
+    write_columnar_transcript(result, tmp_path / "stored.npz", records)
+    write_columnar_transcript(result, tmp_path / "plain.npz")
+
+    root = Path(__file__).resolve().parents[2]
+    summaries = []
+    for name in ("stored", "plain"):
+        res = run_cli("analyze", "timing", str(tmp_path / f"{name}.npz"), "-o", str(tmp_path / f"{name}.json"), cwd=root)
+        assert res.returncode == 0, res.stderr
+        summaries.append(json.loads((tmp_path / f"{name}.json").read_text()))
+
+    stored, plain = summaries
+    assert (stored['source'], plain['source']) == ('stored records', 'computed')
+    assert stored['buckets'] == plain['buckets'] == len(records)
+    assert stored['cadence_distribution'] == plain['cadence_distribution']
+    assert abs(stored['global_gap_mean'] - plain['global_gap_mean']) < 1e-9
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from src.benchmark.imports import HEAVY_MODULES, IMPORT_BUDGET_SECONDS, measure_import_time, parse_importtime
+from src.utils.lazy_imports import lazy_import
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _loaded_after(statement):
+    code = f"import sys; {statement}; print(' '.join(sorted(m for m in sys.modules if '.' not in m)))"
+    completed = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(completed.stdout.split())
+
+
+def test_parse_importtime_reads_nesting():
+    output = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |   yaml.error",
+        "import time:       300 |        420 | yaml",
+        "Traceback noise that is not a timing line",
+        "import time:        50 |        470 | src.utils.config",
+    ])
+
+    timings = parse_importtime(output)
+
+    assert [(t.name, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ("yaml.error", 120, 120, 1), ("yaml", 300, 420, 0), ("src.utils.config", 50, 470, 0)]
+
+
+def test_cli_cold_start_is_within_budget_and_skips_heavy_packages():
+    result = measure_import_time("src.cli.main", repeats=3)
+
+    assert result['heavy_modules'] == []
+    assert result['import_seconds'] < IMPORT_BUDGET_SECONDS, result['slowest']
+
+
+def test_result_types_and_package_exports_load_without_the_audio_stack():
+    loaded = _loaded_after("import src, src.output.columnar, src.analytics.uncertainty_detector")
+    assert not loaded & set(HEAVY_MODULES)
+
+    loaded = _loaded_after("import src; src.get_file_processor")
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_lazy_import_defers_until_first_attribute():
+    assert lazy_import("talkgpt_module_that_does_not_exist") is None
+
+    module = lazy_import("json")
+    assert "not loaded" in repr(module)
+    assert module.dumps([1]) == "[1]"
+    assert "(loaded)" in repr(module)
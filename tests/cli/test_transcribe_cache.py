@@ -0,0 +1,81 @@
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.cli.commands import transcribe as transcribe_cmd
+from src.core import resource_detector
+from src.core.transcriber import BatchTranscriptionResult, TranscriptionResult, TranscriptionSegment, WordTimestamp
+from src.utils.config import load_config
+from src.utils.logger import setup_logging
+
+
+def _write_wav(path: Path):
+    with wave.open(str(path), 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(np.zeros(16000, dtype=np.int16).tobytes())
+    return path
+
+
+def _batch_result(path):
+    words = [WordTimestamp(" hello", 0.1, 0.4, 0.95), WordTimestamp(" there", 0.5, 0.8, 0.2)]
+    segment = TranscriptionSegment(0, 0.1, 0.8, "hello there", -1.2, 0.01, words, "en")
+    merged = TranscriptionResult([segment], "en", 0.99, 1.0, "hello there", 0.6, 0.1, {'model_size': 'tiny'})
+    return BatchTranscriptionResult(path, [merged], merged, 0.1, 1, 0, {'processing_speed': 10.0})
+
+
+def test_cache_hit_still_runs_uncertainty_analysis(tmp_path, monkeypatch):
+    audio_path = _write_wav(tmp_path / "talk.wav")
+    decodes = []
+
+    processor = SimpleNamespace(
+        process_file=lambda path, *args, **kwargs: SimpleNamespace(
+            processing_time=0.0, audio=np.zeros(16000, dtype=np.float32), sample_rate=16000,
+            processed_path=path, time_map=None),
+        cleanup_temp_files=lambda: None,
+    )
+    chunker = SimpleNamespace(stream_array=lambda *args, **kwargs: SimpleNamespace(chunks=[]))
+
+    def transcribe_file(path, *args, **kwargs):
+        decodes.append(path)
+        return _batch_result(path)
+
+    monkeypatch.setattr(transcribe_cmd, "get_file_processor", lambda: processor)
+    monkeypatch.setattr(transcribe_cmd, "get_smart_chunker", lambda **kwargs: chunker)
+    monkeypatch.setattr(transcribe_cmd, "get_transcriber", lambda **kwargs: SimpleNamespace(transcribe_file=transcribe_file))
+    monkeypatch.setattr(resource_detector, "get_device_config",
+                        lambda force_device=None: {'device': 'cpu', 'compute_type': 'int8'})
+
+    config = load_config("default")
+    config.cache.directory = str(tmp_path / "cache")
+    config.analytics.enable_speaker_diarization = False
+    config.analytics.enable_timing_analysis = False
+    config.analytics.enable_uncertainty_detection = True
+    config.output.formats = ['json']
+    logger = setup_logging(config.logging)
+
+    first = transcribe_cmd.transcribe_single_file(audio_path, tmp_path / "out1", config, logger)
+    second = transcribe_cmd.transcribe_single_file(audio_path, tmp_path / "out2", config, logger)
+
+    assert len(decodes) == 1
+    assert (first['cache_hit'], second['cache_hit']) == (False, True)
+    assert first['quality_score'] is not None
+    assert (second['quality_score'], second['flagged_segments']) == (first['quality_score'], first['flagged_segments'])
+
+
+def test_json_output_summarizes_only_the_section_it_cannot_serialize(tmp_path):
+    import json
+
+    result = _batch_result(tmp_path / "a.wav")
+    speaker_result = SimpleNamespace(speaker_count=2, pipeline=object())
+    output_file = tmp_path / "a.json"
+
+    transcribe_cmd._generate_json_file(result, speaker_result, None, output_file)
+
+    data = json.loads(output_file.read_text())
+    assert data['transcription']['merged_result']['segments'][0]['text'] == "hello there"
+    assert data['speaker_analysis'] == {'speaker_count': 2}
+    assert data['uncertainty_analysis'] is None
@@ -14,3 +14,73 @@ def test_transcribe_audio_endpoint_smoke(monkeypatch):
     resp = client.post("/tools/transcribe_audio", json={"input_path": "does_not_exist.wav"})
     assert resp.status_code == 400
 
+
+
+def test_job_endpoints_run_transcriptions_in_background(monkeypatch, tmp_path):
+    import src.mcp.server as server
+
+    audio_path = tmp_path / "a.wav"
+    audio_path.write_bytes(b"RIFF")
+    release = threading.Event()
+
+    def fake_transcribe_single_file(input_path, output_dir, config, logger, **options):
+        assert release.wait(timeout=5)
+        return {
+            'input_file': str(input_path),
+            'output_directory': str(tmp_path),
+            'output_files': {'txt': str(tmp_path / "a.txt")},
+            'processing_time': 1.0,
+            'processing_speed': 2.0,
+        }
+
+    monkeypatch.setattr(server, "transcribe_single_file", fake_transcribe_single_file)
+    client = TestClient(server.app)
+
+    resp = client.post("/jobs/transcribe_audio", json={"input_path": str(audio_path)})
+    assert resp.status_code == 202
+    job_id = resp.json()["job_id"]
+
+    assert client.get(f"/jobs/{job_id}").json()["status"] in ("queued", "running")
+    assert client.get(f"/jobs/{job_id}/result").status_code == 409
+
+    release.set()
+    server.get_state().jobs.wait(job_id, timeout=5)
+
+    assert client.get(f"/jobs/{job_id}").json()["status"] == "completed"
+    result = client.get(f"/jobs/{job_id}/result").json()
+    assert result["output_files"] == {'txt': str(tmp_path / "a.txt")}
+    assert client.get("/jobs/unknown").status_code == 404
+
+
+def test_job_queue_rejects_work_beyond_capacity():
+    from src.mcp.jobs import JobManager, JobQueueFullError
+
+    release = threading.Event()
+    manager = JobManager(max_workers=1, max_pending=1)
+    manager.submit("wait", release.wait, {'timeout': 5})
+    manager.submit("wait", release.wait, {'timeout': 5})
+
+    try:
+        manager.submit("wait", release.wait, {'timeout': 5})
+        assert False, "third job should not fit"
+    except JobQueueFullError:
+        pass
+    finally:
+        release.set()
+        manager.shutdown()
+
+    assert manager.stats()["completed"] == 2
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    from src.mcp.jobs import JobManager
+
+    manager = JobManager(max_workers=1)
+    manager.wait(manager.submit("noop", lambda: None, {}).job_id, timeout=5)
+    manager.shutdown()
+
+    resp = TestClient(app).get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE talkgpt_queue_wait_seconds histogram" in resp.text
+    assert 'talkgpt_queue_wait_seconds_count{queue="mcp"}' in resp.text
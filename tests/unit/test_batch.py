@@ -0,0 +1,72 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.cli.commands import batch
+from src.cli.commands.batch import order_longest_first, plan_cpu_slots, run_parallel
+from src.utils.config import load_config
+
+
+def _fake_task(input_path, output_dir, options):
+    if input_path.name.startswith("bad"):
+        raise ValueError("cannot decode")
+    config = batch._worker_state['config']
+    return {
+        'input_file': str(input_path),
+        'pid': os.getpid(),
+        'cpu_threads': config.resources.cpu_threads,
+        'max_workers': config.processing.max_workers,
+        'options': options,
+    }
+
+
+class FakeProcessor:
+    def __init__(self, durations):
+        self.durations = durations
+
+    def get_file_info(self, path):
+        if path.name not in self.durations:
+            raise RuntimeError("ffprobe failed")
+        return SimpleNamespace(duration=self.durations[path.name])
+
+
+def test_files_are_ordered_longest_first(tmp_path):
+    files = []
+    for name, size in [("short.wav", 10), ("long.wav", 10), ("unprobed.wav", 500), ("mid.wav", 10)]:
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        files.append(path)
+
+    processor = FakeProcessor({"short.wav": 5.0, "long.wav": 600.0, "mid.wav": 60.0})
+    ordered = order_longest_first(files, processor)
+
+    assert [path.name for path in ordered] == ["long.wav", "mid.wav", "short.wav", "unprobed.wav"]
+
+
+def test_cpu_slots_split_cores():
+    slots = plan_cpu_slots(2)
+
+    assert len(slots) == 2
+    assert all(threads >= 1 for _, threads in slots)
+    pinned = [set(cores) for cores, _ in slots if cores]
+    if len(pinned) == 2:
+        assert not pinned[0] & pinned[1]
+
+
+def test_parallel_run_streams_results_from_worker_processes(tmp_path):
+    files = [Path(tmp_path / name) for name in ("a.wav", "bad.wav", "c.wav")]
+    config = load_config("default")
+
+    entries = list(run_parallel(files, tmp_path / "out", config, workers=2,
+                                options={'workers': 2, 'formats': ['txt']},
+                                task=_fake_task))
+
+    by_file = {Path(entry['file']).name: entry for entry in entries}
+    assert set(by_file) == {"a.wav", "bad.wav", "c.wav"}
+    assert by_file["bad.wav"] == {'file': str(files[1]), 'status': 'failed', 'error': "cannot decode"}
+
+    result = by_file["a.wav"]['result']
+    assert result['pid'] != os.getpid()
+    assert result['max_workers'] == 1
+    assert result['cpu_threads'] >= 1
+    assert result['options'] == {'formats': ['txt']}
@@ -0,0 +1,72 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.benchmark import STAGES, BenchmarkCase, compare_reports, load_report, run_case, save_report, synthesize_speech
+from src.benchmark.report import build_report
+from src.utils.config import load_config
+
+
+def _report(stages):
+    cases = {'synthetic-30s': {'audio_seconds': 30.0, 'stages': stages}}
+    return build_report(cases, settings={}, environment={'cpu_count': 4})
+
+
+def _ok(median):
+    return {'status': 'ok', 'median': median}
+
+
+def test_synthetic_speech_is_deterministic():
+    first = synthesize_speech(20.0, seed=3)
+    second = synthesize_speech(20.0, seed=3)
+
+    assert np.array_equal(first.audio, second.audio)
+    assert first.words == second.words and first.turns == second.turns
+    assert not np.array_equal(first.audio, synthesize_speech(20.0, seed=4).audio)
+
+    assert first.duration == pytest.approx(20.0)
+    assert all(0 <= word.start < word.end <= 20.0 for word in first.words)
+    assert len({speaker for _, _, speaker in first.turns}) == 2
+
+
+def test_every_stage_after_decode_runs_without_a_model(tmp_path):
+    case = BenchmarkCase("synthetic-12s", speech=synthesize_speech(12.0))
+
+    result = run_case(case, load_config("default"), tmp_path, repeats=2)
+
+    assert list(result['stages']) == list(STAGES)
+    assert result['stages']['decode']['status'] == 'skipped'
+    for stage in STAGES[3:]:
+        entry = result['stages'][stage]
+        assert entry['status'] == 'ok', (stage, entry)
+        assert len(entry['runs']) == 2
+    assert result['words'] == len(case.speech.words)
+    assert (tmp_path / "outputs" / "synthetic-12s.srt").exists()
+    assert result['memory']['words'] == len(case.speech.words)
+    assert result['memory']['transcript_bytes_per_word'] > 0
+    assert result['memory']['analysis_bytes_per_word'] > 0
+
+
+def test_compare_flags_regressions_beyond_threshold_and_noise():
+    baseline = _report({'chunking': _ok(0.100), 'merge': _ok(0.0001), 'cadence': _ok(0.050),
+                        'decode': {'status': 'skipped', 'reason': 'no model'}})
+    candidate = _report({'chunking': _ok(0.130), 'merge': _ok(0.0005), 'cadence': _ok(0.030),
+                         'decode': _ok(2.0)})
+
+    statuses = {c.stage: c.status for c in compare_reports(baseline, candidate, threshold=0.10)}
+
+    assert statuses == {'chunking': 'regression', 'merge': 'unchanged',
+                        'cadence': 'improvement', 'decode': 'missing'}
+
+
+def test_reports_round_trip_and_check_schema_version(tmp_path):
+    report = _report({'chunking': _ok(0.1)})
+    path = save_report(report, tmp_path / "runs" / "a.json")
+
+    assert load_report(path) == report
+
+    report['schema_version'] = 999
+    path.write_text(json.dumps(report))
+    with pytest.raises(ValueError):
+        load_report(path)
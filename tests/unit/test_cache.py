@@ -0,0 +1,69 @@
+import numpy as np
+
+from src.utils.cache import ResultCache, hash_array, hash_file
+
+
+def test_put_get_round_trip(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = ResultCache.make_key("file", "abc", {"beam_size": 5})
+
+    assert cache.get(key) is None
+    cache.put(key, {"text": "hello"})
+
+    assert ResultCache(tmp_path).get(key) == {"text": "hello"}
+    assert cache.stats()["entries"] == {"file": 1}
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_key_depends_on_content_and_params():
+    base = ResultCache.make_key("file", "abc", {"beam_size": 5, "language": None})
+    assert base == ResultCache.make_key("file", "abc", {"language": None, "beam_size": 5})
+    assert base != ResultCache.make_key("file", "abc", {"beam_size": 1, "language": None})
+    assert base != ResultCache.make_key("chunk", "abc", {"beam_size": 5, "language": None})
+    assert base != ResultCache.make_key("file", "abd", {"beam_size": 5, "language": None})
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResultCache(tmp_path, max_size_mb=0.25)
+    payload = b"x" * 100_000
+
+    cache.put("a", payload)
+    cache.put("b", payload)
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", payload)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == payload and cache.get("c") == payload
+
+
+def test_content_hashes(tmp_path):
+    samples = np.arange(100, dtype=np.float32)
+    assert hash_array(samples) == hash_array(samples.copy())
+    assert hash_array(samples) != hash_array(samples.astype(np.float64))
+
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"audio")
+    assert hash_file(path) == hash_file(path)
+
+
+def test_audio_file_hash_uses_pcm_frames(tmp_path):
+    import wave
+
+    from src.utils.cache import hash_audio_file
+
+    frames = np.arange(1600, dtype="<i2").tobytes()
+    paths = []
+    for name in ("a.wav", "b.wav"):
+        path = tmp_path / name
+        with wave.open(str(path), "wb") as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(16000)
+            wav_file.writeframes(frames)
+        paths.append(path)
+
+    assert hash_audio_file(paths[0]) == hash_audio_file(paths[1])
+
+    other = tmp_path / "c.mp3"
+    other.write_bytes(b"not a wav")
+    assert hash_audio_file(other) == hash_file(other)
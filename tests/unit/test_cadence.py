@@ -0,0 +1,77 @@
+import statistics
+
+import numpy as np
+
+from src.core.utils import Word, calculate_word_gaps
+from src.core.word_table import WordTable, grouped_gap_stats
+from src.post.assembler import assemble_records
+from src.post.cadence import (AnalysisContext, bucket_gap_stats, classify_cadence, classify_cadences,
+                              create_analysis_context, gap_stats)
+from src.post.segmenter import TimingBucket, bucketize
+
+
+def _reference_stats(words):
+    gaps = calculate_word_gaps(words)
+    if not gaps:
+        return 0, 0.0, 0.0
+    mean = statistics.mean(gaps)
+    return len(gaps), mean, sum((gap - mean) ** 2 for gap in gaps) / len(gaps)
+
+
+def _transcript(seed, count=3000):
+    rng = np.random.default_rng(seed)
+    # Pause length drifts between rushed, normal and slow stretches
+    pace = np.repeat(rng.choice([0.05, 0.5, 0.95], count // 50, p=[0.1, 0.8, 0.1]), 50)
+    gaps = pace * rng.uniform(0.8, 1.2, count)
+    lengths = rng.uniform(0.1, 0.4, count)
+    starts = np.cumsum(gaps + np.concatenate([[0.0], lengths[:-1]]))
+    return WordTable([f"w{i}" for i in range(count)], starts, starts + lengths)
+
+
+def test_grouped_stats_match_per_bucket_statistics():
+    table = _transcript(0)
+    buckets = bucketize(table)
+    grouped = bucket_gap_stats(buckets)
+
+    assert grouped.count.sum() == len(grouped.gaps) == len(table) - len(buckets)
+    for i, bucket in enumerate(buckets):
+        count, mean, variance = _reference_stats(list(bucket.words))
+        assert grouped.count[i] == count
+        assert np.isclose(grouped.mean[i], mean, rtol=1e-12, atol=0)
+        assert np.isclose(grouped.variance[i], variance, rtol=1e-9, atol=1e-15)
+        assert grouped.group(i).tolist() == calculate_word_gaps(list(bucket.words))
+
+
+def test_context_and_labels_match_the_scalar_rule():
+    buckets = bucketize(_transcript(1))
+    all_gaps = [gap for bucket in buckets for gap in calculate_word_gaps(list(bucket.words))]
+    context = create_analysis_context(buckets, 1.5)
+
+    assert context.total_gaps == len(all_gaps)
+    assert np.isclose(context.global_mean, statistics.mean(all_gaps), rtol=1e-12)
+    assert np.isclose(context.global_std_dev, statistics.pstdev(all_gaps), rtol=1e-9)
+
+    labels = classify_cadences(bucket_gap_stats(buckets), context)
+    assert labels == [classify_cadence(gap_stats(bucket), context) for bucket in buckets]
+    assert {'slow', 'fast', 'normal'} <= set(labels)
+
+    records = assemble_records(buckets, context, enable_overlap_detection=False)
+    assert [r.cadence for r in records] == labels
+
+
+def test_empty_and_single_word_buckets():
+    words = [Word("a", 0.0, 0.5), Word("b", 0.6, 1.0), Word("c", 1.3, 1.8), Word("d", 5.0, 5.5)]
+    buckets = [TimingBucket(0.0, 0.0, []), TimingBucket(0.0, 1.8, words[:3]), TimingBucket(5.0, 5.5, words[3:])]
+    grouped = bucket_gap_stats(buckets)
+
+    assert grouped.count.tolist() == [0, 2, 0]
+    assert grouped.mean[1] == gap_stats(buckets[1]).mean
+    assert grouped.max_gap.tolist() == [0.0, 0.30000000000000004, 0.0]
+    assert classify_cadences(grouped, AnalysisContext(0.1, 0.01, 0.0001, 2)) == ['normal', 'slow', 'normal']
+    assert gap_stats(buckets[0]).count == 0
+
+
+def test_sample_variance_uses_ddof_one():
+    starts = np.array([0.0, 1.0, 2.5, 4.5])
+    grouped = grouped_gap_stats(starts, starts + 0.5, [0, 4])
+    assert np.isclose(grouped.sample_variance()[0], np.var([0.5, 1.0, 1.5], ddof=1))
@@ -15,3 +15,41 @@ def test_time_based_split_no_libs(monkeypatch, tmp_path: Path):
         # If pydub is not available, the error should be a clear runtime error
         pass
 
+
+
+def test_chunk_array_returns_views_without_files(tmp_path: Path):
+    import numpy as np
+
+    sample_rate = 16000
+    rng = np.random.default_rng(0)
+    audio = (0.1 * rng.standard_normal(sample_rate * 70)).astype(np.float32)
+
+    chunker = SmartChunker(chunk_size=30, overlap_duration=2, min_chunk_length=5)
+    result = chunker.chunk_array(audio, sample_rate=sample_rate, original_file=tmp_path / "a.wav")
+
+    assert result.total_chunks >= 2
+    assert not list(tmp_path.iterdir())
+    for chunk in result.chunks:
+        assert chunk.file_path is None
+        assert np.shares_memory(chunk.audio, audio)
+        assert len(chunk.audio) == int(chunk.end_time * sample_rate) - int(chunk.start_time * sample_rate)
+
+
+def test_stream_array_matches_chunk_array():
+    import numpy as np
+
+    sample_rate = 16000
+    rng = np.random.default_rng(1)
+    audio = (0.1 * rng.standard_normal(sample_rate * 100)).astype(np.float32)
+    audio[sample_rate * 28:sample_rate * 30] = 0
+
+    chunker = SmartChunker(chunk_size=30, overlap_duration=2, min_chunk_length=5)
+    expected = chunker.chunk_array(audio, sample_rate=sample_rate)
+
+    stream = chunker.stream_array(audio, sample_rate=sample_rate, max_pending=1)
+    streamed = list(stream)
+
+    spans = lambda chunks: [(c.chunk_id, c.start_time, c.end_time, c.overlap_prev, c.overlap_next) for c in chunks]
+    assert spans(streamed) == spans(expected.chunks)
+    assert stream.result.total_chunks == expected.total_chunks
+    assert expected.original_file == Path("in_memory")  # names the per-file log, so no <> characters
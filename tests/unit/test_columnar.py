@@ -0,0 +1,92 @@
+import mmap
+
+import numpy as np
+import pytest
+
+from src.core.transcriber import BatchTranscriptionResult, TranscriptionResult, TranscriptionSegment, WordTimestamp
+from src.core.word_table import WordTable
+from src.output.columnar import ColumnarTranscript, is_columnar_transcript, write_columnar_transcript
+from src.post.assembler import assemble_records
+from src.post.cadence import bucket_gap_stats, create_analysis_context
+from src.post.segmenter import bucketize
+
+
+def _result(segment_count=40):
+    rng = np.random.default_rng(0)
+    segments, t = [], 0.0
+    for i in range(segment_count):
+        words = []
+        for j in range(int(rng.integers(0, 9))):
+            start = t + j * 0.45 + float(rng.uniform(0.0, 0.1))
+            words.append(WordTimestamp(f" mot{i}é{j}", start, start + 0.3, float(rng.uniform(0.5, 1.0))))
+        text = "".join(word.word for word in words).strip() or "(silence)"
+        segments.append(TranscriptionSegment(i, t, t + 4.0, text, -0.25, 0.02, words or None, "fr"))
+        t += 4.5
+    return TranscriptionResult(segments, "fr", 0.97, t, "texte complet ✓", 0.8, 1.5, {'model_size': 'tiny'})
+
+
+def _records(result):
+    buckets = bucketize(WordTable.from_segments(result.segments).validated())
+    grouped = bucket_gap_stats(buckets)
+    return assemble_records(buckets, create_analysis_context(buckets, grouped=grouped),
+                            enable_overlap_detection=False, grouped=grouped)
+
+
+def test_round_trip_restores_segments_and_result(tmp_path):
+    result = _result()
+    path = write_columnar_transcript(result, tmp_path / "talk.npz")
+
+    with ColumnarTranscript(path) as transcript:
+        restored = transcript.to_result()
+        assert transcript.word_count == sum(len(s.words or []) for s in result.segments)
+        assert not transcript.has_records
+        with pytest.raises(ValueError):
+            transcript.records()
+
+    assert restored.segments == result.segments
+    assert (restored.text, restored.language, restored.model_info) == (result.text, "fr", {'model_size': 'tiny'})
+
+
+def test_columns_are_memory_mapped_and_readable_by_numpy(tmp_path):
+    result = _result()
+    batch = BatchTranscriptionResult(tmp_path / "talk.wav", [result], result, 1.0, 1, 0, {})
+    path = write_columnar_transcript(batch, tmp_path / "talk.npz")
+
+    transcript = ColumnarTranscript(path)
+    start = transcript.column('word_start')
+    assert isinstance(start.base, mmap.mmap) and not start.flags.writeable
+    assert transcript.meta['original_file'] == str(tmp_path / "talk.wav")
+
+    with np.load(path) as archive:
+        assert np.array_equal(archive['word_start'], start)
+
+    words = transcript.words()
+    stored = [(i, word) for i, segment in enumerate(result.segments) for word in segment.words or []]
+    assert words.texts == [word.word for _, word in stored]
+    assert words.segment.tolist() == [i for i, _ in stored]
+    assert words.start.tolist() == [word.start for _, word in stored]
+
+
+def test_records_keep_their_statistics_and_words(tmp_path):
+    result = _result(80)
+    records = _records(result)
+    path = write_columnar_transcript(result, tmp_path / "talk.npz", records)
+
+    restored = ColumnarTranscript(path).records()
+
+    assert len(restored) == len(records)
+    for original, record in zip(records, restored):
+        assert record.to_dict() == original.to_dict()
+        assert record.words.to_words() == list(original.words)
+
+
+def test_detection_is_by_content(tmp_path):
+    path = write_columnar_transcript(_result(3), tmp_path / "talk.bin")
+    np.savez(tmp_path / "other.npz", values=np.arange(3))
+    (tmp_path / "talk.json").write_text("{}")
+
+    assert is_columnar_transcript(path)
+    assert not is_columnar_transcript(tmp_path / "other.npz")
+    assert not is_columnar_transcript(tmp_path / "talk.json")
+    with pytest.raises(ValueError):
+        ColumnarTranscript(tmp_path / "talk.json")
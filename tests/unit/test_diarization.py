@@ -0,0 +1,100 @@
+import threading
+import time
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.core.diarization import DiarizationStore, DiarizationTurns, diarization_params
+from src.utils.cache import ResultCache
+
+
+class FakeAnnotation:
+    def __init__(self, turns):
+        self.turns = turns
+
+    def itertracks(self, yield_label=False):
+        for i, (start, end, speaker) in enumerate(self.turns):
+            yield SimpleNamespace(start=start, end=end), i, speaker
+
+
+class CountingPipeline:
+    def __init__(self, turns):
+        self.turns = turns
+        self.calls = 0
+        self.kwargs = []
+
+    def __call__(self, path, **kwargs):
+        self.calls += 1
+        self.kwargs.append(kwargs)
+        time.sleep(0.05)
+        return FakeAnnotation(self.turns)
+
+
+def _write_wav(path, seconds=1.0, sample_rate=16000):
+    samples = (np.sin(np.arange(int(seconds * sample_rate)) / 10) * 1000).astype('<i2')
+    with wave.open(str(path), 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+
+
+def test_diarization_runs_once_per_file_and_settings(tmp_path):
+    audio_path = tmp_path / "talk.wav"
+    _write_wav(audio_path)
+    pipeline = CountingPipeline([(0.0, 2.0, "A"), (1.5, 3.0, "B")])
+    cache = ResultCache(tmp_path / "cache")
+
+    store = DiarizationStore(cache)
+    first = store.get(audio_path, pipeline, diarization_params())
+    assert store.get(audio_path, pipeline, diarization_params()) is first
+
+    # A fresh process reads the turns back from disk
+    restored = DiarizationStore(cache).get(audio_path, pipeline, diarization_params())
+    assert restored.turns == first.turns
+    assert pipeline.calls == 1
+
+    # Different pipeline settings are a different diarization, and reach the pipeline
+    store.get(audio_path, pipeline, diarization_params(max_speakers=2))
+    assert pipeline.calls == 2
+    assert pipeline.kwargs == [{}, {'max_speakers': 2}]
+
+
+def test_concurrent_consumers_share_one_run_without_a_disk_cache(tmp_path):
+    audio_path = tmp_path / "talk.wav"
+    _write_wav(audio_path)
+    pipeline = CountingPipeline([(0.0, 1.0, "A")])
+    store = DiarizationStore(None)  # cache disabled in config
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(store.get(audio_path, pipeline)))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pipeline.calls == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_unset_speaker_bounds_share_the_default_key():
+    assert diarization_params("m", None, None) == diarization_params("m") == {'model': "m"}
+
+
+def test_unavailable_pipeline_is_not_cached(tmp_path):
+    audio_path = tmp_path / "talk.wav"
+    _write_wav(audio_path)
+    store = DiarizationStore(ResultCache(tmp_path / "cache"))
+
+    assert store.get(audio_path, lambda path: None) is None
+    assert store.get(audio_path, CountingPipeline([(0.0, 1.0, "A")])).turns == [(0.0, 1.0, "A")]
+
+
+def test_overlap_ranges_are_merged():
+    turns = DiarizationTurns([(0.0, 4.0, "A"), (1.0, 2.0, "B"), (1.5, 3.0, "C"), (5.0, 6.0, "A")])
+
+    assert turns.overlap_ranges() == [(1.0, 3.0)]
+    assert turns.overlap_index().any_overlap(2.5, 2.6)
+    assert not turns.overlap_index().any_overlap(3.0, 6.0)
@@ -0,0 +1,36 @@
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from src.core.file_processor import FileProcessor
+
+
+def test_filter_graph_matches_staged_pipeline(tmp_path: Path):
+    processor = FileProcessor(temp_dir=tmp_path)
+    filters = processor.build_filter_graph(speed_multiplier=3.0)
+
+    names = [name for name, _ in filters]
+    assert names == ["loudnorm", "aformat", "silenceremove", "atempo", "atempo"]
+    assert filters[1][1]["sample_rates"] == 16000
+    assert [kwargs["tempo"] for name, kwargs in filters if name == "atempo"] == [2.0, 1.5]
+
+
+def test_filter_graph_skips_disabled_steps(tmp_path: Path):
+    processor = FileProcessor(temp_dir=tmp_path)
+    filters = processor.build_filter_graph(normalize=False, remove_silence=False, speed_multiplier=1.0)
+    assert [name for name, _ in filters] == ["aformat"]
+
+
+def test_write_wav_round_trip(tmp_path: Path):
+    processor = FileProcessor(temp_dir=tmp_path)
+    audio = np.linspace(-1.0, 1.0, 1600, dtype=np.float32)
+
+    path = processor.write_wav(audio, tmp_path / "out.wav", sample_rate=16000)
+
+    with wave.open(str(path), "rb") as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.getnchannels() == 1
+        pcm = np.frombuffer(wav_file.readframes(wav_file.getnframes()), dtype="<i2")
+    assert pcm.shape == (1600,)
+    assert pcm[0] == -32767 and pcm[-1] == 32767
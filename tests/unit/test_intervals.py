@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.core.intervals import IntervalIndex, TimeBinSet, overlapping_pairs
+from src.post.overlap import _check_overlap_in_range
+
+
+def _random_intervals(rng, count):
+    starts = rng.uniform(0, 100, count).round(2)
+    ends = starts + rng.uniform(0.1, 15, count).round(2)
+    return starts, ends
+
+
+def _brute_best(starts, ends, start, end):
+    best, best_ratio = None, 0.0
+    for i, (s, e) in enumerate(zip(starts, ends)):
+        overlap = min(e, end) - max(s, start)
+        ratio = overlap / (end - start)
+        if ratio > best_ratio:
+            best, best_ratio = i, ratio
+    return best
+
+
+def test_queries_match_linear_scan():
+    rng = np.random.default_rng(0)
+    starts, ends = _random_intervals(rng, 200)
+    index = IntervalIndex(starts, ends)
+
+    query_starts, query_ends = _random_intervals(rng, 300)
+    flags = index.any_overlap_many(query_starts, query_ends)
+
+    for qs, qe, flag in zip(query_starts, query_ends, flags):
+        expected = [i for i, (s, e) in enumerate(zip(starts, ends)) if s < qe and e > qs]
+        assert index.overlapping(qs, qe).tolist() == expected
+        assert index.any_overlap(qs, qe) == bool(expected) == flag
+        assert index.best_overlap(qs, qe) == _brute_best(starts, ends, qs, qe)
+
+
+def test_touching_and_empty_inputs():
+    index = IntervalIndex([0.0, 5.0], [2.0, 6.0])
+
+    assert not index.any_overlap(2.0, 5.0)
+    assert index.best_overlap(3.0, 3.0) is None
+    assert not IntervalIndex([], []).any_overlap(0.0, 1.0)
+    assert IntervalIndex([], []).best_overlap(0.0, 1.0) is None
+
+
+def test_from_any_accepts_segment_lists_and_timelines():
+    overlap_segments = [SimpleNamespace(start_time=1.0, end_time=2.0)]
+    timeline = SimpleNamespace(itersegments=lambda: iter([SimpleNamespace(start=4.0, end=5.0)]))
+
+    assert IntervalIndex.from_any(overlap_segments).any_overlap(1.5, 3.0)
+    assert IntervalIndex.from_any(timeline).overlapping(0.0, 10.0).tolist() == [0]
+
+
+def test_overlap_range_check_accepts_diarization_or_index():
+    diarization = SimpleNamespace(
+        get_overlap=lambda: [SimpleNamespace(start=3.0, end=4.0)]
+    )
+    index = IntervalIndex.from_any(diarization.get_overlap())
+
+    assert not _check_overlap_in_range(diarization, 0.0, 3.0)
+    assert _check_overlap_in_range(diarization, 2.5, 5.0)
+    assert _check_overlap_in_range(index, 3.5, 3.6)
+
+
+def test_overlapping_pairs_match_nested_scan():
+    rng = np.random.default_rng(1)
+    starts, ends = _random_intervals(rng, 150)
+    order = np.argsort(starts, kind='stable')
+    starts, ends = starts[order], ends[order]
+    labels = rng.integers(0, 4, starts.size).tolist()
+
+    expected = [
+        (i, j)
+        for i in range(starts.size)
+        for j in range(i + 1, starts.size)
+        if ends[i] > starts[j] and ends[j] > starts[i] and labels[i] != labels[j]
+    ]
+
+    assert overlapping_pairs(starts, ends, labels) == expected
+
+
+def test_time_bin_set_matches_linear_dedup():
+    rng = np.random.default_rng(2)
+    ranges = [(s, s + d) for s, d in zip(rng.uniform(0, 5, 400), rng.uniform(0, 1, 400))]
+
+    linear = []
+    for start, end in ranges:
+        if not any(abs(start - s) < 0.1 and abs(end - e) < 0.1 for s, e in linear):
+            linear.append((start, end))
+
+    binned = []
+    seen = TimeBinSet(tolerance=0.1)
+    for start, end in ranges:
+        if seen.find(start, end) is None:
+            seen.add(start, end, (start, end))
+            binned.append((start, end))
+
+    assert binned == linear
@@ -0,0 +1,86 @@
+import io
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.transcriber import BatchTranscriptionResult, TranscriptionResult, TranscriptionSegment, WordTimestamp
+from src.utils import json_stream
+from src.utils.json_stream import JsonStreamWriter, write_json
+
+
+def _result(segment_count=300, start=0.0):
+    segments = []
+    for i in range(segment_count):
+        t = start + i * 5.0
+        words = [WordTimestamp(f" w{i}.{j}", t + j * 0.4, t + j * 0.4 + 0.3, 0.9) for j in range(8)]
+        segments.append(TranscriptionSegment(i, t, t + 3.2, "".join(w.word for w in words), -0.2, 0.01, words))
+    return TranscriptionResult(segments, "en", 0.99, start + segment_count * 5.0, "text", 0.9, 1.0, {'model': 'tiny'})
+
+
+def _batch():
+    chunks = [_result(150), _result(150, start=750.0)]
+    merged = TranscriptionResult(chunks[0].segments + chunks[1].segments, "en", 0.99, 1500.0, "text", 0.9, 2.0, {})
+    return BatchTranscriptionResult(Path("/audio/hearing.wav"), chunks, merged, 2.0, 2, 0, {'speed': 1.0})
+
+
+def _dumps(value, **kwargs):
+    stream = io.BytesIO()
+    JsonStreamWriter(stream, **kwargs).write(value)
+    return stream.getvalue().decode('utf-8')
+
+
+def _expected(batch, indent):
+    data = asdict(batch)
+    data['original_file'] = str(data['original_file'])
+    return json.dumps(data, indent=indent, ensure_ascii=False) + "\n"
+
+
+@pytest.mark.parametrize("use_orjson", [False, pytest.param(True, marks=pytest.mark.skipif(
+    not json_stream.ORJSON_AVAILABLE, reason="orjson not installed"))])
+def test_output_matches_json_dump_of_asdict(use_orjson):
+    batch = _batch()
+
+    assert _dumps(batch, indent=2, use_orjson=use_orjson) == _expected(batch, 2)
+    assert json.loads(_dumps(batch, indent=None, use_orjson=use_orjson)) == json.loads(_expected(batch, None))
+
+
+def test_large_containers_numpy_values_and_generators():
+    value = {
+        'gaps': np.linspace(0.0, 1.0, 1000),
+        'count': np.int64(3),
+        'records': ({'id': i, 'text': "é"} for i in range(500)),
+        'nested': [list(range(300)), {}, []],
+        1: None,
+    }
+
+    decoded = json.loads(_dumps(value, indent=4, use_orjson=False))
+
+    assert decoded['gaps'] == np.linspace(0.0, 1.0, 1000).tolist()
+    assert decoded['count'] == 3
+    assert decoded['records'][-1] == {'id': 499, 'text': "é"}
+    assert decoded['nested'] == [list(range(300)), {}, []]
+    assert decoded['1'] is None
+
+
+def test_write_json_excludes_chunk_results(tmp_path):
+    path = write_json(_batch(), tmp_path / "result.json", exclude=('chunk_results',))
+
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert 'chunk_results' not in data
+    assert len(data['merged_result']['segments']) == 300
+    assert data['merged_result']['segments'][0]['words'][0] == {
+        'word': " w0.0", 'start': 0.0, 'end': 0.3, 'probability': 0.9}
+
+
+def test_failed_write_leaves_previous_file(tmp_path):
+    path = tmp_path / "result.json"
+    path.write_text("{}", encoding='utf-8')
+
+    with pytest.raises(TypeError):
+        write_json({'segments': [_result(5), object()]}, path)
+
+    assert path.read_text(encoding='utf-8') == "{}"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,90 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from src.core import model_registry
+from src.core.model_registry import ModelRegistry, resolve_model_path, shared_model_key
+
+
+class SlowModel:
+    """Model stub that counts constructions and decodes."""
+
+    loads = 0
+
+    def __init__(self, path, device, compute_type, **kwargs):
+        SlowModel.loads += 1
+        time.sleep(0.05)
+        self.path, self.device, self.compute_type = path, device, compute_type
+        self.decodes = 0
+
+    def transcribe(self, audio, **kwargs):
+        self.decodes += 1
+        return iter([SimpleNamespace(text="")]), SimpleNamespace(language="en")
+
+
+def test_concurrent_requests_share_one_instance():
+    SlowModel.loads = 0
+    registry = ModelRegistry()
+    models = []
+
+    def load():
+        models.append(registry.get("large-v3", "cpu", "int8", loader=SlowModel))
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert SlowModel.loads == 1
+    assert all(model is models[0] for model in models)
+    assert registry.memory_report()[0]["users"] == 8
+
+    other = registry.get("large-v3", "cpu", "float32", loader=SlowModel)
+    assert other is not models[0]
+    assert len(registry.memory_report()) == 2
+
+
+def test_warm_up_once_and_unload():
+    registry = ModelRegistry()
+    model = registry.get("tiny", "cpu", "int8", loader=SlowModel)
+
+    registry.warm_up(model)
+    registry.warm_up(model)
+    assert model.decodes == 1
+    assert registry.memory_report()[0]["warmed_up"]
+
+    assert registry.unload("tiny", "cpu", "int8")
+    assert not registry.unload("tiny", "cpu", "int8")
+    assert registry.memory_report() == []
+
+
+def test_release_unloads_only_the_last_user():
+    registry = ModelRegistry()
+    model = registry.get("tiny", "cpu", "int8", loader=SlowModel)
+    assert registry.get("tiny", "cpu", "int8", loader=SlowModel) is model
+
+    assert not registry.release(model, unload_unused=True)
+    assert registry.memory_report()[0]["users"] == 1
+    assert registry.release(model, unload_unused=True)
+    assert registry.memory_report() == []
+    assert not registry.release(model, unload_unused=True)
+
+
+def test_resolve_model_path(tmp_path):
+    assert resolve_model_path("large-v3", None) == "large-v3"
+    assert resolve_model_path("large-v3", str(tmp_path)) == "large-v3"
+    (tmp_path / "large-v3").mkdir()
+    assert resolve_model_path("large-v3", str(tmp_path)) == str(tmp_path / "large-v3")
+
+
+def test_worker_and_reprocessor_resolve_the_same_key(tmp_path, monkeypatch):
+    (tmp_path / "large-v3").mkdir()
+    monkeypatch.setenv("MODEL_CACHE_PATH", str(tmp_path))
+    monkeypatch.setattr(model_registry, "_shared_device", ("cuda", "float16"))
+
+    # OptimizedGPUWorker passes its cache path, ConfidenceReprocessor relies on the default
+    worker_key = shared_model_key("large-v3", model_registry.model_cache_dir())
+    reprocessor_key = shared_model_key("large-v3")
+
+    assert worker_key == reprocessor_key == (str(tmp_path / "large-v3"), "cuda", "float16")
@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import resource_detector
+from src.core.resource_detector import (
+    ResourceDetector, cgroup_cpu_limit, cgroup_memory_limit, total_memory_bytes, usable_cpu_count
+)
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_cgroup_v2_limits(tmp_path):
+    proc = _write(tmp_path / "proc" / "cgroup", "0::/\n")
+    root = tmp_path / "cgroup"
+    _write(root / "cpu.max", "150000 100000\n")
+    _write(root / "memory.max", f"{2 << 30}\n")
+    meminfo = _write(tmp_path / "proc" / "meminfo", "MemTotal:       16384000 kB\nMemFree: 1 kB\n")
+
+    assert cgroup_cpu_limit(root, proc) == pytest.approx(1.5)
+    assert cgroup_memory_limit(root, proc) == 2 << 30
+    assert usable_cpu_count(root, proc) <= 2
+    assert total_memory_bytes(root, proc, meminfo) == 2 << 30
+
+    _write(root / "cpu.max", "max 100000\n")
+    _write(root / "memory.max", "max\n")
+    assert cgroup_cpu_limit(root, proc) is None
+    assert cgroup_memory_limit(root, proc) is None
+    assert total_memory_bytes(root, proc, meminfo) == 16384000 * 1024
+
+
+def test_cgroup_v1_takes_the_tightest_limit_along_the_hierarchy(tmp_path):
+    proc = _write(tmp_path / "cgroup-self", "4:memory:/pods/job\n2:cpu,cpuacct:/pods/job\n")
+    root = tmp_path / "cgroup"
+    _write(root / "cpu,cpuacct" / "cpu.cfs_quota_us", "-1\n")
+    _write(root / "cpu,cpuacct" / "cpu.cfs_period_us", "100000\n")
+    _write(root / "cpu,cpuacct" / "pods" / "job" / "cpu.cfs_quota_us", "250000\n")
+    _write(root / "cpu,cpuacct" / "pods" / "job" / "cpu.cfs_period_us", "100000\n")
+    _write(root / "memory" / "memory.limit_in_bytes", "9223372036854771712\n")
+    _write(root / "memory" / "pods" / "memory.limit_in_bytes", f"{8 << 30}\n")
+    _write(root / "memory" / "pods" / "job" / "memory.limit_in_bytes", f"{12 << 30}\n")
+
+    assert cgroup_cpu_limit(root, proc) == pytest.approx(2.5)
+    assert cgroup_memory_limit(root, proc) == 8 << 30
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    calls = []
+
+    def detect_gpu(self):
+        calls.append('gpu')
+        return {'available': False, 'count': 0, 'memory': [], 'names': []}
+
+    monkeypatch.setattr(ResourceDetector, "_detect_gpu", detect_gpu)
+    return calls
+
+
+def test_profile_is_reused_until_the_system_changes_or_it_expires(tmp_path, monkeypatch, probes):
+    path = tmp_path / "profile" / "hardware.json"
+
+    first = ResourceDetector(profile_path=path).detect_hardware()
+    second = ResourceDetector(profile_path=path).detect_hardware()
+    assert second == first and probes == ['gpu'] and path.exists()
+
+    ResourceDetector(profile_path=path, profile_ttl=-1).detect_hardware()
+    assert probes == ['gpu'] * 2
+
+    ResourceDetector(profile_path=path).detect_hardware(refresh=True)
+    assert probes == ['gpu'] * 3
+
+    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "1")
+    ResourceDetector(profile_path=path).detect_hardware()
+    assert probes == ['gpu'] * 4
+
+    path.write_text("{not json")
+    ResourceDetector(profile_path=path).detect_hardware()
+    assert probes == ['gpu'] * 5
+
+    ResourceDetector(profile_path=None).detect_hardware()
+    assert probes == ['gpu'] * 6
+
+
+def test_cuda_devices_are_counted_without_torch(tmp_path, monkeypatch):
+    class NoTorch:
+        def __getattr__(self, name):
+            raise AssertionError("torch was used")
+
+    monkeypatch.setattr(resource_detector, "CTRANSLATE2_AVAILABLE", True)
+    monkeypatch.setattr(resource_detector, "ctranslate2", SimpleNamespace(get_cuda_device_count=lambda: 2))
+    monkeypatch.setattr(resource_detector, "TORCH_AVAILABLE", True)
+    monkeypatch.setattr(resource_detector, "torch", NoTorch())
+    monkeypatch.setattr(resource_detector, "_nvidia_smi_gpus", lambda: [("A10G", 24 << 30)] * 3)
+
+    hardware = ResourceDetector(profile_path=None).detect_hardware()
+
+    assert (hardware.gpu_available, hardware.gpu_count, hardware.recommended_device) == (True, 2, "cuda")
+    assert hardware.gpu_names == ["A10G", "A10G"] and hardware.gpu_memory == [24 << 30] * 2
+
+
+def test_malformed_profile_ttl_falls_back_to_a_day(monkeypatch):
+    monkeypatch.setenv("TALKGPT_HARDWARE_PROFILE_TTL", "1d")
+    assert resource_detector._env_seconds("TALKGPT_HARDWARE_PROFILE_TTL", 24 * 3600) == 24 * 3600
+
+    monkeypatch.setenv("TALKGPT_HARDWARE_PROFILE_TTL", "600")
+    assert resource_detector._env_seconds("TALKGPT_HARDWARE_PROFILE_TTL", 24 * 3600) == 600.0
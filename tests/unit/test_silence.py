@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from src.core.silence import EnergyEnvelope
+
+pydub = pytest.importorskip("pydub")
+from pydub.silence import detect_nonsilent, detect_silence  # noqa: E402
+
+
+def _speech_like_segment(sample_rate=16000, seed=0):
+    """Alternate loud noise bursts with near-silent gaps of varying length."""
+    rng = np.random.default_rng(seed)
+    pieces = []
+    for loud_ms, quiet_ms in [(700, 1200), (300, 400), (900, 50), (400, 2500), (600, 0)]:
+        pieces.append(0.3 * rng.standard_normal(loud_ms * sample_rate // 1000))
+        pieces.append(0.0005 * rng.standard_normal(quiet_ms * sample_rate // 1000))
+    samples = (np.concatenate(pieces) * 32767).astype("<i2")
+    return pydub.AudioSegment(samples.tobytes(), frame_rate=sample_rate, sample_width=2, channels=1)
+
+
+@pytest.mark.parametrize("min_silence_len", [250, 500, 1000])
+def test_envelope_matches_pydub(min_silence_len):
+    segment = _speech_like_segment()
+    envelope = EnergyEnvelope.from_segment(segment)
+
+    assert envelope.duration_ms == len(segment)
+    assert envelope.silent_ranges(min_silence_len, -40) == [
+        tuple(r) for r in detect_silence(segment, min_silence_len, -40)
+    ]
+    assert envelope.nonsilent_ranges(min_silence_len, -40) == [
+        tuple(r) for r in detect_nonsilent(segment, min_silence_len, -40)
+    ]
+
+
+def test_select_concatenates_frames():
+    envelope = EnergyEnvelope.from_array(np.ones(16000, dtype=np.float32), 16000)
+    selected = envelope.select([(0, 100), (500, 600)])
+    assert selected.duration_ms == 200
+    assert selected.nonsilent_ranges(50, -40) == [(0, 200)]
+
+
+def test_all_silent_and_no_silence():
+    silent = EnergyEnvelope.from_array(np.zeros(32000, dtype=np.float32), 16000)
+    assert silent.nonsilent_ranges(1000, -40) == []
+
+    loud = EnergyEnvelope.from_array(np.full(32000, 0.5, dtype=np.float32), 16000)
+    assert loud.nonsilent_ranges(1000, -40) == [(0, 2000)]
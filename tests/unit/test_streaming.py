@@ -0,0 +1,92 @@
+import time
+
+import numpy as np
+
+from src.core.streaming import (
+    ArrayAudioSource, AudioRingBuffer, LocalAgreement, StreamWord, StreamingTranscriber
+)
+
+
+SAMPLE_RATE = 16000
+WORDS = [StreamWord(i * 0.5, i * 0.5 + 0.4, f"w{i}") for i in range(12)]
+
+
+def fake_decoder(audio, offset, prompt=None):
+    """Words fully inside the window, plus a garbled word still being spoken."""
+    window_end = offset + audio.size / SAMPLE_RATE
+    words = []
+    for word in WORDS:
+        if word.start < offset - 1e-6:
+            continue
+        if word.end <= window_end + 1e-6:
+            words.append(StreamWord(word.start, word.end, word.text))
+        elif word.start < window_end:
+            words.append(StreamWord(word.start, window_end, word.text + "?"))
+    return words
+
+
+def test_ring_buffer_wraps_and_keeps_newest_samples():
+    buffer = AudioRingBuffer(capacity_seconds=1.0, sample_rate=10)
+    buffer.write(np.arange(7))
+    buffer.write(np.arange(7, 15))
+
+    assert (buffer.start, buffer.end) == (5, 15)
+    assert buffer.read(0).tolist() == list(range(5, 15))
+    assert buffer.read(8, 12).tolist() == [8, 9, 10, 11]
+
+    buffer.write(np.arange(100, 125).reshape(-1, 1))
+    assert buffer.read(0).tolist() == list(range(115, 125))
+
+
+def test_local_agreement_confirms_stable_prefix():
+    agreement = LocalAgreement()
+    hello, world = StreamWord(0.0, 0.4, "Hello"), StreamWord(0.5, 0.9, "world")
+
+    assert agreement.insert([hello, StreamWord(0.5, 0.8, "word")]) == []
+    assert agreement.insert([StreamWord(0.0, 0.4, "hello,"), world]) == [StreamWord(0.0, 0.4, "hello,")]
+    # A later window repeats the confirmed word before the new ones
+    assert agreement.insert([StreamWord(0.0, 0.4, "hello"), world, StreamWord(1.0, 1.2, "again")]) == [world]
+    assert agreement.flush() == [StreamWord(1.0, 1.2, "again")]
+    assert [word.text for word in agreement.committed] == ["hello,", "world", "again"]
+
+
+def test_engine_confirms_every_word_without_losing_audio():
+    confirmed, partials = [], []
+    engine = StreamingTranscriber(fake_decoder, step_seconds=0.7, max_window_seconds=2.0,
+                                  on_confirmed=confirmed.extend, on_partial=partials.append)
+    audio = np.zeros(int(6.0 * SAMPLE_RATE), dtype=np.float32)
+
+    words = engine.run(ArrayAudioSource(audio, realtime=False))
+
+    assert [word.text for word in words] == [word.text for word in WORDS]
+    assert confirmed == words
+    assert all(not word.text.endswith("?") for word in words)
+
+
+def test_forced_cut_keeps_a_word_it_would_split():
+    engine = StreamingTranscriber(fake_decoder, step_seconds=0.7, max_window_seconds=2.0)
+    # The first decode sees 4.8 s at once; cutting to 2 s lands inside w5 (2.5-2.9)
+    engine.feed(np.zeros(int(4.8 * SAMPLE_RATE), dtype=np.float32))
+    engine.start()
+    deadline = time.monotonic() + 5.0
+    while engine.stats()['decodes'] == 0 and engine._error is None:
+        if time.monotonic() > deadline:
+            engine.finish(timeout=1.0)
+            raise AssertionError("no decode within 5 s")
+        time.sleep(0.005)
+    engine.feed(np.zeros(int(1.2 * SAMPLE_RATE), dtype=np.float32))
+
+    # finish() re-raises a decoder error from the worker thread
+    assert [word.text for word in engine.finish(timeout=5.0)] == [word.text for word in WORDS]
+
+
+def test_realtime_replay_confirms_words_with_low_latency():
+    engine = StreamingTranscriber(fake_decoder, step_seconds=0.25, max_window_seconds=3.0)
+    audio = np.zeros(int(2.0 * SAMPLE_RATE), dtype=np.float32)
+
+    words = engine.run(ArrayAudioSource(audio, block_seconds=0.05))
+    stats = engine.stats()
+
+    assert [word.text for word in words] == [f"w{i}" for i in range(4)]
+    assert stats['decodes'] >= 4
+    assert stats['max_confirm_lag'] < 2.0
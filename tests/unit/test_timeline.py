@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.core.file_processor import FileProcessor
+from src.core.timeline import TimeMap, remap_segments
+
+
+def test_kept_ranges_map_back_across_removed_silence():
+    # 0-2s kept, 2-5s removed, 5-6s kept; then played at 2x
+    time_map = TimeMap.from_kept_ranges([(0.0, 2.0), (5.0, 6.0)], speed_multiplier=2.0)
+
+    assert time_map.to_original(0.5) == pytest.approx(1.0)
+    assert time_map.to_original(1.25) == pytest.approx(5.5)
+    assert time_map.to_processed(5.5) == pytest.approx(1.25)
+    assert time_map.original_duration == 6.0
+    assert not time_map.is_identity
+
+
+def test_identity_and_round_trip():
+    assert TimeMap.from_kept_ranges([(0.0, 10.0)]).is_identity
+
+    time_map = TimeMap.from_kept_ranges([(1.0, 3.0), (4.0, 9.0)], 1.5)
+    restored = TimeMap.from_dict(time_map.to_dict())
+    np.testing.assert_array_equal(restored.processed, time_map.processed)
+    np.testing.assert_array_equal(restored.original, time_map.original)
+
+
+def test_remap_segments_updates_words_once():
+    time_map = TimeMap.from_kept_ranges([(0.0, 2.0), (5.0, 6.0)], speed_multiplier=2.0)
+    segment = SimpleNamespace(start=0.5, end=1.25,
+                              words=[{'word': 'a', 'start': 0.5, 'end': 0.9},
+                                     {'word': 'b', 'start': 1.1, 'end': 1.25}])
+
+    remap_segments([segment, segment], time_map)
+
+    assert (segment.start, segment.end) == pytest.approx((1.0, 5.5))
+    assert segment.words[1]['start'] == pytest.approx(5.2)
+    assert segment.words[0]['end'] == pytest.approx(1.8)
+
+
+def test_cut_silence_reports_kept_ranges(tmp_path):
+    sr = 16000
+    rng = np.random.default_rng(0)
+    audio = np.concatenate([
+        0.3 * rng.standard_normal(sr),       # 0-1s speech
+        np.zeros(3 * sr),                    # 1-4s silence
+        0.3 * rng.standard_normal(sr),       # 4-5s speech
+    ]).astype(np.float32)
+
+    cut, kept = FileProcessor(temp_dir=tmp_path).cut_silence(audio, sr)
+
+    assert np.allclose(kept, [(0.0, 1.1), (3.9, 5.0)], atol=0.002)
+    assert cut.shape[0] == round(sum(end - start for start, end in kept) * sr)
+    time_map = TimeMap.from_kept_ranges(kept)
+    assert time_map.to_original(1.5) == pytest.approx(4.3, abs=0.002)
@@ -0,0 +1,86 @@
+import json
+import threading
+
+from src.utils.tracing import MetricsRegistry, Tracer, get_tracer, traced, write_metrics_file
+
+
+def test_spans_nest_and_feed_the_duration_histogram():
+    registry = MetricsRegistry()
+    tracer = Tracer(registry)
+
+    with tracer.span("file", path="a.wav") as outer:
+        with tracer.span("chunk") as inner:
+            tracer.annotate(chunk_id=3)
+        assert tracer.current() is outer
+
+    assert tracer.current() is None
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert inner.attributes == {'chunk_id': 3}
+    assert [span.name for span in tracer.spans()] == ["chunk", "file"]
+    assert tracer.span_seconds.count(span="chunk") == 1
+
+
+def test_activate_carries_the_parent_to_worker_threads():
+    tracer = Tracer(MetricsRegistry())
+    children = []
+
+    with tracer.span("file") as parent:
+        def work():
+            with tracer.activate(parent), tracer.span("chunk") as span:
+                children.append(span)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert children[0].parent_id == parent.span_id
+
+
+def test_failed_spans_record_the_error():
+    tracer = Tracer(MetricsRegistry())
+    try:
+        with tracer.span("decode"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert tracer.spans()[0].attributes['error'] == "RuntimeError: boom"
+
+
+def test_render_uses_the_prometheus_text_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs", ["status"])
+    histogram = registry.histogram("wait_seconds", "Wait", buckets=(0.1, 1.0))
+    counter.inc(status="ok")
+    counter.inc(2, status="ok")
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE jobs_total counter" in lines
+    assert 'jobs_total{status="ok"} 3.0' in lines
+    assert "# TYPE wait_seconds histogram" in lines
+    assert 'wait_seconds_bucket{le="0.1"} 1.0' in lines
+    assert 'wait_seconds_bucket{le="1.0"} 2.0' in lines
+    assert 'wait_seconds_bucket{le="+Inf"} 3.0' in lines
+    assert "wait_seconds_sum 5.55" in lines
+    assert "wait_seconds_count 3.0" in lines
+
+
+def test_traced_decorator_and_metrics_file(tmp_path):
+    @traced("unit_test_stage")
+    def stage(x):
+        return x * 2
+
+    assert stage(21) == 42
+    assert get_tracer().spans()[-1].name == "unit_test_stage"
+
+    data = json.loads(write_metrics_file(tmp_path / "metrics.json").read_text())
+    assert any(span['name'] == "unit_test_stage" for span in data['spans'])
+    assert data['metrics']['talkgpt_span_seconds']['type'] == "histogram"
+
+    text = write_metrics_file(tmp_path / "metrics.prom").read_text()
+    assert 'talkgpt_span_seconds_count{span="unit_test_stage"}' in text
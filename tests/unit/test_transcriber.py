@@ -0,0 +1,221 @@
+import random
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import src.core.transcriber as transcriber_mod
+from src.core.chunker import AudioChunk, ChunkingResult, ChunkStream
+from src.core.model_registry import get_model_registry
+from src.core.transcriber import WhisperTranscriber
+
+
+@pytest.fixture(autouse=True)
+def _fresh_model_registry():
+    registry = get_model_registry()
+    registry.unload_all()
+    yield
+    registry.unload_all()
+
+
+class FakeWhisperModel:
+    """Stand-in for faster_whisper.WhisperModel that records its kwargs."""
+
+    def __init__(self, model_size, **kwargs):
+        self.kwargs = kwargs
+        self.threads = set()
+
+    def transcribe(self, audio, **kwargs):
+        self.threads.add(threading.get_ident())
+        time.sleep(random.uniform(0.0, 0.02))
+        segment = SimpleNamespace(start=0.0, end=1.0, text=f" {Path(str(audio)).stem}",
+                                  avg_logprob=-0.1, no_speech_prob=0.0, words=None)
+        info = SimpleNamespace(language="en", language_probability=0.99)
+        return iter([segment]), info
+
+
+def _make_transcriber(monkeypatch, num_workers):
+    monkeypatch.setattr(transcriber_mod, "FASTER_WHISPER_AVAILABLE", True)
+    monkeypatch.setattr(transcriber_mod, "WhisperModel", FakeWhisperModel, raising=False)
+    return WhisperTranscriber(model_size="tiny", device="cpu", compute_type="float32",
+                              num_workers=num_workers)
+
+
+def _chunking_result(tmp_path: Path, count: int) -> ChunkingResult:
+    chunks = [
+        AudioChunk(chunk_id=i, start_time=i * 10.0, end_time=(i + 1) * 10.0, duration=10.0,
+                   file_path=tmp_path / f"c{i}.wav", original_start=i * 10.0,
+                   original_end=(i + 1) * 10.0)
+        for i in range(count)
+    ]
+    return ChunkingResult(original_file=tmp_path / "a.wav", chunks=chunks, total_duration=count * 10.0,
+                          total_chunks=count, processing_time=0.0, silence_removed=0.0,
+                          compression_ratio=1.0, chunking_strategy="test")
+
+
+def test_parallel_transcription_preserves_chunk_order(monkeypatch, tmp_path: Path):
+    transcriber = _make_transcriber(monkeypatch, num_workers=4)
+    assert transcriber.model.kwargs["num_workers"] == 4
+
+    result = transcriber.transcribe_file(tmp_path / "a.wav", _chunking_result(tmp_path, 12))
+
+    assert result.chunks_processed == 12
+    assert [r.chunk_info["chunk_id"] for r in result.chunk_results] == list(range(12))
+    assert result.merged_result.text == " ".join(f"c{i}" for i in range(12))
+    assert len(transcriber.model.threads) > 1
+
+
+def test_single_worker_does_not_request_replicas(monkeypatch, tmp_path: Path):
+    transcriber = _make_transcriber(monkeypatch, num_workers=1)
+    assert "num_workers" not in transcriber.model.kwargs
+
+    result = transcriber.transcribe_file(tmp_path / "a.wav", _chunking_result(tmp_path, 3))
+    assert result.chunks_processed == 3
+    assert result.performance_metrics["num_workers"] == 1
+
+
+def test_in_memory_chunk_is_passed_as_array(monkeypatch, tmp_path: Path):
+    import numpy as np
+
+    transcriber = _make_transcriber(monkeypatch, num_workers=1)
+    received = []
+    original = transcriber.model.transcribe
+
+    def record(audio, **kwargs):
+        received.append(audio)
+        return original("mem", **kwargs)
+
+    monkeypatch.setattr(transcriber.model, "transcribe", record)
+    samples = np.zeros(16000 * 10, dtype=np.float32)
+    chunk = AudioChunk(chunk_id=0, start_time=0.0, end_time=10.0, duration=10.0, file_path=None,
+                       original_start=0.0, original_end=10.0, audio=samples, sample_rate=16000)
+
+    transcriber.transcribe_chunk(chunk)
+    assert received[0] is samples
+
+
+def test_chunk_cache_reuses_results_at_new_offsets(monkeypatch, tmp_path: Path):
+    import numpy as np
+    from src.utils.cache import ResultCache
+
+    transcriber = _make_transcriber(monkeypatch, num_workers=1)
+    transcriber.result_cache = ResultCache(tmp_path / "cache")
+    calls = []
+    original = transcriber.model.transcribe
+
+    def record(audio, **kwargs):
+        calls.append(audio)
+        return original("mem", **kwargs)
+
+    monkeypatch.setattr(transcriber.model, "transcribe", record)
+    samples = np.ones(16000, dtype=np.float32)
+
+    def chunk(chunk_id, start):
+        return AudioChunk(chunk_id=chunk_id, start_time=start, end_time=start + 1.0, duration=1.0,
+                          file_path=None, original_start=start, original_end=start + 1.0,
+                          audio=samples.copy(), sample_rate=16000)
+
+    first = transcriber.transcribe_chunk(chunk(0, 0.0))
+    second = transcriber.transcribe_chunk(chunk(7, 30.0))
+
+    assert len(calls) == 1
+    assert second.text == first.text
+    assert (second.segments[0].start, second.segments[0].end) == (30.0, 31.0)
+    assert second.chunk_info["chunk_id"] == 7 and second.chunk_info["cached"]
+    assert first.segments[0].start == 0.0
+
+
+def test_chunk_cache_counters_in_performance_metrics(monkeypatch, tmp_path: Path):
+    import numpy as np
+    from src.utils.cache import ResultCache
+
+    transcriber = _make_transcriber(monkeypatch, num_workers=2)
+    transcriber.result_cache = ResultCache(tmp_path / "cache")
+    chunking = _chunking_result(tmp_path, 3)
+    for chunk in chunking.chunks:
+        chunk.audio = np.full(16000, chunk.chunk_id, dtype=np.float32)
+        chunk.sample_rate = 16000
+
+    first = transcriber.transcribe_file(tmp_path / "a.wav", chunking)
+    second = transcriber.transcribe_file(tmp_path / "a.wav", chunking)
+
+    assert (first.performance_metrics["cache_hits"], first.performance_metrics["cache_misses"]) == (0, 3)
+    assert (second.performance_metrics["cache_hits"], second.performance_metrics["cache_misses"]) == (3, 0)
+    assert second.merged_result.text == first.merged_result.text
+
+
+class FakeBatchedPipeline:
+    """Stand-in for BatchedInferencePipeline: one segment per clip, clips in samples."""
+
+    calls = []
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, clip_timestamps=None, batch_size=8, **kwargs):
+        FakeBatchedPipeline.calls.append((len(audio), clip_timestamps, batch_size))
+        segments = [
+            SimpleNamespace(start=clip["start"] / 16000, end=clip["end"] / 16000, text=f" clip{i}",
+                            avg_logprob=-0.2, no_speech_prob=0.0, words=None)
+            for i, clip in enumerate(clip_timestamps)
+        ]
+        return iter(segments), SimpleNamespace(language="en", language_probability=0.9)
+
+
+def test_batched_decode_maps_segments_back_to_chunks(monkeypatch, tmp_path: Path):
+    import numpy as np
+
+    monkeypatch.setattr(transcriber_mod, "FASTER_WHISPER_AVAILABLE", True)
+    monkeypatch.setattr(transcriber_mod, "WhisperModel", FakeWhisperModel, raising=False)
+    monkeypatch.setattr(transcriber_mod, "BATCHED_PIPELINE_AVAILABLE", True)
+    monkeypatch.setattr(transcriber_mod, "BatchedInferencePipeline", FakeBatchedPipeline, raising=False)
+    FakeBatchedPipeline.calls = []
+    transcriber = WhisperTranscriber(model_size="tiny", device="cpu", compute_type="float32", batch_size=2)
+
+    # Three 35 s chunks starting every 30 s: each is split into a 30 s and a 5 s clip
+    chunking = _chunking_result(tmp_path, 3)
+    for chunk in chunking.chunks:
+        chunk.original_start = chunk.start_time = chunk.chunk_id * 30.0
+        chunk.original_end = chunk.end_time = chunk.original_start + 35.0
+        chunk.audio = np.zeros(35 * 16000, dtype=np.float32)
+        chunk.sample_rate = 16000
+
+    result = transcriber.transcribe_file(tmp_path / "a.wav", chunking)
+
+    assert [len(clips) for _, clips, _ in FakeBatchedPipeline.calls] == [4, 2]
+    first_clips = FakeBatchedPipeline.calls[0][1]
+    assert first_clips[:2] == [{'start': 0, 'end': 30 * 16000}, {'start': 30 * 16000, 'end': 35 * 16000}]
+    assert all(isinstance(clip['start'], int) for clip in first_clips)
+    assert [r.chunk_info["chunk_id"] for r in result.chunk_results] == [0, 1, 2]
+    second = result.chunk_results[1]
+    assert [(s.start, s.end) for s in second.segments] == [(30.0, 60.0), (60.0, 65.0)]
+    assert second.text == "clip2 clip3"
+    assert transcriber.model_info["batch_size"] == 2
+
+
+def test_streamed_chunks_are_decoded_before_chunking_finishes(monkeypatch, tmp_path: Path):
+    transcriber = _make_transcriber(monkeypatch, num_workers=1)
+    expected = _chunking_result(tmp_path, 4)
+    decoded = threading.Event()
+    original_transcribe = transcriber.model.transcribe
+
+    def transcribe(audio, **kwargs):
+        decoded.set()
+        return original_transcribe(audio, **kwargs)
+
+    monkeypatch.setattr(transcriber.model, "transcribe", transcribe)
+
+    def produce(emit):
+        emit(expected.chunks[0])
+        # The producer only continues once chunk 0 has been decoded
+        assert decoded.wait(timeout=5)
+        for chunk in expected.chunks[1:]:
+            emit(chunk)
+        return expected
+
+    result = transcriber.transcribe_file(tmp_path / "a.wav", ChunkStream(produce, max_pending=1))
+
+    assert result.chunks_processed == 4
+    assert result.merged_result.text == " ".join(f"c{i}" for i in range(4))
@@ -0,0 +1,129 @@
+from dataclasses import replace
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.core.transcriber import WordTimestamp
+from src.core.utils import Word, flatten_segments, validate_word_timing
+from src.core.word_table import WordTable
+from src.post.assembler import assemble_records
+from src.post.cadence import create_analysis_context
+from src.post.segmenter import bucketize
+
+
+def _reference_validate(words, timing_repair=True):
+    valid = []
+    for word in words:
+        if word.start < 0 or word.end < 0:
+            continue
+        if word.end <= word.start:
+            if not timing_repair:
+                continue
+            word.end = word.start + 0.02
+            word.timing_repaired = True
+        valid.append(word)
+    valid.sort(key=lambda w: w.start)
+    for previous, word in zip(valid, valid[1:]):
+        if word.start < previous.end:
+            word.start = previous.end + 0.001
+    return valid
+
+
+def _reference_bucketize(words, bucket_seconds=4.0, tolerance=0.25):
+    buckets, current = [], []
+    bucket_start = words[0].start
+    for word in words:
+        current.append(word)
+        duration = word.end - bucket_start
+        if duration >= bucket_seconds - tolerance and (
+                duration >= bucket_seconds + tolerance or word.end >= bucket_start + bucket_seconds):
+            buckets.append((bucket_start, current[-1].end, len(current)))
+            current = []
+            bucket_start = word.end
+    if current:
+        buckets.append((bucket_start, current[-1].end, len(current)))
+    return buckets
+
+
+def _random_words(rng, count):
+    starts = np.cumsum(rng.uniform(0.0, 0.6, count)).round(3)
+    ends = (starts + rng.uniform(-0.05, 0.5, count)).round(3)
+    # A few long and a few broken words
+    ends[rng.integers(0, count, 5)] += 9.0
+    starts[rng.integers(0, count, 3)] = -1.0
+    return [Word(f"w{i}", float(s), float(e), round(float(p), 3))
+            for i, (s, e, p) in enumerate(zip(starts, ends, rng.uniform(0, 1, count)))]
+
+
+def test_flatten_segments_handles_objects_dicts_and_fallback_text():
+    segments = [
+        SimpleNamespace(words=[SimpleNamespace(word=" world", start=0.6, end=1.0, probability=0.9)]),
+        {'words': [{'word': ' Hello', 'start': 0.0, 'end': 0.5, 'probability': 0.95}, {'word': ' '}]},
+        SimpleNamespace(words=[], text=" (music) ", start=2.0, end=3.0, avg_logprob=-0.2),
+    ]
+
+    table = WordTable.from_segments(segments)
+
+    assert table.texts == ["Hello", "world", "(music)"]
+    assert table.segment.tolist() == [1, 0, 2]
+    assert table[0] == Word("Hello", 0.0, 0.5, 0.95)
+    assert [w.word for w in flatten_segments(segments)] == ["Hello", "world", "(music)"]
+
+
+def test_slices_share_storage():
+    table = WordTable(["a", "bb", "ccc"], [0.0, 1.0, 2.0], [0.5, 1.5, 2.5])
+    view = table[1:]
+
+    assert view.texts == ["bb", "ccc"]
+    assert np.shares_memory(view.start, table.start)
+    assert view.joined_text() == "bb ccc"
+    assert len(table[2:1]) == 0
+    assert view[1:].texts == ["ccc"] and view[-1].word == "ccc"
+    assert view.validated().texts == ["bb", "ccc"]
+
+
+def test_validation_matches_reference():
+    rng = np.random.default_rng(1)
+    for timing_repair in (True, False):
+        words = _random_words(rng, 400)
+        expected = _reference_validate([replace(w) for w in words], timing_repair)
+
+        table = WordTable.from_words(words).validated(timing_repair)
+
+        assert table.to_words() == expected
+        assert validate_word_timing(words, timing_repair) == expected
+
+
+def test_bucketize_matches_reference():
+    rng = np.random.default_rng(2)
+    for bucket_seconds, tolerance in ((4.0, 0.25), (2.0, 0.0), (6.0, 1.0)):
+        words = validate_word_timing(_random_words(rng, 500))
+        expected = _reference_bucketize(words, bucket_seconds, tolerance)
+
+        for source in (words, WordTable.from_words(words)):
+            buckets = bucketize(source, bucket_seconds, tolerance)
+            assert [(b.start_time, b.end_time, b.word_count) for b in buckets] == expected
+            assert [w for b in buckets for w in b.words] == words
+
+
+def test_gaps_are_clamped_at_zero():
+    table = WordTable(["a", "b", "c"], [0.0, 0.4, 1.2], [0.5, 1.0, 1.5])
+    assert table.gaps().tolist() == [0.0, 0.19999999999999996]
+
+
+def test_word_timestamps_are_slotted_and_read_like_dicts():
+    entry = WordTimestamp(" hi", 0.0, 0.4, 0.9)
+    entry['end'] = 0.5
+
+    assert not hasattr(entry, '__dict__')
+    assert (entry['word'], entry.end, entry.get('probability')) == (" hi", 0.5, 0.9)
+    assert WordTable.from_segments([SimpleNamespace(words=[entry])]).texts == ["hi"]
+
+
+def test_records_share_words_with_their_buckets():
+    words = validate_word_timing(_random_words(np.random.default_rng(3), 200))
+    buckets = bucketize(WordTable.from_words(words))
+    records = assemble_records(buckets, create_analysis_context(buckets), enable_overlap_detection=False)
+
+    assert all(record.words is bucket.words for record, bucket in zip(records, buckets))
+    assert not hasattr(records[0], '__dict__') and not hasattr(buckets[0], '__dict__')